@@ -0,0 +1,198 @@
+#!python3
+"""
+Measures the build (parsing the guide text, generating the index.html) and the camera I/O of the Python tools
+against the simulated cameras (foscam_cgi.simulator), so that performance regressions can be noticed:
+
+    python3 benchmark.py --output before.json
+    ... change something ...
+    python3 benchmark.py --output after.json --compare before.json
+
+With --compare, the exit status is 1 if any result is worse than in the compared run by more than --threshold
+(default 20 %). The guide text is also scaled synthetically (10x and 100x, with renamed commands) to show how
+the parser scales. Use --quick for fewer repeats and without the 100x guide.
+"""
+
+import argparse
+import asyncio
+import gzip
+import json
+import os
+import platform
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import parse_pdf_to_json as build
+from foscam_cgi import FoscamClient, load_cameras
+
+src_dir = Path(os.path.realpath(__file__)).resolve().parent
+
+
+def scaled_guide_lines(lines, scale: int):
+    """
+    The guide lines repeated `scale` times. The method headers of each copy get a suffix, so that the parsed
+    commandJson has `scale` times the commands.
+    """
+    method_lines = set(build.index_sections(lines)["method"])
+    scaled = list(lines)
+    for copy in range(1, scale):
+        scaled.extend(f"{line.rstrip()}_{copy}\n" if i in method_lines else line for i, line in enumerate(lines))
+    return scaled
+
+
+class Results:
+    """
+    The measurements by name: {"value": ..., "unit": ..., "better": "lower", "higher" or None (not compared)}.
+    """
+    def __init__(self):
+        self.results = {}
+
+    def add(self, name: str, value, unit: str, better: str = "lower"):
+        self.results[name] = {"value": round(value, 3), "unit": unit, "better": better}
+        print(f"{name:40} {value:>14.3f} {unit}")
+
+    def as_dict(self):
+        return {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "results": self.results,
+        }
+
+
+def benchmark_build(results, quick: bool):
+    lines = build.read_guide_lines(src_dir / build.source_file)
+    repeat = 5 if quick else 20
+    for scale in (1, 10) if quick else (1, 10, 100):
+        scaled = scaled_guide_lines(lines, scale)
+        commandJson = build.parse_command_json(scaled)
+        results.add(f"parse.{scale}x", build.min_time_ms(lambda: build.parse_command_json(scaled), repeat), "ms")
+        results.add(f"parse.{scale}x.commands", len(commandJson), "commands", None)
+
+    commandJson = build.build_command_json(src_dir / build.source_file)
+    templateHtml = (src_dir / "index_template.html").read_text()
+    commandJsonString = json.dumps(commandJson, indent=4)
+    commandTemplatesString = build.serialize_command_templates(commandJson)
+    commandIndexString = build.serialize_command_index(commandJson)
+    results.add("generate.json", build.min_time_ms(lambda: json.dumps(commandJson, indent=4), repeat), "ms")
+    results.add("generate.html", build.min_time_ms(lambda: build.generate_html(commandJsonString, templateHtml, commandTemplatesString, commandIndexString), repeat), "ms")
+    results.add("generate.python", build.min_time_ms(lambda: build.generate_python_commands(commandJson), repeat), "ms")
+    html = build.generate_html(commandJsonString, templateHtml, commandTemplatesString, commandIndexString).encode()
+    results.add("size.index_html", len(html) / 1024, "KiB")
+    results.add("size.index_html.gzip", len(gzip.compress(html, compresslevel=9, mtime=0)) / 1024, "KiB")
+    release = build.generate_html(build.serialize_release_spec(commandJson), templateHtml, commandTemplatesString, commandIndexString).encode()
+    results.add("size.release_html", len(release) / 1024, "KiB")
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_simulator(cameras: int, settings_path: Path):
+    """
+    Starts the simulated cameras in another process, so that they do not share the CPU of the measured event loop.
+    """
+    port = free_port()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "foscam_cgi.simulator", "--cameras", str(cameras), "--port", str(port),
+         "--max-connections", "8", "--seed", "1", "--export", str(settings_path)],
+        cwd=src_dir, stdout=subprocess.DEVNULL)
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), 0.1).close()
+            return process
+        except OSError:
+            time.sleep(0.05)
+    process.kill()
+    raise RuntimeError("The simulator did not start")
+
+
+async def throughput(cameras, concurrency: int, requests: int, request):
+    """
+    Sends `requests` requests (`await request(client, camera)`) over the cameras, `concurrency` at a time.
+    `request` returns the size of the response in bytes, or None if it does not know it (the parsed commands).
+    Returns (requests per second, total bytes or None).
+    """
+    async with FoscamClient() as client:
+        await asyncio.gather(*(request(client, camera) for camera in cameras[:concurrency]))   # open the connections
+        remaining = iter(range(requests))
+        received = 0
+
+        async def worker(first: int):
+            nonlocal received
+            for i in remaining:
+                size = await request(client, cameras[(first + i) % len(cameras)])
+                received = None if size is None or received is None else received + size
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(w) for w in range(concurrency)))
+        return requests / (time.perf_counter() - started), received
+
+
+async def command(client, camera):
+    await client.camera(camera).getDevState()    # the size of the body is not kept in the CGIResult
+
+
+async def snapshot(client, camera):
+    return len(await client.camera(camera).snapshot())
+
+
+def benchmark_io(results, quick: bool):
+    settings_path = src_dir / ".build_cache" / "benchmark_cameras.json"
+    settings_path.parent.mkdir(exist_ok=True)
+    process = start_simulator(64, settings_path)
+    try:
+        cameras = list(load_cameras(settings_path).values())
+        requests = 500 if quick else 2000
+        for concurrency in (1, 16, 64):
+            rate, _ = asyncio.run(throughput(cameras, concurrency, requests, command))
+            results.add(f"io.commands.c{concurrency}", rate, "commands/s", "higher")
+        for concurrency in (1, 16, 64):
+            rate, received = asyncio.run(throughput(cameras, concurrency, requests // 4, snapshot))
+            results.add(f"io.snapshots.c{concurrency}", rate, "snapshots/s", "higher")
+        results.add("io.snapshot_size", received / (requests // 4) / 1024, "KiB", None)
+    finally:
+        process.kill()
+        process.wait()
+
+
+def compare(results: dict, baseline: dict, threshold: float):
+    """
+    Prints the results that are worse than in the baseline by more than the threshold. Returns their count.
+    """
+    regressions = 0
+    for name, result in results.items():
+        old = baseline.get(name)
+        if old is None or not old["value"] or result["better"] is None:
+            continue
+        change = (result["value"] - old["value"]) / old["value"]
+        worse = change > threshold if result["better"] == "lower" else change < -threshold
+        if worse:
+            regressions += 1
+            print(f"REGRESSION {name}: {old['value']} -> {result['value']} {result['unit']} ({change:+.0%})")
+    return regressions
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark the build and the camera I/O of the Python tools.")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="a results file of an earlier run; exit with 1 if any result is worse")
+    parser.add_argument("--threshold", type=float, default=0.2, help="the allowed relative regression (default: 0.2)")
+    parser.add_argument("--quick", action="store_true", help="fewer repeats and a smaller scaled guide")
+    parser.add_argument("--skip-io", action="store_true", help="only benchmark the build")
+    args = parser.parse_args()
+
+    results = Results()
+    benchmark_build(results, args.quick)
+    if not args.skip_io:
+        benchmark_io(results, args.quick)
+    if args.output:
+        Path(args.output).write_text(json.dumps(results.as_dict(), indent=4))
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())["results"]
+        sys.exit(1 if compare(results.results, baseline, args.threshold) else 0)
@@ -0,0 +1,7 @@
+"""
+Python tools for Foscam CGI API compatible cameras, built on the commandJson parsed by parse_pdf_to_json.py.
+"""
+
+from .cameras import Camera, load_cameras, parse_camera_reference
+from .client import CameraClient, CameraError, CGIResult, FoscamClient, ParameterError
+from .commands import commandJson
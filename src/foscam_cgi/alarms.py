@@ -0,0 +1,151 @@
+"""
+Polls the alarm state (getDevState) of all the cameras and publishes only the changes, so that any number of
+subscribers (the index.html via server-sent events, or Python callbacks) share one poll per camera.
+
+The state of a camera is packed into one int of 2-bit fields (see state_fields), plus a bit for an unreachable
+camera, so that comparing the state of thousands of cameras is cheap.
+"""
+
+import asyncio
+import random
+import time
+
+from .client import CameraError
+
+# The getDevState values that are published: 0 = disabled, 1 = no alarm, 2 = alarm (record: 0 = no, 1 = recording)
+alarm_fields = ("motionDetectAlarm", "soundAlarm", "IOAlarm")
+state_fields = alarm_fields + ("record",)
+offline_bit = 1 << (2 * len(state_fields))
+
+
+def pack_state(values: dict):
+    state = 0
+    for i, field in enumerate(state_fields):
+        value = values.get(field, 0)
+        state |= (value if isinstance(value, int) and 0 <= value <= 3 else 0) << (2 * i)
+    return state
+
+
+def unpack_state(state: int):
+    if state & offline_bit:
+        return {"online": False}
+    return {"online": True, **{field: (state >> (2 * i)) & 3 for i, field in enumerate(state_fields)}}
+
+
+def is_alarm(state: int):
+    """
+    True if any of the alarms of the packed state is on.
+    """
+    return not state & offline_bit and any((state >> (2 * i)) & 3 == 2 for i in range(len(alarm_fields)))
+
+
+class AlarmPoller:
+    """
+    Calls getDevState on each added camera every `interval` seconds (+-`jitter` as a fraction, so that the
+    cameras are not polled in lockstep), at most `max_concurrent` at once. Each change of the state of a camera
+    is published as an event dict: {"camera": keyName, "cameraName", "time", "alarm": bool, "state": {...},
+    "changed": [fields]}.
+    """
+    def __init__(self, client, interval: float = 2.0, jitter: float = 0.25, max_concurrent: int = 32,
+                 subscriber_queue_size: int = 1000):
+        self.client = client
+        self.interval = interval
+        self.jitter = jitter
+        self.subscriber_queue_size = subscriber_queue_size
+        self.cameras = {}           # keyName -> Camera
+        self.states = {}            # keyName -> packed state, see pack_state()
+        self.listeners = []         # called with each event
+        self._queues = set()        # the asyncio.Queues of subscribe()
+        self._tasks = {}            # keyName -> the polling task of the camera, while running
+        self._slots = asyncio.Semaphore(max_concurrent)
+        self._running = False
+        self.stats = {"polls": 0, "errors": 0, "events": 0, "dropped": 0}
+
+    def add(self, camera):
+        self.cameras[camera.keyName] = camera
+        if self._running and camera.keyName not in self._tasks:
+            self._tasks[camera.keyName] = asyncio.ensure_future(self._poll_camera(camera))
+
+    def remove(self, camera):
+        self.cameras.pop(camera.keyName, None)
+        self.states.pop(camera.keyName, None)
+        task = self._tasks.pop(camera.keyName, None)
+        if task:
+            task.cancel()
+
+    def subscribe(self):
+        """
+        Returns an asyncio.Queue that receives the events. A subscriber that falls more than the queue size behind
+        loses the oldest events. Call unsubscribe(queue) when done.
+        """
+        queue = asyncio.Queue(self.subscriber_queue_size)
+        self._queues.add(queue)
+        return queue
+
+    def unsubscribe(self, queue):
+        self._queues.discard(queue)
+
+    def snapshot(self):
+        """
+        The current state of all the polled cameras: {keyName: {"online": ..., <state_fields>...}}.
+        """
+        return {keyName: unpack_state(state) for keyName, state in self.states.items()}
+
+    def _publish(self, camera, old, new):
+        state = unpack_state(new)
+        previous = unpack_state(old) if old is not None else {}
+        event = {
+            "camera": camera.keyName,
+            "cameraName": camera.cameraName,
+            "time": time.time(),
+            "alarm": is_alarm(new),
+            "state": state,
+            "changed": [field for field, value in state.items() if previous.get(field) != value],
+        }
+        self.stats["events"] += 1
+        for listener in self.listeners:
+            listener(event)
+        for queue in self._queues:
+            if queue.full():
+                queue.get_nowait()
+                self.stats["dropped"] += 1
+            queue.put_nowait(event)
+
+    async def poll_once(self, camera):
+        async with self._slots:
+            self.stats["polls"] += 1
+            try:
+                result = await self.client.camera(camera).getDevState()
+                new = pack_state(result.values) if result.ok else offline_bit
+            except CameraError:
+                self.stats["errors"] += 1
+                new = offline_bit
+        old = self.states.get(camera.keyName)
+        if camera.keyName not in self.cameras:
+            return      # removed while polling
+        self.states[camera.keyName] = new
+        if new != old:
+            self._publish(camera, old, new)
+
+    async def _poll_camera(self, camera):
+        await asyncio.sleep(random.uniform(0, self.interval))   # spread the first polls
+        while True:
+            started = time.monotonic()
+            await self.poll_once(camera)
+            delay = self.interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+            await asyncio.sleep(max(0.0, delay - (time.monotonic() - started)))
+
+    async def run(self):
+        """
+        Polls until cancelled.
+        """
+        self._running = True
+        for camera in self.cameras.values():
+            self.add(camera)
+        try:
+            await asyncio.Event().wait()
+        finally:
+            self._running = False
+            for task in self._tasks.values():
+                task.cancel()
+            self._tasks.clear()
@@ -0,0 +1,248 @@
+"""
+A time-lapse archive of the snapshots: every new frame of the SnapshotCache is appended to a segment file of its
+camera, instead of writing a file per frame. Each segment has a fixed-width index of (timestamp, offset, length,
+hash) records, which is memory-mapped and binary searched to read the frames of a time window without reading
+the whole segment. A frame identical to the previous frame of the camera is not stored again. The oldest segments
+are deleted when they are older than `max_age` or when the archive exceeds `max_bytes`.
+
+    <root>/<camera>/keyName                      the keyName of the camera
+    <root>/<camera>/<start time in ms>.seg       the JPEGs, back to back
+    <root>/<camera>/<start time in ms>.idx       the index records of the segment
+"""
+
+import hashlib
+import mmap
+import re
+import struct
+import time
+from pathlib import Path
+
+index_record = struct.Struct("<dQI8s")    # timestamp (unix seconds), offset, length, hash of the frame
+
+
+class Segment:
+    def __init__(self, base_path: Path):
+        self.data_path = base_path.with_suffix(".seg")
+        self.index_path = base_path.with_suffix(".idx")
+        self.start = int(base_path.name) / 1000
+        self.bytes = self.data_path.stat().st_size if self.data_path.exists() else 0
+        # A record is written after its frame, so a partial record at the end (e.g. after a crash) is ignored.
+        index_bytes = self.index_path.stat().st_size if self.index_path.exists() else 0
+        self.count = index_bytes // index_record.size
+        self.last = None            # (timestamp, hash) of the last record, read lazily
+        self._data = self._index = None
+
+    def append(self, timestamp: float, data: bytes, digest: bytes):
+        if self._data is None:
+            self._data = open(self.data_path, "ab")
+            self._index = open(self.index_path, "ab")
+            self._index.truncate(self.count * index_record.size)
+        self._data.write(data)
+        self._data.flush()
+        self._index.write(index_record.pack(timestamp, self.bytes, len(data), digest))
+        self._index.flush()
+        self.bytes += len(data)
+        self.count += 1
+        self.last = (timestamp, digest)
+
+    def last_record(self):
+        if self.last is None and self.count:
+            with open(self.index_path, "rb") as f:
+                f.seek((self.count - 1) * index_record.size)
+                timestamp, _, _, digest = index_record.unpack(f.read(index_record.size))
+            self.last = (timestamp, digest)
+        return self.last
+
+    def records(self, start: float, end: float):
+        """
+        Returns the (timestamp, offset, length) of the frames in [start, end).
+        """
+        if not self.count:
+            return []
+        with open(self.index_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as index:
+            def timestamp(i):
+                return index_record.unpack_from(index, i * index_record.size)[0]
+            low, high = 0, self.count
+            while low < high:   # the first record at or after start
+                middle = (low + high) // 2
+                if timestamp(middle) < start:
+                    low = middle + 1
+                else:
+                    high = middle
+            records = []
+            for i in range(low, self.count):
+                record_timestamp, offset, length, _ = index_record.unpack_from(index, i * index_record.size)
+                if record_timestamp >= end:
+                    break
+                records.append((record_timestamp, offset, length))
+            return records
+
+    def close(self):
+        if self._data is not None:
+            self._data.close()
+            self._index.close()
+            self._data = self._index = None
+
+    def delete(self):
+        self.close()
+        self.data_path.unlink(missing_ok=True)
+        self.index_path.unlink(missing_ok=True)
+
+
+class CameraArchive:
+    def __init__(self, directory: Path, keyName: str):
+        self.directory = directory
+        self.keyName = keyName
+        self.segments = [Segment(path.with_suffix("")) for path in sorted(directory.glob("*.seg"))]
+
+    @property
+    def bytes(self):
+        return sum(segment.bytes for segment in self.segments)
+
+
+def directory_name(keyName: str):
+    """
+    A file system safe and unique directory name for a camera.
+    """
+    readable = re.sub(r"[^A-Za-z0-9.-]+", "_", keyName).strip("_")[:64]
+    return f"{readable}-{hashlib.blake2b(keyName.encode(), digest_size=4).hexdigest()}"
+
+
+class Archive:
+    def __init__(self, root, max_age: float = 7 * 24 * 3600, max_bytes: int = 50 * 1024 ** 3,
+                 segment_bytes: int = 64 * 1024 ** 2, segment_seconds: float = 3600):
+        self.root = Path(root)
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self.segment_bytes = segment_bytes
+        self.segment_seconds = segment_seconds  # also the granularity of the eviction by age
+        self.cameras = {}                       # keyName -> CameraArchive
+        self.root.mkdir(parents=True, exist_ok=True)
+        for key_file in self.root.glob("*/keyName"):
+            keyName = key_file.read_text()
+            self.cameras[keyName] = CameraArchive(key_file.parent, keyName)
+        self.bytes = sum(camera.bytes for camera in self.cameras.values())
+        self.stats = {"frames": 0, "duplicates": 0, "errors": 0, "evicted_segments": 0}
+
+    def _camera(self, keyName: str):
+        archive = self.cameras.get(keyName)
+        if archive is None:
+            directory = self.root / directory_name(keyName)
+            directory.mkdir(exist_ok=True)
+            (directory / "keyName").write_text(keyName)
+            archive = self.cameras[keyName] = CameraArchive(directory, keyName)
+        return archive
+
+    def add(self, camera, frame):
+        """
+        Appends a snapshots.Frame of the camera. Can be used as a listener of the SnapshotCache.
+        """
+        try:
+            self.append(camera.keyName, frame.data, frame.timestamp, bytes.fromhex(frame.etag))
+        except OSError:     # e.g. the disk is full; the snapshots are still served
+            self.stats["errors"] += 1
+
+    def append(self, keyName: str, data: bytes, timestamp: float = None, digest: bytes = None):
+        archive = self._camera(keyName)
+        timestamp = time.time() if timestamp is None else timestamp
+        digest = digest or hashlib.blake2b(data, digest_size=8).digest()
+        segment = archive.segments[-1] if archive.segments else None
+        last = segment.last_record() if segment else None
+        if last is not None:
+            if last[1] == digest:
+                self.stats["duplicates"] += 1
+                return
+            timestamp = max(timestamp, last[0])     # keep the index sorted if the clock goes back
+        if segment is None or segment.bytes >= self.segment_bytes or timestamp - segment.start >= self.segment_seconds:
+            if segment is not None:
+                segment.close()
+            self.evict()
+            segment = Segment(archive.directory / f"{int(timestamp * 1000):015d}")
+            archive.segments.append(segment)
+        segment.append(timestamp, data, digest)
+        self.bytes += len(data)
+        self.stats["frames"] += 1
+
+    def evict(self, now: float = None):
+        """
+        Deletes the segments whose frames are all older than max_age, and then the oldest segments until the
+        archive fits in max_bytes. Called whenever a new segment is started.
+        """
+        cutoff = (time.time() if now is None else now) - self.max_age
+        for archive in self.cameras.values():
+            while archive.segments:
+                segments = archive.segments
+                end = segments[1].start if len(segments) > 1 else (segments[0].last_record() or (segments[0].start,))[0]
+                if end >= cutoff:
+                    break
+                self._delete(archive, 0)
+        while self.bytes > self.max_bytes:
+            candidates = [a for a in self.cameras.values() if len(a.segments) > 1]
+            if not candidates:
+                break
+            self._delete(min(candidates, key=lambda a: a.segments[0].start), 0)
+
+    def _delete(self, archive, index: int):
+        segment = archive.segments.pop(index)
+        self.bytes -= segment.bytes
+        segment.delete()
+        self.stats["evicted_segments"] += 1
+
+    def _records(self, keyName: str, start: float, end: float):
+        archive = self.cameras.get(keyName)
+        if archive is None:
+            return
+        segments = archive.segments
+        for i, segment in enumerate(segments):
+            if segment.start >= end:
+                break
+            if i + 1 < len(segments) and segments[i + 1].start <= start:
+                continue    # all the frames of this segment are before start
+            for record in segment.records(start, end):
+                yield segment, record
+
+    def timestamps(self, keyName: str, start: float = 0, end: float = float("inf")):
+        """
+        Returns the timestamps of the archived frames of the camera in [start, end).
+        """
+        return [timestamp for _, (timestamp, _, _) in self._records(keyName, start, end)]
+
+    def frames(self, keyName: str, start: float = 0, end: float = float("inf")):
+        """
+        Yields the (timestamp, JPEG bytes) of the archived frames of the camera in [start, end), reading only
+        those frames from the segments.
+        """
+        data_file = data_segment = None
+        try:
+            for segment, (timestamp, offset, length) in self._records(keyName, start, end):
+                if data_segment is not segment:
+                    if data_file:
+                        data_file.close()
+                    data_file, data_segment = open(segment.data_path, "rb"), segment
+                data_file.seek(offset)
+                yield timestamp, data_file.read(length)
+        finally:
+            if data_file:
+                data_file.close()
+
+    def frame_at(self, keyName: str, timestamp: float):
+        """
+        Returns the (timestamp, JPEG bytes) of the last archived frame at or before `timestamp`, or None.
+        """
+        archive = self.cameras.get(keyName)
+        if archive is None:
+            return None
+        for segment in reversed(archive.segments):
+            if segment.start <= timestamp:
+                records = segment.records(segment.start, timestamp + 1e-6)
+                if records:
+                    frame_timestamp, offset, length = records[-1]
+                    with open(segment.data_path, "rb") as f:
+                        f.seek(offset)
+                        return frame_timestamp, f.read(length)
+        return None
+
+    def close(self):
+        for archive in self.cameras.values():
+            for segment in archive.segments:
+                segment.close()
@@ -0,0 +1,260 @@
+"""
+Backs up the configuration of many cameras: every get* command without parameters is sent to every camera
+(concurrently across the cameras), and the results are stored content-addressed, so that a section (the values
+returned by one command) that is identical on many cameras or on many days is stored only once.
+
+    python3 -m foscam_cgi.backup run --settings FoscamApiExportedSettings.json --store backups
+    python3 -m foscam_cgi.backup list --store backups
+    python3 -m foscam_cgi.backup diff --store backups [<old snapshot> [<new snapshot>]]   (default: the latest two)
+    python3 -m foscam_cgi.backup show --store backups <snapshot> <camera keyName>
+
+    <store>/chunks/<2 hex>/<30 hex>    a section, or the manifest of a camera ({cmd: section hash}), zlib compressed
+    <store>/snapshots/<time>.json      {"time": ..., "cameras": {keyName: manifest hash}, "errors": {keyName: error}}
+
+The chunks are named by the BLAKE2b hash of their canonical JSON. A camera whose configuration has not changed
+since the last backup costs one line in the snapshot file. The values include the passwords of e.g. getFtpConfig
+and getSMTPConfig, so keep the store private.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import time
+import zlib
+from pathlib import Path
+
+from .cameras import load_cameras
+from .client import CameraError, FoscamClient
+from .commands import commandJson
+
+# Parameterless get* commands that do not read configuration:
+skipped_commands = {
+    "getDevState", "getSessionList", "getTemperatureState", "getMusicPlayState",    # the current state
+    "getRecordList", "getRecordList2",      # the recordings on the SD card
+    "getGeneratePubKey",                    # generates a new key
+}
+# Fields that change by themselves (the clock of the camera):
+volatile_fields = {
+    "getDevInfo": {"year", "mon", "day", "hour", "min", "sec"},
+    "getSystemTime": {"year", "mon", "day", "hour", "minute", "sec"},
+}
+
+
+def backup_commands():
+    return [cmd for cmd, command in commandJson.items()
+            if cmd.startswith("get") and not command["ExampleParams"] and cmd not in skipped_commands]
+
+
+def canonical_json(data):
+    return json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+class ChunkStore:
+    """
+    Immutable blobs named by their hash.
+    """
+    def __init__(self, root):
+        self.root = Path(root)
+        self._known = set()     # hashes known to be stored
+        self.stats = {"written": 0, "deduplicated": 0, "bytes_written": 0}
+
+    def _path(self, digest: str):
+        return self.root / digest[:2] / digest[2:]
+
+    def put(self, data: bytes):
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        if digest in self._known or self._path(digest).exists():
+            self.stats["deduplicated"] += 1
+        else:
+            path = self._path(digest)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            compressed = zlib.compress(data, 6)
+            temporary = path.with_suffix(".tmp")
+            temporary.write_bytes(compressed)
+            os.replace(temporary, path)     # a chunk is either complete or missing
+            self.stats["written"] += 1
+            self.stats["bytes_written"] += len(compressed)
+        self._known.add(digest)
+        return digest
+
+    def get(self, digest: str):
+        return zlib.decompress(self._path(digest).read_bytes())
+
+    def put_json(self, data):
+        return self.put(canonical_json(data))
+
+    def get_json(self, digest: str):
+        return json.loads(self.get(digest))
+
+
+class BackupStore:
+    def __init__(self, root):
+        self.root = Path(root)
+        self.chunks = ChunkStore(self.root / "chunks")
+        self.snapshot_dir = self.root / "snapshots"
+
+    def snapshots(self):
+        """
+        The names of the snapshots, oldest first.
+        """
+        return sorted(path.stem for path in self.snapshot_dir.glob("*.json"))
+
+    def load(self, name: str):
+        return json.loads((self.snapshot_dir / f"{name}.json").read_text())
+
+    def save(self, snapshot: dict):
+        self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+        name = time.strftime("%Y%m%dT%H%M%S", time.localtime(snapshot["time"]))
+        temporary = self.snapshot_dir / f"{name}.tmp"
+        temporary.write_text(json.dumps(snapshot, indent=1, sort_keys=True))
+        os.replace(temporary, self.snapshot_dir / f"{name}.json")
+        return name
+
+    def manifest(self, snapshot: dict, keyName: str):
+        """
+        {"sections": {cmd: hash}, "results": {cmd: <result> code or "error"}} of a camera in the snapshot.
+        """
+        return self.chunks.get_json(snapshot["cameras"][keyName])
+
+    def configuration(self, snapshot: dict, keyName: str):
+        """
+        {cmd: {param: value}} of a camera in the snapshot.
+        """
+        sections = self.manifest(snapshot, keyName)["sections"]
+        return {cmd: self.chunks.get_json(digest) for cmd, digest in sections.items()}
+
+
+def normalize(cmd: str, values: dict):
+    volatile = volatile_fields.get(cmd, ())
+    return {name: value for name, value in values.items() if name not in volatile}
+
+
+async def backup_camera(client, camera, commands, slots):
+    """
+    Returns ({cmd: values}, {cmd: result code or "error"}). Raises CameraError if the camera does not respond.
+    """
+    async def read(cmd):
+        async with slots:
+            return await client.camera(camera).command(cmd)
+
+    first = await read(commands[0])     # do not send all the commands to a camera that is not there
+    if first.result == -2:
+        raise CameraError(f"{camera.keyName}: {first.message}")
+    results = [first] + await asyncio.gather(*(read(cmd) for cmd in commands[1:]), return_exceptions=True)
+    sections, failed = {}, {}
+    for cmd, result in zip(commands, results):
+        if isinstance(result, CameraError):
+            failed[cmd] = "error"
+        elif isinstance(result, BaseException):
+            raise result
+        elif result.ok:
+            sections[cmd] = normalize(cmd, result.values)
+        else:
+            failed[cmd] = result.result    # e.g. -1 or -3 for a command that the model does not have
+    return sections, failed
+
+
+async def backup(client, cameras, store: BackupStore, max_concurrent: int = 256, commands=None):
+    """
+    Backs up the cameras into the store. Returns the name of the new snapshot.
+    """
+    commands = commands or backup_commands()
+    slots = asyncio.Semaphore(max_concurrent)
+    snapshot = {"time": time.time(), "cameras": {}, "errors": {}}
+
+    async def one(camera):
+        try:
+            sections, failed = await backup_camera(client, camera, commands, slots)
+        except CameraError as e:
+            snapshot["errors"][camera.keyName] = str(e)
+            return
+        manifest = {"sections": {cmd: store.chunks.put_json(values) for cmd, values in sections.items()},
+                    "results": failed}
+        snapshot["cameras"][camera.keyName] = store.chunks.put_json(manifest)
+
+    await asyncio.gather(*(one(camera) for camera in cameras))
+    return store.save(snapshot)
+
+
+def diff(store: BackupStore, old: dict, new: dict):
+    """
+    Compares two snapshots. Yields (keyName, cmd, {param: (old value, new value)}); cmd is None for a camera that
+    is only in one of the snapshots, and the diff is None for a section that is only in one of them.
+    """
+    for keyName in sorted(set(old["cameras"]) | set(new["cameras"])):
+        old_hash, new_hash = old["cameras"].get(keyName), new["cameras"].get(keyName)
+        if old_hash == new_hash:
+            continue        # the same manifest: no need to read the sections
+        if old_hash is None or new_hash is None:
+            yield keyName, None, None
+            continue
+        old_sections = store.chunks.get_json(old_hash)["sections"]
+        new_sections = store.chunks.get_json(new_hash)["sections"]
+        for cmd in sorted(set(old_sections) | set(new_sections)):
+            if old_sections.get(cmd) == new_sections.get(cmd):
+                continue
+            if cmd not in old_sections or cmd not in new_sections:
+                yield keyName, cmd, None
+                continue
+            old_values, new_values = store.chunks.get_json(old_sections[cmd]), store.chunks.get_json(new_sections[cmd])
+            yield keyName, cmd, {param: (old_values.get(param), new_values.get(param))
+                                 for param in sorted(set(old_values) | set(new_values))
+                                 if old_values.get(param) != new_values.get(param)}
+
+
+async def run(args, store):
+    cameras = list(load_cameras(args.settings).values())
+    started = time.monotonic()
+    async with FoscamClient(max_connections=2, pipeline_depth=2, timeout=args.timeout, retries=1) as client:
+        name = await backup(client, cameras, store, args.max_concurrent)
+    snapshot = store.load(name)
+    for keyName, error in snapshot["errors"].items():
+        print(f"{keyName}: {error}")
+    print(f"Snapshot {name}: {len(snapshot['cameras'])} cameras backed up, {len(snapshot['errors'])} failed, "
+          f"{time.monotonic() - started:.1f} s, {store.chunks.stats['written']} new chunks "
+          f"({store.chunks.stats['bytes_written'] / 1024:.0f} KiB), {store.chunks.stats['deduplicated']} deduplicated")
+    return 1 if snapshot["errors"] else 0
+
+
+def main(args):
+    store = BackupStore(args.store)
+    if args.action == "run":
+        if not args.settings:
+            raise SystemExit("run needs the cameras from --settings")
+        return asyncio.run(run(args, store))
+    names = store.snapshots()
+    if args.action == "list":
+        for name in names:
+            snapshot = store.load(name)
+            print(f"{name}  {len(snapshot['cameras'])} cameras, {len(snapshot['errors'])} failed")
+    elif args.action == "diff":
+        compared = args.names if len(args.names) == 2 else args.names + names[-1:] if args.names else names[-2:]
+        if len(compared) != 2:
+            raise SystemExit("diff needs two snapshots")
+        old_name, new_name = compared
+        print(f"{old_name} -> {new_name}")
+        for keyName, cmd, changes in diff(store, store.load(old_name), store.load(new_name)):
+            if cmd is None:
+                print(f"{keyName}: only in one of the snapshots")
+            elif changes is None:
+                print(f"{keyName}: {cmd}: only in one of the snapshots")
+            else:
+                print(f"{keyName}: {cmd}(" + ", ".join(f"{p}: {o!r} -> {n!r}" for p, (o, n) in changes.items()) + ")")
+    elif args.action == "show":
+        if len(args.names) != 2:
+            raise SystemExit("show needs a snapshot and a camera keyName")
+        print(json.dumps(store.configuration(store.load(args.names[0]), args.names[1]), indent=4, sort_keys=True))
+    return 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Back up the configuration of the cameras, deduplicated.")
+    parser.add_argument("action", choices=("run", "list", "diff", "show"))
+    parser.add_argument("names", nargs="*", help="diff: [old snapshot [new snapshot]], show: snapshot camera")
+    parser.add_argument("--store", required=True, help="the backup directory")
+    parser.add_argument("--settings", help="run: a settings file exported from the index.html")
+    parser.add_argument("--max-concurrent", type=int, default=256, help="the maximum concurrent requests in total (default: 256)")
+    parser.add_argument("--timeout", type=float, default=10.0, help="seconds to wait for a response (default: 10)")
+    raise SystemExit(main(parser.parse_intermixed_args()))
@@ -0,0 +1,157 @@
+"""
+Converts the bitmap parameters of setMotionDetectConfig, setAudioAlarmConfig, setScheduleRecordConfig etc. to and
+from NumPy boolean arrays, for any number of cameras at once. Requires NumPy (pip install numpy).
+
+    area0-area9          the motion detection area: 10 rows of 10 bits, bit 0 is the left column (1023 = all)
+    schedule0-schedule6  Monday to Sunday in 48 half hours, bit 0 is 00:00-00:30 (281474976710655 = all day)
+
+The arrays are (cameras, 10, 10) for the areas and (cameras, 7, 48) for the schedules, so that the usual NumPy
+operators combine them: `a | b` (union), `a & b` (intersection), `~a` (complement). A schedule can be written as
+rules separated by semicolons, e.g. "weekdays 18:00-07:00; weekends all day" (see parse_schedule()).
+"""
+
+import re
+
+import numpy as np
+
+area_rows = area_columns = 10
+days = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+slots_per_day = 48
+day_groups = {"daily": range(7), "everyday": range(7), "weekdays": range(5), "weekends": range(5, 7)}
+
+_time = re.compile(r"(\d{1,2}):(\d{2})")
+
+
+def decode_rows(values, bits: int):
+    """
+    Converts an array of row bitmask ints, shape (..., rows), to booleans, shape (..., rows, bits).
+    """
+    values = np.asarray(values, dtype=np.uint64)
+    return ((values[..., None] >> np.arange(bits, dtype=np.uint64)) & np.uint64(1)).astype(bool)
+
+
+def encode_rows(mask):
+    """
+    The inverse of decode_rows(): booleans (..., rows, bits) -> row bitmask ints (..., rows).
+    """
+    mask = np.asarray(mask, dtype=bool)
+    weights = np.left_shift(np.uint64(1), np.arange(mask.shape[-1], dtype=np.uint64))
+    return (mask * weights).sum(axis=-1, dtype=np.uint64)
+
+
+def _params_array(params, name: str, count: int):
+    if isinstance(params, dict):
+        params = [params]
+    return np.array([[int(p[f"{name}{i}"]) for i in range(count)] for p in params], dtype=np.uint64)
+
+
+def _params_dicts(values, name: str):
+    return [{f"{name}{i}": int(value) for i, value in enumerate(row)} for row in np.atleast_2d(values)]
+
+
+def decode_areas(params):
+    """
+    Reads the area0-area9 of one or more cameras (dicts such as CGIResult.values or commandJson ExampleParams).
+    Returns booleans of shape (cameras, 10, 10): [camera, row, column].
+    """
+    return decode_rows(_params_array(params, "area", area_rows), area_columns)
+
+
+def encode_areas(mask):
+    """
+    Returns a list of {"area0": int, ..., "area9": int}, one per camera of the (cameras, 10, 10) mask.
+    """
+    return _params_dicts(encode_rows(np.reshape(mask, (-1, area_rows, area_columns))), "area")
+
+
+def decode_schedules(params):
+    """
+    Reads the schedule0-schedule6 of one or more cameras. Returns booleans of shape (cameras, 7, 48):
+    [camera, day (0 = Monday), half hour (0 = 00:00-00:30)].
+    """
+    return decode_rows(_params_array(params, "schedule", len(days)), slots_per_day)
+
+
+def encode_schedules(mask):
+    """
+    Returns a list of {"schedule0": int, ..., "schedule6": int}, one per camera of the (cameras, 7, 48) mask.
+    """
+    return _params_dicts(encode_rows(np.reshape(mask, (-1, len(days), slots_per_day))), "schedule")
+
+
+def shift_schedule(mask, hours: float):
+    """
+    Shifts the schedules later by `hours` (a multiple of 0.5, may be negative), e.g. to convert a schedule written
+    for another time zone. The week wraps around: Sunday night continues to Monday morning.
+    """
+    slots = hours * 2
+    if slots != int(slots):
+        raise ValueError(f"The shift must be a multiple of half an hour, not {hours}")
+    mask = np.asarray(mask, dtype=bool)
+    week = mask.reshape(mask.shape[:-2] + (len(days) * slots_per_day,))
+    return np.roll(week, int(slots), axis=-1).reshape(mask.shape)
+
+
+def _parse_days(text: str):
+    selected = set()
+    for part in text.split(","):
+        part = part.strip()
+        if part in day_groups:
+            selected.update(day_groups[part])
+            continue
+        first, _, last = part.partition("-")
+        first, last = first[:3], (last or first)[:3]     # monday -> mon
+        if first not in days or last not in days:
+            raise ValueError(f"Unknown day {part!r}, use e.g. mon, mon-fri, weekdays, weekends or daily")
+        start, end = days.index(first), days.index(last)
+        selected.update((start + i) % len(days) for i in range((end - start) % len(days) + 1))
+    return sorted(selected)
+
+
+def _parse_slot(text: str):
+    match = _time.fullmatch(text.strip())
+    if not match or int(match[2]) not in (0, 30) or int(match[1]) * 2 + int(match[2]) // 30 > slots_per_day:
+        raise ValueError(f"Invalid time {text!r}, use full or half hours from 00:00 to 24:00")
+    return int(match[1]) * 2 + int(match[2]) // 30
+
+
+def parse_schedule(rules: str):
+    """
+    Parses schedule rules into a (7, 48) mask. Each rule is days followed by a time range or "all day", e.g.
+    "weekdays 18:00-07:00; sat,sun all day; wed 12:00-13:00". A range that ends before it starts continues
+    to the next day. Days: mon..sun, ranges such as mon-fri, lists such as mon,wed, weekdays, weekends, daily.
+    """
+    week = np.zeros((len(days), slots_per_day), dtype=bool)
+    for rule in filter(None, (r.strip().lower() for r in rules.split(";"))):
+        day_text, _, time_text = rule.partition(" ")
+        time_text = time_text.strip()
+        if time_text in ("", "all day"):
+            start, end = 0, slots_per_day
+        else:
+            start_text, separator, end_text = time_text.partition("-")
+            if not separator:
+                raise ValueError(f"Invalid time range {time_text!r}, use e.g. 18:00-07:00 or all day")
+            start, end = _parse_slot(start_text), _parse_slot(end_text)
+        for day in _parse_days(day_text):
+            if start < end:
+                week[day, start:end] = True
+            else:       # overnight
+                week[day, start:] = True
+                week[(day + 1) % len(days), :end] = True
+    return week
+
+
+def describe_schedule(mask):
+    """
+    The (7, 48) mask of one camera as text, e.g. "mon 00:00-07:00, 18:00-24:00; tue ...".
+    """
+    def clock(slot):
+        return f"{slot // 2:02d}:{slot % 2 * 30:02d}"
+
+    descriptions = []
+    for day, row in zip(days, np.asarray(mask, dtype=bool).reshape(len(days), slots_per_day)):
+        edges = np.flatnonzero(np.diff(np.concatenate(([0], row.astype(np.int8), [0]))))
+        ranges = [f"{clock(start)}-{clock(end)}" for start, end in zip(edges[::2], edges[1::2])]
+        if ranges:
+            descriptions.append(f"{day} {', '.join(ranges)}")
+    return "; ".join(descriptions)
@@ -0,0 +1,121 @@
+"""
+Camera addresses and credentials, and loading them from the settings file exported from the index.html
+(Add/Remove camera -> Export data). The Python tools use the same keyName as the html to identify a camera.
+"""
+
+import json
+from pathlib import Path
+
+# The version of the globals of the index.html (`globalsVersion` in index_template.html), for settings_document().
+globals_version = 5
+
+
+class Camera:
+    """
+    A camera as saved by the `Camera` class of the index.html.
+    """
+    def __init__(self, ip: str, user: str = "admin", password: str = "", cameraName: str = "", port=88, isOldSdCamera: bool = False,
+                 site: str = "", tags=(), model: str = ""):
+        self.ip = ip
+        self.port = int(port)
+        self.user = user
+        self.password = password
+        self.cameraName = cameraName
+        self.isOldSdCamera = isOldSdCamera # old standard definition cameras use a different API (IP Camera CGI V1.27)
+        self.site = site                    # optional grouping, only for the UI and the tools (see registry.py)
+        self.tags = list(tags)
+        self.model = model
+
+        self.keyName = f"{ip}:{port} ({user}) {cameraName}"  # the same format as in the index.html
+
+    @classmethod
+    def from_settings(cls, record: dict):
+        """
+        Creates a Camera from one entry of `globals.setup.cameras` of the exported settings.
+        """
+        camera = cls(record["ip"], record["user"], record.get("password", ""), record.get("cameraName", ""),
+                     record.get("port", 88), record.get("isOldSdCamera", False), record.get("site") or "",
+                     record.get("tags") or (), record.get("model") or "")
+        camera.keyName = record.get("keyName", camera.keyName)
+        return camera
+
+    def to_settings(self):
+        """
+        The entry of `globals.setup.cameras` for this camera, with the defaults of the index.html.
+        """
+        return {
+            "ip": self.ip, "port": self.port, "user": self.user, "password": self.password,
+            "cameraName": self.cameraName, "isOldSdCamera": self.isOldSdCamera, "keyName": self.keyName,
+            "site": self.site, "tags": list(self.tags), "model": self.model,
+            "motionDetectAreaTableState": "1" * 100,
+            "motionDetectScheduleTableState": "1" * 7 * 48,
+            "motionDetectLinkageTableState": "0111",
+            "ViewerSetupOptions": "0",
+        }
+
+    @property
+    def address(self):
+        return (self.ip, self.port)
+
+    def __repr__(self):
+        return f"Camera({self.keyName!r})"
+
+
+def load_cameras(exported_settings_path):
+    """
+    Reads the cameras from a settings file exported from the index.html, or from a camera registry database
+    (a .db or .sqlite file, see registry.py). Returns a dict of keyName -> Camera.
+    """
+    if Path(exported_settings_path).suffix in (".db", ".sqlite"):
+        from .registry import CameraRegistry
+        with CameraRegistry(exported_settings_path) as registry:
+            return registry.cameras()
+    globals_ = json.loads(Path(exported_settings_path).read_text())
+    return {
+        keyName: Camera.from_settings(record)
+        for keyName, record in globals_["setup"]["cameras"].items()
+    }
+
+
+def settings_document(cameras, base=None):
+    """
+    Returns a settings document that the index.html can import (Add/Remove camera -> Import), with the given
+    Cameras added. `base` is an existing exported settings dict to add them to; otherwise the other settings
+    are the defaults of the index.html.
+    """
+    if base is None:
+        views = ("Setup", "InitialSetup", "Status", "Basic", "Network", "Video", "Detector", "Record", "System",
+                 "PTZ", "Operate", "Custom", "ViewerSetup")
+        base = {
+            "setup": {"cameras": {}},
+            "selectedCamera": None,
+            "views": {view: {"isVisible": view == "Setup", "apiCommands": []} for view in views},
+            "customCommands": {},
+            "viewerConsecutiveImages": 3,
+            "viewerRefreshInterval_ms": 4000,
+            "viewerIsEnabled": False,
+            "viewerMosaic": False,
+            "version": globals_version,
+        }
+    for camera in cameras:
+        base["setup"]["cameras"][camera.keyName] = camera.to_settings()
+    if base.get("selectedCamera") is None and base["setup"]["cameras"]:
+        base["selectedCamera"] = next(iter(base["setup"]["cameras"]))
+    return base
+
+
+def parse_camera_reference(reference: str, cameras=None):
+    """
+    Resolves a camera reference: either a keyName of the given cameras, or an address in the form
+    `[user[:password]@]host[:port]`. The user defaults to admin and the password to empty, like in factory settings.
+    """
+    if cameras and reference in cameras:
+        return cameras[reference]
+    user, password = "admin", ""
+    credentials, separator, address = reference.rpartition("@")
+    if separator:
+        user, _, password = credentials.partition(":")
+    host, _, port = address.partition(":")
+    if not host:
+        raise ValueError(f"Not a camera name or address: {reference!r}")
+    return Camera(host, user, password, port=port or 88)
@@ -0,0 +1,226 @@
+"""
+An asyncio client for the CGIProxy.fcgi API of Foscam HD cameras. Every command of the parsed commandJson is
+a method of `CameraClient` (see the generated commands.py), e.g. `await cam.getDevState()`.
+
+    async with FoscamClient() as client:
+        cam = client.camera(Camera("192.168.1.123", "admin", "password"))
+        state = await cam.getDevState()
+        if state.ok:
+            print(state["motionDetectAlarm"])
+"""
+
+import asyncio
+import random
+import re
+import time
+import xml.etree.ElementTree as ElementTree
+
+from .cameras import Camera
+from .commands import Commands
+from .connection import ConnectionPool, HttpError
+from .urls import cgi_path, render_target, validate
+
+# The meanings of the <result> codes, as listed in the help of the index.html:
+result_codes = {
+    0: "Success",
+    -1: "CGI request string format error",
+    -2: "Username or password error",
+    -3: "Access denied",
+    -4: "CGI execute fail",
+    -5: "Timeout",
+    -7: "Unknown error",
+}
+
+_integer = re.compile(r"-?(0|[1-9][0-9]*)")
+
+
+class CameraError(Exception):
+    """
+    A command could not be sent to the camera, or the camera did not answer with a <CGI_Result>.
+    """
+
+
+class ParameterError(CameraError):
+    """
+    The parameters are not valid for the command (see urls.validate()), so it was not sent to the camera.
+    """
+
+
+class CGIResult:
+    """
+    The parsed <CGI_Result> response. Values that are integers in the XML are converted to int, others are str.
+    The values can be read like a dict: `result["isEnable"]`.
+    """
+    def __init__(self, cmd: str, result: int, values: dict):
+        self.cmd = cmd
+        self.result = result
+        self.values = values
+
+    @classmethod
+    def from_xml(cls, cmd: str, xml: bytes):
+        try:
+            root = ElementTree.fromstring(xml)
+        except ElementTree.ParseError as e:
+            raise CameraError(f"{cmd}: the response is not valid XML ({e})")
+        if root.tag != "CGI_Result":
+            raise CameraError(f"{cmd}: unexpected response <{root.tag}>")
+        values = {}
+        for element in root:
+            text = (element.text or "").strip()
+            values[element.tag] = int(text) if _integer.fullmatch(text) else text
+        result = values.pop("result", -7)
+        return cls(cmd, result if isinstance(result, int) else -7, values)
+
+    @property
+    def ok(self):
+        return self.result == 0
+
+    @property
+    def message(self):
+        return result_codes.get(self.result, f"Unknown result {self.result}")
+
+    def raise_for_result(self):
+        if not self.ok:
+            raise CameraError(f"{self.cmd}: {self.message} ({self.result})")
+        return self
+
+    def __getitem__(self, key):
+        return self.values[key]
+
+    def __contains__(self, key):
+        return key in self.values
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+    def as_dict(self):
+        return {"cmd": self.cmd, "result": self.result, **self.values}
+
+    def __repr__(self):
+        return f"CGIResult({self.cmd}, result={self.result}, {self.values})"
+
+
+def build_cgi_target(camera: Camera, cmd: str, params=None, path: str = cgi_path):
+    """
+    Returns the request target, in the same parameter order as getUrl() of the index.html: cmd, params, usr, pwd.
+    """
+    return render_target(camera, cmd, params, path)
+
+
+class CameraClient(Commands):
+    """
+    Sends commands to one camera over a pool of keep-alive connections. Failed requests (connection errors,
+    timeouts) are retried `retries` times with a jittered backoff. The timing of the commands is recorded in
+    `metrics` (a metrics.Metrics) if given.
+    """
+    def __init__(self, camera: Camera, max_connections: int = 2, pipeline_depth: int = 1,
+                 timeout: float = 10.0, connect_timeout: float = 3.0, retries: int = 2, retry_backoff: float = 0.2,
+                 metrics=None):
+        self.camera = camera
+        self.metrics = metrics
+        self.timeout = timeout
+        self.retries = retries
+        self.retry_backoff = retry_backoff
+        self.pool = ConnectionPool(camera.ip, camera.port, max_connections, pipeline_depth, connect_timeout)
+
+    async def get(self, target: str, timeout: float = None):
+        """
+        Sends a GET request with retries. Returns the HttpResponse.
+        """
+        for attempt in range(self.retries + 1):
+            try:
+                response = await self.pool.request(target, timeout or self.timeout)
+                if response.status != 200:
+                    raise CameraError(f"{self.camera.keyName}: HTTP {response.status} {response.reason}")
+                return response
+            except (HttpError, OSError, asyncio.TimeoutError, asyncio.IncompleteReadError) as e:
+                if attempt >= self.retries:
+                    raise CameraError(f"{self.camera.keyName}: {type(e).__name__}: {e}") from e
+                await asyncio.sleep(self.retry_backoff * (2 ** attempt) * random.uniform(0.5, 1.5))
+
+    async def _send(self, cmd: str, params=None):
+        """
+        Sends a CGI request. Returns (HttpResponse, start time) and records a failed request in `metrics`.
+        """
+        started = time.perf_counter()
+        try:
+            return await self.get(build_cgi_target(self.camera, cmd, params)), started
+        except CameraError as e:
+            if self.metrics is not None:
+                self.metrics.record_error(self.camera.keyName, cmd, e, time.perf_counter() - started)
+            raise
+
+    def _record(self, cmd: str, response, result: int, started: float):
+        if self.metrics is not None:
+            self.metrics.record(self.camera.keyName, cmd, response, result, time.perf_counter() - started)
+
+    def _result(self, cmd: str, response, started: float):
+        """
+        Parses the <CGI_Result> and records the request in `metrics`.
+        """
+        try:
+            result = CGIResult.from_xml(cmd, response.body)
+        except CameraError:
+            self._record(cmd, response, -7, started)
+            raise
+        self._record(cmd, response, result.result, started)
+        return result
+
+    async def command(self, cmd: str, **params):
+        """
+        Sends a CGI command and returns the parsed CGIResult. Raises ParameterError without sending the command if
+        the camera would reject the parameters.
+        """
+        problems = validate(cmd, params)
+        if problems:
+            raise ParameterError(f"{self.camera.keyName}: {cmd}: {'; '.join(problems)}")
+        response, started = await self._send(cmd, params)
+        return self._result(cmd, response, started)
+
+    async def snapshot(self, cmd: str = "snapPicture2"):
+        """
+        Returns a still image (jpg bytes). snapPicture2 returns the image itself, unlike snapPicture.
+        """
+        response, started = await self._send(cmd)
+        if response.headers.get("content-type", "").startswith("image/"):
+            self._record(cmd, response, 0, started)
+            return response.body
+        self._result(cmd, response, started).raise_for_result()
+        raise CameraError(f"{self.camera.keyName}: {cmd} did not return an image")
+
+    def close(self):
+        self.pool.close()
+
+
+class FoscamClient:
+    """
+    Clients for many cameras, created on demand and kept for reuse. The keyword arguments are passed to every
+    CameraClient: each camera gets its own connection pool and its own limit of concurrent requests.
+    """
+    def __init__(self, **camera_client_options):
+        self.camera_client_options = camera_client_options
+        self.clients = {}
+
+    def camera(self, camera: Camera):
+        client = self.clients.get(camera.keyName)
+        if client is None:
+            client = self.clients[camera.keyName] = CameraClient(camera, **self.camera_client_options)
+        return client
+
+    async def command_all(self, cameras, cmd: str, **params):
+        """
+        Sends the same command to all cameras concurrently. Returns a dict of keyName -> CGIResult or exception.
+        """
+        results = await asyncio.gather(*(self.camera(c).command(cmd, **params) for c in cameras), return_exceptions=True)
+        return {c.keyName: r for c, r in zip(cameras, results)}
+
+    def close(self):
+        for client in self.clients.values():
+            client.close()
+        self.clients = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,3414 @@
+"""
+Generated by parse_pdf_to_json.py from the Foscam CGI User Guide. Do not edit: add or fix commands at
+the end of parse_pdf_to_json.py instead.
+"""
+
+commandJson = {'getImageSetting': {'ExampleParams': None,
+                     'paramOptions': None,
+                     'Function': 'Get color attribute of video',
+                     'Privilege': 'admin'},
+ 'setBrightness': {'ExampleParams': {'brightness': '50'},
+                   'paramOptions': None,
+                   'Function': 'Set brightness of video',
+                   'Privilege': 'admin'},
+ 'setContrast': {'ExampleParams': {'constrast': '50'},
+                 'paramOptions': None,
+                 'Function': 'Set contrast of video',
+                 'Privilege': 'admin'},
+ 'setHue': {'ExampleParams': {'hue': '50'}, 'paramOptions': None, 'Function': 'Set hue of video', 'Privilege': 'admin'},
+ 'setSaturation': {'ExampleParams': {'saturation': '50'},
+                   'paramOptions': None,
+                   'Function': 'Set saturation of video',
+                   'Privilege': 'admin'},
+ 'setSharpness': {'ExampleParams': {'sharpness': '50'},
+                  'paramOptions': None,
+                  'Function': 'Set sharpness of video',
+                  'Privilege': 'admin'},
+ 'resetImageSetting': {'ExampleParams': None,
+                       'paramOptions': None,
+                       'Function': 'Reset color parameters to default value',
+                       'Privilege': 'admin'},
+ 'getMirrorAndFlipSetting': {'ExampleParams': None,
+                             'paramOptions': None,
+                             'Function': 'Get mirror and flip attribute of video',
+                             'Privilege': 'admin'},
+ 'mirrorVideo': {'ExampleParams': {'isMirror': '1'},
+                 'paramOptions': {'isMirror': {'optionsType': 'dict',
+                                               'options': {'false/disabled (0)': 0, 'true/enabled (1)': 1}}},
+                 'Function': 'Mirror video',
+                 'Privilege': 'admin'},
+ 'flipVideo': {'ExampleParams': {'isFlip': '1'},
+               'paramOptions': {'isFlip': {'optionsType': 'dict',
+                                           'options': {'false/disabled (0)': 0, 'true/enabled (1)': 1}}},
+               'Function': 'Flip video',
+               'Privilege': 'admin'},
+ 'getRatio': {'ExampleParams': None,
+              'paramOptions': None,
+              'Function': 'Get value for image distortion correction',
+              'Privilege': 'admin'},
+ 'setRatio': {'ExampleParams': {'ratio': '150'},
+              'paramOptions': None,
+              'Function': 'Set value for image distortion correction',
+              'Privilege': 'admin'},
+ 'getH264FrmRefMode': {'ExampleParams': None,
+                       'paramOptions': None,
+                       'Function': 'Get frame shipping reference mode of H264 encode stream',
+                       'Privilege': 'admin'},
+ 'setH264FrmRefMode': {'ExampleParams': {'mode': '0'},
+                       'paramOptions': None,
+                       'Function': 'Set frame shipping reference mode of H264 encode stream',
+                       'Privilege': 'admin'},
+ 'getScheduleRecordStreamChn': {'ExampleParams': None,
+                                'paramOptions': None,
+                                'Function': 'Get stream channel for schedule record',
+                                'Privilege': 'admin'},
+ 'setScheduleRecordStreamChn': {'ExampleParams': {'chn': '0'},
+                                'paramOptions': None,
+                                'Function': 'Set stream channel for schedule record',
+                                'Privilege': 'admin'},
+ 'setPwrFreq': {'ExampleParams': {'freq': 2},
+                'paramOptions': {'freq': {'optionsType': 'dict',
+                                          'options': {'60 Hz (0)': 0, '50 Hz (1)': 1, 'Outdoor mode (2)': 2}}},
+                'Function': 'Set power freq of sensor',
+                'Privilege': 'admin'},
+ 'getVideoStreamParam': {'ExampleParams': None,
+                         'paramOptions': None,
+                         'Function': 'Get video stream param',
+                         'Privilege': 'admin'},
+ 'setVideoStreamParam': {'ExampleParams': {'streamType': '0',
+                                           'resolution': '0',
+                                           'bitRate': '2097152',
+                                           'frameRate': '30',
+                                           'GOP': '30',
+                                           'isVBR': '0'},
+                         'paramOptions': {'streamType': {'optionsType': 'list', 'options': [0, 1, 2, 3]},
+                                          'resolution': {'optionsType': 'dict',
+                                                         'options': {'QHD/1536p (9)': 9,
+                                                                     'FullHD/1080p (7)': 7,
+                                                                     'HD/720p (0)': 0,
+                                                                     'VGA/480p (3)': 3,
+                                                                     'VGA 4:3 (1)': 1}},
+                                          'isVBR': {'optionsType': 'dict',
+                                                    'options': {'false/disabled (0)': 0, 'true/enabled (1)': 1}}},
+                         'Function': 'Set the video stream param of stream N. Good bitRates to try: 4194304, 2097152, '
+                                     '1048576, 524288, 262144, 131072 (or may have to be between 20480--2097152). Good '
+                                     'frameRates: 20, 15, 10, 5. GOP (key frame interval): P frames between I frame, '
+                                     'the suggested value is: X * frameRate, e.g. 40, 30, 20, 10.',
+                         'Privilege': 'admin'},
+ 'getSubVideoStreamParam': {'ExampleParams': None,
+                            'paramOptions': None,
+                            'Function': 'Get sub video stream param',
+                            'Privilege': 'visitor'},
+ 'setSubVideoStreamParam': {'ExampleParams': {'streamType': '0',
+                                              'resolution': '0',
+                                              'bitRate': '2097152',
+                                              'frameRate': '30',
+                                              'GOP': '30',
+                                              'isVBR': '0'},
+                            'paramOptions': {'streamType': {'optionsType': 'list', 'options': [0, 1, 2, 3]},
+                                             'resolution': {'optionsType': 'dict',
+                                                            'options': {'QHD/1536p (9)': 9,
+                                                                        'FullHD/1080p (7)': 7,
+                                                                        'HD/720p (0)': 0,
+                                                                        'VGA/480p (3)': 3,
+                                                                        'VGA 4:3 (1)': 1}},
+                                             'isVBR': {'optionsType': 'dict',
+                                                       'options': {'false/disabled (0)': 0, 'true/enabled (1)': 1}}},
+                            'Function': 'Set the sub video stream param of stream N',
+                            'Privilege': 'admin'},
+ 'getMainVideoStreamType': {'ExampleParams': None,
+                            'paramOptions': None,
+                            'Function': 'Get the stream type of main stream. The streamType can be 0,1,2 or 3. It is '
+                                        'basically a settings profile where you can save the video encoding settings, '
+                                        'and then easily switch between profiles. If you edit streamTypes other than '
+                                        'the currently active (0 by default), you must remember to also '
+                                        'setMainVideoStreamType to that number to take the new settings into use.',
+                            'Privilege': 'admin'},
+ 'getSubVideoStreamType': {'ExampleParams': None,
+                           'paramOptions': None,
+                           'Function': 'Get the stream type of sub stream',
+                           'Privilege': 'admin'},
+ 'setMainVideoStreamType': {'ExampleParams': {'streamType': '0'},
+                            'paramOptions': {'streamType': {'optionsType': 'list', 'options': [0, 1, 2, 3]}},
+                            'Function': 'Set the stream type of main stream',
+                            'Privilege': 'admin'},
+ 'setSubStreamFormat': {'ExampleParams': {'format': '0'},
+                        'paramOptions': None,
+                        'Function': 'Set the stream format of sub stream',
+                        'Privilege': 'admin'},
+ 'GetMJStream': {'ExampleParams': {},
+                 'paramOptions': None,
+                 'Function': 'Get motion jpeg stream',
+                 'Privilege': 'visitor'},
+ 'getOSDSetting': {'ExampleParams': None, 'paramOptions': None, 'Function': 'Get OSD config', 'Privilege': 'admin'},
+ 'setOSDSetting': {'ExampleParams': {'isEnableTimeStamp': '1',
+                                     'isEnableDevName': '1',
+                                     'dispPos': '0',
+                                     'isEnableOSDMask': '0'},
+                   'paramOptions': {'isEnableTimeStamp': {'optionsType': 'dict',
+                                                          'options': {'false/disabled (0)': 0, 'true/enabled (1)': 1}},
+                                    'isEnableDevName': {'optionsType': 'dict',
+                                                        'options': {'false/disabled (0)': 0, 'true/enabled (1)': 1}},
+                                    'isEnableOSDMask': {'optionsType': 'dict',
+                                                        'options': {'false/disabled (0)': 0, 'true/enabled (1)': 1}}},
+                   'Function': 'Set OSD config',
+                   'Privilege': 'admin'},
+ 'getOsdMaskArea': {'ExampleParams': None,
+                    'paramOptions': None,
+                    'Function': 'Get OSD mask area info',
+                    'Privilege': 'admin'},
+ 'setOsdMaskArea': {'ExampleParams': {'x1_0': '100',
+                                      'y1_0': '100',
+                                      'x2_0': '200',
+                                      'y2_0': '200',
+                                      'x1_1': '0',
+                                      'y1_1': '0',
+                                      'x2_1': '0',
+                                      'y2_1': '0',
+                                      'x1_2': '0',
+                                      'y1_2': '0',
+                                      'x2_2': '0',
+                                      'y2_2': '0',
+                                      'x1_3': '0',
+                                      'y1_3': '0',
+                                      'x2_3': '0',
+                                      'y2_3': '0'},
+                    'paramOptions': None,
+                    'Function': 'Set OSD mask area info',
+                    'Privilege': 'admin'},
+ 'getOSDMask': {'ExampleParams': None, 'paramOptions': None, 'Function': 'Get OSD mask status', 'Privilege': 'admin'},
+ 'setOSDMask': {'ExampleParams': {'isEnableOSDMask': '1'},
+                'paramOptions': {'isEnableOSDMask': {'optionsType': 'dict',
+                                                     'options': {'false/disabled (0)': 0, 'true/enabled (1)': 1}}},
+                'Function': 'Set OSD mask status',
+                'Privilege': 'admin'},
+ 'getMotionDetectConfig': {'ExampleParams': None,
+                           'paramOptions': None,
+                           'Function': 'Get motion detect config',
+                           'Privilege': 'admin'},
+ 'setMotionDetectConfig': {'ExampleParams': {'isEnable': '1',
+                                             'linkage': '14',
+                                             'snapInterval': '2',
+                                             'sensitivity': '1',
+                                             'triggerInterval': '5',
+                                             'isMovAlarmEnable': '1',
+                                             'isPirAlarmEnable': '1',
+                                             'area0': '1023',
+                                             'area1': '1023',
+                                             'area2': '1023',
+                                             'area3': '1023',
+                                             'area4': '1023',
+                                             'area5': '1023',
+                                             'area6': '1023',
+                                             'area7': '1023',
+                                             'area8': '1023',
+                                             'area9': '1023',
+                                             'schedule0': '281474976710655',
+                                             'schedule1': '281474976710655',
+                                             'schedule2': '281474976710655',
+                                             'schedule3': '281474976710655',
+                                             'schedule4': '281474976710655',
+                                             'schedule5': '281474976710655',
+                                             'schedule6': '281474976710655'},
+                           'paramOptions': {'isEnable': {'optionsType': 'dict',
+                                                         'options': {'false/disabled (0)': 0, 'true/enabled (1)': 1}},
+                                            'isMovAlarmEnable': {'optionsType': 'dict',
+                                                                 'options': {'false/disabled (0)': 0,
+                                                                             'true/enabled (1)': 1}},
+                                            'isPirAlarmEnable': {'optionsType': 'dict',
+                                                                 'options': {'false/disabled (0)': 0,
+                                                                             'true/enabled (1)': 1}},
+                                            'sensitivity': {'optionsType': 'dict',
+                                                            'options': {'Low (0)': 0,
+                                                                        'Medium (1)': 1,
+                                                                        'High (2)': 2,
+                                                                        'Lower (3)': 3,
+                                                                        'Lowest (4)': 4}}},
+                           'Function': 'Set motion detect config. NOTE: The motion detection area and schedule and '
+                                       'others must always be included, even if you for example only want to toggle '
+                                       "(enable) the 'isEnable'. For the area params '1023' and for schedule params "
+                                       "'281474976710655' mean that the motion detection is always enabled for the "
+                                       "entire image area. You can use the checkbox tables and their 'Apply' buttons "
+                                       'above to input the parameters without manually calculating the bitmaps. '
+                                       "'snapInterval' means the interval time to snap picture again. "
+                                       "'triggerInterval' means the time after which the motion detect alarm can "
+                                       'trigger again after a motion detection has happened (+ 5 seconds).',
+                           'Privilege': 'admin'},
+ 'setLocalAlarmRecordConfig': {'ExampleParams': {'isEnableLocalAlarmRecord': '1', 'localAlarmRecordSecs': '30'},
+                               'paramOptions': {'isEnableLocalAlarmRecord': {'optionsType': 'dict',
+                                                                             'options': {'false/disabled (0)': 0,
+                                                                                         'true/enabled (1)': 1}}},
+                               'Function': 'Set local alarm-record config',
+                               'Privilege': 'admin'},
+ 'getLocalAlarmRecordConfig': {'ExampleParams': None,
+                               'paramOptions': None,
+                               'Function': 'Get local alarm-record config',
+                               'Privilege': 'admin'},
+ 'getSnapConfig': {'ExampleParams': None, 'paramOptions': None, 'Function': 'Get snap config', 'Privilege': 'admin'},
+ 'setSnapConfig': {'ExampleParams': {'snapQuality': '1', 'saveLocation': '2'},
+                   'paramOptions': {'snapQuality': {'optionsType': 'dict',
+                                                    'options': {'Low quality (0)': 0,
+                                                                'Normal quality (1)': 1,
+                                                                'High quality (2)': 2}},
+                                    'saveLocation': {'optionsType': 'dict',
+                                                     'options': {'Save to sd card (0)': 0,
+                                                                 'Not in use now (1)': 1,
+                                                                 'Upload to FTP (2)': 2}}},
+                   'Function': 'Set snap config',
+                   'Privilege': 'admin'},
+ 'getScheduleSnapConfig': {'ExampleParams': None,
+                           'paramOptions': None,
+                           'Function': 'Get schedule snap config',
+                           'Privilege': 'admin'},
+ 'setScheduleSnapConfig': {'ExampleParams': {'isEnable': '0',
+                                             'snapInterval': '2',
+                                             'schedule0': '1023',
+                                             'schedule1': '1023',
+                                             'schedule2': '1023',
+                                             'schedule3': '1023',
+                                             'schedule4': '1023',
+                                             'schedule5': '1023',
+                                             'schedule6': '1023'},
+                           'paramOptions': {'isEnable': {'optionsType': 'dict',
+                                                         'options': {'false/disabled (0)': 0, 'true/enabled (1)': 1}}},
+                           'Function': 'Set schedule snap config. To figure out the values for schedule parameters, '
+                                       "you can possibly use the (motion detection) schedule table in the 'Detector' "
+                                       'view.',
+                           'Privilege': 'admin'},
+ 'snapPicture': {'ExampleParams': None,
+                 'paramOptions': None,
+                 'Function': 'Manual snap picture',
+                 'Privilege': 'visitor'},
+ 'snapPicture2': {'ExampleParams': None,
+                  'paramOptions': None,
+                  'Function': 'Manual snap picture. Get a jpg still image from the camera.',
+                  'Privilege': 'visitor'},
+ 'getRecordList': {'ExampleParams': {'recordPath': 0,
+                                     'startTime': 0,
+                                     'endTime': 2147483647,
+                                     'recordType': 0,
+                                     'startNo': 0},
+                   'paramOptions': None,
+                   'Function': 'Get record list. Returns at most 10 recordings (record0-record9) starting from '
+                               "'startNo', and 'totalCnt', the number of recordings from 'startTime' to 'endTime' "
+                               "(unix time). 'recordPath' as with setRecordPath. If recent recordings are missing, see "
+                               'reloadRecordindex.',
+                   'Privilege': 'admin'},
+ 'getRecordList2': {'ExampleParams': {'recordPath': 0,
+                                      'startTime': 0,
+                                      'endTime': 2147483647,
+                                      'recordType': 0,
+                                      'startNo': 0},
+                    'paramOptions': None,
+                    'Function': 'Get record list. Returns at most 10 recordings (record0-record9) starting from '
+                                "'startNo', and 'totalCnt', the number of recordings from 'startTime' to 'endTime' "
+                                "(unix time). 'recordPath' as with setRecordPath. If recent recordings are missing, "
+                                'see reloadRecordindex.',
+                    'Privilege': 'admin'},
+ 'reloadRecordindex': {'ExampleParams': None,
+                       'paramOptions': None,
+                       'Function': 'Synchronization of record index for Play',
+                       'Privilege': 'admin'},
+ 'getAlarmRecordConfig': {'ExampleParams': None,
+                          'paramOptions': None,
+                          'Function': 'Get alarm record config',
+                          'Privilege': 'admin'},
+ 'setAlarmRecordConfig': {'ExampleParams': {'isEnablePreRecord': '1', 'preRecordSecs': '5', 'alarmRecordSecs': '30'},
+                          'paramOptions': {'isEnablePreRecord': {'optionsType': 'dict',
+                                                                 'options': {'false/disabled (0)': 0,
+                                                                             'true/enabled (1)': 1}}},
+                          'Function': 'Set alarm record config',
+                          'Privilege': 'admin'},
+ 'getRecordPath': {'ExampleParams': None,
+                   'paramOptions': None,
+                   'Function': 'Get record path for storage',
+                   'Privilege': 'admin'},
+ 'setRecordPath': {'ExampleParams': {'path': 2},
+                   'paramOptions': {'path': {'optionsType': 'dict',
+                                             'options': {'SD card (0)': 0,
+                                                         'FTP server (2)': 2,
+                                                         'SD card and cloud (3)': 3}}},
+                   'Function': "Set record path for storage. How to read the response: 'setResult': 0 success, -1 Sd "
+                               'card is not exist, -2 Share direction is not set, -3 Not enough space, -4 Param error, '
+                               '-5 Param recording.',
+                   'Privilege': 'admin'},
+ 'getScheduleRecordConfig': {'ExampleParams': None,
+                             'paramOptions': None,
+                             'Function': 'Get config for schedule recording',
+                             'Privilege': 'admin'},
+ 'setScheduleRecordConfig': {'ExampleParams': {'isEnable': 0,
+                                               'recordLevel': '0',
+                                               'spaceFullMode': '0',
+                                               'isEnableAudio': '0',
+                                               'schedule0': 281474976710655,
+                                               'schedule1': 281474976710655,
+                                               'schedule2': 281474976710655,
+                                               'schedule3': 281474976710655,
+                                               'schedule4': 281474976710655,
+                                               'schedule5': 281474976710655,
+                                               'schedule6': 281474976710655},
+                             'paramOptions': {'isEnable': {'optionsType': 'dict',
+                                                           'options': {'false/disabled (0)': 0, 'true/enabled (1)': 1}},
+                                              'isEnableAudio': {'optionsType': 'dict',
+                                                                'options': {'false/disabled (0)': 0,
+                                                                            'true/enabled (1)': 1}},
+                                              'recordLevel': {'optionsType': 'dict',
+                                                              'options': {'Level for drop frame, 30/30 (0)': 0,
+                                                                          '24/30 (1)': 1,
+                                                                          '15/30 (2)': 2,
+                                                                          '8/30 (3)': 3,
+                                                                          '4/30 (4)': 4,
+                                                                          '1/30 (5)': 5}},
+                                              'spaceFullMode': {'optionsType': 'dict',
+                                                                'options': {'Overwrite the oldest video and continue recording (0)': 0,
+                                                                            'Stop recording (1)': 1}}},
+                             'Function': 'Set schedule recordconfig. (This can be disabled if you only want to record '
+                                         "a video clip when motion is detected.) The 'schedule' parameters work the "
+                                         'same way as with setMotionDetectConfig, so you can possibly use the table '
+                                         "under the 'Detector' category to figure out the correct values.",
+                             'Privilege': 'admin'},
+ 'setIOAlarmConfig': {'ExampleParams': {'isEnable': '1',
+                                        'linkage': '16',
+                                        'snapInterval': '2',
+                                        'alarmLevel': '1',
+                                        'triggerInterval': '5',
+                                        'schedule0': '1024',
+                                        'schedule1': '1024',
+                                        'schedule2': '1024',
+                                        'schedule3': '1024',
+                                        'schedule4': '1024',
+                                        'schedule5': '1024',
+                                        'schedule6': '1024'},
+                      'paramOptions': {'isEnable': {'optionsType': 'dict',
+                                                    'options': {'false/disabled (0)': 0, 'true/enabled (1)': 1}}},
+                      'Function': 'Set IO alarm config',
+                      'Privilege': 'admin'},
+ 'getIOAlarmConfig': {'ExampleParams': None,
+                      'paramOptions': None,
+                      'Function': 'Get IO alarm config',
+                      'Privilege': 'admin'},
+ 'clearIOAlarmOutput': {'ExampleParams': None,
+                        'paramOptions': None,
+                        'Function': 'Clean IO alarm output',
+                        'Privilege': 'admin'},
+ 'setAudioAlarmConfig': {'ExampleParams': {'isEnable': '1',
+                                           'linkage': 14,
+                                           'snapInterval': '2',
+                                           'sensitivity': '1',
+                                           'triggerInterval': '5',
+                                           'schedule0': 281474976710655,
+                                           'schedule1': 281474976710655,
+                                           'schedule2': 281474976710655,
+                                           'schedule3': 281474976710655,
+                                           'schedule4': 281474976710655,
+                                           'schedule5': 281474976710655,
+                                           'schedule6': 281474976710655},
+                         'paramOptions': {'isEnable': {'optionsType': 'dict',
+                                                       'options': {'false/disabled (0)': 0, 'true/enabled (1)': 1}},
+                                          'sensitivity': {'optionsType': 'dict',
+                                                          'options': {'Low (0)': 0,
+                                                                      'Medium (1)': 1,
+                                                                      'High (2)': 2,
+                                                                      'Lower (3)': 3,
+                                                                      'Lowest (4)': 4}}},
+                         'Function': "Set the sound detection config. For 'sensitivity' probably only 0, 1 and 2 work. "
+                                     "'Linkage' and 'schedule' work the same way as with setMotionDetectConfig above, "
+                                     'so you can use the table above to figure out the correct values.',
+                         'Privilege': 'admin'},
+ 'getAudioAlarmConfig': {'ExampleParams': {},
+                         'paramOptions': None,
+                         'Function': 'Get Audio alarm config',
+                         'Privilege': 'admin'},
+ 'setPCAudioAlarmCfg': {'ExampleParams': {'isEnablePCAudioAlarm': '1'},
+                        'paramOptions': {'isEnablePCAudioAlarm': {'optionsType': 'dict',
+                                                                  'options': {'false/disabled (0)': 0,
+                                                                              'true/enabled (1)': 1}}},
+                        'Function': 'Set audio alarm config for PC（web live video）',
+                        'Privilege': 'admin'},
+ 'getPCAudioAlarmCfg': {'ExampleParams': None,
+                        'paramOptions': None,
+                        'Function': 'Get audio alarm config for PC（web live video）',
+                        'Privilege': 'admin'},
+ 'getMultiDevList': {'ExampleParams': None,
+                     'paramOptions': None,
+                     'Function': 'Get multi device list',
+                     'Privilege': 'admin'},
+ 'getMultiDevDetailInfo': {'ExampleParams': None,
+                           'paramOptions': None,
+                           'Function': 'Get multi device information',
+                           'Privilege': 'admin'},
+ 'addMultiDev': {'ExampleParams': {'chnnl': '2',
+                                   'productType': 'H264',
+                                   'ip': '192.168.1.3',
+                                   'port': '88',
+                                   'mediaPort': '88',
+                                   'userName': 'admin',
+                                   'passWord': '',
+                                   'devName': 'FI9805W'},
+                 'paramOptions': None,
+                 'Function': 'Add multiy device',
+                 'Privilege': 'admin'},
+ 'delMultiDev': {'ExampleParams': {'chnnl': '2'},
+                 'paramOptions': None,
+                 'Function': 'Delete multiy device',
+                 'Privilege': 'admin'},
+ 'setDeFrameLevel': {'ExampleParams': {'level': '0'},
+                     'paramOptions': {'level': {'optionsType': 'dict',
+                                                'options': {'Disable the status of enhance (0)': 0,
+                                                            'Enable the status of enhance (1)': 1}}},
+                     'Function': 'Set status to enhance night vision definition',
+                     'Privilege': 'admin'},
+ 'getDeFrameLevel': {'ExampleParams': {},
+                     'paramOptions': None,
+                     'Function': 'Get status of enhance the night vision definition',
+                     'Privilege': 'admin'},
+ 'addAccount': {'ExampleParams': {'usrName': 'test', 'usrPwd': 'test', 'privilege': '0'},
+                'paramOptions': {'privilege': {'optionsType': 'dict',
+                                               'options': {'Visitor (0)': 0,
+                                                           'Operator (1)': 1,
+                                                           'Administrator (2)': 2}}},
+                'Function': 'Add user account',
+                'Privilege': 'admin'},
+ 'delAccount': {'ExampleParams': {'usrName': 'test'},
+                'paramOptions': None,
+                'Function': 'Delete user account',
+                'Privilege': 'admin'},
+ 'getPassword': {'ExampleParams': {'usrName': 'test'},
+                 'paramOptions': None,
+                 'Function': 'Get user password',
+                 'Privilege': 'admin'},
+ 'changePassword': {'ExampleParams': {'usrName': 'admin', 'oldPwd': '', 'newPwd': 'test'},
+                    'paramOptions': None,
+                    'Function': 'Change password',
+                    'Privilege': 'admin'},
+ 'changeUserName': {'ExampleParams': {'usrName': 'admin', 'newUsrName': 'newname'},
+                    'paramOptions': None,
+                    'Function': 'Change user name',
+                    'Privilege': 'admin'},
+ 'changeUserNameAndPwdTogether': {'ExampleParams': {'usrName': 'admin',
+                                                    'newUsrName': 'newname',
+                                                    'oldPwd': '',
+                                                    'newPwd': 'newpwd'},
+                                  'paramOptions': None,
+                                  'Function': 'Change user name and password together',
+                                  'Privilege': 'admin'},
+ 'logIn': {'ExampleParams': {'usrName': 'admin', 'remoteIp': '192.168.1.12', 'groupId': '673982479'},
+           'paramOptions': None,
+           'Function': 'User log in to camera',
+           'Privilege': 'visitor'},
+ 'logOut': {'ExampleParams': {'usrName': 'admin', 'ip': '192.168.1.12', 'groupId': '673982479'},
+            'paramOptions': None,
+            'Function': 'User log out to camera',
+            'Privilege': 'visitor'},
+ 'getSessionList': {'ExampleParams': None,
+                    'paramOptions': None,
+                    'Function': 'Get current session list of the camera',
+                    'Privilege': 'admin'},
+ 'getUserList': {'ExampleParams': None,
+                 'paramOptions': None,
+                 'Function': 'Get user account list of the camera',
+                 'Privilege': 'admin'},
+ 'usrBeatHeart': {'ExampleParams': {'usrName': 'admin', 'ip': '192.168.1.13', 'groupId': '673982479'},
+                  'paramOptions': None,
+                  'Function': 'user checks connection with camera',
+                  'Privilege': 'visitor'},
+ 'ptzMoveUp': {'ExampleParams': None, 'paramOptions': None, 'Function': 'Move up', 'Privilege': 'operator'},
+ 'ptzMoveDown': {'ExampleParams': None, 'paramOptions': None, 'Function': 'Move down', 'Privilege': 'operator'},
+ 'ptzMoveLeft': {'ExampleParams': None, 'paramOptions': None, 'Function': 'Move to left', 'Privilege': 'operator'},
+ 'ptzMoveRight': {'ExampleParams': None, 'paramOptions': None, 'Function': 'Move to right', 'Privilege': 'operator'},
+ 'ptzMoveTopLeft': {'ExampleParams': None,
+                    'paramOptions': None,
+                    'Function': 'Move to top left',
+                    'Privilege': 'operator'},
+ 'ptzMoveTopRight': {'ExampleParams': None,
+                     'paramOptions': None,
+                     'Function': 'Move to top right',
+                     'Privilege': 'operator'},
+ 'ptzMoveBottomLeft': {'ExampleParams': None,
+                       'paramOptions': None,
+                       'Function': 'Move to bottom left',
+                       'Privilege': 'operator'},
+ 'ptzMoveBottomRight': {'ExampleParams': None,
+                        'paramOptions': None,
+                        'Function': 'Move to bottom right',
+                        'Privilege': 'operator'},
+ 'ptzStopRun': {'ExampleParams': None, 'paramOptions': None, 'Function': 'Stop run PT', 'Privilege': 'operator'},
+ 'ptzReset': {'ExampleParams': None,
+              'paramOptions': None,
+              'Function': 'Reset PT to default position',
+              'Privilege': 'operator'},
+ 'getPTZSpeed': {'ExampleParams': None,
+                 'paramOptions': None,
+                 'Function': 'Get the speed of PT',
+                 'Privilege': 'operator'},
+ 'setPTZSpeed': {'ExampleParams': {'speed': '2'},
+                 'paramOptions': {'speed': {'optionsType': 'dict',
+                                            'options': {'Slowest (Opticam: Fastest) (0)': 0,
+                                                        'Slow (Opticam: Fast) (1)': 1,
+                                                        'Normal speed (2)': 2,
+                                                        'Fast (Opticam: Slow) (3)': 3,
+                                                        'Fastest (Opticam: Slowest) (4)': 4}}},
+                 'Function': 'Set the speed of PT',
+                 'Privilege': 'operator'},
+ 'getPTZPresetPointList': {'ExampleParams': None,
+                           'paramOptions': None,
+                           'Function': 'Get all preset point. The device can support at most 16 preset points. There '
+                                       'are four default points: LeftMost, RightMost, TopMost, BottomMost.',
+                           'Privilege': 'operator'},
+ 'ptzAddPresetPoint': {'ExampleParams': {'name': '1'},
+                       'paramOptions': None,
+                       'Function': 'Add preset point. The preset point position will be the current PT position. '
+                                   'Third-party applications usually use simply numbers (e.g. 1 or 5) as the names. If '
+                                   'a preset with the given name already exists, you may have to delete it first (see '
+                                   'ptzDeletePresetPoint).',
+                       'Privilege': 'admin'},
+ 'ptzDeletePresetPoint': {'ExampleParams': {'name': 'test'},
+                          'paramOptions': None,
+                          'Function': 'Delete preset point by name. If the preset is defined as the preset to go to '
+                                      'after boot, you may have to change that definition to something else first (see '
+                                      'setPTZPrePointForSelfTest).',
+                          'Privilege': 'admin'},
+ 'ptzGotoPresetPoint': {'ExampleParams': {'name': 'test'},
+                        'paramOptions': None,
+                        'Function': 'Goto preset position',
+                        'Privilege': 'operator'},
+ 'ptzGetCruiseMapList': {'ExampleParams': None,
+                         'paramOptions': None,
+                         'Function': 'Get all cruise map list',
+                         'Privilege': 'operator'},
+ 'ptzGetCruiseMapInfo': {'ExampleParams': {'name': '1'},
+                         'paramOptions': None,
+                         'Function': 'Get the detail info of a cruise map by name',
+                         'Privilege': 'operator'},
+ 'ptzSetCruiseMap': {'ExampleParams': {'name': 'test',
+                                       'point0': 'test0',
+                                       'point1': 'test1',
+                                       'point2': 'test2',
+                                       'point3': 'test3',
+                                       'point4': 'test4',
+                                       'point5': 'test5',
+                                       'point6': '',
+                                       'point7': ''},
+                     'paramOptions': None,
+                     'Function': 'Add a cruise map. Our device can support at most 8 preset point one cruise map. The '
+                                 "'name' is the name of the cruise map. The 'point' parameters are preset names.",
+                     'Privilege': 'admin'},
+ 'ptzDelCruiseMap': {'ExampleParams': {'name': 'test'},
+                     'paramOptions': None,
+                     'Function': 'Delete a cruise map',
+                     'Privilege': 'admin'},
+ 'ptzStartCruise': {'ExampleParams': {'mapName': 'test'},
+                    'paramOptions': None,
+                    'Function': 'Start a specificate cruise',
+                    'Privilege': 'operator'},
+ 'ptzStopCruise': {'ExampleParams': None,
+                   'paramOptions': None,
+                   'Function': 'Start current cruise',
+                   'Privilege': 'operator'},
+ 'setCruiseTime': {'ExampleParams': {'time': '5'},
+                   'paramOptions': None,
+                   'Function': 'Set time for continue cruise',
+                   'Privilege': 'operator'},
+ 'getCruiseTime': {'ExampleParams': {},
+                   'paramOptions': None,
+                   'Function': 'Get time for continue cruise. NOTE: The API PDF starting from here is full of errors '
+                               'and weird things, so the rest of the cruise commands probably contain some errors.',
+                   'Privilege': 'operator'},
+ 'setCruiseTimeCustomed': {'ExampleParams': {'time': '5', 'customed': '1'},
+                           'paramOptions': {'customed': {'optionsType': 'dict',
+                                                         'options': {'false/disabled (0)': 0, 'true/enabled (1)': 1}}},
+                           'Function': 'Set time for continue cruise by costomer',
+                           'Privilege': 'operator'},
+ 'getCruiseTimeCustomed': {'ExampleParams': None,
+                           'paramOptions': None,
+                           'Function': 'Get time for customed continue cruise.',
+                           'Privilege': 'operator'},
+ 'setCruiseLoopCnt': {'ExampleParams': {'count': '5'},
+                      'paramOptions': None,
+                      'Function': 'Set counts for continue cruise',
+                      'Privilege': 'operator'},
+ 'getCruiseLoopCnt': {'ExampleParams': None,
+                      'paramOptions': None,
+                      'Function': 'Set counts for continue cruise',
+                      'Privilege': 'operator'},
+ 'setCruiseCtrlMode': {'ExampleParams': {'mode': '0'},
+                       'paramOptions': {'mode': {'optionsType': 'dict',
+                                                 'options': {'By time (0)': 0, 'By loop count (1)': 1}}},
+                       'Function': 'Set control mode for continue cruise, by time or count',
+                       'Privilege': 'operator'},
+ 'getCruiseCtrlMode': {'ExampleParams': None,
+                       'paramOptions': None,
+                       'Function': 'Get control mode for continue cruise, by time or count',
+                       'Privilege': 'operator'},
+ 'setCruisePrePointLingerTime': {'ExampleParams': {'name': '123',
+                                                   'time0': '0',
+                                                   'time1': '1',
+                                                   'time2': '2',
+                                                   'time3': '3',
+                                                   'time4': '4',
+                                                   'time5': '5',
+                                                   'time6': '6',
+                                                   'time7': '7'},
+                                 'paramOptions': None,
+                                 'Function': 'Set linger time for cruise,when pt arrive prepoint',
+                                 'Privilege': 'operator'},
+ 'getCruisePrePointLingerTime': {'ExampleParams': {'name': 'test'},
+                                 'paramOptions': None,
+                                 'Function': 'Set linger time for cruise,when pt arrive prepoint',
+                                 'Privilege': 'operator'},
+ 'zoomIn': {'ExampleParams': None, 'paramOptions': None, 'Function': 'Zoom in', 'Privilege': 'operator'},
+ 'zoomOut': {'ExampleParams': None, 'paramOptions': None, 'Function': 'Zoom out', 'Privilege': 'operator'},
+ 'zoomStop': {'ExampleParams': None, 'paramOptions': None, 'Function': 'Stop zoom run', 'Privilege': 'operator'},
+ 'getZoomSpeed': {'ExampleParams': None,
+                  'paramOptions': None,
+                  'Function': 'Get the speed of Zoom',
+                  'Privilege': 'operator'},
+ 'setZoomSpeed': {'ExampleParams': {'speed': '1'},
+                  'paramOptions': {'speed': {'optionsType': 'dict',
+                                             'options': {'Slow (or Fast?) (0)': 0,
+                                                         'Normal (1)': 1,
+                                                         'Fast (or Slow?) (2)': 2}}},
+                  'Function': 'Set the speed of PTZ',
+                  'Privilege': 'operator'},
+ 'setPTZSelfTestMode': {'ExampleParams': {'mode': '2'},
+                        'paramOptions': {'mode': {'optionsType': 'dict',
+                                                  'options': {'No selftest (0)': 0,
+                                                              'Normal selftest (1)': 1,
+                                                              'After selftest, goto presetpoint set with setPTZPrePointForSelfTest (2)': 2}}},
+                        'Function': 'Set the selftest mode of PTZ',
+                        'Privilege': 'operator'},
+ 'getPTZSelfTestMode': {'ExampleParams': None,
+                        'paramOptions': None,
+                        'Function': 'Get the selftest mode of PTZ',
+                        'Privilege': 'operator'},
+ 'setPTZPrePointForSelfTest': {'ExampleParams': {'name': '1'},
+                               'paramOptions': None,
+                               'Function': 'Set presetpoint for selftest of PTZ. This setting defines the position of '
+                                           'PTZ after the camera boots. Set the preset name with this, and enable mode '
+                                           "2 with 'setPTZSelfTestMode'.",
+                               'Privilege': 'operator'},
+ 'getPTZPrePointForSelfTest': {'ExampleParams': None,
+                               'paramOptions': None,
+                               'Function': 'Get the presetpoint for selftest of PTZ',
+                               'Privilege': 'operator'},
+ 'set485Info': {'ExampleParams': {'rs485Protocol': '0',
+                                  'rs485Addr': '1',
+                                  'rs485Baud': '1200',
+                                  'rs485DataBit': '7',
+                                  'rs485StopBit': '1',
+                                  'rs485Check': '0'},
+                'paramOptions': None,
+                'Function': 'Set informations of 485',
+                'Privilege': 'operator'},
+ 'get485Info': {'ExampleParams': {},
+                'paramOptions': None,
+                'Function': 'Get informations of 485',
+                'Privilege': 'operator'},
+ 'getIPInfo': {'ExampleParams': None, 'paramOptions': None, 'Function': 'Get IP Info', 'Privilege': 'admin'},
+ 'setIpInfo': {'ExampleParams': {'isDHCP': 1,
+                                 'ip': '192.168.1.88',
+                                 'gate': '192.168.1.1',
+                                 'mask': '255.255.255.0',
+                                 'dns1': '8.8.8.8',
+                                 'dns2': '192.168.1.1'},
+               'paramOptions': {'isDHCP': {'optionsType': 'dict',
+                                           'options': {'false/disabled (0)': 0, 'true/enabled (1)': 1}}},
+               'Function': 'Set IP Info',
+               'Privilege': 'admin'},
+ 'refreshWifiList': {'ExampleParams': None,
+                     'paramOptions': None,
+                     'Function': 'Start scan the aps around',
+                     'Privilege': 'admin'},
+ 'getWifiList': {'ExampleParams': {'startNo': '0'},
+                 'paramOptions': None,
+                 'Function': 'Get the aps around after refreshWifiList',
+                 'Privilege': 'admin'},
+ 'setWifiSetting': {'ExampleParams': {'isEnable': '1',
+                                      'isUseWifi': '1',
+                                      'ssid': 'wifi_SSID',
+                                      'netType': '0',
+                                      'encryptType': 3,
+                                      'psk': 'wifi_password',
+                                      'authMode': 2,
+                                      'keyFormat': '0',
+                                      'defaultKey': '1',
+                                      'key1': '',
+                                      'key2': '',
+                                      'key3': '',
+                                      'key4': '',
+                                      'key1Len': '64',
+                                      'key2Len': '64',
+                                      'key3Len': '64',
+                                      'key4Len': '64'},
+                    'paramOptions': {'isEnable': {'optionsType': 'dict',
+                                                  'options': {'false/disabled (0)': 0, 'true/enabled (1)': 1}},
+                                     'isUseWifi': {'optionsType': 'dict',
+                                                   'options': {'false/disabled (0)': 0, 'true/enabled (1)': 1}},
+                                     'encryptType': {'optionsType': 'dict',
+                                                     'options': {'Open mode (0)': 0,
+                                                                 'WEP (1)': 1,
+                                                                 'WPA (2)': 2,
+                                                                 'WPA2 (3)': 3,
+                                                                 'WPA/WPA2 (4)': 4}}},
+                    'Function': "Set wifi config. Give 'ssid' and 'psk'. Others you can usually ignore and leave as "
+                                'defaults.',
+                    'Privilege': 'admin'},
+ 'getWifiConfig': {'ExampleParams': None, 'paramOptions': None, 'Function': 'Get wifi config', 'Privilege': 'admin'},
+ 'getPortInfo': {'ExampleParams': None, 'paramOptions': None, 'Function': 'Get ports of camera', 'Privilege': 'admin'},
+ 'setPortInfo': {'ExampleParams': {'webPort': '88', 'mediaPort': '88', 'httpsPort': '443', 'onvifPort': '888'},
+                 'paramOptions': None,
+                 'Function': 'Set ports of camera',
+                 'Privilege': 'admin'},
+ 'getUPnPConfig': {'ExampleParams': None, 'paramOptions': None, 'Function': 'Get UpnP config', 'Privilege': 'admin'},
+ 'setUPnPConfig': {'ExampleParams': {'isEnable': '1'},
+                   'paramOptions': {'isEnable': {'optionsType': 'dict',
+                                                 'options': {'false/disabled (0)': 0, 'true/enabled (1)': 1}}},
+                   'Function': 'Set UpnP config',
+                   'Privilege': 'admin'},
+ 'getDDNSConfig': {'ExampleParams': None, 'paramOptions': None, 'Function': 'Get DDNS config', 'Privilege': 'admin'},
+ 'setDDNSConfig': {'ExampleParams': {'isEnable': 0,
+                                     'hostName': 'test.dyndns.org',
+                                     'ddnsServer': '4',
+                                     'user': 'test',
+                                     'password': 'test'},
+                   'paramOptions': {'isEnable': {'optionsType': 'dict',
+                                                 'options': {'false/disabled (0)': 0, 'true/enabled (1)': 1}},
+                                    'ddnsServer': {'optionsType': 'dict',
+                                                   'options': {'Factory DDNS (0)': 0,
+                                                               'Oray (1)': 1,
+                                                               '3322 (2)': 2,
+                                                               'no-ip (3)': 3,
+                                                               'dyndns (4)': 4}}},
+                   'Function': 'Set DDNS config',
+                   'Privilege': 'admin'},
+ 'setFtpConfig': {'ExampleParams': {'ftpAddr': 'ftp://192.168.1.2/sbuDir',
+                                    'ftpPort': '21',
+                                    'mode': '0',
+                                    'userName': 'test',
+                                    'password': 'test'},
+                  'paramOptions': {'mode': {'optionsType': 'dict',
+                                            'options': {'PASV mode (0)': 0, 'PORT mode (1)': 1}}},
+                  'Function': 'Set FTP config',
+                  'Privilege': 'admin'},
+ 'getFtpConfig': {'ExampleParams': None, 'paramOptions': None, 'Function': 'Get FTP config', 'Privilege': 'admin'},
+ 'testFtpServer': {'ExampleParams': {'ftpAddr': 'ftp://192.168.1.2/sbuDir',
+                                     'ftpPort': '21',
+                                     'mode': '0',
+                                     'fptuserName': 'test',
+                                     'ftppassword': 'test'},
+                   'paramOptions': {'mode': {'optionsType': 'dict',
+                                             'options': {'PASV mode (0)': 0, 'PORT mode (1)': 1}}},
+                   'Function': 'Test FTP server',
+                   'Privilege': 'admin'},
+ 'getSMTPConfig': {'ExampleParams': None, 'paramOptions': None, 'Function': 'Get mail config', 'Privilege': 'admin'},
+ 'setSMTPConfig': {'ExampleParams': {'isEnable': '1',
+                                     'server': 'smtp.gmail.com',
+                                     'port': '465',
+                                     'isNeedAuth': '1',
+                                     'user': 'youraccount@gmail.com',
+                                     'password': 'your_gmail_account_app_password',
+                                     'sender': 'youraccount@gmail.com',
+                                     'reciever': 'youraccount@gmail.com,anotherreceiver@gmail.com',
+                                     'tls': '1'},
+                   'paramOptions': {'isEnable': {'optionsType': 'dict',
+                                                 'options': {'false/disabled (0)': 0, 'true/enabled (1)': 1}},
+                                    'isNeedAuth': {'optionsType': 'dict',
+                                                   'options': {'false/disabled (0)': 0, 'true/enabled (1)': 1}},
+                                    'tls': {'optionsType': 'dict',
+                                            'options': {'none (0)': 0,
+                                                        'TLS (use this for Gmail) (1)': 1,
+                                                        'STARTTLS (2)': 2}}},
+                   'Function': 'Set mail config. Defaults work with Gmail. You have to enable 2-step verification for '
+                               'your Gmail account and then create an app password in Google account settings. Gmail '
+                               'probably also supports STARTTLS with port 587 or 25. For Hotmail use STARTTLS with '
+                               'port 587 or 25. Maximum length of password may be 16.',
+                   'Privilege': 'admin'},
+ 'smtpTest': {'ExampleParams': {'smtpServer': 'smtp.gmail.com',
+                                'port': '465',
+                                'isNeedAuth': '1',
+                                'user': 'youraccount@gmail.com',
+                                'password': 'your_gmail_account_app_password',
+                                'sender': 'youraccount@gmail.com'},
+              'paramOptions': {'isNeedAuth': {'optionsType': 'dict',
+                                              'options': {'false/disabled (0)': 0, 'true/enabled (1)': 1}}},
+              'Function': 'Test mail setting',
+              'Privilege': 'admin'},
+ 'setP2PEnable': {'ExampleParams': {'enable': 0},
+                  'paramOptions': {'enable': {'optionsType': 'dict',
+                                              'options': {'false/disabled (0)': 0, 'true/enabled (1)': 1}}},
+                  'Function': 'Set p2p status',
+                  'Privilege': 'admin'},
+ 'getP2PEnable': {'ExampleParams': None, 'paramOptions': None, 'Function': 'Get p2p status', 'Privilege': 'admin'},
+ 'setP2PPort': {'ExampleParams': {'port': '12345'},
+                'paramOptions': None,
+                'Function': 'Set p2p port',
+                'Privilege': 'admin'},
+ 'getP2PPort': {'ExampleParams': None, 'paramOptions': None, 'Function': 'Get p2p port', 'Privilege': 'admin'},
+ 'getP2PInfo': {'ExampleParams': None, 'paramOptions': None, 'Function': 'Get p2p UID', 'Privilege': 'admin'},
+ 'getPPPoEConfig': {'ExampleParams': None, 'paramOptions': None, 'Function': 'Get PPPoE config', 'Privilege': 'admin'},
+ 'setPPPoEConfig': {'ExampleParams': {'isEnable': '1', 'userName': 'usr', 'password': 'pwd'},
+                    'paramOptions': {'isEnable': {'optionsType': 'dict',
+                                                  'options': {'false/disabled (0)': 0, 'true/enabled (1)': 1}}},
+                    'Function': 'Set PPPoE config',
+                    'Privilege': 'admin'},
+ 'setSystemTime': {'ExampleParams': {'timeSource': '0',
+                                     'ntpServer': 'Auto',
+                                     'dateFormat': '0',
+                                     'timeFormat': '1',
+                                     'timeZone': '0',
+                                     'isDst': '0',
+                                     'dst': '0',
+                                     'year': '2022',
+                                     'mon': '1',
+                                     'day': '6',
+                                     'hour': '9',
+                                     'minute': '35',
+                                     'sec': '0'},
+                   'paramOptions': {'timeSource': {'optionsType': 'dict',
+                                                   'options': {'NTP (0)': 0, 'set time manually below (1)': 1}},
+                                    'timeFormat': {'optionsType': 'dict', 'options': {'12 h (0)': 0, '24 h (1)': 1}},
+                                    'dateFormat': {'optionsType': 'dict',
+                                                   'options': {'YYYY-MM-DD (0)': 0,
+                                                               'DD/MM/YYYY (1)': 1,
+                                                               'MM/DD/YYYY (2)': 2}},
+                                    'isDst': {'optionsType': 'dict',
+                                              'options': {'false/disabled (0)': 0, 'true/enabled (1)': 1}}},
+                   'Function': 'Set system time. timeZone is the seconds between local time and GMT time. For example: '
+                               'timeZone=-7200 presents GMT+2 time (e.g. Finland), timeZone=3600 presents GMT-01:00, '
+                               'and timeZone=-3600 presents GMT+01:00',
+                   'Privilege': 'admin'},
+ 'getSystemTime': {'ExampleParams': None, 'paramOptions': None, 'Function': 'Get system time', 'Privilege': 'admin'},
+ 'openInfraLed': {'ExampleParams': None,
+                  'paramOptions': None,
+                  'Function': "Force open infra led. The 'setInfraLedConfig' mode must be 1 (manual) for this to work.",
+                  'Privilege': 'admin'},
+ 'closeInfraLed': {'ExampleParams': None,
+                   'paramOptions': None,
+                   'Function': "Force close infra led. The 'setInfraLedConfig' mode must be 1 (manual) for this to "
+                               'work.',
+                   'Privilege': 'admin'},
+ 'getInfraLedConfig': {'ExampleParams': None,
+                       'paramOptions': None,
+                       'Function': 'Get infra led config',
+                       'Privilege': 'admin'},
+ 'setInfraLedConfig': {'ExampleParams': {'mode': 0},
+                       'paramOptions': {'mode': {'optionsType': 'dict',
+                                                 'options': {'Auto mode (0)': 0, 'Manual mode (1)': 1}}},
+                       'Function': 'Set infra led config',
+                       'Privilege': 'admin'},
+ 'getScheduleInfraLedConfig': {'ExampleParams': None,
+                               'paramOptions': None,
+                               'Function': 'Get config for infra led switch schedule',
+                               'Privilege': 'admin'},
+ 'setScheduleInfraLedConfig': {'ExampleParams': {'mode': ''},
+                               'paramOptions': None,
+                               'Function': 'Set config for infra led switch schedule',
+                               'Privilege': 'admin'},
+ 'getDevState': {'ExampleParams': None, 'paramOptions': None, 'Function': 'Get all device state', 'Privilege': 'admin'},
+ 'getDevName': {'ExampleParams': None, 'paramOptions': None, 'Function': 'Get camera name', 'Privilege': 'admin'},
+ 'setDevName': {'ExampleParams': {'devName': 'test'},
+                'paramOptions': None,
+                'Function': 'Set camera name',
+                'Privilege': 'admin'},
+ 'getDevInfo': {'ExampleParams': None,
+                'paramOptions': None,
+                'Function': 'Get camera information',
+                'Privilege': 'admin'},
+ 'getProductModel': {'ExampleParams': None,
+                     'paramOptions': None,
+                     'Function': 'Get camera model number',
+                     'Privilege': 'visitor'},
+ 'getProductModelName': {'ExampleParams': None,
+                         'paramOptions': None,
+                         'Function': 'Get camera model name',
+                         'Privilege': 'visitor'},
+ 'getProductLanguage': {'ExampleParams': None,
+                        'paramOptions': None,
+                        'Function': 'Get camera main language',
+                        'Privilege': 'visitor'},
+ 'getProductSensorType': {'ExampleParams': None,
+                          'paramOptions': None,
+                          'Function': 'Get camera sensor type number',
+                          'Privilege': 'visitor'},
+ 'getProductWifiType': {'ExampleParams': None,
+                        'paramOptions': None,
+                        'Function': 'Get camera wifi type number',
+                        'Privilege': 'visitor'},
+ 'getProductSdFlag': {'ExampleParams': None,
+                      'paramOptions': None,
+                      'Function': 'Whether camera support sd card',
+                      'Privilege': 'visitor'},
+ 'getProductOutdoorFlag': {'ExampleParams': None,
+                           'paramOptions': None,
+                           'Function': 'Whether camera is outdoor machine',
+                           'Privilege': 'visitor'},
+ 'getProductPtFlag': {'ExampleParams': None,
+                      'paramOptions': None,
+                      'Function': 'Whether camera is pt machine',
+                      'Privilege': 'visitor'},
+ 'getProductZoomFlag': {'ExampleParams': None,
+                        'paramOptions': None,
+                        'Function': 'Whether camera is zoom machine',
+                        'Privilege': 'visitor'},
+ 'getProductRs485Flag': {'ExampleParams': None,
+                         'paramOptions': None,
+                         'Function': 'Whether camera support rs485',
+                         'Privilege': 'visitor'},
+ 'getProductIoAlarmFlag': {'ExampleParams': None,
+                           'paramOptions': None,
+                           'Function': 'Whether camera support IO alarm',
+                           'Privilege': 'visitor'},
+ 'getProductOnvifFlag': {'ExampleParams': None,
+                         'paramOptions': None,
+                         'Function': 'Whether camera support Onvif',
+                         'Privilege': 'visitor'},
+ 'getProductP2pFlag': {'ExampleParams': None,
+                       'paramOptions': None,
+                       'Function': 'Whether camera support P2p',
+                       'Privilege': 'visitor'},
+ 'getProductWpsFlag': {'ExampleParams': None,
+                       'paramOptions': None,
+                       'Function': 'Whether camera support Wps',
+                       'Privilege': 'visitor'},
+ 'getProductAudioFlag': {'ExampleParams': None,
+                         'paramOptions': None,
+                         'Function': 'Whether camera support audio-speak',
+                         'Privilege': 'visitor'},
+ 'getProductTalkFlag': {'ExampleParams': None,
+                        'paramOptions': None,
+                        'Function': 'Whether camera support audio-talk',
+                        'Privilege': 'visitor'},
+ 'getProductAppVer': {'ExampleParams': None,
+                      'paramOptions': None,
+                      'Function': 'Get camera application version',
+                      'Privilege': 'visitor'},
+ 'getProductAllInfo': {'ExampleParams': None,
+                       'paramOptions': None,
+                       'Function': 'Get camera Information',
+                       'Privilege': 'visitor'},
+ 'getGeneratePubKey': {'ExampleParams': None,
+                       'paramOptions': None,
+                       'Function': 'Get public key generated by camera for software reset',
+                       'Privilege': 'visitor'},
+ 'toolRestoreToFactory': {'ExampleParams': {'codeLen': '10', 'code': 'xxxxxxxxxx'},
+                          'paramOptions': None,
+                          'Function': 'Set camera reset to factory by software',
+                          'Privilege': 'visitor'},
+ 'rebootSystem': {'ExampleParams': None, 'paramOptions': None, 'Function': 'Reboot camera', 'Privilege': 'admin'},
+ 'restoreToFactorySetting': {'ExampleParams': None,
+                             'paramOptions': None,
+                             'Function': 'Restore to factory setting. WARNING! This will erase all settings in camera '
+                                         'and you may lose connection to the camera, especially wireless. Also '
+                                         "remember to close the new opened tab so that you don't later accidentally "
+                                         'reload that tab, performing the erase again. (For now clicking the button '
+                                         'only shows the URL - copy and paste it manually to the address bar and '
+                                         'send.)',
+                             'Privilege': 'admin'},
+ 'exportConfig': {'ExampleParams': None,
+                  'paramOptions': None,
+                  'Function': 'Export config file. After calling this command, you can get the config file by visiting '
+                              'the following address: /configs/export/configs.bin',
+                  'Privilege': 'admin'},
+ 'ImportConfig': {'ExampleParams': {},
+                  'paramOptions': None,
+                  'Function': 'Import config file. See the Foscam API PDF documentation how this actually works. This '
+                              'button probably does not work.',
+                  'Privilege': 'admin'},
+ 'FwUpgrade': {'ExampleParams': {},
+               'paramOptions': None,
+               'Function': 'Upgrade firmware. See the Foscam API PDF documentation how this actually works. This '
+                           'button probably does not work.',
+               'Privilege': 'admin'},
+ 'removePatch': {'ExampleParams': {}, 'paramOptions': None, 'Function': 'remove firewall patch', 'Privilege': 'admin'},
+ 'getFirewallConfig': {'ExampleParams': None,
+                       'paramOptions': None,
+                       'Function': 'Get firewall config',
+                       'Privilege': 'admin'},
+ 'setFirewallConfig': {'ExampleParams': {'isEnable': '1',
+                                         'rule': '0',
+                                         'ipList0': '0',
+                                         'ipList1': '0',
+                                         'ipList2': '0',
+                                         'ipList3': '0',
+                                         'ipList4': '0',
+                                         'ipList5': '0',
+                                         'ipList6': '0',
+                                         'ipList7': '0'},
+                       'paramOptions': {'isEnable': {'optionsType': 'dict',
+                                                     'options': {'false/disabled (0)': 0, 'true/enabled (1)': 1}}},
+                       'Function': 'Set firewall config',
+                       'Privilege': 'admin'},
+ 'getLog': {'ExampleParams': {'offset': '0', 'count': '20'},
+            'paramOptions': None,
+            'Function': 'Get system log',
+            'Privilege': 'admin'},
+ 'getAudioVolume': {'ExampleParams': None, 'paramOptions': None, 'Function': 'Get Audio Volume', 'Privilege': 'admin'},
+ 'setAudioVolume': {'ExampleParams': {'volume': '100'},
+                    'paramOptions': None,
+                    'Function': 'Set Audio Volume',
+                    'Privilege': 'admin'},
+ 'getWifiMode': {'ExampleParams': None, 'paramOptions': None, 'Function': 'Get Wifi Mode', 'Privilege': 'admin'},
+ 'getTemperatureAlarmConfig': {'ExampleParams': None,
+                               'paramOptions': None,
+                               'Function': 'Get Temperature Alarm Config',
+                               'Privilege': 'admin'},
+ 'setTemperatureAlarmConfig': {'ExampleParams': {'isEnable': '1',
+                                                 'linkage': '129',
+                                                 'topLimit': '40',
+                                                 'triggerInterval': '5',
+                                                 'schedule0': '1023',
+                                                 'schedule1': '1023',
+                                                 'schedule2': '1023',
+                                                 'schedule3': '1023',
+                                                 'schedule4': '1023',
+                                                 'schedule5': '1023',
+                                                 'schedule6': '1023'},
+                               'paramOptions': {'isEnable': {'optionsType': 'dict',
+                                                             'options': {'false/disabled (0)': 0,
+                                                                         'true/enabled (1)': 1}}},
+                               'Function': 'Set Temperature Alarm Config',
+                               'Privilege': 'admin'},
+ 'getTemperatureState': {'ExampleParams': {},
+                         'paramOptions': None,
+                         'Function': 'Get Temperature Degree',
+                         'Privilege': 'admin'},
+ 'setMusicDefaultListRefresh': {'ExampleParams': None,
+                                'paramOptions': None,
+                                'Function': 'Refresh default list',
+                                'Privilege': 'admin'},
+ 'getMusicListsName': {'ExampleParams': {},
+                       'paramOptions': None,
+                       'Function': 'Get Music lists name',
+                       'Privilege': 'admin'},
+ 'getMusicsNameOfList': {'ExampleParams': {'name': 'default', 'startNo': '0', 'musicNum': '50'},
+                         'paramOptions': None,
+                         'Function': 'Get Musics name of list',
+                         'Privilege': 'admin'},
+ 'addMusicList': {'ExampleParams': {'name': '1',
+                                    'music0': '1.wav',
+                                    'music1': '',
+                                    'music2': '',
+                                    'music3': '',
+                                    'music4': '',
+                                    'music5': ''},
+                  'paramOptions': None,
+                  'Function': 'Add Musics list and music',
+                  'Privilege': 'admin'},
+ 'delMusicList': {'ExampleParams': {'name': '1'},
+                  'paramOptions': None,
+                  'Function': 'Delete Musics list and music',
+                  'Privilege': 'admin'},
+ 'setMusicPlayMode': {'ExampleParams': {'mode': '1'},
+                      'paramOptions': None,
+                      'Function': 'Set Musics Play Mode',
+                      'Privilege': 'admin'},
+ 'getMusicPlayMode': {'ExampleParams': None,
+                      'paramOptions': None,
+                      'Function': 'Get Musics Play Mode',
+                      'Privilege': 'admin'},
+ 'setMusicPlayNext': {'ExampleParams': None, 'paramOptions': None, 'Function': 'Play Next Music', 'Privilege': 'admin'},
+ 'setMusicPlayPre': {'ExampleParams': None,
+                     'paramOptions': None,
+                     'Function': 'Play Precede Music',
+                     'Privilege': 'admin'},
+ 'getMusicPlayState': {'ExampleParams': None,
+                       'paramOptions': None,
+                       'Function': 'Get Music Play State',
+                       'Privilege': 'admin'},
+ 'setMusicPlayStart': {'ExampleParams': {'mode': '1', 'index': '0', 'name': 'default'},
+                       'paramOptions': None,
+                       'Function': 'Start Play Music',
+                       'Privilege': 'admin'},
+ 'setMusicPlayStop': {'ExampleParams': None, 'paramOptions': None, 'Function': 'Stop Play Music', 'Privilege': 'admin'},
+ 'setMusicDormantTime': {'ExampleParams': {'minutes': '10'},
+                         'paramOptions': None,
+                         'Function': 'Set Music Dormant Time',
+                         'Privilege': 'admin'},
+ 'getMusicDormantTime': {'ExampleParams': {},
+                         'paramOptions': None,
+                         'Function': 'Get Music Dormant Time',
+                         'Privilege': 'admin'},
+ 'getCloudConfig': {'ExampleParams': None, 'paramOptions': None, 'Function': 'Get Cloud Config', 'Privilege': 'admin'},
+ 'setCloudConfig': {'ExampleParams': {'isEnable': 0, 'cloudServer': 1, 'code': 'Authorization code from server'},
+                    'paramOptions': {'isEnable': {'optionsType': 'dict',
+                                                  'options': {'false/disabled (0)': 0, 'true/enabled (1)': 1}},
+                                     'cloudServer': {'optionsType': 'dict',
+                                                     'options': {'Dropbox (1)': 1, 'Baidu (2)': 2}}},
+                    'Function': 'Set Cloud Config',
+                    'Privilege': 'admin'},
+ 'selectCloudServer': {'ExampleParams': {'isEnable': 0, 'cloudServer': '2'},
+                       'paramOptions': {'isEnable': {'optionsType': 'dict',
+                                                     'options': {'false/disabled (0)': 0, 'true/enabled (1)': 1}},
+                                        'cloudServer': {'optionsType': 'dict',
+                                                        'options': {'Dropbox (1)': 1, 'Baidu (2)': 2}}},
+                       'Function': 'Select Cloud Server',
+                       'Privilege': 'admin'},
+ 'getCloudToken': {'ExampleParams': {'isEnable': '1', 'cloudServer': '2', 'code': 'dfasdfdfadf'},
+                   'paramOptions': {'isEnable': {'optionsType': 'dict',
+                                                 'options': {'false/disabled (0)': 0, 'true/enabled (1)': 1}},
+                                    'cloudServer': {'optionsType': 'dict',
+                                                    'options': {'Dropbox (1)': 1, 'Baidu (2)': 2}}},
+                   'Function': 'Get Cloud Token. Call this cgi, then call getCloudConfig 10s later, find accessToken',
+                   'Privilege': 'admin'},
+ 'getCloudQuota': {'ExampleParams': {'isEnable': '1', 'cloudServer': '2', 'code': 'dfasdfdfadf'},
+                   'paramOptions': {'isEnable': {'optionsType': 'dict',
+                                                 'options': {'false/disabled (0)': 0, 'true/enabled (1)': 1}},
+                                    'cloudServer': {'optionsType': 'dict',
+                                                    'options': {'Dropbox (1)': 1, 'Baidu (2)': 2}}},
+                   'Function': 'Get Cloud Quota. Call this cgi, then call getCloudConfig 10s later, find accessToken',
+                   'Privilege': 'admin'},
+ 'testCloudServer': {'ExampleParams': {'isEnable': '1', 'cloudServer': '2', 'code': 'dfasdfdfadf'},
+                     'paramOptions': {'isEnable': {'optionsType': 'dict',
+                                                   'options': {'false/disabled (0)': 0, 'true/enabled (1)': 1}},
+                                      'cloudServer': {'optionsType': 'dict',
+                                                      'options': {'Dropbox (1)': 1, 'Baidu (2)': 2}}},
+                     'Function': 'Get Cloud Quota. Call this cgi, then call getCloudConfig 10s later, find accessToken',
+                     'Privilege': 'admin'},
+ 'getPushConfig': {'ExampleParams': None, 'paramOptions': None, 'Function': 'Get Push Config', 'Privilege': 'admin'},
+ 'setPushConfig': {'ExampleParams': {'isEnable': '1', 'pushServer': '1'},
+                   'paramOptions': {'isEnable': {'optionsType': 'dict',
+                                                 'options': {'false/disabled (0)': 0, 'true/enabled (1)': 1}}},
+                   'Function': 'Set Push Config',
+                   'Privilege': 'admin'},
+ 'testPushServer': {'ExampleParams': {'isEnable': '1', 'pushServer': '1', 'usr': 'admin'},
+                    'paramOptions': {'isEnable': {'optionsType': 'dict',
+                                                  'options': {'false/disabled (0)': 0, 'true/enabled (1)': 1}}},
+                    'Function': 'Test Push Server',
+                    'Privilege': 'admin'},
+ 'pushOperate': {'ExampleParams': None,
+                 'paramOptions': None,
+                 'Function': 'Test Push pushOperate',
+                 'Privilege': 'admin'},
+ 'SetOnlineUpgrade': {'ExampleParams': {'update_type': '1',
+                                        'url': 'http://bcs.duapp.com/foscam/FosBaby_B_app_ver2.x.1.11.bin',
+                                        'cycle': '0'},
+                      'paramOptions': None,
+                      'Function': 'Online upgrade',
+                      'Privilege': 'admin'},
+ 'setCloudStreamLevel': {'ExampleParams': {'level': '30'},
+                         'paramOptions': None,
+                         'Function': 'Set cloud stream level',
+                         'Privilege': 'admin'},
+ 'getCloudStreamLevel': {'ExampleParams': None,
+                         'paramOptions': None,
+                         'Function': 'Get cloud stream level',
+                         'Privilege': 'admin'},
+ 'setSubVideoStreamType': {'ExampleParams': {'streamType': '0'},
+                           'Function': 'Set the stream type of sub stream',
+                           'Privilege': 'admin',
+                           'paramOptions': {'streamType': {'optionsType': 'list', 'options': [0, 1, 2, 3]}}},
+ 'importConfig': {'ExampleParams': {},
+                  'paramOptions': None,
+                  'Function': 'Import config file. See the Foscam API PDF documentation how this actually works. This '
+                              'button probably does not work.',
+                  'Privilege': 'admin'},
+ 'fwUpgrade': {'ExampleParams': {},
+               'paramOptions': None,
+               'Function': 'Upgrade firmware. See the Foscam API PDF documentation how this actually works. This '
+                           'button probably does not work.',
+               'Privilege': 'admin'},
+ 'focusNear': {'ExampleParams': None, 'Function': 'Focus near.', 'Privilege': 'operator', 'paramOptions': None},
+ 'focusFar': {'ExampleParams': None, 'Function': 'Focus far.', 'Privilege': 'operator', 'paramOptions': None},
+ 'focusStop': {'ExampleParams': None,
+               'Function': 'Stop the focusing motor.',
+               'Privilege': 'operator',
+               'paramOptions': None}}
+
+
+# The allowed values (as strings) of the parameters that have paramOptions, each distinct set once:
+optionSets = (
+    frozenset(['0', '1']),
+    frozenset(['0', '1', '2']),
+    frozenset(['0', '1', '2', '3']),
+    frozenset(['0', '1', '3', '7', '9']),
+    frozenset(['0', '1', '2', '3', '4']),
+    frozenset(['0', '2', '3']),
+    frozenset(['0', '1', '2', '3', '4', '5']),
+    frozenset(['1', '2']),
+)
+
+# cmd -> (query start, parameter names in a fixed order, their '&<name>=', their optionSets index or None):
+commandTemplates = {
+    'getImageSetting': ('cmd=getImageSetting', (), (), ()),
+    'setBrightness': ('cmd=setBrightness', ('brightness',), ('&brightness=',), (None,)),
+    'setContrast': ('cmd=setContrast', ('constrast',), ('&constrast=',), (None,)),
+    'setHue': ('cmd=setHue', ('hue',), ('&hue=',), (None,)),
+    'setSaturation': ('cmd=setSaturation', ('saturation',), ('&saturation=',), (None,)),
+    'setSharpness': ('cmd=setSharpness', ('sharpness',), ('&sharpness=',), (None,)),
+    'resetImageSetting': ('cmd=resetImageSetting', (), (), ()),
+    'getMirrorAndFlipSetting': ('cmd=getMirrorAndFlipSetting', (), (), ()),
+    'mirrorVideo': ('cmd=mirrorVideo', ('isMirror',), ('&isMirror=',), (0,)),
+    'flipVideo': ('cmd=flipVideo', ('isFlip',), ('&isFlip=',), (0,)),
+    'getRatio': ('cmd=getRatio', (), (), ()),
+    'setRatio': ('cmd=setRatio', ('ratio',), ('&ratio=',), (None,)),
+    'getH264FrmRefMode': ('cmd=getH264FrmRefMode', (), (), ()),
+    'setH264FrmRefMode': ('cmd=setH264FrmRefMode', ('mode',), ('&mode=',), (None,)),
+    'getScheduleRecordStreamChn': ('cmd=getScheduleRecordStreamChn', (), (), ()),
+    'setScheduleRecordStreamChn': ('cmd=setScheduleRecordStreamChn', ('chn',), ('&chn=',), (None,)),
+    'setPwrFreq': ('cmd=setPwrFreq', ('freq',), ('&freq=',), (1,)),
+    'getVideoStreamParam': ('cmd=getVideoStreamParam', (), (), ()),
+    'setVideoStreamParam': ('cmd=setVideoStreamParam', ('streamType', 'resolution', 'bitRate', 'frameRate', 'GOP', 'isVBR'), ('&streamType=', '&resolution=', '&bitRate=', '&frameRate=', '&GOP=', '&isVBR='), (2, 3, None, None, None, 0)),
+    'getSubVideoStreamParam': ('cmd=getSubVideoStreamParam', (), (), ()),
+    'setSubVideoStreamParam': ('cmd=setSubVideoStreamParam', ('streamType', 'resolution', 'bitRate', 'frameRate', 'GOP', 'isVBR'), ('&streamType=', '&resolution=', '&bitRate=', '&frameRate=', '&GOP=', '&isVBR='), (2, 3, None, None, None, 0)),
+    'getMainVideoStreamType': ('cmd=getMainVideoStreamType', (), (), ()),
+    'getSubVideoStreamType': ('cmd=getSubVideoStreamType', (), (), ()),
+    'setMainVideoStreamType': ('cmd=setMainVideoStreamType', ('streamType',), ('&streamType=',), (2,)),
+    'setSubStreamFormat': ('cmd=setSubStreamFormat', ('format',), ('&format=',), (None,)),
+    'GetMJStream': ('cmd=GetMJStream', (), (), ()),
+    'getOSDSetting': ('cmd=getOSDSetting', (), (), ()),
+    'setOSDSetting': ('cmd=setOSDSetting', ('isEnableTimeStamp', 'isEnableDevName', 'dispPos', 'isEnableOSDMask'), ('&isEnableTimeStamp=', '&isEnableDevName=', '&dispPos=', '&isEnableOSDMask='), (0, 0, None, 0)),
+    'getOsdMaskArea': ('cmd=getOsdMaskArea', (), (), ()),
+    'setOsdMaskArea': ('cmd=setOsdMaskArea', ('x1_0', 'y1_0', 'x2_0', 'y2_0', 'x1_1', 'y1_1', 'x2_1', 'y2_1', 'x1_2', 'y1_2', 'x2_2', 'y2_2', 'x1_3', 'y1_3', 'x2_3', 'y2_3'), ('&x1_0=', '&y1_0=', '&x2_0=', '&y2_0=', '&x1_1=', '&y1_1=', '&x2_1=', '&y2_1=', '&x1_2=', '&y1_2=', '&x2_2=', '&y2_2=', '&x1_3=', '&y1_3=', '&x2_3=', '&y2_3='), (None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None)),
+    'getOSDMask': ('cmd=getOSDMask', (), (), ()),
+    'setOSDMask': ('cmd=setOSDMask', ('isEnableOSDMask',), ('&isEnableOSDMask=',), (0,)),
+    'getMotionDetectConfig': ('cmd=getMotionDetectConfig', (), (), ()),
+    'setMotionDetectConfig': ('cmd=setMotionDetectConfig', ('isEnable', 'linkage', 'snapInterval', 'sensitivity', 'triggerInterval', 'isMovAlarmEnable', 'isPirAlarmEnable', 'area0', 'area1', 'area2', 'area3', 'area4', 'area5', 'area6', 'area7', 'area8', 'area9', 'schedule0', 'schedule1', 'schedule2', 'schedule3', 'schedule4', 'schedule5', 'schedule6'), ('&isEnable=', '&linkage=', '&snapInterval=', '&sensitivity=', '&triggerInterval=', '&isMovAlarmEnable=', '&isPirAlarmEnable=', '&area0=', '&area1=', '&area2=', '&area3=', '&area4=', '&area5=', '&area6=', '&area7=', '&area8=', '&area9=', '&schedule0=', '&schedule1=', '&schedule2=', '&schedule3=', '&schedule4=', '&schedule5=', '&schedule6='), (0, None, None, 4, None, 0, 0, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None, None)),
+    'setLocalAlarmRecordConfig': ('cmd=setLocalAlarmRecordConfig', ('isEnableLocalAlarmRecord', 'localAlarmRecordSecs'), ('&isEnableLocalAlarmRecord=', '&localAlarmRecordSecs='), (0, None)),
+    'getLocalAlarmRecordConfig': ('cmd=getLocalAlarmRecordConfig', (), (), ()),
+    'getSnapConfig': ('cmd=getSnapConfig', (), (), ()),
+    'setSnapConfig': ('cmd=setSnapConfig', ('snapQuality', 'saveLocation'), ('&snapQuality=', '&saveLocation='), (1, 1)),
+    'getScheduleSnapConfig': ('cmd=getScheduleSnapConfig', (), (), ()),
+    'setScheduleSnapConfig': ('cmd=setScheduleSnapConfig', ('isEnable', 'snapInterval', 'schedule0', 'schedule1', 'schedule2', 'schedule3', 'schedule4', 'schedule5', 'schedule6'), ('&isEnable=', '&snapInterval=', '&schedule0=', '&schedule1=', '&schedule2=', '&schedule3=', '&schedule4=', '&schedule5=', '&schedule6='), (0, None, None, None, None, None, None, None, None)),
+    'snapPicture': ('cmd=snapPicture', (), (), ()),
+    'snapPicture2': ('cmd=snapPicture2', (), (), ()),
+    'getRecordList': ('cmd=getRecordList', ('recordPath', 'startTime', 'endTime', 'recordType', 'startNo'), ('&recordPath=', '&startTime=', '&endTime=', '&recordType=', '&startNo='), (None, None, None, None, None)),
+    'getRecordList2': ('cmd=getRecordList2', ('recordPath', 'startTime', 'endTime', 'recordType', 'startNo'), ('&recordPath=', '&startTime=', '&endTime=', '&recordType=', '&startNo='), (None, None, None, None, None)),
+    'reloadRecordindex': ('cmd=reloadRecordindex', (), (), ()),
+    'getAlarmRecordConfig': ('cmd=getAlarmRecordConfig', (), (), ()),
+    'setAlarmRecordConfig': ('cmd=setAlarmRecordConfig', ('isEnablePreRecord', 'preRecordSecs', 'alarmRecordSecs'), ('&isEnablePreRecord=', '&preRecordSecs=', '&alarmRecordSecs='), (0, None, None)),
+    'getRecordPath': ('cmd=getRecordPath', (), (), ()),
+    'setRecordPath': ('cmd=setRecordPath', ('path',), ('&path=',), (5,)),
+    'getScheduleRecordConfig': ('cmd=getScheduleRecordConfig', (), (), ()),
+    'setScheduleRecordConfig': ('cmd=setScheduleRecordConfig', ('isEnable', 'recordLevel', 'spaceFullMode', 'isEnableAudio', 'schedule0', 'schedule1', 'schedule2', 'schedule3', 'schedule4', 'schedule5', 'schedule6'), ('&isEnable=', '&recordLevel=', '&spaceFullMode=', '&isEnableAudio=', '&schedule0=', '&schedule1=', '&schedule2=', '&schedule3=', '&schedule4=', '&schedule5=', '&schedule6='), (0, 6, 0, 0, None, None, None, None, None, None, None)),
+    'setIOAlarmConfig': ('cmd=setIOAlarmConfig', ('isEnable', 'linkage', 'snapInterval', 'alarmLevel', 'triggerInterval', 'schedule0', 'schedule1', 'schedule2', 'schedule3', 'schedule4', 'schedule5', 'schedule6'), ('&isEnable=', '&linkage=', '&snapInterval=', '&alarmLevel=', '&triggerInterval=', '&schedule0=', '&schedule1=', '&schedule2=', '&schedule3=', '&schedule4=', '&schedule5=', '&schedule6='), (0, None, None, None, None, None, None, None, None, None, None, None)),
+    'getIOAlarmConfig': ('cmd=getIOAlarmConfig', (), (), ()),
+    'clearIOAlarmOutput': ('cmd=clearIOAlarmOutput', (), (), ()),
+    'setAudioAlarmConfig': ('cmd=setAudioAlarmConfig', ('isEnable', 'linkage', 'snapInterval', 'sensitivity', 'triggerInterval', 'schedule0', 'schedule1', 'schedule2', 'schedule3', 'schedule4', 'schedule5', 'schedule6'), ('&isEnable=', '&linkage=', '&snapInterval=', '&sensitivity=', '&triggerInterval=', '&schedule0=', '&schedule1=', '&schedule2=', '&schedule3=', '&schedule4=', '&schedule5=', '&schedule6='), (0, None, None, 4, None, None, None, None, None, None, None, None)),
+    'getAudioAlarmConfig': ('cmd=getAudioAlarmConfig', (), (), ()),
+    'setPCAudioAlarmCfg': ('cmd=setPCAudioAlarmCfg', ('isEnablePCAudioAlarm',), ('&isEnablePCAudioAlarm=',), (0,)),
+    'getPCAudioAlarmCfg': ('cmd=getPCAudioAlarmCfg', (), (), ()),
+    'getMultiDevList': ('cmd=getMultiDevList', (), (), ()),
+    'getMultiDevDetailInfo': ('cmd=getMultiDevDetailInfo', (), (), ()),
+    'addMultiDev': ('cmd=addMultiDev', ('chnnl', 'productType', 'ip', 'port', 'mediaPort', 'userName', 'passWord', 'devName'), ('&chnnl=', '&productType=', '&ip=', '&port=', '&mediaPort=', '&userName=', '&passWord=', '&devName='), (None, None, None, None, None, None, None, None)),
+    'delMultiDev': ('cmd=delMultiDev', ('chnnl',), ('&chnnl=',), (None,)),
+    'setDeFrameLevel': ('cmd=setDeFrameLevel', ('level',), ('&level=',), (0,)),
+    'getDeFrameLevel': ('cmd=getDeFrameLevel', (), (), ()),
+    'addAccount': ('cmd=addAccount', ('usrName', 'usrPwd', 'privilege'), ('&usrName=', '&usrPwd=', '&privilege='), (None, None, 1)),
+    'delAccount': ('cmd=delAccount', ('usrName',), ('&usrName=',), (None,)),
+    'getPassword': ('cmd=getPassword', ('usrName',), ('&usrName=',), (None,)),
+    'changePassword': ('cmd=changePassword', ('usrName', 'oldPwd', 'newPwd'), ('&usrName=', '&oldPwd=', '&newPwd='), (None, None, None)),
+    'changeUserName': ('cmd=changeUserName', ('usrName', 'newUsrName'), ('&usrName=', '&newUsrName='), (None, None)),
+    'changeUserNameAndPwdTogether': ('cmd=changeUserNameAndPwdTogether', ('usrName', 'newUsrName', 'oldPwd', 'newPwd'), ('&usrName=', '&newUsrName=', '&oldPwd=', '&newPwd='), (None, None, None, None)),
+    'logIn': ('cmd=logIn', ('usrName', 'remoteIp', 'groupId'), ('&usrName=', '&remoteIp=', '&groupId='), (None, None, None)),
+    'logOut': ('cmd=logOut', ('usrName', 'ip', 'groupId'), ('&usrName=', '&ip=', '&groupId='), (None, None, None)),
+    'getSessionList': ('cmd=getSessionList', (), (), ()),
+    'getUserList': ('cmd=getUserList', (), (), ()),
+    'usrBeatHeart': ('cmd=usrBeatHeart', ('usrName', 'ip', 'groupId'), ('&usrName=', '&ip=', '&groupId='), (None, None, None)),
+    'ptzMoveUp': ('cmd=ptzMoveUp', (), (), ()),
+    'ptzMoveDown': ('cmd=ptzMoveDown', (), (), ()),
+    'ptzMoveLeft': ('cmd=ptzMoveLeft', (), (), ()),
+    'ptzMoveRight': ('cmd=ptzMoveRight', (), (), ()),
+    'ptzMoveTopLeft': ('cmd=ptzMoveTopLeft', (), (), ()),
+    'ptzMoveTopRight': ('cmd=ptzMoveTopRight', (), (), ()),
+    'ptzMoveBottomLeft': ('cmd=ptzMoveBottomLeft', (), (), ()),
+    'ptzMoveBottomRight': ('cmd=ptzMoveBottomRight', (), (), ()),
+    'ptzStopRun': ('cmd=ptzStopRun', (), (), ()),
+    'ptzReset': ('cmd=ptzReset', (), (), ()),
+    'getPTZSpeed': ('cmd=getPTZSpeed', (), (), ()),
+    'setPTZSpeed': ('cmd=setPTZSpeed', ('speed',), ('&speed=',), (4,)),
+    'getPTZPresetPointList': ('cmd=getPTZPresetPointList', (), (), ()),
+    'ptzAddPresetPoint': ('cmd=ptzAddPresetPoint', ('name',), ('&name=',), (None,)),
+    'ptzDeletePresetPoint': ('cmd=ptzDeletePresetPoint', ('name',), ('&name=',), (None,)),
+    'ptzGotoPresetPoint': ('cmd=ptzGotoPresetPoint', ('name',), ('&name=',), (None,)),
+    'ptzGetCruiseMapList': ('cmd=ptzGetCruiseMapList', (), (), ()),
+    'ptzGetCruiseMapInfo': ('cmd=ptzGetCruiseMapInfo', ('name',), ('&name=',), (None,)),
+    'ptzSetCruiseMap': ('cmd=ptzSetCruiseMap', ('name', 'point0', 'point1', 'point2', 'point3', 'point4', 'point5', 'point6', 'point7'), ('&name=', '&point0=', '&point1=', '&point2=', '&point3=', '&point4=', '&point5=', '&point6=', '&point7='), (None, None, None, None, None, None, None, None, None)),
+    'ptzDelCruiseMap': ('cmd=ptzDelCruiseMap', ('name',), ('&name=',), (None,)),
+    'ptzStartCruise': ('cmd=ptzStartCruise', ('mapName',), ('&mapName=',), (None,)),
+    'ptzStopCruise': ('cmd=ptzStopCruise', (), (), ()),
+    'setCruiseTime': ('cmd=setCruiseTime', ('time',), ('&time=',), (None,)),
+    'getCruiseTime': ('cmd=getCruiseTime', (), (), ()),
+    'setCruiseTimeCustomed': ('cmd=setCruiseTimeCustomed', ('time', 'customed'), ('&time=', '&customed='), (None, 0)),
+    'getCruiseTimeCustomed': ('cmd=getCruiseTimeCustomed', (), (), ()),
+    'setCruiseLoopCnt': ('cmd=setCruiseLoopCnt', ('count',), ('&count=',), (None,)),
+    'getCruiseLoopCnt': ('cmd=getCruiseLoopCnt', (), (), ()),
+    'setCruiseCtrlMode': ('cmd=setCruiseCtrlMode', ('mode',), ('&mode=',), (0,)),
+    'getCruiseCtrlMode': ('cmd=getCruiseCtrlMode', (), (), ()),
+    'setCruisePrePointLingerTime': ('cmd=setCruisePrePointLingerTime', ('name', 'time0', 'time1', 'time2', 'time3', 'time4', 'time5', 'time6', 'time7'), ('&name=', '&time0=', '&time1=', '&time2=', '&time3=', '&time4=', '&time5=', '&time6=', '&time7='), (None, None, None, None, None, None, None, None, None)),
+    'getCruisePrePointLingerTime': ('cmd=getCruisePrePointLingerTime', ('name',), ('&name=',), (None,)),
+    'zoomIn': ('cmd=zoomIn', (), (), ()),
+    'zoomOut': ('cmd=zoomOut', (), (), ()),
+    'zoomStop': ('cmd=zoomStop', (), (), ()),
+    'getZoomSpeed': ('cmd=getZoomSpeed', (), (), ()),
+    'setZoomSpeed': ('cmd=setZoomSpeed', ('speed',), ('&speed=',), (1,)),
+    'setPTZSelfTestMode': ('cmd=setPTZSelfTestMode', ('mode',), ('&mode=',), (1,)),
+    'getPTZSelfTestMode': ('cmd=getPTZSelfTestMode', (), (), ()),
+    'setPTZPrePointForSelfTest': ('cmd=setPTZPrePointForSelfTest', ('name',), ('&name=',), (None,)),
+    'getPTZPrePointForSelfTest': ('cmd=getPTZPrePointForSelfTest', (), (), ()),
+    'set485Info': ('cmd=set485Info', ('rs485Protocol', 'rs485Addr', 'rs485Baud', 'rs485DataBit', 'rs485StopBit', 'rs485Check'), ('&rs485Protocol=', '&rs485Addr=', '&rs485Baud=', '&rs485DataBit=', '&rs485StopBit=', '&rs485Check='), (None, None, None, None, None, None)),
+    'get485Info': ('cmd=get485Info', (), (), ()),
+    'getIPInfo': ('cmd=getIPInfo', (), (), ()),
+    'setIpInfo': ('cmd=setIpInfo', ('isDHCP', 'ip', 'gate', 'mask', 'dns1', 'dns2'), ('&isDHCP=', '&ip=', '&gate=', '&mask=', '&dns1=', '&dns2='), (0, None, None, None, None, None)),
+    'refreshWifiList': ('cmd=refreshWifiList', (), (), ()),
+    'getWifiList': ('cmd=getWifiList', ('startNo',), ('&startNo=',), (None,)),
+    'setWifiSetting': ('cmd=setWifiSetting', ('isEnable', 'isUseWifi', 'ssid', 'netType', 'encryptType', 'psk', 'authMode', 'keyFormat', 'defaultKey', 'key1', 'key2', 'key3', 'key4', 'key1Len', 'key2Len', 'key3Len', 'key4Len'), ('&isEnable=', '&isUseWifi=', '&ssid=', '&netType=', '&encryptType=', '&psk=', '&authMode=', '&keyFormat=', '&defaultKey=', '&key1=', '&key2=', '&key3=', '&key4=', '&key1Len=', '&key2Len=', '&key3Len=', '&key4Len='), (0, 0, None, None, 4, None, None, None, None, None, None, None, None, None, None, None, None)),
+    'getWifiConfig': ('cmd=getWifiConfig', (), (), ()),
+    'getPortInfo': ('cmd=getPortInfo', (), (), ()),
+    'setPortInfo': ('cmd=setPortInfo', ('webPort', 'mediaPort', 'httpsPort', 'onvifPort'), ('&webPort=', '&mediaPort=', '&httpsPort=', '&onvifPort='), (None, None, None, None)),
+    'getUPnPConfig': ('cmd=getUPnPConfig', (), (), ()),
+    'setUPnPConfig': ('cmd=setUPnPConfig', ('isEnable',), ('&isEnable=',), (0,)),
+    'getDDNSConfig': ('cmd=getDDNSConfig', (), (), ()),
+    'setDDNSConfig': ('cmd=setDDNSConfig', ('isEnable', 'hostName', 'ddnsServer', 'user', 'password'), ('&isEnable=', '&hostName=', '&ddnsServer=', '&user=', '&password='), (0, None, 4, None, None)),
+    'setFtpConfig': ('cmd=setFtpConfig', ('ftpAddr', 'ftpPort', 'mode', 'userName', 'password'), ('&ftpAddr=', '&ftpPort=', '&mode=', '&userName=', '&password='), (None, None, 0, None, None)),
+    'getFtpConfig': ('cmd=getFtpConfig', (), (), ()),
+    'testFtpServer': ('cmd=testFtpServer', ('ftpAddr', 'ftpPort', 'mode', 'fptuserName', 'ftppassword'), ('&ftpAddr=', '&ftpPort=', '&mode=', '&fptuserName=', '&ftppassword='), (None, None, 0, None, None)),
+    'getSMTPConfig': ('cmd=getSMTPConfig', (), (), ()),
+    'setSMTPConfig': ('cmd=setSMTPConfig', ('isEnable', 'server', 'port', 'isNeedAuth', 'user', 'password', 'sender', 'reciever', 'tls'), ('&isEnable=', '&server=', '&port=', '&isNeedAuth=', '&user=', '&password=', '&sender=', '&reciever=', '&tls='), (0, None, None, 0, None, None, None, None, 1)),
+    'smtpTest': ('cmd=smtpTest', ('smtpServer', 'port', 'isNeedAuth', 'user', 'password', 'sender'), ('&smtpServer=', '&port=', '&isNeedAuth=', '&user=', '&password=', '&sender='), (None, None, 0, None, None, None)),
+    'setP2PEnable': ('cmd=setP2PEnable', ('enable',), ('&enable=',), (0,)),
+    'getP2PEnable': ('cmd=getP2PEnable', (), (), ()),
+    'setP2PPort': ('cmd=setP2PPort', ('port',), ('&port=',), (None,)),
+    'getP2PPort': ('cmd=getP2PPort', (), (), ()),
+    'getP2PInfo': ('cmd=getP2PInfo', (), (), ()),
+    'getPPPoEConfig': ('cmd=getPPPoEConfig', (), (), ()),
+    'setPPPoEConfig': ('cmd=setPPPoEConfig', ('isEnable', 'userName', 'password'), ('&isEnable=', '&userName=', '&password='), (0, None, None)),
+    'setSystemTime': ('cmd=setSystemTime', ('timeSource', 'ntpServer', 'dateFormat', 'timeFormat', 'timeZone', 'isDst', 'dst', 'year', 'mon', 'day', 'hour', 'minute', 'sec'), ('&timeSource=', '&ntpServer=', '&dateFormat=', '&timeFormat=', '&timeZone=', '&isDst=', '&dst=', '&year=', '&mon=', '&day=', '&hour=', '&minute=', '&sec='), (0, None, 1, 0, None, 0, None, None, None, None, None, None, None)),
+    'getSystemTime': ('cmd=getSystemTime', (), (), ()),
+    'openInfraLed': ('cmd=openInfraLed', (), (), ()),
+    'closeInfraLed': ('cmd=closeInfraLed', (), (), ()),
+    'getInfraLedConfig': ('cmd=getInfraLedConfig', (), (), ()),
+    'setInfraLedConfig': ('cmd=setInfraLedConfig', ('mode',), ('&mode=',), (0,)),
+    'getScheduleInfraLedConfig': ('cmd=getScheduleInfraLedConfig', (), (), ()),
+    'setScheduleInfraLedConfig': ('cmd=setScheduleInfraLedConfig', ('mode',), ('&mode=',), (None,)),
+    'getDevState': ('cmd=getDevState', (), (), ()),
+    'getDevName': ('cmd=getDevName', (), (), ()),
+    'setDevName': ('cmd=setDevName', ('devName',), ('&devName=',), (None,)),
+    'getDevInfo': ('cmd=getDevInfo', (), (), ()),
+    'getProductModel': ('cmd=getProductModel', (), (), ()),
+    'getProductModelName': ('cmd=getProductModelName', (), (), ()),
+    'getProductLanguage': ('cmd=getProductLanguage', (), (), ()),
+    'getProductSensorType': ('cmd=getProductSensorType', (), (), ()),
+    'getProductWifiType': ('cmd=getProductWifiType', (), (), ()),
+    'getProductSdFlag': ('cmd=getProductSdFlag', (), (), ()),
+    'getProductOutdoorFlag': ('cmd=getProductOutdoorFlag', (), (), ()),
+    'getProductPtFlag': ('cmd=getProductPtFlag', (), (), ()),
+    'getProductZoomFlag': ('cmd=getProductZoomFlag', (), (), ()),
+    'getProductRs485Flag': ('cmd=getProductRs485Flag', (), (), ()),
+    'getProductIoAlarmFlag': ('cmd=getProductIoAlarmFlag', (), (), ()),
+    'getProductOnvifFlag': ('cmd=getProductOnvifFlag', (), (), ()),
+    'getProductP2pFlag': ('cmd=getProductP2pFlag', (), (), ()),
+    'getProductWpsFlag': ('cmd=getProductWpsFlag', (), (), ()),
+    'getProductAudioFlag': ('cmd=getProductAudioFlag', (), (), ()),
+    'getProductTalkFlag': ('cmd=getProductTalkFlag', (), (), ()),
+    'getProductAppVer': ('cmd=getProductAppVer', (), (), ()),
+    'getProductAllInfo': ('cmd=getProductAllInfo', (), (), ()),
+    'getGeneratePubKey': ('cmd=getGeneratePubKey', (), (), ()),
+    'toolRestoreToFactory': ('cmd=toolRestoreToFactory', ('codeLen', 'code'), ('&codeLen=', '&code='), (None, None)),
+    'rebootSystem': ('cmd=rebootSystem', (), (), ()),
+    'restoreToFactorySetting': ('cmd=restoreToFactorySetting', (), (), ()),
+    'exportConfig': ('cmd=exportConfig', (), (), ()),
+    'ImportConfig': ('cmd=ImportConfig', (), (), ()),
+    'FwUpgrade': ('cmd=FwUpgrade', (), (), ()),
+    'removePatch': ('cmd=removePatch', (), (), ()),
+    'getFirewallConfig': ('cmd=getFirewallConfig', (), (), ()),
+    'setFirewallConfig': ('cmd=setFirewallConfig', ('isEnable', 'rule', 'ipList0', 'ipList1', 'ipList2', 'ipList3', 'ipList4', 'ipList5', 'ipList6', 'ipList7'), ('&isEnable=', '&rule=', '&ipList0=', '&ipList1=', '&ipList2=', '&ipList3=', '&ipList4=', '&ipList5=', '&ipList6=', '&ipList7='), (0, None, None, None, None, None, None, None, None, None)),
+    'getLog': ('cmd=getLog', ('offset', 'count'), ('&offset=', '&count='), (None, None)),
+    'getAudioVolume': ('cmd=getAudioVolume', (), (), ()),
+    'setAudioVolume': ('cmd=setAudioVolume', ('volume',), ('&volume=',), (None,)),
+    'getWifiMode': ('cmd=getWifiMode', (), (), ()),
+    'getTemperatureAlarmConfig': ('cmd=getTemperatureAlarmConfig', (), (), ()),
+    'setTemperatureAlarmConfig': ('cmd=setTemperatureAlarmConfig', ('isEnable', 'linkage', 'topLimit', 'triggerInterval', 'schedule0', 'schedule1', 'schedule2', 'schedule3', 'schedule4', 'schedule5', 'schedule6'), ('&isEnable=', '&linkage=', '&topLimit=', '&triggerInterval=', '&schedule0=', '&schedule1=', '&schedule2=', '&schedule3=', '&schedule4=', '&schedule5=', '&schedule6='), (0, None, None, None, None, None, None, None, None, None, None)),
+    'getTemperatureState': ('cmd=getTemperatureState', (), (), ()),
+    'setMusicDefaultListRefresh': ('cmd=setMusicDefaultListRefresh', (), (), ()),
+    'getMusicListsName': ('cmd=getMusicListsName', (), (), ()),
+    'getMusicsNameOfList': ('cmd=getMusicsNameOfList', ('name', 'startNo', 'musicNum'), ('&name=', '&startNo=', '&musicNum='), (None, None, None)),
+    'addMusicList': ('cmd=addMusicList', ('name', 'music0', 'music1', 'music2', 'music3', 'music4', 'music5'), ('&name=', '&music0=', '&music1=', '&music2=', '&music3=', '&music4=', '&music5='), (None, None, None, None, None, None, None)),
+    'delMusicList': ('cmd=delMusicList', ('name',), ('&name=',), (None,)),
+    'setMusicPlayMode': ('cmd=setMusicPlayMode', ('mode',), ('&mode=',), (None,)),
+    'getMusicPlayMode': ('cmd=getMusicPlayMode', (), (), ()),
+    'setMusicPlayNext': ('cmd=setMusicPlayNext', (), (), ()),
+    'setMusicPlayPre': ('cmd=setMusicPlayPre', (), (), ()),
+    'getMusicPlayState': ('cmd=getMusicPlayState', (), (), ()),
+    'setMusicPlayStart': ('cmd=setMusicPlayStart', ('mode', 'index', 'name'), ('&mode=', '&index=', '&name='), (None, None, None)),
+    'setMusicPlayStop': ('cmd=setMusicPlayStop', (), (), ()),
+    'setMusicDormantTime': ('cmd=setMusicDormantTime', ('minutes',), ('&minutes=',), (None,)),
+    'getMusicDormantTime': ('cmd=getMusicDormantTime', (), (), ()),
+    'getCloudConfig': ('cmd=getCloudConfig', (), (), ()),
+    'setCloudConfig': ('cmd=setCloudConfig', ('isEnable', 'cloudServer', 'code'), ('&isEnable=', '&cloudServer=', '&code='), (0, 7, None)),
+    'selectCloudServer': ('cmd=selectCloudServer', ('isEnable', 'cloudServer'), ('&isEnable=', '&cloudServer='), (0, 7)),
+    'getCloudToken': ('cmd=getCloudToken', ('isEnable', 'cloudServer', 'code'), ('&isEnable=', '&cloudServer=', '&code='), (0, 7, None)),
+    'getCloudQuota': ('cmd=getCloudQuota', ('isEnable', 'cloudServer', 'code'), ('&isEnable=', '&cloudServer=', '&code='), (0, 7, None)),
+    'testCloudServer': ('cmd=testCloudServer', ('isEnable', 'cloudServer', 'code'), ('&isEnable=', '&cloudServer=', '&code='), (0, 7, None)),
+    'getPushConfig': ('cmd=getPushConfig', (), (), ()),
+    'setPushConfig': ('cmd=setPushConfig', ('isEnable', 'pushServer'), ('&isEnable=', '&pushServer='), (0, None)),
+    'testPushServer': ('cmd=testPushServer', ('isEnable', 'pushServer', 'usr'), ('&isEnable=', '&pushServer=', '&usr='), (0, None, None)),
+    'pushOperate': ('cmd=pushOperate', (), (), ()),
+    'SetOnlineUpgrade': ('cmd=SetOnlineUpgrade', ('update_type', 'url', 'cycle'), ('&update_type=', '&url=', '&cycle='), (None, None, None)),
+    'setCloudStreamLevel': ('cmd=setCloudStreamLevel', ('level',), ('&level=',), (None,)),
+    'getCloudStreamLevel': ('cmd=getCloudStreamLevel', (), (), ()),
+    'setSubVideoStreamType': ('cmd=setSubVideoStreamType', ('streamType',), ('&streamType=',), (2,)),
+    'importConfig': ('cmd=importConfig', (), (), ()),
+    'fwUpgrade': ('cmd=fwUpgrade', (), (), ()),
+    'focusNear': ('cmd=focusNear', (), (), ()),
+    'focusFar': ('cmd=focusFar', (), (), ()),
+    'focusStop': ('cmd=focusStop', (), (), ()),
+}
+
+
+class Commands:
+    """
+    One method per command. Each sends the command with the given parameters and returns the CGIResult.
+    """
+
+    async def getImageSetting(self, **params):
+        """
+        Get color attribute of video
+
+        Privilege: admin
+        """
+        return await self.command('getImageSetting', **params)
+
+    async def setBrightness(self, **params):
+        """
+        Set brightness of video
+
+        Privilege: admin
+        Example params: brightness=50
+        """
+        return await self.command('setBrightness', **params)
+
+    async def setContrast(self, **params):
+        """
+        Set contrast of video
+
+        Privilege: admin
+        Example params: constrast=50
+        """
+        return await self.command('setContrast', **params)
+
+    async def setHue(self, **params):
+        """
+        Set hue of video
+
+        Privilege: admin
+        Example params: hue=50
+        """
+        return await self.command('setHue', **params)
+
+    async def setSaturation(self, **params):
+        """
+        Set saturation of video
+
+        Privilege: admin
+        Example params: saturation=50
+        """
+        return await self.command('setSaturation', **params)
+
+    async def setSharpness(self, **params):
+        """
+        Set sharpness of video
+
+        Privilege: admin
+        Example params: sharpness=50
+        """
+        return await self.command('setSharpness', **params)
+
+    async def resetImageSetting(self, **params):
+        """
+        Reset color parameters to default value
+
+        Privilege: admin
+        """
+        return await self.command('resetImageSetting', **params)
+
+    async def getMirrorAndFlipSetting(self, **params):
+        """
+        Get mirror and flip attribute of video
+
+        Privilege: admin
+        """
+        return await self.command('getMirrorAndFlipSetting', **params)
+
+    async def mirrorVideo(self, **params):
+        """
+        Mirror video
+
+        Privilege: admin
+        Example params: isMirror=1
+        """
+        return await self.command('mirrorVideo', **params)
+
+    async def flipVideo(self, **params):
+        """
+        Flip video
+
+        Privilege: admin
+        Example params: isFlip=1
+        """
+        return await self.command('flipVideo', **params)
+
+    async def getRatio(self, **params):
+        """
+        Get value for image distortion correction
+
+        Privilege: admin
+        """
+        return await self.command('getRatio', **params)
+
+    async def setRatio(self, **params):
+        """
+        Set value for image distortion correction
+
+        Privilege: admin
+        Example params: ratio=150
+        """
+        return await self.command('setRatio', **params)
+
+    async def getH264FrmRefMode(self, **params):
+        """
+        Get frame shipping reference mode of H264 encode stream
+
+        Privilege: admin
+        """
+        return await self.command('getH264FrmRefMode', **params)
+
+    async def setH264FrmRefMode(self, **params):
+        """
+        Set frame shipping reference mode of H264 encode stream
+
+        Privilege: admin
+        Example params: mode=0
+        """
+        return await self.command('setH264FrmRefMode', **params)
+
+    async def getScheduleRecordStreamChn(self, **params):
+        """
+        Get stream channel for schedule record
+
+        Privilege: admin
+        """
+        return await self.command('getScheduleRecordStreamChn', **params)
+
+    async def setScheduleRecordStreamChn(self, **params):
+        """
+        Set stream channel for schedule record
+
+        Privilege: admin
+        Example params: chn=0
+        """
+        return await self.command('setScheduleRecordStreamChn', **params)
+
+    async def setPwrFreq(self, **params):
+        """
+        Set power freq of sensor
+
+        Privilege: admin
+        Example params: freq=2
+        """
+        return await self.command('setPwrFreq', **params)
+
+    async def getVideoStreamParam(self, **params):
+        """
+        Get video stream param
+
+        Privilege: admin
+        """
+        return await self.command('getVideoStreamParam', **params)
+
+    async def setVideoStreamParam(self, **params):
+        """
+        Set the video stream param of stream N. Good bitRates to try: 4194304, 2097152, 1048576, 524288,
+        262144, 131072 (or may have to be between 20480--2097152). Good frameRates: 20, 15, 10, 5. GOP (key
+        frame interval): P frames between I frame, the suggested value is: X * frameRate, e.g. 40, 30, 20,
+        10.
+
+        Privilege: admin
+        Example params: streamType=0, resolution=0, bitRate=2097152, frameRate=30, GOP=30, isVBR=0
+        """
+        return await self.command('setVideoStreamParam', **params)
+
+    async def getSubVideoStreamParam(self, **params):
+        """
+        Get sub video stream param
+
+        Privilege: visitor
+        """
+        return await self.command('getSubVideoStreamParam', **params)
+
+    async def setSubVideoStreamParam(self, **params):
+        """
+        Set the sub video stream param of stream N
+
+        Privilege: admin
+        Example params: streamType=0, resolution=0, bitRate=2097152, frameRate=30, GOP=30, isVBR=0
+        """
+        return await self.command('setSubVideoStreamParam', **params)
+
+    async def getMainVideoStreamType(self, **params):
+        """
+        Get the stream type of main stream. The streamType can be 0,1,2 or 3. It is basically a settings
+        profile where you can save the video encoding settings, and then easily switch between profiles. If
+        you edit streamTypes other than the currently active (0 by default), you must remember to also
+        setMainVideoStreamType to that number to take the new settings into use.
+
+        Privilege: admin
+        """
+        return await self.command('getMainVideoStreamType', **params)
+
+    async def getSubVideoStreamType(self, **params):
+        """
+        Get the stream type of sub stream
+
+        Privilege: admin
+        """
+        return await self.command('getSubVideoStreamType', **params)
+
+    async def setMainVideoStreamType(self, **params):
+        """
+        Set the stream type of main stream
+
+        Privilege: admin
+        Example params: streamType=0
+        """
+        return await self.command('setMainVideoStreamType', **params)
+
+    async def setSubStreamFormat(self, **params):
+        """
+        Set the stream format of sub stream
+
+        Privilege: admin
+        Example params: format=0
+        """
+        return await self.command('setSubStreamFormat', **params)
+
+    async def GetMJStream(self, **params):
+        """
+        Get motion jpeg stream
+
+        Privilege: visitor
+        """
+        return await self.command('GetMJStream', **params)
+
+    async def getOSDSetting(self, **params):
+        """
+        Get OSD config
+
+        Privilege: admin
+        """
+        return await self.command('getOSDSetting', **params)
+
+    async def setOSDSetting(self, **params):
+        """
+        Set OSD config
+
+        Privilege: admin
+        Example params: isEnableTimeStamp=1, isEnableDevName=1, dispPos=0, isEnableOSDMask=0
+        """
+        return await self.command('setOSDSetting', **params)
+
+    async def getOsdMaskArea(self, **params):
+        """
+        Get OSD mask area info
+
+        Privilege: admin
+        """
+        return await self.command('getOsdMaskArea', **params)
+
+    async def setOsdMaskArea(self, **params):
+        """
+        Set OSD mask area info
+
+        Privilege: admin
+        Example params: x1_0=100, y1_0=100, x2_0=200, y2_0=200, x1_1=0, y1_1=0, x2_1=0, y2_1=0, x1_2=0,
+            y1_2=0, x2_2=0, y2_2=0, x1_3=0, y1_3=0, x2_3=0, y2_3=0
+        """
+        return await self.command('setOsdMaskArea', **params)
+
+    async def getOSDMask(self, **params):
+        """
+        Get OSD mask status
+
+        Privilege: admin
+        """
+        return await self.command('getOSDMask', **params)
+
+    async def setOSDMask(self, **params):
+        """
+        Set OSD mask status
+
+        Privilege: admin
+        Example params: isEnableOSDMask=1
+        """
+        return await self.command('setOSDMask', **params)
+
+    async def getMotionDetectConfig(self, **params):
+        """
+        Get motion detect config
+
+        Privilege: admin
+        """
+        return await self.command('getMotionDetectConfig', **params)
+
+    async def setMotionDetectConfig(self, **params):
+        """
+        Set motion detect config. NOTE: The motion detection area and schedule and others must always be
+        included, even if you for example only want to toggle (enable) the 'isEnable'. For the area params
+        '1023' and for schedule params '281474976710655' mean that the motion detection is always enabled
+        for the entire image area. You can use the checkbox tables and their 'Apply' buttons above to input
+        the parameters without manually calculating the bitmaps. 'snapInterval' means the interval time to
+        snap picture again. 'triggerInterval' means the time after which the motion detect alarm can trigger
+        again after a motion detection has happened (+ 5 seconds).
+
+        Privilege: admin
+        Example params: isEnable=1, linkage=14, snapInterval=2, sensitivity=1, triggerInterval=5,
+            isMovAlarmEnable=1, isPirAlarmEnable=1, area0=1023, area1=1023, area2=1023, area3=1023,
+            area4=1023, area5=1023, area6=1023, area7=1023, area8=1023, area9=1023,
+            schedule0=281474976710655, schedule1=281474976710655, schedule2=281474976710655,
+            schedule3=281474976710655, schedule4=281474976710655, schedule5=281474976710655,
+            schedule6=281474976710655
+        """
+        return await self.command('setMotionDetectConfig', **params)
+
+    async def setLocalAlarmRecordConfig(self, **params):
+        """
+        Set local alarm-record config
+
+        Privilege: admin
+        Example params: isEnableLocalAlarmRecord=1, localAlarmRecordSecs=30
+        """
+        return await self.command('setLocalAlarmRecordConfig', **params)
+
+    async def getLocalAlarmRecordConfig(self, **params):
+        """
+        Get local alarm-record config
+
+        Privilege: admin
+        """
+        return await self.command('getLocalAlarmRecordConfig', **params)
+
+    async def getSnapConfig(self, **params):
+        """
+        Get snap config
+
+        Privilege: admin
+        """
+        return await self.command('getSnapConfig', **params)
+
+    async def setSnapConfig(self, **params):
+        """
+        Set snap config
+
+        Privilege: admin
+        Example params: snapQuality=1, saveLocation=2
+        """
+        return await self.command('setSnapConfig', **params)
+
+    async def getScheduleSnapConfig(self, **params):
+        """
+        Get schedule snap config
+
+        Privilege: admin
+        """
+        return await self.command('getScheduleSnapConfig', **params)
+
+    async def setScheduleSnapConfig(self, **params):
+        """
+        Set schedule snap config. To figure out the values for schedule parameters, you can possibly use the
+        (motion detection) schedule table in the 'Detector' view.
+
+        Privilege: admin
+        Example params: isEnable=0, snapInterval=2, schedule0=1023, schedule1=1023, schedule2=1023,
+            schedule3=1023, schedule4=1023, schedule5=1023, schedule6=1023
+        """
+        return await self.command('setScheduleSnapConfig', **params)
+
+    async def snapPicture(self, **params):
+        """
+        Manual snap picture
+
+        Privilege: visitor
+        """
+        return await self.command('snapPicture', **params)
+
+    async def snapPicture2(self, **params):
+        """
+        Manual snap picture. Get a jpg still image from the camera.
+
+        Privilege: visitor
+        """
+        return await self.command('snapPicture2', **params)
+
+    async def getRecordList(self, **params):
+        """
+        Get record list. Returns at most 10 recordings (record0-record9) starting from 'startNo', and
+        'totalCnt', the number of recordings from 'startTime' to 'endTime' (unix time). 'recordPath' as with
+        setRecordPath. If recent recordings are missing, see reloadRecordindex.
+
+        Privilege: admin
+        Example params: recordPath=0, startTime=0, endTime=2147483647, recordType=0, startNo=0
+        """
+        return await self.command('getRecordList', **params)
+
+    async def getRecordList2(self, **params):
+        """
+        Get record list. Returns at most 10 recordings (record0-record9) starting from 'startNo', and
+        'totalCnt', the number of recordings from 'startTime' to 'endTime' (unix time). 'recordPath' as with
+        setRecordPath. If recent recordings are missing, see reloadRecordindex.
+
+        Privilege: admin
+        Example params: recordPath=0, startTime=0, endTime=2147483647, recordType=0, startNo=0
+        """
+        return await self.command('getRecordList2', **params)
+
+    async def reloadRecordindex(self, **params):
+        """
+        Synchronization of record index for Play
+
+        Privilege: admin
+        """
+        return await self.command('reloadRecordindex', **params)
+
+    async def getAlarmRecordConfig(self, **params):
+        """
+        Get alarm record config
+
+        Privilege: admin
+        """
+        return await self.command('getAlarmRecordConfig', **params)
+
+    async def setAlarmRecordConfig(self, **params):
+        """
+        Set alarm record config
+
+        Privilege: admin
+        Example params: isEnablePreRecord=1, preRecordSecs=5, alarmRecordSecs=30
+        """
+        return await self.command('setAlarmRecordConfig', **params)
+
+    async def getRecordPath(self, **params):
+        """
+        Get record path for storage
+
+        Privilege: admin
+        """
+        return await self.command('getRecordPath', **params)
+
+    async def setRecordPath(self, **params):
+        """
+        Set record path for storage. How to read the response: 'setResult': 0 success, -1 Sd card is not
+        exist, -2 Share direction is not set, -3 Not enough space, -4 Param error, -5 Param recording.
+
+        Privilege: admin
+        Example params: path=2
+        """
+        return await self.command('setRecordPath', **params)
+
+    async def getScheduleRecordConfig(self, **params):
+        """
+        Get config for schedule recording
+
+        Privilege: admin
+        """
+        return await self.command('getScheduleRecordConfig', **params)
+
+    async def setScheduleRecordConfig(self, **params):
+        """
+        Set schedule recordconfig. (This can be disabled if you only want to record a video clip when motion
+        is detected.) The 'schedule' parameters work the same way as with setMotionDetectConfig, so you can
+        possibly use the table under the 'Detector' category to figure out the correct values.
+
+        Privilege: admin
+        Example params: isEnable=0, recordLevel=0, spaceFullMode=0, isEnableAudio=0,
+            schedule0=281474976710655, schedule1=281474976710655, schedule2=281474976710655,
+            schedule3=281474976710655, schedule4=281474976710655, schedule5=281474976710655,
+            schedule6=281474976710655
+        """
+        return await self.command('setScheduleRecordConfig', **params)
+
+    async def setIOAlarmConfig(self, **params):
+        """
+        Set IO alarm config
+
+        Privilege: admin
+        Example params: isEnable=1, linkage=16, snapInterval=2, alarmLevel=1, triggerInterval=5,
+            schedule0=1024, schedule1=1024, schedule2=1024, schedule3=1024, schedule4=1024, schedule5=1024,
+            schedule6=1024
+        """
+        return await self.command('setIOAlarmConfig', **params)
+
+    async def getIOAlarmConfig(self, **params):
+        """
+        Get IO alarm config
+
+        Privilege: admin
+        """
+        return await self.command('getIOAlarmConfig', **params)
+
+    async def clearIOAlarmOutput(self, **params):
+        """
+        Clean IO alarm output
+
+        Privilege: admin
+        """
+        return await self.command('clearIOAlarmOutput', **params)
+
+    async def setAudioAlarmConfig(self, **params):
+        """
+        Set the sound detection config. For 'sensitivity' probably only 0, 1 and 2 work. 'Linkage' and
+        'schedule' work the same way as with setMotionDetectConfig above, so you can use the table above to
+        figure out the correct values.
+
+        Privilege: admin
+        Example params: isEnable=1, linkage=14, snapInterval=2, sensitivity=1, triggerInterval=5,
+            schedule0=281474976710655, schedule1=281474976710655, schedule2=281474976710655,
+            schedule3=281474976710655, schedule4=281474976710655, schedule5=281474976710655,
+            schedule6=281474976710655
+        """
+        return await self.command('setAudioAlarmConfig', **params)
+
+    async def getAudioAlarmConfig(self, **params):
+        """
+        Get Audio alarm config
+
+        Privilege: admin
+        """
+        return await self.command('getAudioAlarmConfig', **params)
+
+    async def setPCAudioAlarmCfg(self, **params):
+        """
+        Set audio alarm config for PC（web live video）
+
+        Privilege: admin
+        Example params: isEnablePCAudioAlarm=1
+        """
+        return await self.command('setPCAudioAlarmCfg', **params)
+
+    async def getPCAudioAlarmCfg(self, **params):
+        """
+        Get audio alarm config for PC（web live video）
+
+        Privilege: admin
+        """
+        return await self.command('getPCAudioAlarmCfg', **params)
+
+    async def getMultiDevList(self, **params):
+        """
+        Get multi device list
+
+        Privilege: admin
+        """
+        return await self.command('getMultiDevList', **params)
+
+    async def getMultiDevDetailInfo(self, **params):
+        """
+        Get multi device information
+
+        Privilege: admin
+        """
+        return await self.command('getMultiDevDetailInfo', **params)
+
+    async def addMultiDev(self, **params):
+        """
+        Add multiy device
+
+        Privilege: admin
+        Example params: chnnl=2, productType=H264, ip=192.168.1.3, port=88, mediaPort=88, userName=admin,
+            passWord=, devName=FI9805W
+        """
+        return await self.command('addMultiDev', **params)
+
+    async def delMultiDev(self, **params):
+        """
+        Delete multiy device
+
+        Privilege: admin
+        Example params: chnnl=2
+        """
+        return await self.command('delMultiDev', **params)
+
+    async def setDeFrameLevel(self, **params):
+        """
+        Set status to enhance night vision definition
+
+        Privilege: admin
+        Example params: level=0
+        """
+        return await self.command('setDeFrameLevel', **params)
+
+    async def getDeFrameLevel(self, **params):
+        """
+        Get status of enhance the night vision definition
+
+        Privilege: admin
+        """
+        return await self.command('getDeFrameLevel', **params)
+
+    async def addAccount(self, **params):
+        """
+        Add user account
+
+        Privilege: admin
+        Example params: usrName=test, usrPwd=test, privilege=0
+        """
+        return await self.command('addAccount', **params)
+
+    async def delAccount(self, **params):
+        """
+        Delete user account
+
+        Privilege: admin
+        Example params: usrName=test
+        """
+        return await self.command('delAccount', **params)
+
+    async def getPassword(self, **params):
+        """
+        Get user password
+
+        Privilege: admin
+        Example params: usrName=test
+        """
+        return await self.command('getPassword', **params)
+
+    async def changePassword(self, **params):
+        """
+        Change password
+
+        Privilege: admin
+        Example params: usrName=admin, oldPwd=, newPwd=test
+        """
+        return await self.command('changePassword', **params)
+
+    async def changeUserName(self, **params):
+        """
+        Change user name
+
+        Privilege: admin
+        Example params: usrName=admin, newUsrName=newname
+        """
+        return await self.command('changeUserName', **params)
+
+    async def changeUserNameAndPwdTogether(self, **params):
+        """
+        Change user name and password together
+
+        Privilege: admin
+        Example params: usrName=admin, newUsrName=newname, oldPwd=, newPwd=newpwd
+        """
+        return await self.command('changeUserNameAndPwdTogether', **params)
+
+    async def logIn(self, **params):
+        """
+        User log in to camera
+
+        Privilege: visitor
+        Example params: usrName=admin, remoteIp=192.168.1.12, groupId=673982479
+        """
+        return await self.command('logIn', **params)
+
+    async def logOut(self, **params):
+        """
+        User log out to camera
+
+        Privilege: visitor
+        Example params: usrName=admin, ip=192.168.1.12, groupId=673982479
+        """
+        return await self.command('logOut', **params)
+
+    async def getSessionList(self, **params):
+        """
+        Get current session list of the camera
+
+        Privilege: admin
+        """
+        return await self.command('getSessionList', **params)
+
+    async def getUserList(self, **params):
+        """
+        Get user account list of the camera
+
+        Privilege: admin
+        """
+        return await self.command('getUserList', **params)
+
+    async def usrBeatHeart(self, **params):
+        """
+        user checks connection with camera
+
+        Privilege: visitor
+        Example params: usrName=admin, ip=192.168.1.13, groupId=673982479
+        """
+        return await self.command('usrBeatHeart', **params)
+
+    async def ptzMoveUp(self, **params):
+        """
+        Move up
+
+        Privilege: operator
+        """
+        return await self.command('ptzMoveUp', **params)
+
+    async def ptzMoveDown(self, **params):
+        """
+        Move down
+
+        Privilege: operator
+        """
+        return await self.command('ptzMoveDown', **params)
+
+    async def ptzMoveLeft(self, **params):
+        """
+        Move to left
+
+        Privilege: operator
+        """
+        return await self.command('ptzMoveLeft', **params)
+
+    async def ptzMoveRight(self, **params):
+        """
+        Move to right
+
+        Privilege: operator
+        """
+        return await self.command('ptzMoveRight', **params)
+
+    async def ptzMoveTopLeft(self, **params):
+        """
+        Move to top left
+
+        Privilege: operator
+        """
+        return await self.command('ptzMoveTopLeft', **params)
+
+    async def ptzMoveTopRight(self, **params):
+        """
+        Move to top right
+
+        Privilege: operator
+        """
+        return await self.command('ptzMoveTopRight', **params)
+
+    async def ptzMoveBottomLeft(self, **params):
+        """
+        Move to bottom left
+
+        Privilege: operator
+        """
+        return await self.command('ptzMoveBottomLeft', **params)
+
+    async def ptzMoveBottomRight(self, **params):
+        """
+        Move to bottom right
+
+        Privilege: operator
+        """
+        return await self.command('ptzMoveBottomRight', **params)
+
+    async def ptzStopRun(self, **params):
+        """
+        Stop run PT
+
+        Privilege: operator
+        """
+        return await self.command('ptzStopRun', **params)
+
+    async def ptzReset(self, **params):
+        """
+        Reset PT to default position
+
+        Privilege: operator
+        """
+        return await self.command('ptzReset', **params)
+
+    async def getPTZSpeed(self, **params):
+        """
+        Get the speed of PT
+
+        Privilege: operator
+        """
+        return await self.command('getPTZSpeed', **params)
+
+    async def setPTZSpeed(self, **params):
+        """
+        Set the speed of PT
+
+        Privilege: operator
+        Example params: speed=2
+        """
+        return await self.command('setPTZSpeed', **params)
+
+    async def getPTZPresetPointList(self, **params):
+        """
+        Get all preset point. The device can support at most 16 preset points. There are four default
+        points: LeftMost, RightMost, TopMost, BottomMost.
+
+        Privilege: operator
+        """
+        return await self.command('getPTZPresetPointList', **params)
+
+    async def ptzAddPresetPoint(self, **params):
+        """
+        Add preset point. The preset point position will be the current PT position. Third-party
+        applications usually use simply numbers (e.g. 1 or 5) as the names. If a preset with the given name
+        already exists, you may have to delete it first (see ptzDeletePresetPoint).
+
+        Privilege: admin
+        Example params: name=1
+        """
+        return await self.command('ptzAddPresetPoint', **params)
+
+    async def ptzDeletePresetPoint(self, **params):
+        """
+        Delete preset point by name. If the preset is defined as the preset to go to after boot, you may
+        have to change that definition to something else first (see setPTZPrePointForSelfTest).
+
+        Privilege: admin
+        Example params: name=test
+        """
+        return await self.command('ptzDeletePresetPoint', **params)
+
+    async def ptzGotoPresetPoint(self, **params):
+        """
+        Goto preset position
+
+        Privilege: operator
+        Example params: name=test
+        """
+        return await self.command('ptzGotoPresetPoint', **params)
+
+    async def ptzGetCruiseMapList(self, **params):
+        """
+        Get all cruise map list
+
+        Privilege: operator
+        """
+        return await self.command('ptzGetCruiseMapList', **params)
+
+    async def ptzGetCruiseMapInfo(self, **params):
+        """
+        Get the detail info of a cruise map by name
+
+        Privilege: operator
+        Example params: name=1
+        """
+        return await self.command('ptzGetCruiseMapInfo', **params)
+
+    async def ptzSetCruiseMap(self, **params):
+        """
+        Add a cruise map. Our device can support at most 8 preset point one cruise map. The 'name' is the
+        name of the cruise map. The 'point' parameters are preset names.
+
+        Privilege: admin
+        Example params: name=test, point0=test0, point1=test1, point2=test2, point3=test3, point4=test4,
+            point5=test5, point6=, point7=
+        """
+        return await self.command('ptzSetCruiseMap', **params)
+
+    async def ptzDelCruiseMap(self, **params):
+        """
+        Delete a cruise map
+
+        Privilege: admin
+        Example params: name=test
+        """
+        return await self.command('ptzDelCruiseMap', **params)
+
+    async def ptzStartCruise(self, **params):
+        """
+        Start a specificate cruise
+
+        Privilege: operator
+        Example params: mapName=test
+        """
+        return await self.command('ptzStartCruise', **params)
+
+    async def ptzStopCruise(self, **params):
+        """
+        Start current cruise
+
+        Privilege: operator
+        """
+        return await self.command('ptzStopCruise', **params)
+
+    async def setCruiseTime(self, **params):
+        """
+        Set time for continue cruise
+
+        Privilege: operator
+        Example params: time=5
+        """
+        return await self.command('setCruiseTime', **params)
+
+    async def getCruiseTime(self, **params):
+        """
+        Get time for continue cruise. NOTE: The API PDF starting from here is full of errors and weird
+        things, so the rest of the cruise commands probably contain some errors.
+
+        Privilege: operator
+        """
+        return await self.command('getCruiseTime', **params)
+
+    async def setCruiseTimeCustomed(self, **params):
+        """
+        Set time for continue cruise by costomer
+
+        Privilege: operator
+        Example params: time=5, customed=1
+        """
+        return await self.command('setCruiseTimeCustomed', **params)
+
+    async def getCruiseTimeCustomed(self, **params):
+        """
+        Get time for customed continue cruise.
+
+        Privilege: operator
+        """
+        return await self.command('getCruiseTimeCustomed', **params)
+
+    async def setCruiseLoopCnt(self, **params):
+        """
+        Set counts for continue cruise
+
+        Privilege: operator
+        Example params: count=5
+        """
+        return await self.command('setCruiseLoopCnt', **params)
+
+    async def getCruiseLoopCnt(self, **params):
+        """
+        Set counts for continue cruise
+
+        Privilege: operator
+        """
+        return await self.command('getCruiseLoopCnt', **params)
+
+    async def setCruiseCtrlMode(self, **params):
+        """
+        Set control mode for continue cruise, by time or count
+
+        Privilege: operator
+        Example params: mode=0
+        """
+        return await self.command('setCruiseCtrlMode', **params)
+
+    async def getCruiseCtrlMode(self, **params):
+        """
+        Get control mode for continue cruise, by time or count
+
+        Privilege: operator
+        """
+        return await self.command('getCruiseCtrlMode', **params)
+
+    async def setCruisePrePointLingerTime(self, **params):
+        """
+        Set linger time for cruise,when pt arrive prepoint
+
+        Privilege: operator
+        Example params: name=123, time0=0, time1=1, time2=2, time3=3, time4=4, time5=5, time6=6, time7=7
+        """
+        return await self.command('setCruisePrePointLingerTime', **params)
+
+    async def getCruisePrePointLingerTime(self, **params):
+        """
+        Set linger time for cruise,when pt arrive prepoint
+
+        Privilege: operator
+        Example params: name=test
+        """
+        return await self.command('getCruisePrePointLingerTime', **params)
+
+    async def zoomIn(self, **params):
+        """
+        Zoom in
+
+        Privilege: operator
+        """
+        return await self.command('zoomIn', **params)
+
+    async def zoomOut(self, **params):
+        """
+        Zoom out
+
+        Privilege: operator
+        """
+        return await self.command('zoomOut', **params)
+
+    async def zoomStop(self, **params):
+        """
+        Stop zoom run
+
+        Privilege: operator
+        """
+        return await self.command('zoomStop', **params)
+
+    async def getZoomSpeed(self, **params):
+        """
+        Get the speed of Zoom
+
+        Privilege: operator
+        """
+        return await self.command('getZoomSpeed', **params)
+
+    async def setZoomSpeed(self, **params):
+        """
+        Set the speed of PTZ
+
+        Privilege: operator
+        Example params: speed=1
+        """
+        return await self.command('setZoomSpeed', **params)
+
+    async def setPTZSelfTestMode(self, **params):
+        """
+        Set the selftest mode of PTZ
+
+        Privilege: operator
+        Example params: mode=2
+        """
+        return await self.command('setPTZSelfTestMode', **params)
+
+    async def getPTZSelfTestMode(self, **params):
+        """
+        Get the selftest mode of PTZ
+
+        Privilege: operator
+        """
+        return await self.command('getPTZSelfTestMode', **params)
+
+    async def setPTZPrePointForSelfTest(self, **params):
+        """
+        Set presetpoint for selftest of PTZ. This setting defines the position of PTZ after the camera
+        boots. Set the preset name with this, and enable mode 2 with 'setPTZSelfTestMode'.
+
+        Privilege: operator
+        Example params: name=1
+        """
+        return await self.command('setPTZPrePointForSelfTest', **params)
+
+    async def getPTZPrePointForSelfTest(self, **params):
+        """
+        Get the presetpoint for selftest of PTZ
+
+        Privilege: operator
+        """
+        return await self.command('getPTZPrePointForSelfTest', **params)
+
+    async def set485Info(self, **params):
+        """
+        Set informations of 485
+
+        Privilege: operator
+        Example params: rs485Protocol=0, rs485Addr=1, rs485Baud=1200, rs485DataBit=7, rs485StopBit=1,
+            rs485Check=0
+        """
+        return await self.command('set485Info', **params)
+
+    async def get485Info(self, **params):
+        """
+        Get informations of 485
+
+        Privilege: operator
+        """
+        return await self.command('get485Info', **params)
+
+    async def getIPInfo(self, **params):
+        """
+        Get IP Info
+
+        Privilege: admin
+        """
+        return await self.command('getIPInfo', **params)
+
+    async def setIpInfo(self, **params):
+        """
+        Set IP Info
+
+        Privilege: admin
+        Example params: isDHCP=1, ip=192.168.1.88, gate=192.168.1.1, mask=255.255.255.0, dns1=8.8.8.8,
+            dns2=192.168.1.1
+        """
+        return await self.command('setIpInfo', **params)
+
+    async def refreshWifiList(self, **params):
+        """
+        Start scan the aps around
+
+        Privilege: admin
+        """
+        return await self.command('refreshWifiList', **params)
+
+    async def getWifiList(self, **params):
+        """
+        Get the aps around after refreshWifiList
+
+        Privilege: admin
+        Example params: startNo=0
+        """
+        return await self.command('getWifiList', **params)
+
+    async def setWifiSetting(self, **params):
+        """
+        Set wifi config. Give 'ssid' and 'psk'. Others you can usually ignore and leave as defaults.
+
+        Privilege: admin
+        Example params: isEnable=1, isUseWifi=1, ssid=wifi_SSID, netType=0, encryptType=3,
+            psk=wifi_password, authMode=2, keyFormat=0, defaultKey=1, key1=, key2=, key3=, key4=,
+            key1Len=64, key2Len=64, key3Len=64, key4Len=64
+        """
+        return await self.command('setWifiSetting', **params)
+
+    async def getWifiConfig(self, **params):
+        """
+        Get wifi config
+
+        Privilege: admin
+        """
+        return await self.command('getWifiConfig', **params)
+
+    async def getPortInfo(self, **params):
+        """
+        Get ports of camera
+
+        Privilege: admin
+        """
+        return await self.command('getPortInfo', **params)
+
+    async def setPortInfo(self, **params):
+        """
+        Set ports of camera
+
+        Privilege: admin
+        Example params: webPort=88, mediaPort=88, httpsPort=443, onvifPort=888
+        """
+        return await self.command('setPortInfo', **params)
+
+    async def getUPnPConfig(self, **params):
+        """
+        Get UpnP config
+
+        Privilege: admin
+        """
+        return await self.command('getUPnPConfig', **params)
+
+    async def setUPnPConfig(self, **params):
+        """
+        Set UpnP config
+
+        Privilege: admin
+        Example params: isEnable=1
+        """
+        return await self.command('setUPnPConfig', **params)
+
+    async def getDDNSConfig(self, **params):
+        """
+        Get DDNS config
+
+        Privilege: admin
+        """
+        return await self.command('getDDNSConfig', **params)
+
+    async def setDDNSConfig(self, **params):
+        """
+        Set DDNS config
+
+        Privilege: admin
+        Example params: isEnable=0, hostName=test.dyndns.org, ddnsServer=4, user=test, password=test
+        """
+        return await self.command('setDDNSConfig', **params)
+
+    async def setFtpConfig(self, **params):
+        """
+        Set FTP config
+
+        Privilege: admin
+        Example params: ftpAddr=ftp://192.168.1.2/sbuDir, ftpPort=21, mode=0, userName=test, password=test
+        """
+        return await self.command('setFtpConfig', **params)
+
+    async def getFtpConfig(self, **params):
+        """
+        Get FTP config
+
+        Privilege: admin
+        """
+        return await self.command('getFtpConfig', **params)
+
+    async def testFtpServer(self, **params):
+        """
+        Test FTP server
+
+        Privilege: admin
+        Example params: ftpAddr=ftp://192.168.1.2/sbuDir, ftpPort=21, mode=0, fptuserName=test,
+            ftppassword=test
+        """
+        return await self.command('testFtpServer', **params)
+
+    async def getSMTPConfig(self, **params):
+        """
+        Get mail config
+
+        Privilege: admin
+        """
+        return await self.command('getSMTPConfig', **params)
+
+    async def setSMTPConfig(self, **params):
+        """
+        Set mail config. Defaults work with Gmail. You have to enable 2-step verification for your Gmail
+        account and then create an app password in Google account settings. Gmail probably also supports
+        STARTTLS with port 587 or 25. For Hotmail use STARTTLS with port 587 or 25. Maximum length of
+        password may be 16.
+
+        Privilege: admin
+        Example params: isEnable=1, server=smtp.gmail.com, port=465, isNeedAuth=1,
+            user=youraccount@gmail.com, password=your_gmail_account_app_password,
+            sender=youraccount@gmail.com, reciever=youraccount@gmail.com,anotherreceiver@gmail.com, tls=1
+        """
+        return await self.command('setSMTPConfig', **params)
+
+    async def smtpTest(self, **params):
+        """
+        Test mail setting
+
+        Privilege: admin
+        Example params: smtpServer=smtp.gmail.com, port=465, isNeedAuth=1, user=youraccount@gmail.com,
+            password=your_gmail_account_app_password, sender=youraccount@gmail.com
+        """
+        return await self.command('smtpTest', **params)
+
+    async def setP2PEnable(self, **params):
+        """
+        Set p2p status
+
+        Privilege: admin
+        Example params: enable=0
+        """
+        return await self.command('setP2PEnable', **params)
+
+    async def getP2PEnable(self, **params):
+        """
+        Get p2p status
+
+        Privilege: admin
+        """
+        return await self.command('getP2PEnable', **params)
+
+    async def setP2PPort(self, **params):
+        """
+        Set p2p port
+
+        Privilege: admin
+        Example params: port=12345
+        """
+        return await self.command('setP2PPort', **params)
+
+    async def getP2PPort(self, **params):
+        """
+        Get p2p port
+
+        Privilege: admin
+        """
+        return await self.command('getP2PPort', **params)
+
+    async def getP2PInfo(self, **params):
+        """
+        Get p2p UID
+
+        Privilege: admin
+        """
+        return await self.command('getP2PInfo', **params)
+
+    async def getPPPoEConfig(self, **params):
+        """
+        Get PPPoE config
+
+        Privilege: admin
+        """
+        return await self.command('getPPPoEConfig', **params)
+
+    async def setPPPoEConfig(self, **params):
+        """
+        Set PPPoE config
+
+        Privilege: admin
+        Example params: isEnable=1, userName=usr, password=pwd
+        """
+        return await self.command('setPPPoEConfig', **params)
+
+    async def setSystemTime(self, **params):
+        """
+        Set system time. timeZone is the seconds between local time and GMT time. For example:
+        timeZone=-7200 presents GMT+2 time (e.g. Finland), timeZone=3600 presents GMT-01:00, and
+        timeZone=-3600 presents GMT+01:00
+
+        Privilege: admin
+        Example params: timeSource=0, ntpServer=Auto, dateFormat=0, timeFormat=1, timeZone=0, isDst=0,
+            dst=0, year=2022, mon=1, day=6, hour=9, minute=35, sec=0
+        """
+        return await self.command('setSystemTime', **params)
+
+    async def getSystemTime(self, **params):
+        """
+        Get system time
+
+        Privilege: admin
+        """
+        return await self.command('getSystemTime', **params)
+
+    async def openInfraLed(self, **params):
+        """
+        Force open infra led. The 'setInfraLedConfig' mode must be 1 (manual) for this to work.
+
+        Privilege: admin
+        """
+        return await self.command('openInfraLed', **params)
+
+    async def closeInfraLed(self, **params):
+        """
+        Force close infra led. The 'setInfraLedConfig' mode must be 1 (manual) for this to work.
+
+        Privilege: admin
+        """
+        return await self.command('closeInfraLed', **params)
+
+    async def getInfraLedConfig(self, **params):
+        """
+        Get infra led config
+
+        Privilege: admin
+        """
+        return await self.command('getInfraLedConfig', **params)
+
+    async def setInfraLedConfig(self, **params):
+        """
+        Set infra led config
+
+        Privilege: admin
+        Example params: mode=0
+        """
+        return await self.command('setInfraLedConfig', **params)
+
+    async def getScheduleInfraLedConfig(self, **params):
+        """
+        Get config for infra led switch schedule
+
+        Privilege: admin
+        """
+        return await self.command('getScheduleInfraLedConfig', **params)
+
+    async def setScheduleInfraLedConfig(self, **params):
+        """
+        Set config for infra led switch schedule
+
+        Privilege: admin
+        Example params: mode=
+        """
+        return await self.command('setScheduleInfraLedConfig', **params)
+
+    async def getDevState(self, **params):
+        """
+        Get all device state
+
+        Privilege: admin
+        """
+        return await self.command('getDevState', **params)
+
+    async def getDevName(self, **params):
+        """
+        Get camera name
+
+        Privilege: admin
+        """
+        return await self.command('getDevName', **params)
+
+    async def setDevName(self, **params):
+        """
+        Set camera name
+
+        Privilege: admin
+        Example params: devName=test
+        """
+        return await self.command('setDevName', **params)
+
+    async def getDevInfo(self, **params):
+        """
+        Get camera information
+
+        Privilege: admin
+        """
+        return await self.command('getDevInfo', **params)
+
+    async def getProductModel(self, **params):
+        """
+        Get camera model number
+
+        Privilege: visitor
+        """
+        return await self.command('getProductModel', **params)
+
+    async def getProductModelName(self, **params):
+        """
+        Get camera model name
+
+        Privilege: visitor
+        """
+        return await self.command('getProductModelName', **params)
+
+    async def getProductLanguage(self, **params):
+        """
+        Get camera main language
+
+        Privilege: visitor
+        """
+        return await self.command('getProductLanguage', **params)
+
+    async def getProductSensorType(self, **params):
+        """
+        Get camera sensor type number
+
+        Privilege: visitor
+        """
+        return await self.command('getProductSensorType', **params)
+
+    async def getProductWifiType(self, **params):
+        """
+        Get camera wifi type number
+
+        Privilege: visitor
+        """
+        return await self.command('getProductWifiType', **params)
+
+    async def getProductSdFlag(self, **params):
+        """
+        Whether camera support sd card
+
+        Privilege: visitor
+        """
+        return await self.command('getProductSdFlag', **params)
+
+    async def getProductOutdoorFlag(self, **params):
+        """
+        Whether camera is outdoor machine
+
+        Privilege: visitor
+        """
+        return await self.command('getProductOutdoorFlag', **params)
+
+    async def getProductPtFlag(self, **params):
+        """
+        Whether camera is pt machine
+
+        Privilege: visitor
+        """
+        return await self.command('getProductPtFlag', **params)
+
+    async def getProductZoomFlag(self, **params):
+        """
+        Whether camera is zoom machine
+
+        Privilege: visitor
+        """
+        return await self.command('getProductZoomFlag', **params)
+
+    async def getProductRs485Flag(self, **params):
+        """
+        Whether camera support rs485
+
+        Privilege: visitor
+        """
+        return await self.command('getProductRs485Flag', **params)
+
+    async def getProductIoAlarmFlag(self, **params):
+        """
+        Whether camera support IO alarm
+
+        Privilege: visitor
+        """
+        return await self.command('getProductIoAlarmFlag', **params)
+
+    async def getProductOnvifFlag(self, **params):
+        """
+        Whether camera support Onvif
+
+        Privilege: visitor
+        """
+        return await self.command('getProductOnvifFlag', **params)
+
+    async def getProductP2pFlag(self, **params):
+        """
+        Whether camera support P2p
+
+        Privilege: visitor
+        """
+        return await self.command('getProductP2pFlag', **params)
+
+    async def getProductWpsFlag(self, **params):
+        """
+        Whether camera support Wps
+
+        Privilege: visitor
+        """
+        return await self.command('getProductWpsFlag', **params)
+
+    async def getProductAudioFlag(self, **params):
+        """
+        Whether camera support audio-speak
+
+        Privilege: visitor
+        """
+        return await self.command('getProductAudioFlag', **params)
+
+    async def getProductTalkFlag(self, **params):
+        """
+        Whether camera support audio-talk
+
+        Privilege: visitor
+        """
+        return await self.command('getProductTalkFlag', **params)
+
+    async def getProductAppVer(self, **params):
+        """
+        Get camera application version
+
+        Privilege: visitor
+        """
+        return await self.command('getProductAppVer', **params)
+
+    async def getProductAllInfo(self, **params):
+        """
+        Get camera Information
+
+        Privilege: visitor
+        """
+        return await self.command('getProductAllInfo', **params)
+
+    async def getGeneratePubKey(self, **params):
+        """
+        Get public key generated by camera for software reset
+
+        Privilege: visitor
+        """
+        return await self.command('getGeneratePubKey', **params)
+
+    async def toolRestoreToFactory(self, **params):
+        """
+        Set camera reset to factory by software
+
+        Privilege: visitor
+        Example params: codeLen=10, code=xxxxxxxxxx
+        """
+        return await self.command('toolRestoreToFactory', **params)
+
+    async def rebootSystem(self, **params):
+        """
+        Reboot camera
+
+        Privilege: admin
+        """
+        return await self.command('rebootSystem', **params)
+
+    async def restoreToFactorySetting(self, **params):
+        """
+        Restore to factory setting. WARNING! This will erase all settings in camera and you may lose
+        connection to the camera, especially wireless. Also remember to close the new opened tab so that you
+        don't later accidentally reload that tab, performing the erase again. (For now clicking the button
+        only shows the URL - copy and paste it manually to the address bar and send.)
+
+        Privilege: admin
+        """
+        return await self.command('restoreToFactorySetting', **params)
+
+    async def exportConfig(self, **params):
+        """
+        Export config file. After calling this command, you can get the config file by visiting the
+        following address: /configs/export/configs.bin
+
+        Privilege: admin
+        """
+        return await self.command('exportConfig', **params)
+
+    async def ImportConfig(self, **params):
+        """
+        Import config file. See the Foscam API PDF documentation how this actually works. This button
+        probably does not work.
+
+        Privilege: admin
+        """
+        return await self.command('ImportConfig', **params)
+
+    async def FwUpgrade(self, **params):
+        """
+        Upgrade firmware. See the Foscam API PDF documentation how this actually works. This button probably
+        does not work.
+
+        Privilege: admin
+        """
+        return await self.command('FwUpgrade', **params)
+
+    async def removePatch(self, **params):
+        """
+        remove firewall patch
+
+        Privilege: admin
+        """
+        return await self.command('removePatch', **params)
+
+    async def getFirewallConfig(self, **params):
+        """
+        Get firewall config
+
+        Privilege: admin
+        """
+        return await self.command('getFirewallConfig', **params)
+
+    async def setFirewallConfig(self, **params):
+        """
+        Set firewall config
+
+        Privilege: admin
+        Example params: isEnable=1, rule=0, ipList0=0, ipList1=0, ipList2=0, ipList3=0, ipList4=0,
+            ipList5=0, ipList6=0, ipList7=0
+        """
+        return await self.command('setFirewallConfig', **params)
+
+    async def getLog(self, **params):
+        """
+        Get system log
+
+        Privilege: admin
+        Example params: offset=0, count=20
+        """
+        return await self.command('getLog', **params)
+
+    async def getAudioVolume(self, **params):
+        """
+        Get Audio Volume
+
+        Privilege: admin
+        """
+        return await self.command('getAudioVolume', **params)
+
+    async def setAudioVolume(self, **params):
+        """
+        Set Audio Volume
+
+        Privilege: admin
+        Example params: volume=100
+        """
+        return await self.command('setAudioVolume', **params)
+
+    async def getWifiMode(self, **params):
+        """
+        Get Wifi Mode
+
+        Privilege: admin
+        """
+        return await self.command('getWifiMode', **params)
+
+    async def getTemperatureAlarmConfig(self, **params):
+        """
+        Get Temperature Alarm Config
+
+        Privilege: admin
+        """
+        return await self.command('getTemperatureAlarmConfig', **params)
+
+    async def setTemperatureAlarmConfig(self, **params):
+        """
+        Set Temperature Alarm Config
+
+        Privilege: admin
+        Example params: isEnable=1, linkage=129, topLimit=40, triggerInterval=5, schedule0=1023,
+            schedule1=1023, schedule2=1023, schedule3=1023, schedule4=1023, schedule5=1023, schedule6=1023
+        """
+        return await self.command('setTemperatureAlarmConfig', **params)
+
+    async def getTemperatureState(self, **params):
+        """
+        Get Temperature Degree
+
+        Privilege: admin
+        """
+        return await self.command('getTemperatureState', **params)
+
+    async def setMusicDefaultListRefresh(self, **params):
+        """
+        Refresh default list
+
+        Privilege: admin
+        """
+        return await self.command('setMusicDefaultListRefresh', **params)
+
+    async def getMusicListsName(self, **params):
+        """
+        Get Music lists name
+
+        Privilege: admin
+        """
+        return await self.command('getMusicListsName', **params)
+
+    async def getMusicsNameOfList(self, **params):
+        """
+        Get Musics name of list
+
+        Privilege: admin
+        Example params: name=default, startNo=0, musicNum=50
+        """
+        return await self.command('getMusicsNameOfList', **params)
+
+    async def addMusicList(self, **params):
+        """
+        Add Musics list and music
+
+        Privilege: admin
+        Example params: name=1, music0=1.wav, music1=, music2=, music3=, music4=, music5=
+        """
+        return await self.command('addMusicList', **params)
+
+    async def delMusicList(self, **params):
+        """
+        Delete Musics list and music
+
+        Privilege: admin
+        Example params: name=1
+        """
+        return await self.command('delMusicList', **params)
+
+    async def setMusicPlayMode(self, **params):
+        """
+        Set Musics Play Mode
+
+        Privilege: admin
+        Example params: mode=1
+        """
+        return await self.command('setMusicPlayMode', **params)
+
+    async def getMusicPlayMode(self, **params):
+        """
+        Get Musics Play Mode
+
+        Privilege: admin
+        """
+        return await self.command('getMusicPlayMode', **params)
+
+    async def setMusicPlayNext(self, **params):
+        """
+        Play Next Music
+
+        Privilege: admin
+        """
+        return await self.command('setMusicPlayNext', **params)
+
+    async def setMusicPlayPre(self, **params):
+        """
+        Play Precede Music
+
+        Privilege: admin
+        """
+        return await self.command('setMusicPlayPre', **params)
+
+    async def getMusicPlayState(self, **params):
+        """
+        Get Music Play State
+
+        Privilege: admin
+        """
+        return await self.command('getMusicPlayState', **params)
+
+    async def setMusicPlayStart(self, **params):
+        """
+        Start Play Music
+
+        Privilege: admin
+        Example params: mode=1, index=0, name=default
+        """
+        return await self.command('setMusicPlayStart', **params)
+
+    async def setMusicPlayStop(self, **params):
+        """
+        Stop Play Music
+
+        Privilege: admin
+        """
+        return await self.command('setMusicPlayStop', **params)
+
+    async def setMusicDormantTime(self, **params):
+        """
+        Set Music Dormant Time
+
+        Privilege: admin
+        Example params: minutes=10
+        """
+        return await self.command('setMusicDormantTime', **params)
+
+    async def getMusicDormantTime(self, **params):
+        """
+        Get Music Dormant Time
+
+        Privilege: admin
+        """
+        return await self.command('getMusicDormantTime', **params)
+
+    async def getCloudConfig(self, **params):
+        """
+        Get Cloud Config
+
+        Privilege: admin
+        """
+        return await self.command('getCloudConfig', **params)
+
+    async def setCloudConfig(self, **params):
+        """
+        Set Cloud Config
+
+        Privilege: admin
+        Example params: isEnable=0, cloudServer=1, code=Authorization code from server
+        """
+        return await self.command('setCloudConfig', **params)
+
+    async def selectCloudServer(self, **params):
+        """
+        Select Cloud Server
+
+        Privilege: admin
+        Example params: isEnable=0, cloudServer=2
+        """
+        return await self.command('selectCloudServer', **params)
+
+    async def getCloudToken(self, **params):
+        """
+        Get Cloud Token. Call this cgi, then call getCloudConfig 10s later, find accessToken
+
+        Privilege: admin
+        Example params: isEnable=1, cloudServer=2, code=dfasdfdfadf
+        """
+        return await self.command('getCloudToken', **params)
+
+    async def getCloudQuota(self, **params):
+        """
+        Get Cloud Quota. Call this cgi, then call getCloudConfig 10s later, find accessToken
+
+        Privilege: admin
+        Example params: isEnable=1, cloudServer=2, code=dfasdfdfadf
+        """
+        return await self.command('getCloudQuota', **params)
+
+    async def testCloudServer(self, **params):
+        """
+        Get Cloud Quota. Call this cgi, then call getCloudConfig 10s later, find accessToken
+
+        Privilege: admin
+        Example params: isEnable=1, cloudServer=2, code=dfasdfdfadf
+        """
+        return await self.command('testCloudServer', **params)
+
+    async def getPushConfig(self, **params):
+        """
+        Get Push Config
+
+        Privilege: admin
+        """
+        return await self.command('getPushConfig', **params)
+
+    async def setPushConfig(self, **params):
+        """
+        Set Push Config
+
+        Privilege: admin
+        Example params: isEnable=1, pushServer=1
+        """
+        return await self.command('setPushConfig', **params)
+
+    async def testPushServer(self, **params):
+        """
+        Test Push Server
+
+        Privilege: admin
+        Example params: isEnable=1, pushServer=1, usr=admin
+        """
+        return await self.command('testPushServer', **params)
+
+    async def pushOperate(self, **params):
+        """
+        Test Push pushOperate
+
+        Privilege: admin
+        """
+        return await self.command('pushOperate', **params)
+
+    async def SetOnlineUpgrade(self, **params):
+        """
+        Online upgrade
+
+        Privilege: admin
+        Example params: update_type=1, url=http://bcs.duapp.com/foscam/FosBaby_B_app_ver2.x.1.11.bin,
+            cycle=0
+        """
+        return await self.command('SetOnlineUpgrade', **params)
+
+    async def setCloudStreamLevel(self, **params):
+        """
+        Set cloud stream level
+
+        Privilege: admin
+        Example params: level=30
+        """
+        return await self.command('setCloudStreamLevel', **params)
+
+    async def getCloudStreamLevel(self, **params):
+        """
+        Get cloud stream level
+
+        Privilege: admin
+        """
+        return await self.command('getCloudStreamLevel', **params)
+
+    async def setSubVideoStreamType(self, **params):
+        """
+        Set the stream type of sub stream
+
+        Privilege: admin
+        Example params: streamType=0
+        """
+        return await self.command('setSubVideoStreamType', **params)
+
+    async def importConfig(self, **params):
+        """
+        Import config file. See the Foscam API PDF documentation how this actually works. This button
+        probably does not work.
+
+        Privilege: admin
+        """
+        return await self.command('importConfig', **params)
+
+    async def fwUpgrade(self, **params):
+        """
+        Upgrade firmware. See the Foscam API PDF documentation how this actually works. This button probably
+        does not work.
+
+        Privilege: admin
+        """
+        return await self.command('fwUpgrade', **params)
+
+    async def focusNear(self, **params):
+        """
+        Focus near.
+
+        Privilege: operator
+        """
+        return await self.command('focusNear', **params)
+
+    async def focusFar(self, **params):
+        """
+        Focus far.
+
+        Privilege: operator
+        """
+        return await self.command('focusFar', **params)
+
+    async def focusStop(self, **params):
+        """
+        Stop the focusing motor.
+
+        Privilege: operator
+        """
+        return await self.command('focusStop', **params)
@@ -0,0 +1,248 @@
+"""
+A minimal asyncio HTTP/1.1 client for the cameras' embedded web server: keep-alive connections, optional
+pipelining, and a per-camera pool of them. Only what the CGI API needs (GET requests) is implemented.
+"""
+
+import asyncio
+import time
+
+
+class HttpError(Exception):
+    """
+    The camera closed the connection or sent something that is not a valid HTTP response.
+    """
+
+
+class HttpResponse:
+    def __init__(self, status: int, reason: str, headers: dict, body: bytes, keep_alive: bool, head_received: float = None):
+        self.status = status
+        self.reason = reason
+        self.headers = headers      # lowercase header names
+        self.body = body
+        self.keep_alive = keep_alive
+        self.head_received = head_received  # time.perf_counter() when the headers were read
+        self.first_byte_time = None     # seconds from sending the request to receiving the headers
+        self.connect_time = None        # seconds to open the connection, if it was opened for this request
+
+    def __repr__(self):
+        return f"HttpResponse({self.status} {self.reason}, {len(self.body)} B)"
+
+
+def build_request(host: str, port: int, target: str, method: str = "GET", headers=None):
+    lines = [f"{method} {target} HTTP/1.1", f"Host: {host}:{port}", "Connection: keep-alive"]
+    for name, value in (headers or {}).items():
+        lines.append(f"{name}: {value}")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+
+async def read_response_head(reader: asyncio.StreamReader):
+    """
+    Reads the status line and the headers. Returns (status, reason, headers, http_version).
+    """
+    status_line = await reader.readline()
+    if not status_line:
+        raise HttpError("Connection closed by the camera")
+    try:
+        version, status, *reason = status_line.decode("latin-1").rstrip("\r\n").split(" ", 2)
+        status = int(status)
+    except ValueError:
+        raise HttpError(f"Invalid status line: {status_line!r}")
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n"):
+            break
+        if not line:
+            raise HttpError("Connection closed while reading the headers")
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return status, reason[0] if reason else "", headers, version
+
+
+async def read_response(reader: asyncio.StreamReader, method: str = "GET"):
+    """
+    Reads one complete response (Content-Length, chunked, or until the connection closes).
+    """
+    status, reason, headers, version = await read_response_head(reader)
+    head_received = time.perf_counter()
+    keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+    if method == "HEAD" or status in (204, 304) or 100 <= status < 200:
+        body = b""
+    elif headers.get("transfer-encoding", "").lower() == "chunked":
+        chunks = []
+        while True:
+            size_line = await reader.readline()
+            try:
+                size = int(size_line.split(b";")[0], 16)
+            except ValueError:
+                raise HttpError(f"Invalid chunk size: {size_line!r}")
+            if size == 0:
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass    # trailers
+                break
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+        body = b"".join(chunks)
+    elif "content-length" in headers:
+        body = await reader.readexactly(int(headers["content-length"]))
+    else:
+        body = await reader.read()
+        keep_alive = False
+    return HttpResponse(status, reason, headers, body, keep_alive, head_received)
+
+
+class HttpConnection:
+    """
+    One keep-alive connection to a camera. Several requests may be pipelined on it: they are written
+    immediately and their responses are read in order.
+    """
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.reader = None
+        self.writer = None
+        self.closed = False
+        self.in_flight = 0
+        self.requests = 0           # requests sent on this connection so far
+        self.connect_time = None    # seconds that open() took
+        self.last_used = time.monotonic()
+        self._write_lock = asyncio.Lock()
+        self._previous_read = None  # completes when the latest pipelined response has been read
+
+    async def open(self, timeout: float):
+        started = time.perf_counter()
+        self.reader, self.writer = await asyncio.wait_for(asyncio.open_connection(self.host, self.port), timeout)
+        self.connect_time = time.perf_counter() - started
+
+    async def request(self, target: str, headers=None):
+        """
+        Sends the request and reads its response. The caller (ConnectionPool) keeps `in_flight` up to date.
+        """
+        self.requests += 1
+        try:
+            async with self._write_lock:
+                if self.closed:
+                    raise HttpError("Connection already closed")
+                self.writer.write(build_request(self.host, self.port, target, headers=headers))
+                sent = time.perf_counter()
+                previous = self._previous_read
+                mine = self._previous_read = asyncio.get_running_loop().create_future()
+                try:
+                    await self.writer.drain()
+                except BaseException:
+                    mine.set_result(None)
+                    self.close()
+                    raise
+            try:
+                if previous is not None:
+                    await asyncio.shield(previous)
+                if self.closed:
+                    raise HttpError("Connection closed before the response")
+                response = await read_response(self.reader)
+            except BaseException:
+                self.close()    # the stream is out of sync, so the pipelined requests after this one fail too
+                raise
+            finally:
+                mine.set_result(None)
+            if not response.keep_alive:
+                self.close()
+            response.first_byte_time = response.head_received - sent
+            return response
+        finally:
+            self.last_used = time.monotonic()
+
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            if self.writer is not None:
+                self.writer.close()
+
+
+class ConnectionPool:
+    """
+    Keep-alive connections to one camera. At most `max_connections` connections are opened, and each carries
+    at most `pipeline_depth` requests at a time; further requests wait. The embedded web servers close idle
+    connections after a while, so connections idle for longer than `idle_timeout` are not reused.
+    """
+    def __init__(self, host: str, port: int, max_connections: int = 2, pipeline_depth: int = 1,
+                 connect_timeout: float = 3.0, idle_timeout: float = 10.0):
+        self.host = host
+        self.port = port
+        self.max_connections = max_connections
+        self.pipeline_depth = pipeline_depth
+        self.connect_timeout = connect_timeout
+        self.idle_timeout = idle_timeout
+        self.connections = []
+        self._slots = asyncio.Semaphore(max_connections * pipeline_depth)
+        self._opening = 0
+        self._changed = asyncio.Event()     # set and replaced when a connection has opened or finished a request
+
+    def _notify(self):
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def _pick_connection(self):
+        now = time.monotonic()
+        for connection in list(self.connections):
+            if connection.closed or (connection.in_flight == 0 and now - connection.last_used > self.idle_timeout):
+                connection.close()
+                self.connections.remove(connection)
+        candidates = [c for c in self.connections if c.in_flight < self.pipeline_depth]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda c: c.in_flight)
+
+    async def _acquire(self):
+        """
+        Returns a connection for one more request, with its `in_flight` already incremented: an idle connection
+        if there is one, else a new connection if the limit allows, else the least busy connection for pipelining.
+        """
+        while True:
+            connection = self._pick_connection()
+            if connection is not None and connection.in_flight == 0:
+                break
+            if len(self.connections) + self._opening < self.max_connections:
+                self._opening += 1
+                try:
+                    connection = HttpConnection(self.host, self.port)
+                    await connection.open(self.connect_timeout)
+                finally:
+                    self._opening -= 1
+                    self._notify()
+                self.connections.append(connection)
+                break
+            if connection is not None:
+                break
+            await self._changed.wait()  # all connections are still being opened by other requests
+        connection.in_flight += 1
+        return connection
+
+    async def request(self, target: str, timeout: float = 10.0, headers=None):
+        """
+        Sends a GET request and returns the HttpResponse. A failure on a reused connection (e.g. closed by the
+        camera while idle) is retried once on a new connection.
+        """
+        async with self._slots:
+            for attempt in range(2):
+                connection = await self._acquire()
+                reused = connection.requests > 0
+                try:
+                    response = await asyncio.wait_for(connection.request(target, headers), timeout)
+                    if not reused:
+                        response.connect_time = connection.connect_time
+                    return response
+                except (HttpError, ConnectionError, asyncio.IncompleteReadError):
+                    connection.close()
+                    if not reused or attempt > 0:
+                        raise
+                except asyncio.TimeoutError:
+                    connection.close()
+                    raise
+                finally:
+                    connection.in_flight -= 1
+                    self._notify()
+
+    def close(self):
+        for connection in self.connections:
+            connection.close()
+        self.connections = []
@@ -0,0 +1,185 @@
+"""
+Finds Foscam compatible cameras in a network, and writes them to a settings file that the index.html can import
+(Add/Remove camera -> Import) and the other tools can read (--settings).
+
+    python3 -m foscam_cgi.discovery 192.168.1.0/24 --password secret --output FoscamApiDiscovered.json
+
+Every address and port is first probed with a TCP connection (thousands at once, with a short timeout). An open
+port is then asked getDevInfo through /cgi-bin/CGIProxy.fcgi (HD cameras), and if that is not found, the
+/get_status.cgi of the older SD camera API (IP Camera CGI V1.27). Give --merge to add the found cameras to an
+existing exported settings file instead of a new one.
+"""
+
+import argparse
+import asyncio
+import ipaddress
+import json
+import re
+import sys
+from pathlib import Path
+from urllib.parse import quote
+
+try:
+    import resource     # not available on Windows
+except ImportError:
+    resource = None
+
+from .cameras import Camera, settings_document
+from .client import CGIResult, CameraError, build_cgi_target
+from .connection import HttpConnection, HttpError
+
+_sd_variable = re.compile(r"var\s+(\w+)\s*=\s*'?([^';]*)'?;")
+
+
+class Found:
+    """
+    A camera that answered. `authenticated` is False if it rejected the credentials (it still is a camera).
+    """
+    def __init__(self, ip: str, port: int, isOldSdCamera: bool, authenticated: bool, info: dict):
+        self.ip = ip
+        self.port = port
+        self.isOldSdCamera = isOldSdCamera
+        self.authenticated = authenticated
+        self.info = info
+
+    @property
+    def name(self):
+        return str(self.info.get("devName") or self.info.get("alias") or self.info.get("productName") or "")
+
+    def camera(self, user: str, password: str):
+        return Camera(self.ip, user, password, self.name, self.port, self.isOldSdCamera,
+                      model=str(self.info.get("productName") or ""))
+
+    def __repr__(self):
+        kind = "SD" if self.isOldSdCamera else "HD"
+        status = "" if self.authenticated else ", wrong credentials"
+        return f"{self.ip}:{self.port} {kind} {self.name!r}{status}"
+
+
+def expand_targets(targets):
+    """
+    Yields the host addresses of networks ("192.168.1.0/24"), ranges ("192.168.1.10-192.168.1.50") and addresses.
+    """
+    for target in targets:
+        first, separator, last = target.partition("-")
+        if separator:
+            start, end = int(ipaddress.ip_address(first)), int(ipaddress.ip_address(last))
+            for address in range(start, end + 1):
+                yield str(ipaddress.ip_address(address))
+        elif "/" in target:
+            yield from (str(host) for host in ipaddress.ip_network(target, strict=False).hosts())
+        else:
+            yield target
+
+
+def raise_open_files_limit(wanted: int):
+    """
+    Raises the soft limit of open files towards `wanted`. Returns the usable number of concurrent sockets.
+    """
+    if resource is None:
+        return min(wanted, 500)     # the default select() based event loop on Windows handles ~500 sockets
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < wanted + 64 and (hard == resource.RLIM_INFINITY or soft < hard):
+        soft = wanted + 64 if hard == resource.RLIM_INFINITY else min(hard, wanted + 64)
+        resource.setrlimit(resource.RLIMIT_NOFILE, (soft, hard))
+    return max(1, min(wanted, soft - 64))
+
+
+class Scanner:
+    def __init__(self, user: str = "admin", password: str = "", ports=(88,), concurrency: int = 2000,
+                 connect_timeout: float = 0.5, probe_timeout: float = 3.0):
+        self.user = user
+        self.password = password
+        self.ports = ports
+        self.concurrency = raise_open_files_limit(concurrency)
+        self.connect_timeout = connect_timeout
+        self.probe_timeout = probe_timeout
+        self.stats = {"probed": 0, "open": 0, "cameras": 0}
+
+    async def _request(self, connection, ip: str, port: int, target: str):
+        """
+        Sends the request on the connection, or on a new one if the server closed it (e.g. after a 404).
+        """
+        if not connection.closed:
+            try:
+                return connection, await asyncio.wait_for(connection.request(target), self.probe_timeout)
+            except (HttpError, ConnectionError, asyncio.IncompleteReadError):
+                connection.close()
+        connection = HttpConnection(ip, port)
+        await connection.open(self.connect_timeout)
+        return connection, await asyncio.wait_for(connection.request(target), self.probe_timeout)
+
+    async def probe(self, ip: str, port: int):
+        """
+        Returns a Found if a camera answers at ip:port, otherwise None.
+        """
+        connection = HttpConnection(ip, port)
+        try:
+            try:
+                await connection.open(self.connect_timeout)
+            except (OSError, asyncio.TimeoutError):
+                return None
+            self.stats["open"] += 1
+            camera = Camera(ip, self.user, self.password, port=port)
+            connection, response = await self._request(connection, ip, port, build_cgi_target(camera, "getDevInfo"))
+            if response.status == 200 and b"<CGI_Result>" in response.body:
+                result = CGIResult.from_xml("getDevInfo", response.body)
+                return Found(ip, port, False, result.result != -2, result.values)
+            sd_target = f"/get_status.cgi?user={quote(self.user)}&pwd={quote(self.password)}"
+            connection, response = await self._request(connection, ip, port, sd_target)
+            if response.status == 200 and b"var " in response.body:
+                info = dict(_sd_variable.findall(response.body.decode("latin-1")))
+                return Found(ip, port, True, True, info)
+            if response.status == 401:
+                return Found(ip, port, True, False, {})
+            return None
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, HttpError, CameraError):
+            return None
+        finally:
+            connection.close()
+
+    async def scan(self, hosts, on_found=None):
+        """
+        Probes all the ports of the hosts. Returns the list of Found, and calls on_found(found) as they are found.
+        """
+        found = []
+        pending = ((host, port) for host in hosts for port in self.ports)
+
+        async def worker():
+            for host, port in pending:
+                self.stats["probed"] += 1
+                result = await self.probe(host, port)
+                if result is not None:
+                    self.stats["cameras"] += 1
+                    found.append(result)
+                    if on_found:
+                        on_found(result)
+
+        await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+        return sorted(found, key=lambda f: (ipaddress.ip_address(f.ip), f.port))
+
+
+async def main(args):
+    scanner = Scanner(args.user, args.password, [int(p) for p in args.ports.split(",")], args.concurrency,
+                      args.connect_timeout)
+    hosts = list(expand_targets(args.targets))
+    print(f"Scanning {len(hosts)} addresses, ports {args.ports}, {scanner.concurrency} at a time", file=sys.stderr)
+    found = await scanner.scan(hosts, on_found=print)
+    cameras = [f.camera(args.user, args.password) for f in found if f.authenticated or args.include_unauthenticated]
+    base = json.loads(Path(args.merge).read_text()) if args.merge else None
+    Path(args.output).write_text(json.dumps(settings_document(cameras, base), indent=4))
+    print(f"{len(found)} cameras found, {len(cameras)} written to {args.output}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Find cameras in a network and write them to an importable settings file.")
+    parser.add_argument("targets", nargs="+", help="networks (192.168.1.0/24), ranges (192.168.1.10-192.168.1.50) or addresses")
+    parser.add_argument("--ports", default="88", help="comma separated ports to probe (default: 88)")
+    parser.add_argument("--user", default="admin", help="the user name to identify the cameras with (default: admin)")
+    parser.add_argument("--password", default="", help="the password (default: empty)")
+    parser.add_argument("--concurrency", type=int, default=2000, help="the number of addresses probed at once (default: 2000)")
+    parser.add_argument("--connect-timeout", type=float, default=0.5, help="seconds to wait for a TCP connection (default: 0.5)")
+    parser.add_argument("--include-unauthenticated", action="store_true", help="also write the cameras that rejected the credentials")
+    parser.add_argument("--output", default="FoscamApiDiscovered.json", help="the settings file to write")
+    parser.add_argument("--merge", help="an exported settings file to add the found cameras to")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,817 @@
+"""
+Receives the alarm snapshots and recordings that the cameras upload by FTP (setFtpConfig, setSnapConfig
+saveLocation=2, setRecordPath path=2) or send by e-mail (setSMTPConfig), without a separate FTP or mail server:
+
+    python3 -m foscam_cgi.ingest serve --settings FoscamApiExportedSettings.json --root uploads --password secret
+    python3 -m foscam_cgi.ingest configure --settings FoscamApiExportedSettings.json --address 192.168.1.10 \\
+        --password secret --ftp-port 2121 --snap --record --smtp-port 2525 --test
+
+`configure` gives each camera its own FTP/SMTP user name (see camera_login()), so that every file is tagged with
+the camera that sent it; a login that is not known is tagged by the address of the camera instead. The uploads
+are written to disk as they arrive (a storm of alarms does not hold whole files in memory), and each one is
+published when it is complete, as an event dict: {"camera": keyName or None, "cameraName", "protocol": "ftp" or
+"smtp", "path": relative to the root, "size", "time", "peer"}. `serve` prints the events as JSON lines.
+
+    <root>/<login>/<the path of the FTP upload>          e.g. uploads/cam1a2b3c4d/snap/MDAlarm_20240501-120000.jpg
+    <root>/<login>/mail/<time>-<n>.eml                   the received mails, and their image attachments beside
+    <root>/logins.json                                   login -> keyName, for reading the directories
+
+The FTP server has both the passive (PASV/EPSV, setFtpConfig mode=0) and the active (PORT/EPRT, mode=1) data
+connections. An active connection is only made back to the address of the control connection. The SMTP server
+accepts AUTH PLAIN and LOGIN without TLS (setSMTPConfig tls=0).
+"""
+
+import argparse
+import asyncio
+import base64
+import binascii
+import hashlib
+import json
+import os
+import posixpath
+import re
+import shutil
+import sys
+import time
+from email import policy
+from email.parser import BytesParser
+from pathlib import Path
+
+from .cameras import load_cameras
+from .client import CameraError, FoscamClient
+from .discovery import raise_open_files_limit
+
+chunk_size = 1 << 16
+mail_domain = "foscam.local"
+_unsafe = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+def camera_login(camera):
+    """
+    The FTP/SMTP user name of a camera: short, stable, and made only of letters and digits (the cameras do not
+    accept all characters in the user names).
+    """
+    return "cam" + hashlib.blake2b(camera.keyName.encode(), digest_size=4).hexdigest()
+
+
+def safe_name(name: str):
+    return _unsafe.sub("_", name).strip("._") or "file"
+
+
+class IngestSink:
+    """
+    The files received by the FtpServer and the SmtpServer: identifies the camera of a session, opens the files
+    under `root`, and publishes the completed files to the listeners and the subscribe() queues.
+    """
+    def __init__(self, root, cameras=(), password: str = None, subscriber_queue_size: int = 1000):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.password = password
+        self.subscriber_queue_size = subscriber_queue_size
+        self.logins = {camera_login(camera): camera for camera in cameras}
+        self.addresses = {camera.ip: camera for camera in cameras}
+        self.listeners = []         # called with each event
+        self._queues = set()        # the asyncio.Queues of subscribe()
+        self._mails = 0
+        self.stats = {"sessions": 0, "rejected": 0, "files": 0, "bytes": 0, "failed": 0, "events": 0, "dropped": 0}
+        if self.logins:
+            with open(self.root / "logins.json.tmp", "w") as f:
+                json.dump({login: camera.keyName for login, camera in self.logins.items()}, f, indent=1)
+            os.replace(self.root / "logins.json.tmp", self.root / "logins.json")
+
+    def subscribe(self):
+        """
+        Returns an asyncio.Queue that receives the events. A subscriber that falls more than the queue size behind
+        loses the oldest events. Call unsubscribe(queue) when done.
+        """
+        queue = asyncio.Queue(self.subscriber_queue_size)
+        self._queues.add(queue)
+        return queue
+
+    def unsubscribe(self, queue):
+        self._queues.discard(queue)
+
+    def authenticate(self, login: str, password: str):
+        """
+        True if the login may upload. With a password, any login with the password may (identify() then finds
+        the camera by its address if the login is not known). Without one, the login must be one of the cameras
+        (or anything, when no cameras were given).
+        """
+        if self.password is not None:
+            return password == self.password
+        return not self.logins or login in self.logins
+
+    def identify(self, login, peer):
+        """
+        The Camera of a session: by its login, or else by the address it connects from. None if not known.
+        """
+        return self.logins.get(login) or self.addresses.get(peer)
+
+    def directory(self, login, camera):
+        """
+        The directory of the files of a session: the login of its camera, or the login itself when no cameras
+        were given, or "unknown".
+        """
+        if camera is not None:
+            return self.root / camera_login(camera)
+        return self.root / (safe_name(login) if login and not self.logins else "unknown")
+
+    def mail_path(self, directory: Path):
+        self._mails += 1
+        return directory / "mail" / f"{time.strftime('%Y%m%d-%H%M%S')}-{self._mails}.eml"
+
+    def publish(self, camera, protocol: str, path: Path, size: int, peer):
+        self.stats["files"] += 1
+        self.stats["bytes"] += size
+        event = {
+            "camera": camera.keyName if camera is not None else None,
+            "cameraName": camera.cameraName if camera is not None else None,
+            "protocol": protocol,
+            "path": path.relative_to(self.root).as_posix(),
+            "size": size,
+            "time": time.time(),
+            "peer": peer,
+        }
+        self.stats["events"] += 1
+        for listener in self.listeners:
+            listener(event)
+        for queue in self._queues:
+            if queue.full():
+                queue.get_nowait()
+                self.stats["dropped"] += 1
+            queue.put_nowait(event)
+
+
+async def _copy_to_file(reader, path: Path, mode: str = "wb"):
+    """
+    Writes the data of `reader` to `path` as it arrives, through `<path>.part` so that a file that is not
+    complete is never seen under its name. Returns the number of bytes received. If the transfer fails, an
+    appended file is restored under its name (with the data received so far) and a new file is removed.
+    """
+    part = path.with_name(path.name + ".part")
+    size = 0
+    appending = mode == "ab" and path.exists()
+    if appending:
+        os.replace(path, part)
+    try:
+        with open(part, mode) as f:
+            while True:
+                data = await reader.read(chunk_size)
+                if not data:
+                    break
+                f.write(data)
+                size += len(data)
+    except BaseException:
+        if appending:
+            os.replace(part, path)
+        else:
+            part.unlink(missing_ok=True)
+        raise
+    os.replace(part, path)
+    return size
+
+
+class FtpSession:
+    """
+    One FTP control connection. Paths are relative to the directory of the session's camera in the sink, and
+    cannot leave it.
+    """
+    def __init__(self, server, reader, writer):
+        self.server = server
+        self.sink = server.sink
+        self.reader = reader
+        self.writer = writer
+        self.peer = writer.get_extra_info("peername")[0]
+        self.local = writer.get_extra_info("sockname")[0]
+        self.login = None
+        self.camera = None
+        self.home = None
+        self.cwd = "/"
+        self.active = None          # (host, port) of PORT/EPRT
+        self.passive = None         # (asyncio.Server, Future of the data connection) of PASV/EPSV
+
+    async def reply(self, code: int, text: str):
+        self.writer.write(f"{code} {text}\r\n".encode())
+        await self.writer.drain()
+
+    def resolve(self, path: str):
+        virtual = posixpath.normpath(posixpath.join(self.cwd, path or "."))
+        return virtual, self.home.joinpath(*[p for p in virtual.split("/") if p])
+
+    async def run(self):
+        await self.reply(220, "foscam_cgi ingest FTP ready")
+        while True:
+            try:
+                line = await asyncio.wait_for(self.reader.readline(), self.server.idle_timeout)
+            except (asyncio.TimeoutError, ValueError):
+                await self.reply(421, "Timeout")
+                break
+            if not line:
+                break
+            command, _, argument = line.decode("utf-8", "replace").rstrip("\r\n").partition(" ")
+            command = command.upper()
+            if command == "QUIT":
+                await self.reply(221, "Bye")
+                break
+            handler = getattr(self, "do_" + command, None)
+            if handler is None:
+                await self.reply(502, f"{command} not implemented")
+            elif self.home is None and command not in ("USER", "PASS", "FEAT", "SYST", "OPTS", "NOOP"):
+                await self.reply(530, "Not logged in")
+            else:
+                try:
+                    await handler(argument)
+                except OSError as e:
+                    await self.reply(550, str(e.strerror or e))
+
+    async def close(self):
+        self._close_passive()
+        self.writer.close()
+
+    async def do_USER(self, argument):
+        self.login, self.home = argument, None
+        await self.reply(331, "Password required")
+
+    async def do_PASS(self, argument):
+        if self.login is None:
+            await self.reply(503, "USER first")
+        elif not self.sink.authenticate(self.login, argument):
+            self.sink.stats["rejected"] += 1
+            await self.reply(530, "Login incorrect")
+        else:
+            self.camera = self.sink.identify(self.login, self.peer)
+            self.home = self.sink.directory(self.login, self.camera)
+            self.home.mkdir(parents=True, exist_ok=True)
+            await self.reply(230, "Logged in")
+
+    async def do_SYST(self, argument):
+        await self.reply(215, "UNIX Type: L8")
+
+    async def do_FEAT(self, argument):
+        self.writer.write(b"211-Features:\r\n EPSV\r\n EPRT\r\n PASV\r\n SIZE\r\n UTF8\r\n")
+        await self.reply(211, "End")
+
+    async def do_OPTS(self, argument):
+        await self.reply(200, "OK")
+
+    async def do_NOOP(self, argument):
+        await self.reply(200, "OK")
+
+    async def do_TYPE(self, argument):
+        await self.reply(200, f"Type set to {argument}")
+
+    async def do_MODE(self, argument):
+        await self.reply(200 if argument.upper() == "S" else 504, "Mode")
+
+    async def do_STRU(self, argument):
+        await self.reply(200 if argument.upper() == "F" else 504, "Structure")
+
+    async def do_ALLO(self, argument):
+        await self.reply(202, "No storage allocation necessary")
+
+    async def do_PWD(self, argument):
+        await self.reply(257, f'"{self.cwd}" is the current directory')
+
+    async def do_CWD(self, argument):
+        virtual, path = self.resolve(argument)
+        if not path.is_dir():
+            await self.reply(550, "No such directory")
+        else:
+            self.cwd = virtual
+            await self.reply(250, f'"{virtual}" is the current directory')
+
+    async def do_CDUP(self, argument):
+        await self.do_CWD("..")
+
+    async def do_MKD(self, argument):
+        virtual, path = self.resolve(argument)
+        path.mkdir(parents=True, exist_ok=True)
+        await self.reply(257, f'"{virtual}" created')
+
+    async def do_SIZE(self, argument):
+        virtual, path = self.resolve(argument)
+        if path.is_file():
+            await self.reply(213, str(path.stat().st_size))
+        else:
+            await self.reply(550, "No such file")
+
+    async def do_DELE(self, argument):
+        virtual, path = self.resolve(argument)
+        path.unlink()
+        await self.reply(250, "Deleted")
+
+    async def do_RMD(self, argument):
+        virtual, path = self.resolve(argument)
+        if path == self.home:
+            await self.reply(550, "Permission denied")
+        else:
+            path.rmdir()
+            await self.reply(250, "Removed")
+
+    async def do_PASV(self, argument):
+        port = await self._listen()
+        if port is None:
+            return
+        address = self.server.public_address or self.local
+        if ":" in address:
+            await self.reply(500, "PASV needs IPv4, use EPSV")
+            return
+        await self.reply(227, f"Entering Passive Mode ({address.replace('.', ',')},{port >> 8},{port & 255})")
+
+    async def do_EPSV(self, argument):
+        port = await self._listen()
+        if port is None:
+            return
+        await self.reply(229, f"Entering Extended Passive Mode (|||{port}|)")
+
+    async def do_PORT(self, argument):
+        fields = argument.split(",")
+        if len(fields) != 6 or not all(f.strip().isdigit() for f in fields):
+            await self.reply(501, "Syntax error in PORT")
+            return
+        await self._set_active(".".join(f.strip() for f in fields[:4]), int(fields[4]) << 8 | int(fields[5]))
+
+    async def do_EPRT(self, argument):
+        fields = argument.split(argument[:1]) if argument else []
+        if len(fields) < 4 or not fields[3].isdigit():
+            await self.reply(501, "Syntax error in EPRT")
+            return
+        await self._set_active(fields[2], int(fields[3]))
+
+    async def do_STOR(self, argument, mode="wb"):
+        virtual, path = self.resolve(argument)
+        if not argument or path == self.home:
+            await self.reply(501, "No file name")
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = await self._data_connection()
+        if data is None:
+            return
+        reader, writer = data
+        try:
+            size = await _copy_to_file(reader, path, mode)
+        except (OSError, ConnectionError) as e:
+            self.sink.stats["failed"] += 1
+            await self.reply(451, f"Transfer failed: {e}")
+            return
+        finally:
+            writer.close()
+        if mode == "ab":
+            size = path.stat().st_size
+        await self.reply(226, "Transfer complete")
+        self.sink.publish(self.camera, "ftp", path, size, self.peer)
+
+    async def do_APPE(self, argument):
+        await self.do_STOR(argument, "ab")
+
+    async def do_NLST(self, argument, long=False):
+        virtual, path = self.resolve(argument if argument and not argument.startswith("-") else "")
+        entries = sorted(path.iterdir()) if path.is_dir() else [path] if path.exists() else []
+        lines = []
+        for entry in entries:
+            if entry.name.endswith(".part"):
+                continue
+            if long:
+                stat = entry.stat()
+                kind = "d" if entry.is_dir() else "-"
+                lines.append(f"{kind}rw-r--r-- 1 ftp ftp {stat.st_size:>12} "
+                             f"{time.strftime('%b %d %H:%M', time.localtime(stat.st_mtime))} {entry.name}")
+            else:
+                lines.append(entry.name)
+        data = await self._data_connection()
+        if data is None:
+            return
+        reader, writer = data
+        writer.write("".join(line + "\r\n" for line in lines).encode())
+        await writer.drain()
+        writer.close()
+        await self.reply(226, "Transfer complete")
+
+    async def do_LIST(self, argument):
+        await self.do_NLST(argument, long=True)
+
+    async def do_ABOR(self, argument):
+        self._close_passive()
+        await self.reply(226, "Aborted")
+
+    async def _set_active(self, host, port):
+        if host != self.peer:
+            await self.reply(500, "The data connection must be to the address of the client")
+            return
+        self._close_passive()
+        self.active = (host, port)
+        await self.reply(200, "PORT command successful")
+
+    async def _listen(self):
+        """
+        Opens the listening socket of a passive data connection. Returns its port, or None after replying.
+        """
+        self._close_passive()
+        self.active = None
+        accepted = asyncio.get_running_loop().create_future()
+
+        def on_connection(reader, writer):
+            if accepted.done() or writer.get_extra_info("peername")[0] != self.peer:
+                writer.close()
+            else:
+                accepted.set_result((reader, writer))
+
+        server = None
+        for port in self.server.passive_port():
+            try:
+                server = await asyncio.start_server(on_connection, self.local, port)
+                break
+            except OSError:
+                continue
+        if server is None:
+            await self.reply(425, "No free passive port")
+            return None
+        self.passive = (server, accepted)
+        return server.sockets[0].getsockname()[1]
+
+    def _close_passive(self):
+        if self.passive is not None:
+            server, accepted = self.passive
+            server.close()
+            if not accepted.done():
+                accepted.cancel()
+            self.passive = None
+
+    async def _data_connection(self):
+        """
+        The (reader, writer) of the data connection of a transfer, after replying 150. None (after replying the
+        error) if there is none.
+        """
+        try:
+            if self.passive is not None:
+                server, accepted = self.passive
+                await self.reply(150, "Opening data connection")
+                data = await asyncio.wait_for(asyncio.shield(accepted), self.server.data_timeout)
+                self._close_passive()
+                return data
+            if self.active is not None:
+                await self.reply(150, "Opening data connection")
+                host, port = self.active
+                self.active = None
+                return await asyncio.wait_for(asyncio.open_connection(host, port), self.server.data_timeout)
+        except (OSError, asyncio.TimeoutError, asyncio.CancelledError):
+            self._close_passive()
+            await self.reply(425, "Can't open data connection")
+            return None
+        await self.reply(425, "Use PORT or PASV first")
+        return None
+
+
+class FtpServer:
+    """
+    An FTP server that only stores: each session writes into the directory of its camera in the IngestSink.
+    `passive_ports` is a range of ports for the passive data connections (e.g. range(50000, 50100) to open in a
+    firewall), or None for any free port. `public_address` is the address given in the PASV replies, when the
+    cameras reach the server through a NAT.
+    """
+    def __init__(self, sink: IngestSink, host: str = "0.0.0.0", port: int = 2121, public_address: str = None,
+                 passive_ports=None, idle_timeout: float = 120.0, data_timeout: float = 30.0):
+        self.sink = sink
+        self.host = host
+        self.port = port
+        self.public_address = public_address
+        self.passive_ports = passive_ports
+        self.idle_timeout = idle_timeout
+        self.data_timeout = data_timeout
+        self._next_port = 0
+
+    def passive_port(self):
+        """
+        The ports to try for the next passive data connection, starting after the last one used.
+        """
+        if not self.passive_ports:
+            return [0]
+        ports = list(self.passive_ports)
+        start = self._next_port % len(ports)
+        self._next_port += 1
+        return ports[start:] + ports[:start]
+
+    async def _connection(self, reader, writer):
+        self.sink.stats["sessions"] += 1
+        session = FtpSession(self, reader, writer)
+        try:
+            await session.run()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            await session.close()
+
+    async def start(self):
+        return await asyncio.start_server(self._connection, self.host, self.port, backlog=1024)
+
+
+class SmtpSession:
+    """
+    One SMTP connection. The DATA of each mail is written to a .eml file line by line as it arrives.
+    """
+    def __init__(self, server, reader, writer):
+        self.server = server
+        self.sink = server.sink
+        self.reader = reader
+        self.writer = writer
+        self.peer = writer.get_extra_info("peername")[0]
+        self.login = None
+        self.sender = None
+        self.recipients = []
+
+    async def reply(self, code: int, text: str):
+        self.writer.write(f"{code} {text}\r\n".encode())
+        await self.writer.drain()
+
+    async def readline(self):
+        line = await asyncio.wait_for(self.reader.readline(), self.server.idle_timeout)
+        if not line:
+            raise ConnectionResetError("closed")
+        return line
+
+    async def run(self):
+        await self.reply(220, f"{mail_domain} foscam_cgi ingest ESMTP")
+        while True:
+            line = (await self.readline()).decode("utf-8", "replace").rstrip("\r\n")
+            command, _, argument = line.partition(" ")
+            command = command.upper()
+            if command == "QUIT":
+                await self.reply(221, "Bye")
+                return
+            if command == "EHLO":
+                self.writer.write(f"250-{mail_domain}\r\n250-AUTH PLAIN LOGIN\r\n250-8BITMIME\r\n".encode())
+                await self.reply(250, f"SIZE {self.server.max_size}")
+            elif command == "HELO":
+                await self.reply(250, mail_domain)
+            elif command == "AUTH":
+                await self.auth(argument)
+            elif command == "MAIL":
+                if self.sink.password is not None and self.login is None:
+                    await self.reply(530, "Authentication required")
+                else:
+                    self.sender, self.recipients = _address(argument), []
+                    await self.reply(250, "OK")
+            elif command == "RCPT":
+                if self.sender is None:
+                    await self.reply(503, "MAIL first")
+                else:
+                    self.recipients.append(_address(argument))
+                    await self.reply(250, "OK")
+            elif command == "DATA":
+                if not self.recipients:
+                    await self.reply(503, "RCPT first")
+                else:
+                    await self.data()
+            elif command == "RSET":
+                self.sender, self.recipients = None, []
+                await self.reply(250, "OK")
+            elif command == "NOOP":
+                await self.reply(250, "OK")
+            elif command == "VRFY":
+                await self.reply(252, "Cannot verify")
+            else:
+                await self.reply(502, f"{command} not implemented")
+
+    async def auth(self, argument):
+        mechanism, _, initial = argument.partition(" ")
+        try:
+            if mechanism.upper() == "PLAIN":
+                if not initial:
+                    await self.reply(334, "")
+                    initial = (await self.readline()).strip().decode()
+                _, login, password = base64.b64decode(initial).decode().split("\0")
+            elif mechanism.upper() == "LOGIN":
+                if not initial:
+                    await self.reply(334, "VXNlcm5hbWU6")
+                    initial = (await self.readline()).strip().decode()
+                login = base64.b64decode(initial).decode()
+                await self.reply(334, "UGFzc3dvcmQ6")
+                password = base64.b64decode((await self.readline()).strip()).decode()
+            else:
+                await self.reply(504, "Unrecognized authentication type")
+                return
+        except (ValueError, binascii.Error, UnicodeDecodeError):
+            await self.reply(501, "Cannot decode the credentials")
+            return
+        if self.sink.authenticate(login, password):
+            self.login = login
+            await self.reply(235, "Authentication successful")
+        else:
+            self.sink.stats["rejected"] += 1
+            await self.reply(535, "Authentication failed")
+
+    async def data(self):
+        login = self.login or self.sender.partition("@")[0]
+        camera = self.sink.identify(login, self.peer)
+        path = self.sink.mail_path(self.sink.directory(login, camera))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        part = path.with_name(path.name + ".part")
+        await self.reply(354, "End data with <CR><LF>.<CR><LF>")
+        size = 0
+        with open(part, "wb") as f:
+            while True:
+                line = await self.readline()
+                if line in (b".\r\n", b".\n"):
+                    break
+                if line.startswith(b"."):
+                    line = line[1:]
+                size += len(line)
+                if size <= self.server.max_size:
+                    f.write(line)
+        self.sender, self.recipients = None, []
+        if size > self.server.max_size:
+            part.unlink()
+            self.sink.stats["failed"] += 1
+            await self.reply(552, "Message too large")
+            return
+        os.replace(part, path)
+        await self.reply(250, "OK")
+        for file in (self.server.extract(path) if self.server.extract_attachments else []) or [path]:
+            self.sink.publish(camera, "smtp", file, file.stat().st_size, self.peer)
+
+
+def _address(argument: str):
+    match = re.search(r"<([^>]*)>", argument)
+    return match.group(1) if match else argument.partition(":")[2].strip()
+
+
+class SmtpServer:
+    """
+    An SMTP server that only receives: each mail is stored in the directory of its camera in the IngestSink,
+    identified by the AUTH login, else by the user of the sender address, else by the address of the camera.
+    With `extract_attachments`, the images attached to a mail are also saved beside it, and published instead
+    of the mail.
+    """
+    def __init__(self, sink: IngestSink, host: str = "0.0.0.0", port: int = 2525, max_size: int = 32 << 20,
+                 extract_attachments: bool = True, idle_timeout: float = 120.0):
+        self.sink = sink
+        self.host = host
+        self.port = port
+        self.max_size = max_size
+        self.extract_attachments = extract_attachments
+        self.idle_timeout = idle_timeout
+
+    @staticmethod
+    def extract(path: Path):
+        """
+        Saves the image attachments of the mail at `path` beside it. Returns their paths.
+        """
+        with open(path, "rb") as f:
+            message = BytesParser(policy=policy.default).parse(f)
+        files = []
+        for n, part in enumerate(message.walk()):
+            if part.get_content_maintype() != "image":
+                continue
+            name = safe_name(part.get_filename() or f"image{n}.jpg")
+            file = path.with_name(f"{path.stem}-{name}")
+            with open(file, "wb") as f:
+                f.write(part.get_payload(decode=True) or b"")
+            files.append(file)
+        return files
+
+    async def _connection(self, reader, writer):
+        self.sink.stats["sessions"] += 1
+        try:
+            await SmtpSession(self, reader, writer).run()
+        except (ConnectionError, asyncio.TimeoutError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self):
+        return await asyncio.start_server(self._connection, self.host, self.port, backlog=1024, limit=1 << 20)
+
+
+async def configure_camera(client, camera, address: str, password: str, ftp_port: int = 21, mode: int = 0,
+                           snap: bool = False, record: bool = False, smtp_port: int = None, receiver: str = None,
+                           test: bool = False):
+    """
+    Points a camera at the ingest servers at `address` with its own login (camera_login()): setFtpConfig, and
+    with `snap` setSnapConfig saveLocation=2 (keeping the snapQuality), with `record` setRecordPath path=2, and
+    with `smtp_port` setSMTPConfig.
+    With `test`, also testFtpServer and smtpTest. Returns {cmd: CGIResult}, raises CameraError.
+    """
+    cameraClient = client.camera(camera)
+    login = camera_login(camera)
+    ftpAddr = f"ftp://{address}/"
+    results = {"setFtpConfig": (await cameraClient.setFtpConfig(
+        ftpAddr=ftpAddr, ftpPort=ftp_port, mode=mode, userName=login, password=password)).raise_for_result()}
+    if test:
+        results["testFtpServer"] = (await cameraClient.testFtpServer(
+            ftpAddr=ftpAddr, ftpPort=ftp_port, mode=mode, fptuserName=login, ftppassword=password)).raise_for_result()
+    if snap:
+        current = (await cameraClient.getSnapConfig()).raise_for_result()
+        results["setSnapConfig"] = (await cameraClient.setSnapConfig(
+            snapQuality=current.get("snapQuality", 1), saveLocation=2)).raise_for_result()
+    if record:
+        results["setRecordPath"] = (await cameraClient.setRecordPath(path=2)).raise_for_result()
+    if smtp_port:
+        sender = f"{login}@{mail_domain}"
+        results["setSMTPConfig"] = (await cameraClient.setSMTPConfig(
+            isEnable=1, server=address, port=smtp_port, isNeedAuth=1, user=login, password=password, sender=sender,
+            reciever=receiver or f"alarm@{mail_domain}", tls=0)).raise_for_result()
+        if test:
+            results["smtpTest"] = (await cameraClient.smtpTest(
+                smtpServer=address, port=smtp_port, isNeedAuth=1, user=login, password=password,
+                sender=sender)).raise_for_result()
+    return results
+
+
+async def configure_all(client, cameras, address: str, password: str, **options):
+    """
+    configure_camera() of all the cameras concurrently. Returns a dict of keyName -> {cmd: CGIResult} or exception.
+    """
+    results = await asyncio.gather(*(configure_camera(client, camera, address, password, **options)
+                                     for camera in cameras), return_exceptions=True)
+    return {camera.keyName: result for camera, result in zip(cameras, results)}
+
+
+def parse_port_range(text: str):
+    first, _, last = text.partition("-")
+    return range(int(first), int(last or first) + 1)
+
+
+async def serve(args):
+    cameras = list(load_cameras(args.settings).values()) if args.settings else []
+    raise_open_files_limit(args.max_connections)
+    sink = IngestSink(args.root, cameras, args.password)
+    sink.listeners.append(lambda event: print(json.dumps(event), flush=True))
+    servers = []
+    if args.ftp_port:
+        ftp = FtpServer(sink, args.host, args.ftp_port, args.public_address,
+                        parse_port_range(args.passive_ports) if args.passive_ports else None)
+        servers.append(await ftp.start())
+        print(f"FTP on {args.host}:{args.ftp_port}", file=sys.stderr)
+    if args.smtp_port:
+        smtp = SmtpServer(sink, args.host, args.smtp_port, extract_attachments=not args.keep_mail)
+        servers.append(await smtp.start())
+        print(f"SMTP on {args.host}:{args.smtp_port}", file=sys.stderr)
+    if not servers:
+        raise SystemExit("nothing to serve: both --ftp-port and --smtp-port are 0")
+    print(f"{len(cameras)} cameras, writing to {sink.root} "
+          f"({shutil.disk_usage(sink.root).free >> 30} GiB free)", file=sys.stderr)
+    try:
+        await asyncio.gather(*(server.serve_forever() for server in servers))
+    finally:
+        print(json.dumps(sink.stats), file=sys.stderr)
+
+
+async def configure(args):
+    if not args.settings or not args.address:
+        raise SystemExit("configure needs the cameras from --settings and the --address of this host")
+    cameras = load_cameras(args.settings)
+    async with FoscamClient(timeout=args.timeout) as client:
+        results = await configure_all(client, list(cameras.values()), args.address, args.password, ftp_port=args.ftp_port,
+                                      mode=args.mode, snap=args.snap, record=args.record, smtp_port=args.smtp_port or None,
+                                      receiver=args.receiver, test=args.test)
+    failed = 0
+    for keyName, result in results.items():
+        if isinstance(result, (CameraError, OSError, asyncio.TimeoutError)):
+            failed += 1
+            print(f"{keyName}: {result}")
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            print(f"{keyName}: login {camera_login(cameras[keyName])}, "
+                  + ", ".join(f"{cmd} {r.values or 'OK'}" for cmd, r in result.items()))
+    print(f"{len(results) - failed} of {len(results)} cameras configured")
+    return 1 if failed else 0
+
+
+def main(args):
+    if args.password is None:
+        args.password = os.environ.get("FOSCAM_INGEST_PASSWORD")
+    if args.action == "configure" and not args.password:
+        raise SystemExit("configure needs --password (or FOSCAM_INGEST_PASSWORD)")
+    if args.action == "serve" and not args.password and not args.no_auth:
+        raise SystemExit("serve needs --password (or FOSCAM_INGEST_PASSWORD), or --no-auth to accept uploads without one")
+    if args.no_auth:
+        args.password = None
+    try:
+        return asyncio.run(serve(args) if args.action == "serve" else configure(args))
+    except KeyboardInterrupt:
+        return 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Receive the alarm snapshots and recordings of the cameras by FTP and e-mail.")
+    parser.add_argument("action", choices=("serve", "configure"))
+    parser.add_argument("--settings", help="a settings file exported from the index.html")
+    parser.add_argument("--password", help="the FTP/SMTP password of the cameras (default: $FOSCAM_INGEST_PASSWORD)")
+    parser.add_argument("--no-auth", action="store_true", help="serve: accept FTP logins and mails without the password")
+    parser.add_argument("--ftp-port", type=int, default=2121, help="the FTP port, 0 for no FTP (default: 2121)")
+    parser.add_argument("--smtp-port", type=int, default=2525, help="the SMTP port, 0 for no SMTP (default: 2525)")
+    parser.add_argument("--root", default="uploads", help="serve: the directory of the received files (default: uploads)")
+    parser.add_argument("--host", default="0.0.0.0", help="serve: the address to listen on (default: all)")
+    parser.add_argument("--public-address", help="serve: the address in the PASV replies (default: the address the camera connected to)")
+    parser.add_argument("--passive-ports", help="serve: the ports of the passive data connections, e.g. 50000-50100 (default: any)")
+    parser.add_argument("--max-connections", type=int, default=4000, help="serve: raise the open files limit for this many connections (default: 4000)")
+    parser.add_argument("--keep-mail", action="store_true", help="serve: do not extract the image attachments of the mails")
+    parser.add_argument("--address", help="configure: the address of this host, as the cameras reach it")
+    parser.add_argument("--mode", type=int, choices=(0, 1), default=0, help="configure: the FTP mode of the cameras, 0 = PASV, 1 = PORT (default: 0)")
+    parser.add_argument("--snap", action="store_true", help="configure: also save the snapshots to FTP (setSnapConfig saveLocation=2)")
+    parser.add_argument("--record", action="store_true", help="configure: also save the recordings to FTP (setRecordPath path=2)")
+    parser.add_argument("--receiver", help="configure: the recipient of the alarm mails (default: alarm@foscam.local)")
+    parser.add_argument("--test", action="store_true", help="configure: also send testFtpServer (and smtpTest)")
+    parser.add_argument("--timeout", type=float, default=10.0, help="configure: seconds to wait for a response (default: 10)")
+    raise SystemExit(main(parser.parse_args()))
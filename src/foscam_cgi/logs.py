@@ -0,0 +1,327 @@
+"""
+Harvests the system logs (getLog) of many cameras into a columnar store, to audit the logins before the 1000 entry
+log of a camera rolls over:
+
+    python3 -m foscam_cgi.logs harvest --settings FoscamApiExportedSettings.json --store logs
+    python3 -m foscam_cgi.logs query --store logs --start 2024-05-01 --end 2024-05-02 --ip 192.168.1.23
+
+getLog returns at most 10 entries ("time+user+ip+logID") from `offset`, and `totalCnt`, the number of entries in
+the log (offset 0 is the oldest entry). The store remembers the number of entries and the newest entry of each
+camera, so that a harvest reads only the pages after it: while the log is not full, from the known newest entry
+on; when it is full (the entries move towards offset 0 as new ones are added), backwards from the end until the
+known newest entry is found. The pages of a camera are requested together (pipelined on its connection), and
+all the cameras concurrently.
+
+    <store>/time.i8, camera.u2, user.u2, ip.u4, logID.u2   a column each (little-endian, bytes per value)
+    <store>/meta.json       the number of rows, the camera and user names that the columns refer to, the blocks
+                            (one per harvest, sorted by time) with their time range, and the newest entries
+
+A query reads only the blocks of its time range, and filters them with NumPy if it is installed.
+"""
+
+import argparse
+import asyncio
+import ipaddress
+import json
+import os
+import sys
+import time
+from array import array
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import unquote
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .cameras import load_cameras
+from .client import CameraError, FoscamClient
+
+page_size = 10          # the entries returned by one getLog
+
+# (name, array typecode, NumPy dtype) of the columns:
+columns = (("time", "q", "<i8"), ("camera", "H", "<u2"), ("user", "H", "<u2"), ("ip", "I", "<u4"), ("logID", "H", "<u2"))
+
+
+def parse_ip(text: str):
+    """
+    The IPv4 address as an integer; the cameras write it dotted or as a decimal number. 0 if it is neither.
+    """
+    if text.isdigit():
+        return int(text) & 0xffffffff
+    try:
+        return int(ipaddress.IPv4Address(text))
+    except ValueError:
+        return 0
+
+
+def parse_entry(text):
+    """
+    (time, user, ip, logID) of a log entry "time+user+ip+logID", or None if it is not one.
+    """
+    time_text, _, rest = unquote(str(text)).partition("+")
+    fields = rest.rsplit("+", 2)
+    if len(fields) != 3 or not time_text.isdigit() or not fields[2].isdigit():
+        return None
+    return int(time_text), fields[0], parse_ip(fields[1]), int(fields[2])
+
+
+class LogStore:
+    def __init__(self, root):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        meta_path = self.root / "meta.json"
+        meta = json.loads(meta_path.read_text()) if meta_path.exists() else {}
+        self.rows = meta.get("rows", 0)
+        self.cameras = meta.get("cameras", [])
+        self.users = meta.get("users", [])
+        self.blocks = meta.get("blocks", [])       # [first row, rows, min time, max time]
+        self.marks = meta.get("marks", {})         # keyName -> {"total": totalCnt, "last": the newest entry}
+        self._camera_ids = {name: i for i, name in enumerate(self.cameras)}
+        self._user_ids = {name: i for i, name in enumerate(self.users)}
+        for name, typecode, _ in columns:
+            # Drop the rows of an append that was interrupted before meta.json was written.
+            path = self._path(name)
+            if path.exists() and path.stat().st_size > self.rows * array(typecode).itemsize:
+                os.truncate(path, self.rows * array(typecode).itemsize)
+
+    def _path(self, name: str):
+        dtype = next(dtype for n, _, dtype in columns if n == name)
+        return self.root / f"{name}.{dtype[1:]}"
+
+    def _id(self, ids: dict, names: list, name: str):
+        index = ids.get(name)
+        if index is None:
+            index = ids[name] = len(names)
+            names.append(name)
+        return index
+
+    def append(self, entries, marks: dict):
+        """
+        Appends the entries [(time, keyName, user, ip, logID)] as a block, and updates the marks of the cameras.
+        """
+        entries = sorted(entries)
+        if entries:
+            data = (
+                array("q", [entry[0] for entry in entries]),
+                array("H", [self._id(self._camera_ids, self.cameras, entry[1]) for entry in entries]),
+                array("H", [self._id(self._user_ids, self.users, entry[2]) for entry in entries]),
+                array("I", [entry[3] for entry in entries]),
+                array("H", [entry[4] for entry in entries]),
+            )
+            for (name, _, _), column in zip(columns, data):
+                if sys.byteorder == "big":
+                    column.byteswap()
+                with open(self._path(name), "ab") as file:
+                    column.tofile(file)
+            self.blocks.append([self.rows, len(entries), entries[0][0], entries[-1][0]])
+            self.rows += len(entries)
+        self.marks.update(marks)
+        self._save()
+
+    def _save(self):
+        meta = {"rows": self.rows, "cameras": self.cameras, "users": self.users, "blocks": self.blocks,
+                "marks": self.marks}
+        temporary = self.root / "meta.tmp"
+        temporary.write_text(json.dumps(meta))
+        os.replace(temporary, self.root / "meta.json")     # the rows and the marks are committed together
+
+    def _read(self, name: str, first: int, count: int):
+        typecode, dtype = next((typecode, dtype) for n, typecode, dtype in columns if n == name)
+        if np is not None:
+            return np.fromfile(self._path(name), dtype, count, offset=first * np.dtype(dtype).itemsize)
+        column = array(typecode)
+        with open(self._path(name), "rb") as file:
+            file.seek(first * column.itemsize)
+            column.fromfile(file, count)
+        if sys.byteorder == "big":
+            column.byteswap()
+        return column
+
+    def _ranges(self, start, end):
+        """
+        The (first row, rows) of the blocks that may have entries from `start` to `end`, adjacent ones merged.
+        """
+        ranges = []
+        for first, count, min_time, max_time in self.blocks:
+            if (start is not None and max_time < start) or (end is not None and min_time > end):
+                continue
+            if ranges and ranges[-1][0] + ranges[-1][1] == first:
+                ranges[-1][1] += count
+            else:
+                ranges.append([first, count])
+        return ranges
+
+    def query(self, start=None, end=None, ip=None, camera=None, user=None):
+        """
+        The entries (time, keyName, user, ip, logID) from `start` to `end` (Unix times, inclusive) of the IP
+        address, camera keyName and user name if given, sorted by time.
+        """
+        ip = parse_ip(ip) if isinstance(ip, str) else ip
+        camera_id = self._camera_ids.get(camera, -1) if camera is not None else None
+        user_id = self._user_ids.get(user, -1) if user is not None else None
+        if camera_id == -1 or user_id == -1:
+            return []
+        found = []
+        for first, count in self._ranges(start, end):
+            times = self._read("time", first, count)
+            filters = [(times, ">=", start), (times, "<=", end)]
+            filters += [(self._read(name, first, count), "==", value)
+                        for name, value in (("ip", ip), ("camera", camera_id), ("user", user_id)) if value is not None]
+            filters = [f for f in filters if f[2] is not None]
+            if np is not None:
+                mask = np.ones(count, bool)
+                for column, operator, value in filters:
+                    mask &= column >= value if operator == ">=" else column <= value if operator == "<=" else column == value
+                rows = (first + np.flatnonzero(mask)).tolist()
+            else:
+                tests = {">=": lambda a, b: a >= b, "<=": lambda a, b: a <= b, "==": lambda a, b: a == b}
+                rows = [first + i for i in range(count)
+                        if all(tests[operator](column[i], value) for column, operator, value in filters)]
+            found.extend(self._rows(rows))
+        return sorted(found)
+
+    def _rows(self, rows):
+        if not rows:
+            return []
+        first, count = rows[0], rows[-1] - rows[0] + 1
+        data = {name: self._read(name, first, count) for name, _, _ in columns}
+        return [(int(data["time"][row - first]), self.cameras[data["camera"][row - first]],
+                 self.users[data["user"][row - first]], str(ipaddress.IPv4Address(int(data["ip"][row - first]))),
+                 int(data["logID"][row - first])) for row in rows]
+
+
+class LogHarvester:
+    def __init__(self, client, store: LogStore, max_concurrent: int = 256, batch: int = 4):
+        self.client = client
+        self.store = store
+        self.slots = asyncio.Semaphore(max_concurrent)
+        self.batch = batch      # the pages of a camera requested together when searching backwards
+        self.stats = {"cameras": 0, "failed": 0, "requests": 0, "entries": 0, "gaps": 0}
+
+    async def _page(self, camera, offset: int, count: int = page_size):
+        """
+        (totalCnt, [entries]) from the offset.
+        """
+        async with self.slots:
+            self.stats["requests"] += 1
+            result = await self.client.camera(camera).command("getLog", offset=offset, count=count)
+        result.raise_for_result()
+        entries, i = [], 0
+        while f"log{i}" in result.values:
+            entries.append(str(result.values[f"log{i}"]))
+            i += 1
+        return result.get("totalCnt", 0), entries
+
+    async def new_entries(self, camera, mark):
+        """
+        (totalCnt, the entries after the mark, oldest first, and whether entries were lost since the mark).
+        """
+        if mark is not None:
+            # The known newest entry is at total - 1 if the log has not rolled over (or been cleared) since.
+            start = max(0, mark["total"] - 1)
+            total, first = await self._page(camera, start)
+            if first and first[0] == mark["last"]:
+                pages = await asyncio.gather(*(self._page(camera, offset)
+                                               for offset in range(start + len(first), total, page_size)))
+                return total, first[1:] + [entry for _, page in pages for entry in page], False
+        else:
+            total, first = await self._page(camera, 0)
+            pages = await asyncio.gather(*(self._page(camera, offset)
+                                           for offset in range(len(first), total, page_size)))
+            return total, first + [entry for _, page in pages for entry in page], False
+        # Search backwards from the end, a batch of pages at a time.
+        found, end = [], total
+        while end > 0:
+            offsets = [max(0, end - page_size * (i + 1)) for i in range(self.batch) if end - page_size * i > 0]
+            pages = await asyncio.gather(*(self._page(camera, offset, min(page_size, end - page_size * i - offset))
+                                           for i, offset in enumerate(offsets)))
+            for _, page in pages:
+                found[:0] = page
+            end = offsets[-1]
+            if mark["last"] in found:
+                index = len(found) - 1 - found[::-1].index(mark["last"])
+                return total, found[index + 1:], False
+        return total, found, bool(found)     # the known newest entry has rolled out: there may be entries lost
+
+    async def harvest(self, cameras):
+        """
+        Reads the new entries of the cameras and appends them to the store as one block. Returns {keyName: error}
+        of the cameras that failed.
+        """
+        entries, marks, errors = [], {}, {}
+
+        async def one(camera):
+            mark = self.store.marks.get(camera.keyName)
+            try:
+                total, new, gap = await self.new_entries(camera, mark)
+            except CameraError as e:
+                errors[camera.keyName] = str(e)
+                self.stats["failed"] += 1
+                return
+            self.stats["cameras"] += 1
+            self.stats["gaps"] += gap
+            for text in new:
+                entry = parse_entry(text)
+                if entry is not None:
+                    entries.append((entry[0], camera.keyName, *entry[1:]))
+            self.stats["entries"] += len(new)
+            if new:
+                marks[camera.keyName] = {"total": total, "last": new[-1]}
+            elif mark is not None and total != mark["total"]:
+                marks[camera.keyName] = {"total": total, "last": mark["last"]}
+
+        await asyncio.gather(*(one(camera) for camera in cameras))
+        self.store.append(entries, marks)
+        return errors
+
+
+def parse_time(text):
+    if text is None:
+        return None
+    return int(text) if text.isdigit() else int(datetime.fromisoformat(text).timestamp())
+
+
+async def harvest(args, store):
+    cameras = list(load_cameras(args.settings).values())
+    started = time.monotonic()
+    async with FoscamClient(max_connections=1, pipeline_depth=4, timeout=args.timeout, retries=1) as client:
+        harvester = LogHarvester(client, store, args.max_concurrent)
+        errors = await harvester.harvest(cameras)
+    for keyName, error in errors.items():
+        print(f"{keyName}: {error}")
+    stats = harvester.stats
+    print(f"{stats['cameras']} cameras harvested, {stats['failed']} failed, {stats['entries']} new entries, "
+          f"{stats['requests']} requests, {stats['gaps']} cameras with lost entries, {time.monotonic() - started:.1f} s")
+    return 1 if errors else 0
+
+
+def main(args):
+    store = LogStore(args.store)
+    if args.action == "harvest":
+        if not args.settings:
+            raise SystemExit("harvest needs the cameras from --settings")
+        return asyncio.run(harvest(args, store))
+    started = time.perf_counter()
+    found = store.query(parse_time(args.start), parse_time(args.end), args.ip, args.camera, args.user)
+    for entry_time, keyName, user, ip, log_id in found:
+        print(f"{datetime.fromtimestamp(entry_time).isoformat(' ')}  {keyName}  {user}  {ip}  {log_id}")
+    print(f"{len(found)} of {store.rows} entries, {(time.perf_counter() - started) * 1000:.1f} ms", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Harvest the logs of the cameras into a store, and query it.")
+    parser.add_argument("action", choices=("harvest", "query"))
+    parser.add_argument("--store", required=True, help="the log store directory")
+    parser.add_argument("--settings", help="harvest: a settings file exported from the index.html")
+    parser.add_argument("--max-concurrent", type=int, default=256, help="the maximum concurrent requests in total (default: 256)")
+    parser.add_argument("--timeout", type=float, default=10.0, help="seconds to wait for a response (default: 10)")
+    parser.add_argument("--start", help="query: from this time (ISO format or Unix time)")
+    parser.add_argument("--end", help="query: until this time (ISO format or Unix time)")
+    parser.add_argument("--ip", help="query: only the entries of this IP address")
+    parser.add_argument("--camera", help="query: only the entries of this camera keyName")
+    parser.add_argument("--user", help="query: only the entries of this user")
+    raise SystemExit(main(parser.parse_args()))
@@ -0,0 +1,177 @@
+"""
+Latency histograms and counters of the camera requests, per camera and command, to find the cameras and commands
+that are slow or failing (e.g. when the Viewer shows "error"). A CameraClient records into a Metrics given as its
+`metrics` option:
+
+    metrics = Metrics()
+    async with FoscamClient(metrics=metrics) as client:
+        ...
+    print(metrics.prometheus())     # the Prometheus text format, also served by the proxy at /metrics
+    print(metrics.summary())        # quantiles as JSON, served at /metrics/json
+
+Each request records the time to open its connection (if it did not reuse a keep-alive connection), the time to
+the response headers, the total time (including retries), the response bytes and the <result> code. The histograms have
+fixed log-scaled buckets (two per power of two, from 0.25 ms to 128 s), so that recording is a few arithmetic
+operations and the memory does not grow with the number of requests.
+"""
+
+import math
+import time
+
+min_exponent = -12      # the first bucket holds the times up to 2 ** -12 s (0.24 ms)
+max_exponent = 7        # the last bounded bucket ends at 2 ** 7 s, the next one holds the longer times
+bucket_bounds = tuple(2 ** (min_exponent + i / 2) for i in range(2 * (max_exponent - min_exponent) + 1))
+_half_octave = 2 ** -0.5
+
+
+def bucket_index(seconds: float):
+    """
+    The index of the bucket of `seconds`: bucket i holds the times from bucket_bounds[i - 1] to bucket_bounds[i],
+    the last one (len(bucket_bounds)) the times beyond the last bound.
+    """
+    mantissa, exponent = math.frexp(seconds)     # seconds = mantissa * 2 ** exponent, 0.5 <= mantissa < 1
+    if mantissa <= 0:
+        return 0
+    index = 2 * (exponent - min_exponent) - 1 + (mantissa > _half_octave) - (mantissa == 0.5)
+    return 0 if index < 0 else len(bucket_bounds) if index > len(bucket_bounds) else index
+
+
+class Histogram:
+    def __init__(self):
+        self.counts = [0] * (len(bucket_bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float):
+        self.counts[bucket_index(seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def quantile(self, q: float):
+        """
+        The upper bound of the bucket of the q-quantile (at most the largest recorded value), or None if empty.
+        """
+        if not self.count:
+            return None
+        rank, seen = q * self.count, 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                return min(bucket_bounds[index], self.max) if index < len(bucket_bounds) else self.max
+        return self.max
+
+    def summary(self):
+        if not self.count:
+            return {"count": 0}
+        return {"count": self.count, "mean": self.sum / self.count, "p50": self.quantile(0.5),
+                "p90": self.quantile(0.9), "p99": self.quantile(0.99), "max": self.max}
+
+
+class RequestStats:
+    """
+    The measurements of one command to one camera.
+    """
+    def __init__(self):
+        self.connect = Histogram()      # only the requests that opened a new connection
+        self.first_byte = Histogram()
+        self.total = Histogram()
+        self.bytes = 0
+        self.results = {}               # <result> code, or "error" for failed requests -> count
+        self.last_error = None
+        self.last_error_time = None
+
+
+class Metrics:
+    """
+    The RequestStats by (camera keyName, cmd).
+    """
+    def __init__(self):
+        self.stats = {}
+        self.started = time.time()
+
+    def _stats(self, keyName: str, cmd: str):
+        stats = self.stats.get((keyName, cmd))
+        if stats is None:
+            stats = self.stats[(keyName, cmd)] = RequestStats()
+        return stats
+
+    def record(self, keyName: str, cmd: str, response, result, total: float):
+        """
+        Records a request that got a response (an HttpResponse with its timing, see ConnectionPool.request()).
+        """
+        stats = self._stats(keyName, cmd)
+        if response.connect_time is not None:
+            stats.connect.add(response.connect_time)
+        stats.first_byte.add(response.first_byte_time)
+        stats.total.add(total)
+        stats.bytes += len(response.body)
+        stats.results[result] = stats.results.get(result, 0) + 1
+
+    def record_error(self, keyName: str, cmd: str, error: Exception, total: float):
+        """
+        Records a request that failed without a response (connection error or timeout, after the retries).
+        """
+        stats = self._stats(keyName, cmd)
+        stats.total.add(total)
+        stats.results["error"] = stats.results.get("error", 0) + 1
+        stats.last_error = str(error)
+        stats.last_error_time = time.time()
+
+    def summary(self):
+        """
+        {keyName: {cmd: {"requests", "bytes", "results", "connect", "firstByte", "total", ...}}} for JSON.
+        """
+        cameras = {}
+        for (keyName, cmd), stats in sorted(self.stats.items()):
+            summary = {"requests": sum(stats.results.values()), "bytes": stats.bytes,
+                       "results": {str(code): count for code, count in stats.results.items()},
+                       "connect": stats.connect.summary(), "firstByte": stats.first_byte.summary(),
+                       "total": stats.total.summary()}
+            if stats.last_error is not None:
+                summary["lastError"] = stats.last_error
+                summary["lastErrorTime"] = stats.last_error_time
+            cameras.setdefault(keyName, {})[cmd] = summary
+        return {"since": self.started, "cameras": cameras}
+
+    def prometheus(self):
+        """
+        The metrics in the Prometheus text exposition format. Of the histogram buckets, only those that have
+        counts are written (and +Inf), to keep the output small for many cameras.
+        """
+        lines = []
+        histograms = (("connect", "Seconds to open a connection to the camera"),
+                      ("first_byte", "Seconds from sending a request to the first byte of the response"),
+                      ("total", "Seconds of a command including retries"))
+        for name, help_text in histograms:
+            metric = f"foscam_request_{name}_seconds"
+            lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} histogram"]
+            for (keyName, cmd), stats in self.stats.items():
+                histogram = getattr(stats, name)
+                if not histogram.count:
+                    continue
+                labels = f'camera="{_escape(keyName)}",cmd="{_escape(cmd)}"'
+                cumulative = 0
+                for index, count in enumerate(histogram.counts[:-1]):
+                    if count:
+                        cumulative += count
+                        lines.append(f'{metric}_bucket{{{labels},le="{bucket_bounds[index]:.6g}"}} {cumulative}')
+                lines.append(f'{metric}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+                lines.append(f"{metric}_sum{{{labels}}} {histogram.sum:.6f}")
+                lines.append(f"{metric}_count{{{labels}}} {histogram.count}")
+        lines += ["# HELP foscam_response_bytes_total Bytes of the responses",
+                  "# TYPE foscam_response_bytes_total counter"]
+        for (keyName, cmd), stats in self.stats.items():
+            lines.append(f'foscam_response_bytes_total{{camera="{_escape(keyName)}",cmd="{_escape(cmd)}"}} {stats.bytes}')
+        lines += ["# HELP foscam_requests_total Requests by the <result> code of the response, or error",
+                  "# TYPE foscam_requests_total counter"]
+        for (keyName, cmd), stats in self.stats.items():
+            for code, count in stats.results.items():
+                lines.append(f'foscam_requests_total{{camera="{_escape(keyName)}",cmd="{_escape(cmd)}",result="{code}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,98 @@
+"""
+Composes the snapshots of many cameras into one grid image for the Viewer, so that a low-power display downloads
+and decodes one image per refresh instead of one per camera. Requires Pillow (pip install pillow).
+
+The snapshots are decoded at a reduced scale (the JPEG decoder skips the detail that the small tile would not
+show anyway), and only the tiles whose snapshot has changed since the previous grid are decoded and redrawn.
+"""
+
+import asyncio
+import io
+import math
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+background_color = (29, 45, 71)     # the background color of the index.html
+error_color = (60, 20, 20)          # a tile whose camera did not return an image
+
+
+def grid_size(count: int, width: int, height: int):
+    """
+    Returns the (columns, rows) for `count` tiles that keeps the tiles closest to 16:9 on a width x height grid.
+    """
+    best = None
+    for columns in range(1, count + 1):
+        rows = math.ceil(count / columns)
+        tile_aspect = (width / columns) / (height / rows)
+        score = abs(math.log(tile_aspect / (16 / 9)))
+        if best is None or score < best[0]:
+            best = (score, columns, rows)
+    return best[1], best[2]
+
+
+class Mosaic:
+    """
+    The grid of one set of cameras. Keeps the composed canvas between renders and redraws only the changed tiles.
+    """
+    def __init__(self, snapshots, cameras, width: int = 1920, height: int = 1080, quality: int = 75):
+        if Image is None:
+            raise RuntimeError("The mosaic requires Pillow: pip install pillow")
+        self.snapshots = snapshots
+        self.cameras = list(cameras)
+        self.width = width
+        self.height = height
+        self.quality = quality
+        self.columns, self.rows = grid_size(max(1, len(self.cameras)), width, height)
+        self.tile_width = width // self.columns
+        self.tile_height = height // self.rows
+        self.canvas = Image.new("RGB", (width, height), background_color)
+        self.tile_etags = [None] * len(self.cameras)   # the etag of the frame currently drawn on each tile
+        self.jpeg = None
+        self._rendering = None
+
+    def _draw_tile(self, index: int, data):
+        x = (index % self.columns) * self.tile_width
+        y = (index // self.columns) * self.tile_height
+        if data is None:
+            self.canvas.paste(error_color, (x, y, x + self.tile_width, y + self.tile_height))
+            return
+        image = Image.open(io.BytesIO(data))
+        image.draft("RGB", (self.tile_width, self.tile_height))    # reduced-scale (1/2, 1/4, 1/8) JPEG decoding
+        image = image.convert("RGB")
+        image.thumbnail((self.tile_width, self.tile_height))
+        self.canvas.paste(background_color, (x, y, x + self.tile_width, y + self.tile_height))
+        self.canvas.paste(image, (x + (self.tile_width - image.width) // 2, y + (self.tile_height - image.height) // 2))
+
+    async def _render(self):
+        frames = await asyncio.gather(*(self.snapshots.get(c) for c in self.cameras), return_exceptions=True)
+        changed = []
+        for index, frame in enumerate(frames):
+            etag = None if isinstance(frame, BaseException) else frame.etag
+            if etag != self.tile_etags[index] or self.jpeg is None:
+                changed.append((index, None if etag is None else frame.data))
+                self.tile_etags[index] = etag
+        if changed or self.jpeg is None:
+            self.jpeg = await asyncio.get_running_loop().run_in_executor(None, self._compose, changed)
+        return self.jpeg
+
+    def _compose(self, changed):
+        for index, data in changed:
+            try:
+                self._draw_tile(index, data)
+            except OSError:     # not a valid image
+                self._draw_tile(index, None)
+        output = io.BytesIO()
+        self.canvas.save(output, "JPEG", quality=self.quality)
+        return output.getvalue()
+
+    async def render(self):
+        """
+        Returns the grid as JPEG bytes. Concurrent calls share one render.
+        """
+        if self._rendering is None:
+            self._rendering = asyncio.ensure_future(self._render())
+            self._rendering.add_done_callback(lambda _: setattr(self, "_rendering", None))
+        return await asyncio.shield(self._rendering)
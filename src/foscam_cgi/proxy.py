@@ -0,0 +1,358 @@
+"""
+A local proxy for the index.html: serves the index.html and forwards commands to the cameras, so that the page
+can read the responses (the cameras do not send CORS headers). Run it in the src directory:
+
+    python3 -m foscam_cgi.proxy --settings FoscamApiExportedSettings.json
+
+and open http://127.0.0.1:8000. The index.html detects the proxy and then sends the commands through it.
+
+    GET /api/                        -> {"proxy": "foscam_cgi", "cameras": [keyNames from --settings], ...}
+    GET /api/<camera>/<cmd>?params   -> the parsed <CGI_Result> as JSON (or the image for snapPicture2)
+    GET /snapshot/<camera>?maxAge=1  -> the latest snapshot from the shared cache (see snapshots.py)
+    GET /mosaic?cam=<camera>&cam=<camera>&width=1920&height=1080
+                                     -> the snapshots of all the cameras in one grid image (see mosaic.py)
+    GET /poller                      -> the intervals and change scores of the polled cameras (see scheduler.py)
+    GET /archive/<camera>?start=&end=-> {"timestamps": [...]} of the archived frames (see archive.py)
+    GET /archive/<camera>/<timestamp>-> the archived frame at or before the timestamp (unix seconds)
+    GET /events                      -> server-sent events of the alarm state changes (see alarms.py)
+    GET /stream/<camera>             -> the MJPEG stream of the camera as multipart/x-mixed-replace (see streams.py)
+    GET /stream                      -> the state of the MJPEG streams
+    GET /ptz/<camera>/<cmd>?params   -> the result of a PTZ, zoom, focus or IR command, sent by the channel of
+                                        the camera ({"dropped": true} if a newer move superseded it, see ptz.py)
+    GET /metrics                     -> the request latencies per camera and command for Prometheus (see metrics.py)
+    GET /metrics/json                -> the same as JSON, with the quantiles
+
+<camera> is a keyName from the settings file, or `user:password@ip:port` (URL-encoded) of a camera in the settings
+file (of any camera with --allow-any-camera). Pages of other origins are refused unless given by --allow-origin.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+
+from . import mosaic
+from .alarms import AlarmPoller
+from .archive import Archive
+from .cameras import load_cameras, parse_camera_reference
+from .client import CameraError, FoscamClient, ParameterError
+from .metrics import Metrics
+from .ptz import PtzControl
+from .scheduler import AdaptivePoller
+from .server import Response, StreamingResponse, serve
+from .snapshots import SnapshotCache
+from .streams import StreamHub, multipart_stream
+
+# Commands that return an image instead of a <CGI_Result>:
+image_commands = ("snapPicture2",)
+
+
+class ApiProxy:
+    """
+    Routes the requests of the index.html. Other services (snapshots, event streams, ...) register their own
+    routes by the first path segment in `routes`.
+    """
+    def __init__(self, index_path, cameras=None, client=None, snapshot_max_age: float = 1.0, snapshot_cache_bytes: int = 64 * 1024 * 1024,
+                 allow_any_camera: bool = False):
+        self.index_path = Path(index_path)
+        self.cameras = cameras or {}
+        # Addresses outside the settings are only forwarded to with allow_any_camera, so that the proxy is not an
+        # open relay to any host and port of the network.
+        self.addresses = {camera.address for camera in self.cameras.values()}
+        self.allow_any_camera = allow_any_camera
+        # Concurrent commands to one camera are pipelined over two keep-alive connections.
+        self.client = client or FoscamClient(max_connections=2, pipeline_depth=4, metrics=Metrics())
+        self.metrics = self.client.camera_client_options.get("metrics")
+        self.ptz_control = PtzControl(metrics=self.metrics)
+        self.snapshots = SnapshotCache(self.client, snapshot_max_age, snapshot_cache_bytes)
+        self.mosaics = OrderedDict()    # (camera references, width, height) -> Mosaic, least recently used first
+        self.max_mosaics = 16
+        self.poller = None              # an AdaptivePoller, see poll()
+        self.archive = None             # an Archive, see archive_to()
+        self.alarms = None              # an AlarmPoller, see watch_alarms()
+        self.streams = None             # a StreamHub, see stream()
+        self.routes = {"api": self.api, "snapshot": self.snapshot, "mosaic": self.mosaic, "poller": self.poller_status,
+                       "archive": self.archived, "events": self.events, "ptz": self.ptz, "metrics": self.metrics_export,
+                       "stream": self.stream_frames}
+
+    def poll(self, cameras, **poller_options):
+        """
+        Polls the snapshots of the cameras in the background (started by run()). The Viewer is then served the
+        latest polled snapshot instead of fetching one per refresh.
+        """
+        self.poller = AdaptivePoller(self.snapshots, **poller_options)
+        for camera in cameras:
+            self.poller.add(camera)
+
+    def archive_to(self, directory, **archive_options):
+        """
+        Archives every new snapshot (of the poller or the viewers) as a time-lapse.
+        """
+        self.archive = Archive(directory, **archive_options)
+        self.snapshots.listeners.append(self.archive.add)
+
+    def watch_alarms(self, cameras, **alarm_options):
+        """
+        Polls the alarm state of the cameras in the background (started by run()) for the /events stream.
+        """
+        self.alarms = AlarmPoller(self.client, **alarm_options)
+        for camera in cameras:
+            self.alarms.add(camera)
+
+    def stream(self, cameras, **stream_options):
+        """
+        Receives the MJPEG streams of the cameras in the background (started by run()) instead of polling their
+        snapshots, and serves /stream/<camera> (for other cameras too, while someone is watching).
+        """
+        self.streams = StreamHub(self.snapshots, **stream_options)
+        for camera in cameras:
+            self.streams.hold(camera)
+
+    def services(self):
+        """
+        The background services to run alongside the server.
+        """
+        return [service for service in (self.poller, self.alarms, self.streams) if service is not None]
+
+    def camera(self, reference: str):
+        camera = parse_camera_reference(reference, self.cameras)
+        if not self.allow_any_camera and camera.address not in self.addresses:
+            raise ValueError(f"{camera.ip}:{camera.port} is not a camera of the --settings (see --allow-any-camera)")
+        return camera
+
+    async def handle(self, request):
+        if request.method not in ("GET", "HEAD"):
+            return Response.error(405, "Only GET is supported")
+        if not request.segments or request.segments == ["index.html"]:
+            return Response(200, self.index_path.read_bytes(), "text/html; charset=utf-8")
+        route = self.routes.get(request.segments[0])
+        if route is None:
+            return Response.error(404, f"Not found: {request.path}")
+        return await route(request)
+
+    async def api(self, request):
+        if len(request.segments) == 1:
+            return Response.json({"proxy": "foscam_cgi", "cameras": list(self.cameras), "routes": list(self.routes),
+                                  "addresses": sorted(f"{ip}:{port}" for ip, port in self.addresses),
+                                  "anyCamera": self.allow_any_camera,
+                                  "alarms": self.alarms is not None, "streams": self.streams is not None})
+        if len(request.segments) != 3:
+            return Response.error(404, "Use /api/<camera>/<cmd>?params")
+        try:
+            camera = self.camera(request.segments[1])
+        except ValueError as e:
+            return Response.error(400, str(e))
+        cmd = request.segments[2]
+        cameraClient = self.client.camera(camera)
+        try:
+            if cmd in image_commands:
+                return Response(200, await cameraClient.snapshot(cmd), "image/jpeg", {"Cache-Control": "no-store"})
+            result = await cameraClient.command(cmd, **request.query)
+        except ParameterError as e:
+            return Response.error(400, str(e))
+        except CameraError as e:
+            return Response.error(502, str(e))
+        return Response.json(result.as_dict())
+
+    async def ptz(self, request):
+        if len(request.segments) != 3:
+            return Response.error(404, "Use /ptz/<camera>/<cmd>?params")
+        try:
+            camera = self.camera(request.segments[1])
+        except ValueError as e:
+            return Response.error(400, str(e))
+        try:
+            result = await self.ptz_control.channel(camera).command(request.segments[2], **request.query)
+        except ParameterError as e:
+            return Response.error(400, str(e))
+        except CameraError as e:
+            return Response.error(502, str(e))
+        return Response.json({"dropped": True} if result is None else result.as_dict())
+
+    async def snapshot(self, request):
+        if len(request.segments) != 2:
+            return Response.error(404, "Use /snapshot/<camera>?maxAge=<seconds>")
+        try:
+            camera = self.camera(request.segments[1])
+            max_age = float(request.query["maxAge"]) if request.query.get("maxAge") else None
+            frame = None
+            if max_age is None and self.poller and camera.keyName in self.poller.states:
+                frame = self.snapshots.latest(camera)
+            if self.streams:
+                frame = self.streams.latest(camera) or frame    # the latest frame of a running stream
+            frame = frame or await self.snapshots.get(camera, max_age)
+        except ValueError as e:
+            return Response.error(400, str(e))
+        except CameraError as e:
+            return Response.error(502, str(e))
+        return Response(200, frame.data, "image/jpeg", {
+            "Cache-Control": "no-store",
+            "ETag": f'"{frame.etag}"',
+            "X-Frame-Age": f"{frame.age:.3f}",
+        })
+
+    async def mosaic(self, request):
+        references = tuple(value for name, value in request.query_list if name == "cam")
+        if not references:
+            return Response.error(400, "Use /mosaic?cam=<camera>&cam=<camera>&width=<px>&height=<px>")
+        if mosaic.Image is None:
+            return Response.error(503, "The mosaic requires Pillow: pip install pillow")
+        try:
+            width = min(max(int(request.query.get("width") or 1920), 64), 7680)
+            height = min(max(int(request.query.get("height") or 1080), 64), 4320)
+            key = (references, width, height)
+            grid = self.mosaics.get(key)
+            if grid is None:
+                grid = self.mosaics[key] = mosaic.Mosaic(self.snapshots, [self.camera(r) for r in references], width, height)
+                while len(self.mosaics) > self.max_mosaics:
+                    self.mosaics.popitem(last=False)
+            self.mosaics.move_to_end(key)
+        except ValueError as e:
+            return Response.error(400, str(e))
+        return Response(200, await grid.render(), "image/jpeg", {"Cache-Control": "no-store"})
+
+    async def poller_status(self, request):
+        if self.poller is None:
+            return Response.error(404, "Not polling, start the proxy with --poll")
+        return Response.json(self.poller.status())
+
+    async def metrics_export(self, request):
+        if self.metrics is None:
+            return Response.error(404, "The client was created without metrics")
+        if request.segments[1:] == ["json"]:
+            return Response.json(self.metrics.summary())
+        return Response(200, self.metrics.prometheus().encode(), "text/plain; version=0.0.4; charset=utf-8")
+
+    async def archived(self, request):
+        if self.archive is None:
+            return Response.error(404, "Not archiving, start the proxy with --archive")
+        if len(request.segments) not in (2, 3):
+            return Response.error(404, "Use /archive/<camera>?start=<unix time>&end=<unix time> or /archive/<camera>/<unix time>")
+        try:
+            keyName = self.camera(request.segments[1]).keyName
+            if len(request.segments) == 3:
+                found = self.archive.frame_at(keyName, float(request.segments[2]))
+                if found is None:
+                    return Response.error(404, "No archived frame at or before that time")
+                return Response(200, found[1], "image/jpeg", {"X-Frame-Timestamp": f"{found[0]:.3f}"})
+            start = float(request.query.get("start") or 0)
+            end = float(request.query.get("end") or "inf")
+        except ValueError as e:
+            return Response.error(400, str(e))
+        return Response.json({"timestamps": self.archive.timestamps(keyName, start, end)})
+
+    async def stream_frames(self, request):
+        if self.streams is None:
+            return Response.error(404, "Not streaming, start the proxy with --mjpeg")
+        if len(request.segments) == 1:
+            return Response.json(self.streams.status())
+        if len(request.segments) != 2:
+            return Response.error(404, "Use /stream/<camera>")
+        try:
+            camera = self.camera(request.segments[1])
+        except ValueError as e:
+            return Response.error(400, str(e))
+        streams = self.streams
+
+        async def stream(writer):
+            mjpeg = streams.subscribe(camera)
+            try:
+                await multipart_stream(mjpeg, writer)
+            finally:
+                streams.unsubscribe(camera)
+
+        return StreamingResponse(stream, "multipart/x-mixed-replace; boundary=frame")
+
+    async def events(self, request):
+        if self.alarms is None:
+            return Response.error(404, "Not watching alarms, start the proxy with --alarms")
+        alarms = self.alarms
+
+        async def stream(writer):
+            queue = alarms.subscribe()
+            try:
+                writer.write(f"event: state\ndata: {json.dumps(alarms.snapshot())}\n\n".encode())
+                while True:
+                    await writer.drain()
+                    try:
+                        event = await asyncio.wait_for(queue.get(), 15)
+                    except asyncio.TimeoutError:
+                        writer.write(b": keep-alive\n\n")     # also detects a closed connection
+                        continue
+                    writer.write(f"data: {json.dumps(event)}\n\n".encode())
+            finally:
+                alarms.unsubscribe(queue)
+
+        return StreamingResponse(stream, "text/event-stream")
+
+    def close(self):
+        self.client.close()
+        self.ptz_control.close()
+        if self.archive:
+            self.archive.close()
+
+
+async def run(proxy, host: str, port: int, allow_origins=()):
+    server = await serve(proxy.handle, host, port, allow_origins=allow_origins)
+    print(f"Serving {proxy.index_path} and the camera API proxy on http://{host}:{port}")
+    services = [asyncio.ensure_future(service.run()) for service in proxy.services()]
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        for service in services:
+            service.cancel()
+        proxy.close()
+
+
+def argument_parser(description: str):
+    """
+    The common command line arguments of the local services.
+    """
+    src_dir = Path(os.path.realpath(__file__)).resolve().parent.parent
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--settings", help="a settings file exported from the index.html, to address cameras by name")
+    parser.add_argument("--host", default="127.0.0.1", help="the address to listen on (default: 127.0.0.1, only this machine)")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--index", default=str(src_dir.parent / "index.html"), help="the index.html to serve")
+    parser.add_argument("--allow-origin", action="append", default=[], metavar="ORIGIN",
+                        help="also accept requests from pages of this origin, e.g. http://dashboard.local:3000 (repeatable)")
+    parser.add_argument("--allow-any-camera", action="store_true",
+                        help="forward to any user:password@ip:port, not only to the addresses of the --settings cameras")
+    parser.add_argument("--snapshot-max-age", type=float, default=1.0, help="serve cached snapshots up to this age in seconds (default: 1)")
+    parser.add_argument("--snapshot-cache-mb", type=float, default=64, help="memory limit of the snapshot cache (default: 64 MB)")
+    parser.add_argument("--poll", action="store_true", help="keep polling the snapshots of the --settings cameras, faster when the picture changes")
+    parser.add_argument("--poll-min-interval", type=float, default=1.0, help="poll a camera at most this often in seconds (default: 1)")
+    parser.add_argument("--poll-max-interval", type=float, default=30.0, help="poll a static camera at least this often in seconds (default: 30)")
+    parser.add_argument("--poll-rate", type=float, default=20.0, help="the total snapshots per second of all cameras (default: 20)")
+    parser.add_argument("--alarms", action="store_true", help="poll the alarm state of the --settings cameras for the /events stream")
+    parser.add_argument("--alarm-interval", type=float, default=2.0, help="poll the alarm state this often in seconds (default: 2)")
+    parser.add_argument("--mjpeg", action="store_true", help="receive the MJPEG streams of the --settings cameras instead of polling snapshots (see foscam_cgi.streams)")
+    parser.add_argument("--archive", metavar="DIRECTORY", help="keep all the snapshots as a time-lapse in this directory")
+    parser.add_argument("--archive-days", type=float, default=7, help="delete archived snapshots older than this (default: 7)")
+    parser.add_argument("--archive-gb", type=float, default=50, help="the size limit of the archive (default: 50 GB)")
+    return parser
+
+
+if __name__ == '__main__':
+    args = argument_parser("Serve the index.html and proxy its commands to the cameras.").parse_args()
+    proxy = ApiProxy(args.index, load_cameras(args.settings) if args.settings else None,
+                     snapshot_max_age=args.snapshot_max_age, snapshot_cache_bytes=int(args.snapshot_cache_mb * 1024 * 1024),
+                     allow_any_camera=args.allow_any_camera)
+    if args.archive:
+        proxy.archive_to(args.archive, max_age=args.archive_days * 24 * 3600, max_bytes=int(args.archive_gb * 1024 ** 3))
+    if (args.poll or args.alarms or args.mjpeg) and not proxy.cameras:
+        raise SystemExit("--poll, --alarms and --mjpeg need the cameras from --settings")
+    if args.alarms:
+        proxy.watch_alarms(proxy.cameras.values(), interval=args.alarm_interval)
+    if args.mjpeg:
+        proxy.stream(proxy.cameras.values())
+    if args.poll:
+        proxy.poll(proxy.cameras.values(), min_interval=args.poll_min_interval, max_interval=args.poll_max_interval,
+                   max_rate=args.poll_rate)
+    try:
+        asyncio.run(run(proxy, args.host, args.port, args.allow_origin))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,136 @@
+"""
+A control channel for PTZ (pan, tilt, zoom), focus and the infrared LEDs, used by the proxy for the PTZ buttons of
+the index.html (GET /ptz/<camera>/<cmd>?params). Each camera gets its own keep-alive connection, so that the
+commands are not queued behind snapshots, and the commands are sent one at a time in the order they were given:
+
+- A move (ptzMoveUp, zoomIn, ptzGotoPresetPoint, ...) that is still waiting when a newer move or the matching stop
+  is given is dropped instead of sent late.
+- A stop (ptzStopRun, zoomStop, focusStop) is sent until the camera acknowledges it with <result>0</result>, or
+  until `stop_deadline` seconds have passed, so that a lost request does not leave the camera moving.
+- The steps of a sequence (e.g. the manual IR mode before openInfraLed) are sent as soon as the previous step is
+  acknowledged, instead of after a fixed delay.
+"""
+
+import asyncio
+
+from .client import CameraClient, CameraError
+
+# The stop command of each kind of movement:
+move_commands = {
+    "ptzMoveUp": "ptzStopRun", "ptzMoveDown": "ptzStopRun", "ptzMoveLeft": "ptzStopRun", "ptzMoveRight": "ptzStopRun",
+    "ptzMoveTopLeft": "ptzStopRun", "ptzMoveTopRight": "ptzStopRun", "ptzMoveBottomLeft": "ptzStopRun",
+    "ptzMoveBottomRight": "ptzStopRun", "ptzGotoPresetPoint": "ptzStopRun", "ptzReset": "ptzStopRun",
+    "zoomIn": "zoomStop", "zoomOut": "zoomStop",
+    "focusNear": "focusStop", "focusFar": "focusStop",
+}
+stop_commands = set(move_commands.values())
+
+# Result codes that do not change by retrying: format error, wrong credentials, access denied.
+permanent_results = (-1, -2, -3)
+
+
+def sequence_for(cmd: str, params: dict):
+    """
+    The steps [(cmd, params, required)] to send for the command. A failed required step ends the sequence.
+    """
+    if cmd in ("openInfraLed", "closeInfraLed"):
+        # The IR LEDs can only be switched in the manual mode.
+        return [("setInfraLedConfig", {"mode": 1}, True), (cmd, params, True)]
+    if cmd == "ptzAddPresetPoint":
+        # Replace a preset of the same name. Deleting fails if there is none, which does not matter.
+        return [("ptzDeletePresetPoint", params, False), (cmd, params, True)]
+    return [(cmd, params, True)]
+
+
+class PtzChannel:
+    """
+    The PTZ commands of one camera. The methods return the CGIResult of the (last) command sent, or None if the
+    move was dropped because a newer move or a stop was given while it was waiting.
+    """
+    def __init__(self, camera, request_timeout: float = 2.0, stop_deadline: float = 5.0, metrics=None):
+        self.camera = camera
+        self.stop_deadline = stop_deadline
+        self.client = CameraClient(camera, max_connections=1, pipeline_depth=1, timeout=request_timeout,
+                                   retries=0, metrics=metrics)
+        self._lock = asyncio.Lock()     # one command at a time, in the order they were given
+        self._waiting_move = None       # (stop cmd, future) of the move waiting for the lock
+        self.stats = {"sent": 0, "dropped": 0, "stop_retries": 0}
+
+    def _drop_waiting_move(self, stop_cmd=None):
+        if self._waiting_move is not None and stop_cmd in (None, self._waiting_move[0]):
+            self._waiting_move[1].set_result(None)
+            self._waiting_move = None
+            self.stats["dropped"] += 1
+
+    async def _send(self, cmd: str, params: dict):
+        self.stats["sent"] += 1
+        return await self.client.command(cmd, **params)
+
+    async def move(self, cmd: str, **params):
+        self._drop_waiting_move()
+        dropped = asyncio.get_running_loop().create_future()
+        waiting = self._waiting_move = (move_commands[cmd], dropped)
+        async with self._lock:
+            if dropped.done():
+                return None
+            if self._waiting_move is waiting:
+                self._waiting_move = None
+            return await self._send(cmd, params)
+
+    async def stop(self, cmd: str, **params):
+        """
+        Sends the stop until it is acknowledged. Raises CameraError if it was not within `stop_deadline` seconds.
+        """
+        self._drop_waiting_move(cmd)
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            deadline = loop.time() + self.stop_deadline
+            backoff = 0.05
+            while True:
+                try:
+                    result = await self._send(cmd, params)
+                    if result.ok or result.result in permanent_results:
+                        return result
+                    error = CameraError(f"{self.camera.keyName}: {cmd}: {result.message}")
+                except CameraError as e:
+                    error = e
+                if loop.time() + backoff >= deadline:
+                    raise error
+                self.stats["stop_retries"] += 1
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 0.5)
+
+    async def command(self, cmd: str, **params):
+        if cmd in stop_commands:
+            return await self.stop(cmd, **params)
+        if cmd in move_commands:
+            return await self.move(cmd, **params)
+        async with self._lock:
+            for step_cmd, step_params, required in sequence_for(cmd, params):
+                result = await self._send(step_cmd, step_params)
+                if required and not result.ok:
+                    break
+            return result
+
+    def close(self):
+        self.client.close()
+
+
+class PtzControl:
+    """
+    The PtzChannels of all the cameras, created on demand.
+    """
+    def __init__(self, **channel_options):
+        self.channel_options = channel_options
+        self.channels = {}
+
+    def channel(self, camera):
+        channel = self.channels.get(camera.keyName)
+        if channel is None:
+            channel = self.channels[camera.keyName] = PtzChannel(camera, **self.channel_options)
+        return channel
+
+    def close(self):
+        for channel in self.channels.values():
+            channel.close()
+        self.channels = {}
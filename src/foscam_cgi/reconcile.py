@@ -0,0 +1,201 @@
+"""
+Pushes a desired configuration to many cameras, sending only the set* commands that change something. The
+current configuration is read with the matching get* commands (concurrently across the cameras), and a set*
+command is sent with all of its parameters: the changed ones from the desired state and the others as they
+currently are (e.g. setMotionDetectConfig needs all the area and schedule parameters, see parse_pdf_to_json.py).
+
+The desired state is a JSON file of camera groups. A camera can be in several groups; the later groups win.
+Instead of schedule0-schedule6, a "schedule" can be given as rules (see bitmaps.parse_schedule(), needs NumPy).
+
+    {"groups": [
+        {"cameras": ["<keyName from --settings, or user:password@ip:port>", ...],
+         "config": {"setMotionDetectConfig": {"isEnable": 1, "sensitivity": 2, "schedule": "weekdays 18:00-07:00"},
+                    "setScheduleRecordConfig": {"isEnable": 0}}}
+    ]}
+
+    python3 -m foscam_cgi.reconcile desired.json --settings FoscamApiExportedSettings.json           (shows the plan)
+    python3 -m foscam_cgi.reconcile desired.json --settings FoscamApiExportedSettings.json --apply   (sends it)
+"""
+
+import argparse
+import asyncio
+import json
+from pathlib import Path
+
+from .cameras import load_cameras, parse_camera_reference
+from .client import CameraError, FoscamClient
+from .commands import commandJson
+from .urls import validate
+
+# The get* command of a set* command, where it is not simply set<Name> -> get<Name>:
+get_commands = {
+    "setBrightness": "getImageSetting",
+    "setContrast": "getImageSetting",
+    "setHue": "getImageSetting",
+    "setSaturation": "getImageSetting",
+    "setSharpness": "getImageSetting",
+    "setIpInfo": "getIPInfo",
+    "setWifiSetting": "getWifiConfig",
+}
+
+
+def get_command_for(set_cmd: str):
+    """
+    Returns the get* command that reads the parameters of the set* command, or None if there is none.
+    """
+    get_cmd = get_commands.get(set_cmd, "get" + set_cmd[3:])
+    return get_cmd if set_cmd.startswith("set") and get_cmd in commandJson else None
+
+
+class Change:
+    """
+    A set* command that changes the configuration of one camera. `diff` is {param: (current, desired)}.
+    """
+    def __init__(self, camera, cmd: str, params: dict, diff: dict):
+        self.camera = camera
+        self.cmd = cmd
+        self.params = params
+        self.diff = diff
+        self.result = None      # the CGIResult or the CameraError, after apply()
+
+    def __repr__(self):
+        changes = ", ".join(f"{param}: {current!r} -> {desired!r}" for param, (current, desired) in self.diff.items())
+        return f"{self.camera.keyName}: {self.cmd}({changes})"
+
+
+def desired_configs(document: dict, cameras=None):
+    """
+    Merges the groups of a desired state document into {keyName: (Camera, {set_cmd: {param: value}})}.
+    """
+    merged = {}
+    for group in document["groups"]:
+        group_config = {}
+        for cmd, params in group["config"].items():
+            if cmd not in commandJson:
+                raise ValueError(f"Unknown command {cmd!r}")
+            if get_command_for(cmd) is None:
+                raise ValueError(f"{cmd} has no get command to read the current value from")
+            params = dict(params)
+            if isinstance(params.get("schedule"), str):
+                from .bitmaps import encode_schedules, parse_schedule
+                params.update(encode_schedules(parse_schedule(params.pop("schedule")))[0])
+            problems = validate(cmd, params)
+            if problems:
+                raise ValueError(f"{cmd}: {'; '.join(problems)}")
+            group_config[cmd] = params
+        for reference in group["cameras"]:
+            camera = parse_camera_reference(reference, cameras)
+            _, config = merged.setdefault(camera.keyName, (camera, {}))
+            for cmd, params in group_config.items():
+                config.setdefault(cmd, {}).update(params)
+    return merged
+
+
+class Reconciler:
+    """
+    Plans and applies the changes. At most `max_concurrent` requests are sent at once in total, and the set*
+    commands to one camera are sent one at a time, `camera_interval` seconds apart, because the camera may
+    restart the affected subsystem after each one.
+    """
+    def __init__(self, client, max_concurrent: int = 16, camera_interval: float = 1.0):
+        self.client = client
+        self.camera_interval = camera_interval
+        self._slots = asyncio.Semaphore(max_concurrent)
+
+    async def _read(self, camera, get_cmd: str):
+        async with self._slots:
+            return (await self.client.camera(camera).command(get_cmd)).raise_for_result()
+
+    async def _plan_camera(self, camera, config: dict):
+        get_cmds = sorted({get_command_for(cmd) for cmd in config})
+        results = await asyncio.gather(*(self._read(camera, get_cmd) for get_cmd in get_cmds))
+        current = dict(zip(get_cmds, results))
+        changes = []
+        for cmd, desired in config.items():
+            values = current[get_command_for(cmd)]
+            diff = {param: (values.get(param), value) for param, value in desired.items()
+                    if str(values.get(param)) != str(value)}
+            if not diff:
+                continue
+            params = {}
+            for param in (commandJson[cmd]["ExampleParams"] or {}):
+                if param in desired:
+                    params[param] = desired[param]
+                elif param in values:
+                    params[param] = values[param]
+                else:
+                    raise CameraError(f"{cmd}: {get_command_for(cmd)} did not return the current value of {param!r}")
+            for param, value in desired.items():
+                params.setdefault(param, value)     # parameters that the guide does not list
+            changes.append(Change(camera, cmd, params, diff))
+        return changes
+
+    async def plan(self, configs: dict):
+        """
+        Reads the current configuration of the cameras of desired_configs(). Returns (changes, errors), where
+        errors is {keyName: CameraError} of the cameras that could not be read.
+        """
+        keyNames = list(configs)
+        results = await asyncio.gather(*(self._plan_camera(*configs[keyName]) for keyName in keyNames),
+                                       return_exceptions=True)
+        changes, errors = [], {}
+        for keyName, result in zip(keyNames, results):
+            if isinstance(result, CameraError):
+                errors[keyName] = result
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                changes.extend(result)
+        return changes, errors
+
+    async def _apply_camera(self, changes):
+        for i, change in enumerate(changes):
+            if i:
+                await asyncio.sleep(self.camera_interval)
+            async with self._slots:
+                try:
+                    change.result = await self.client.camera(change.camera).command(change.cmd, **change.params)
+                except CameraError as e:
+                    change.result = e
+
+    async def apply(self, changes):
+        """
+        Sends the changes. The result of each is stored in `change.result`.
+        """
+        by_camera = {}
+        for change in changes:
+            by_camera.setdefault(change.camera.keyName, []).append(change)
+        await asyncio.gather(*(self._apply_camera(camera_changes) for camera_changes in by_camera.values()))
+        return changes
+
+
+async def main(args):
+    cameras = load_cameras(args.settings) if args.settings else None
+    configs = desired_configs(json.loads(Path(args.desired).read_text()), cameras)
+    async with FoscamClient() as client:
+        reconciler = Reconciler(client, args.max_concurrent, args.camera_interval)
+        changes, errors = await reconciler.plan(configs)
+        for keyName, error in errors.items():
+            print(f"{keyName}: could not read the configuration: {error}")
+        for change in changes:
+            print(change)
+        print(f"{len(configs)} cameras, {len(changes)} commands to send, {len(errors)} cameras not reachable")
+        if not args.apply or not changes:
+            return 1 if errors else 0
+        await reconciler.apply(changes)
+        failed = [c for c in changes if isinstance(c.result, CameraError) or not c.result.ok]
+        for change in failed:
+            message = change.result if isinstance(change.result, CameraError) else change.result.message
+            print(f"{change.camera.keyName}: {change.cmd} failed: {message}")
+        print(f"{len(changes) - len(failed)} commands sent successfully, {len(failed)} failed")
+        return 1 if errors or failed else 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Send only the set* commands that change the configuration of the cameras.")
+    parser.add_argument("desired", help="the desired state JSON file (see foscam_cgi/reconcile.py)")
+    parser.add_argument("--settings", help="a settings file exported from the index.html, to address cameras by name")
+    parser.add_argument("--apply", action="store_true", help="send the commands (default: only show them)")
+    parser.add_argument("--max-concurrent", type=int, default=16, help="the maximum concurrent requests in total (default: 16)")
+    parser.add_argument("--camera-interval", type=float, default=1.0, help="seconds between the commands to one camera (default: 1)")
+    raise SystemExit(asyncio.run(main(parser.parse_args())))
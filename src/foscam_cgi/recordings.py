@@ -0,0 +1,362 @@
+"""
+Indexes the recordings on the SD cards of many cameras (getRecordList), to find the cameras that recorded at a
+given time without paging through the recordings of each camera in the index.html:
+
+    python3 -m foscam_cgi.recordings crawl --settings FoscamApiExportedSettings.json --store recordings
+    python3 -m foscam_cgi.recordings query --store recordings --start "2024-05-01 12:00" --end "2024-05-01 12:10"
+
+getRecordList returns 10 recordings at a time from `startNo` (0 is the oldest), and `totalCnt`. The store
+remembers the number of recordings and the newest one of each camera, so that a crawl requests only the pages
+after it, a few pages of a camera at a time and all the cameras concurrently. Cameras that do not have
+getRecordList are asked getRecordList2. reloadRecordindex (which makes the camera scan its SD card) is only sent
+when the listing does not continue from the newest known recording (the card was overwritten or replaced; the
+recordings of the camera are then read again), or when the listing has not grown for `reload_after` seconds.
+
+    <store>/records.tsv     <camera number>\\t<start>\\t<end>\\t<type>\\t<path> per recording
+    <store>/state.json      the camera keyNames, the committed size of records.tsv, and the crawl state per camera
+
+The recordings are loaded into a RecordIndex, which keeps a bit set of the cameras that recorded in each 10
+minutes, hour and day, so that cameras_between() is a few unions of the bit sets, and an exact check of the
+recordings of the 10 minutes at both ends.
+"""
+
+import argparse
+import asyncio
+import bisect
+import json
+import os
+import re
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import unquote
+
+from .cameras import load_cameras
+from .client import CameraError, FoscamClient
+
+page_size = 10              # the recordings returned by one getRecordList
+bucket_seconds = 600        # the finest time slot of the RecordIndex
+_file_time = re.compile(r"(\d{8}_\d{6})")
+
+
+def parse_record(text):
+    """
+    (start, end, type, path) of a recording "path,size,startTime,endTime,recordType" (the fields can also be
+    separated by "|"), or None. Without the times, the start is read from the file name (e.g. alarm_20240501_120000.avi).
+    """
+    fields = re.split(r"[,|]", unquote(str(text)))
+    path, numbers = fields[0], [int(field) for field in fields[1:] if field.strip().lstrip("-").isdigit()]
+    if len(numbers) >= 3:
+        return numbers[-3], numbers[-2], numbers[-1], path
+    match = _file_time.search(path)
+    if match is None:
+        return None
+    start = int(datetime.strptime(match.group(1), "%Y%m%d_%H%M%S").timestamp())
+    return start, start, -1, path
+
+
+class RecordIndex:
+    """
+    The recordings (start, end, type, path) by camera number, and which cameras recorded in each time slot.
+    """
+    def __init__(self):
+        self.records = {}           # camera -> [(start, end, type, path)] sorted by start
+        self.longest = {}           # camera -> the longest duration, to bound the search by start
+        self.slots = {}             # slot (start // bucket_seconds) -> bit set (int) of the cameras that recorded
+        self.hours = {}             # hour -> bit set of the cameras that recorded in the hour
+        self.days = {}              # day -> bit set of the cameras that recorded in the day
+        self.slot_records = {}      # slot -> [(start, end, camera)] overlapping the slot
+
+    def add(self, camera: int, records):
+        found = self.records.setdefault(camera, [])
+        for record in records:
+            start, end = record[0], max(record[0], record[1])
+            if found and start < found[-1][0]:
+                bisect.insort(found, record)
+            else:
+                found.append(record)
+            self.longest[camera] = max(self.longest.get(camera, 0), end - start)
+            bit = 1 << camera
+            for slot in range(start // bucket_seconds, end // bucket_seconds + 1):
+                self.slots[slot] = self.slots.get(slot, 0) | bit
+                self.slot_records.setdefault(slot, []).append((start, end, camera))
+            for hour in range(start // 3600, end // 3600 + 1):
+                self.hours[hour] = self.hours.get(hour, 0) | bit
+            for day in range(start // 86400, end // 86400 + 1):
+                self.days[day] = self.days.get(day, 0) | bit
+
+    def remove(self, camera: int):
+        """
+        Removes the recordings of the camera (rebuilds the time slots).
+        """
+        records = self.records
+        self.__init__()
+        for other, found in records.items():
+            if other != camera:
+                self.add(other, found)
+
+    def cameras_between(self, start: int, end: int):
+        """
+        The set of the camera numbers that have a recording overlapping start...end.
+        """
+        first, last = start // bucket_seconds, end // bucket_seconds
+        cameras = self._between_slots(first, last)
+        for slot in {first, last}:     # the slots at the ends: check the recordings
+            for record_start, record_end, camera in self.slot_records.get(slot, ()):
+                if record_start <= end and record_end >= start:
+                    cameras |= 1 << camera
+        bits = bin(cameras)[:1:-1]      # the lowest bit first
+        return {number for number, bit in enumerate(bits) if bit == "1"}
+
+    def _between_slots(self, first: int, last: int):
+        """
+        The bit set of the cameras that recorded in the slots after `first` and before `last`.
+        """
+        cameras = 0
+        slot, per_hour, per_day = first + 1, 3600 // bucket_seconds, 86400 // bucket_seconds
+        while slot < last:      # the slots in between: any recording in them overlaps
+            if slot % per_day == 0 and slot + per_day <= last:
+                cameras |= self.days.get(slot // per_day, 0)
+                slot += per_day
+            elif slot % per_hour == 0 and slot + per_hour <= last:
+                cameras |= self.hours.get(slot // per_hour, 0)
+                slot += per_hour
+            else:
+                cameras |= self.slots.get(slot, 0)
+                slot += 1
+        return cameras
+
+    def between(self, camera: int, start: int, end: int):
+        """
+        The recordings of the camera overlapping start...end.
+        """
+        found = self.records.get(camera, [])
+        first = bisect.bisect_left(found, (start - self.longest.get(camera, 0),))
+        last = bisect.bisect_right(found, (end, float("inf")))
+        return [record for record in found[first:last] if max(record[0], record[1]) >= start]
+
+
+class RecordingStore:
+    def __init__(self, root):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        state_path = self.root / "state.json"
+        state = json.loads(state_path.read_text()) if state_path.exists() else {}
+        self.cameras = state.get("cameras", [])
+        self.crawls = state.get("crawls", {})     # keyName -> {"cmd", "total", "last", "grown"}
+        self.size = state.get("size", 0)
+        self._numbers = {keyName: i for i, keyName in enumerate(self.cameras)}
+        self.index = RecordIndex()
+        path = self.root / "records.tsv"
+        if path.exists():
+            if path.stat().st_size > self.size:
+                os.truncate(path, self.size)    # the rows of a crawl that was interrupted before state.json
+            loaded = {}
+            with open(path, encoding="utf-8") as file:
+                for line in file:
+                    camera, start, end, record_type, record_path = line.rstrip("\n").split("\t", 4)
+                    loaded.setdefault(int(camera), []).append((int(start), int(end), int(record_type), record_path))
+            for camera, records in loaded.items():
+                self.index.add(camera, sorted(records))
+
+    def number(self, keyName: str):
+        number = self._numbers.get(keyName)
+        if number is None:
+            number = self._numbers[keyName] = len(self.cameras)
+            self.cameras.append(keyName)
+        return number
+
+    def commit(self, added: dict, replaced: set, crawls: dict):
+        """
+        Adds the recordings {keyName: [records]}, after removing all the recordings of the `replaced` cameras,
+        and updates the crawl states.
+        """
+        for keyName in replaced:
+            self.index.remove(self.number(keyName))
+        for keyName, records in added.items():
+            self.index.add(self.number(keyName), records)
+        path = self.root / "records.tsv"
+        if replaced:
+            temporary = self.root / "records.tmp"
+            with open(temporary, "w", encoding="utf-8") as file:
+                for camera, records in self.index.records.items():
+                    file.writelines(_line(camera, record) for record in records)
+            os.replace(temporary, path)
+        else:
+            with open(path, "a", encoding="utf-8") as file:
+                for keyName, records in added.items():
+                    file.writelines(_line(self.number(keyName), record) for record in records)
+        self.size = path.stat().st_size if path.exists() else 0
+        self.crawls.update(crawls)
+        temporary = self.root / "state.tmp"
+        temporary.write_text(json.dumps({"cameras": self.cameras, "size": self.size, "crawls": self.crawls}))
+        os.replace(temporary, self.root / "state.json")
+
+    def cameras_between(self, start: int, end: int):
+        return sorted(self.cameras[number] for number in self.index.cameras_between(start, end))
+
+    def between(self, keyName: str, start: int, end: int):
+        number = self._numbers.get(keyName)
+        return [] if number is None else self.index.between(number, start, end)
+
+
+def _line(camera: int, record):
+    start, end, record_type, path = record
+    return f"{camera}\t{start}\t{end}\t{record_type}\t{path.replace(chr(9), ' ').replace(chr(10), ' ')}\n"
+
+
+class RecordingCrawler:
+    def __init__(self, client, store: RecordingStore, per_camera: int = 4, max_concurrent: int = 256,
+                 reload_after: float = 3600.0, record_path: int = 0, record_type: int = 0):
+        self.client = client
+        self.store = store
+        self.per_camera = per_camera        # the concurrent requests per camera
+        self.slots = asyncio.Semaphore(max_concurrent)
+        self.reload_after = reload_after
+        self.record_path = record_path
+        self.record_type = record_type
+        self.stats = {"cameras": 0, "failed": 0, "requests": 0, "recordings": 0, "reloads": 0, "recrawled": 0}
+
+    async def _request(self, camera, cmd: str, camera_slots, **params):
+        async with camera_slots, self.slots:
+            self.stats["requests"] += 1
+            return await self.client.camera(camera).command(cmd, **params)
+
+    async def _page(self, camera, cmd: str, start_no: int, camera_slots):
+        """
+        (totalCnt, [recordings]) from start_no, or raises CameraError.
+        """
+        result = await self._request(camera, cmd, camera_slots, recordPath=self.record_path, startTime=0,
+                                     endTime=2 ** 31 - 1, recordType=self.record_type, startNo=start_no)
+        result.raise_for_result()
+        records, i = [], 0
+        while f"record{i}" in result.values:
+            records.append(str(result.values[f"record{i}"]))
+            i += 1
+        return result.get("totalCnt", 0), records
+
+    async def _reload(self, camera, camera_slots):
+        self.stats["reloads"] += 1
+        (await self._request(camera, "reloadRecordindex", camera_slots)).raise_for_result()
+
+    async def crawl_camera(self, camera):
+        """
+        Returns ([new recordings as text], whether the known recordings are replaced, the new crawl state).
+        """
+        state = self.store.crawls.get(camera.keyName) or {"cmd": "getRecordList", "total": 0, "last": None,
+                                                           "grown": time.time()}
+        cmd = state["cmd"]
+        camera_slots = asyncio.Semaphore(self.per_camera)
+        start_no = max(0, state["total"] - 1)   # the newest known recording, to check that the listing continues
+        try:
+            total, first = await self._page(camera, cmd, start_no, camera_slots)
+        except CameraError:
+            if cmd != "getRecordList" or state["last"] is not None:
+                raise
+            cmd = "getRecordList2"
+            total, first = await self._page(camera, cmd, start_no, camera_slots)
+        replaced = False
+        if state["last"] is not None and (not first or first[0] != state["last"]):
+            await self._reload(camera, camera_slots)
+            self.stats["recrawled"] += 1
+            replaced, start_no = True, 0
+            total, first = await self._page(camera, cmd, start_no, camera_slots)
+        elif total <= state["total"] and time.time() - state["grown"] > self.reload_after:
+            await self._reload(camera, camera_slots)
+            state = {**state, "grown": time.time()}     # do not reload again before reload_after
+            total, first = await self._page(camera, cmd, start_no, camera_slots)
+        pages = await asyncio.gather(*(self._page(camera, cmd, number, camera_slots)
+                                       for number in range(start_no + len(first), total, page_size)))
+        records = first + [record for _, page in pages for record in page]
+        if state["last"] is not None and not replaced:
+            records = records[1:]       # the newest known recording
+        grown = time.time() if records else state["grown"]
+        last = records[-1] if records else None if replaced else state["last"]
+        return records, replaced, {"cmd": cmd, "total": total, "last": last, "grown": grown}
+
+    async def crawl(self, cameras):
+        """
+        Crawls the cameras and commits the new recordings to the store. Returns {keyName: error} of the cameras
+        that failed.
+        """
+        added, replaced, crawls, errors = {}, set(), {}, {}
+
+        async def one(camera):
+            try:
+                records, replace, crawls[camera.keyName] = await self.crawl_camera(camera)
+            except CameraError as e:
+                errors[camera.keyName] = str(e)
+                self.stats["failed"] += 1
+                return
+            self.stats["cameras"] += 1
+            if replace:
+                replaced.add(camera.keyName)
+            parsed = [record for record in map(parse_record, records) if record is not None]
+            if parsed:
+                added[camera.keyName] = parsed
+                self.stats["recordings"] += len(parsed)
+
+        await asyncio.gather(*(one(camera) for camera in cameras))
+        self.store.commit(added, replaced, crawls)
+        return errors
+
+
+def parse_time(text):
+    return int(text) if text.isdigit() else int(datetime.fromisoformat(text).timestamp())
+
+
+async def crawl(args, store):
+    cameras = list(load_cameras(args.settings).values())
+    started = time.monotonic()
+    async with FoscamClient(max_connections=1, pipeline_depth=args.per_camera, timeout=args.timeout, retries=1) as client:
+        crawler = RecordingCrawler(client, store, args.per_camera, args.max_concurrent, args.reload_after,
+                                   args.record_path, args.record_type)
+        errors = await crawler.crawl(cameras)
+    for keyName, error in errors.items():
+        print(f"{keyName}: {error}")
+    stats = crawler.stats
+    print(f"{stats['cameras']} cameras crawled, {stats['failed']} failed, {stats['recordings']} new recordings, "
+          f"{stats['requests']} requests, {stats['reloads']} index reloads, {stats['recrawled']} cameras read again, "
+          f"{time.monotonic() - started:.1f} s")
+    return 1 if errors else 0
+
+
+def main(args):
+    if args.action == "crawl":
+        if not args.settings:
+            raise SystemExit("crawl needs the cameras from --settings")
+        return asyncio.run(crawl(args, RecordingStore(args.store)))
+    if not args.start:
+        raise SystemExit("query needs --start")
+    store = RecordingStore(args.store)
+    start = parse_time(args.start)
+    end = parse_time(args.end) if args.end else start
+    started = time.perf_counter()
+    cameras = store.cameras_between(start, end)
+    elapsed = time.perf_counter() - started
+    for keyName in cameras:
+        print(keyName)
+        if args.list:
+            for record_start, record_end, record_type, path in store.between(keyName, start, end):
+                print(f"    {datetime.fromtimestamp(record_start).isoformat(' ')} - "
+                      f"{datetime.fromtimestamp(record_end).time().isoformat()}  type {record_type}  {path}")
+    print(f"{len(cameras)} of {len(store.cameras)} cameras recorded, {elapsed * 1000:.3f} ms", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Index the SD card recordings of the cameras, and find the cameras that recorded at a time.")
+    parser.add_argument("action", choices=("crawl", "query"))
+    parser.add_argument("--store", required=True, help="the recording index directory")
+    parser.add_argument("--settings", help="crawl: a settings file exported from the index.html")
+    parser.add_argument("--per-camera", type=int, default=4, help="crawl: the concurrent requests per camera (default: 4)")
+    parser.add_argument("--max-concurrent", type=int, default=256, help="crawl: the maximum concurrent requests in total (default: 256)")
+    parser.add_argument("--reload-after", type=float, default=3600.0, help="crawl: seconds without new recordings before reloadRecordindex (default: 3600)")
+    parser.add_argument("--record-path", type=int, default=0, help="crawl: the recordPath of getRecordList (default: 0, the SD card)")
+    parser.add_argument("--record-type", type=int, default=0, help="crawl: the recordType of getRecordList (default: 0)")
+    parser.add_argument("--timeout", type=float, default=10.0, help="seconds to wait for a response (default: 10)")
+    parser.add_argument("--start", help="query: from this time (ISO format or Unix time)")
+    parser.add_argument("--end", help="query: until this time (default: --start)")
+    parser.add_argument("--list", action="store_true", help="query: also list the recordings of each camera")
+    raise SystemExit(main(parser.parse_args()))
@@ -0,0 +1,237 @@
+"""
+A camera registry in SQLite for the tools, with the same content as the settings exported from the index.html
+(Add/Remove camera -> Export data), but with the cameras as rows: a camera is found by its name, site, tag, model
+or Viewer membership without reading all of them, and changing a camera writes only its row.
+
+    python3 -m foscam_cgi.registry import FoscamApiExportedSettings.json --db cameras.db
+    python3 -m foscam_cgi.registry find --db cameras.db --site warehouse --tag outdoor
+    python3 -m foscam_cgi.registry set --db cameras.db "192.168.1.23:88 (admin) Gate" --site warehouse --tags outdoor,gate
+    python3 -m foscam_cgi.registry export --db cameras.db FoscamApiExportedSettings.json
+
+The other tools read the cameras from the registry with `--settings cameras.db` (see cameras.load_cameras()).
+The export is the imported document: the camera records (also the fields the registry does not know) and their
+order, and the other globals are kept as they were.
+"""
+
+import argparse
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+from .cameras import Camera, settings_document
+
+schema = """
+CREATE TABLE IF NOT EXISTS cameras (
+    keyName TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    cameraName TEXT,
+    site TEXT,
+    model TEXT,
+    viewer TEXT,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS cameras_position ON cameras (position);
+CREATE INDEX IF NOT EXISTS cameras_cameraName ON cameras (cameraName);
+CREATE INDEX IF NOT EXISTS cameras_site ON cameras (site);
+CREATE INDEX IF NOT EXISTS cameras_model ON cameras (model);
+CREATE INDEX IF NOT EXISTS cameras_viewer ON cameras (viewer);
+CREATE TABLE IF NOT EXISTS tags (
+    tag TEXT NOT NULL,
+    keyName TEXT NOT NULL REFERENCES cameras (keyName) ON DELETE CASCADE,
+    PRIMARY KEY (tag, keyName)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS tags_keyName ON tags (keyName);
+CREATE TABLE IF NOT EXISTS settings (
+    name TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# The lookups of find(): argument -> column of the cameras table
+indexed_columns = {"cameraName": "cameraName", "site": "site", "model": "model", "viewer": "viewer"}
+
+
+def _dumps(value):
+    # Like JSON.stringify() of the index.html, so that an unchanged document is exported byte for byte the same.
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _row(record: dict):
+    return (record.get("cameraName"), record.get("site") or None, record.get("model") or None,
+            record.get("ViewerSetupOptions"), _dumps(record))
+
+
+class CameraRegistry:
+    """
+    The cameras of a settings document in an SQLite database at `path`. The records are the entries of
+    `globals.setup.cameras` as dicts; Camera objects are returned by cameras().
+    """
+    def __init__(self, path):
+        self.path = Path(path)
+        self.db = sqlite3.connect(self.path)
+        self.db.execute("PRAGMA foreign_keys = ON")
+        self.db.execute("PRAGMA journal_mode = WAL")
+        self.db.executescript(schema)
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self.db.execute("SELECT count(*) FROM cameras").fetchone()[0]
+
+    def import_settings(self, document: dict):
+        """
+        Replaces the registry with an exported settings document.
+        """
+        document = dict(document)
+        cameras = document.pop("setup", {}).get("cameras", {})
+        with self.db:
+            self.db.execute("DELETE FROM cameras")
+            self.db.execute("DELETE FROM settings")
+            self.db.execute("INSERT INTO settings VALUES ('globals', ?)",
+                            (_dumps({"setup": {"cameras": {}}, **document}),))
+            self.db.executemany("INSERT INTO cameras VALUES (?, ?, ?, ?, ?, ?, ?)",
+                                ((keyName, position) + _row(record)
+                                 for position, (keyName, record) in enumerate(cameras.items())))
+            self.db.executemany("INSERT OR IGNORE INTO tags VALUES (?, ?)",
+                                ((tag, keyName) for keyName, record in cameras.items()
+                                 for tag in record.get("tags") or ()))
+
+    def export_settings(self):
+        """
+        The settings document that the index.html can import, as it was imported with the changes since.
+        """
+        row = self.db.execute("SELECT value FROM settings WHERE name = 'globals'").fetchone()
+        document = json.loads(row[0]) if row else settings_document([])
+        document["setup"]["cameras"] = self.records()
+        if document.get("selectedCamera") not in document["setup"]["cameras"]:
+            document["selectedCamera"] = None     # deleted; the index.html selects the first camera
+        return document
+
+    def records(self, keyNames=None):
+        """
+        The records of all the cameras, or of the given keyNames, as a dict in the order of the cameras.
+        """
+        if keyNames is None:
+            rows = self.db.execute("SELECT position, keyName, record FROM cameras ORDER BY position").fetchall()
+        else:
+            keyNames, rows = list(keyNames), []
+            for i in range(0, len(keyNames), 500):
+                chunk = keyNames[i:i + 500]
+                rows += self.db.execute("SELECT position, keyName, record FROM cameras WHERE keyName IN "
+                                        f"({', '.join('?' * len(chunk))})", chunk).fetchall()
+            rows.sort()
+        return {keyName: json.loads(record) for position, keyName, record in rows}
+
+    def cameras(self, keyNames=None):
+        """
+        A dict of keyName -> Camera, like cameras.load_cameras().
+        """
+        return {keyName: Camera.from_settings(record) for keyName, record in self.records(keyNames).items()}
+
+    def find(self, cameraName=None, site=None, tag=None, model=None, viewer=None):
+        """
+        The keyNames of the cameras that match all the given values, in the order of the cameras. `viewer` is
+        True for the cameras in the Viewer, False for the others.
+        """
+        values = {"cameraName": cameraName, "site": site, "model": model,
+                  "viewer": None if viewer is None else "1" if viewer else "0"}
+        conditions = [f"{indexed_columns[name]} = ?" for name, value in values.items() if value is not None]
+        parameters = [value for value in values.values() if value is not None]
+        if tag is not None:
+            conditions.append("keyName IN (SELECT keyName FROM tags WHERE tag = ?)")
+            parameters.append(tag)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        return [row[0] for row in self.db.execute(f"SELECT keyName FROM cameras {where} ORDER BY position", parameters)]
+
+    def put(self, camera):
+        """
+        Adds or replaces a camera (a Camera or a record dict). The fields of an existing record that a Camera
+        does not have (e.g. the motion detection table states of the index.html) are kept.
+        """
+        if isinstance(camera, Camera):
+            existing = self.records([camera.keyName]).get(camera.keyName, {})
+            new = camera.to_settings()
+            record = {**new, **existing, **{field: new[field] for field in
+                                            ("ip", "port", "user", "password", "cameraName", "isOldSdCamera",
+                                             "keyName", "site", "tags", "model")}}
+        else:
+            record = camera
+        keyName = record["keyName"]
+        with self.db:
+            row = self.db.execute("SELECT position FROM cameras WHERE keyName = ?", (keyName,)).fetchone()
+            if row is None:
+                position = self.db.execute("SELECT coalesce(max(position) + 1, 0) FROM cameras").fetchone()[0]
+                self.db.execute("INSERT INTO cameras VALUES (?, ?, ?, ?, ?, ?, ?)", (keyName, position) + _row(record))
+            else:
+                self.db.execute("UPDATE cameras SET cameraName = ?, site = ?, model = ?, viewer = ?, record = ? "
+                                "WHERE keyName = ?", _row(record) + (keyName,))
+                self.db.execute("DELETE FROM tags WHERE keyName = ?", (keyName,))
+            self.db.executemany("INSERT OR IGNORE INTO tags VALUES (?, ?)",
+                                ((tag, keyName) for tag in record.get("tags") or ()))
+
+    def update(self, keyName: str, **changes):
+        """
+        Changes fields of the record of a camera, e.g. update(keyName, site="warehouse", ViewerSetupOptions="1").
+        """
+        record = self.records([keyName]).get(keyName)
+        if record is None:
+            raise KeyError(keyName)
+        record.update(changes)
+        self.put(record)
+        return record
+
+    def delete(self, keyName: str):
+        with self.db:
+            self.db.execute("DELETE FROM cameras WHERE keyName = ?", (keyName,))
+
+
+def main(args):
+    with CameraRegistry(args.db) as registry:
+        if args.action == "import":
+            registry.import_settings(json.loads(Path(args.file).read_text()))
+            print(f"{len(registry)} cameras imported to {args.db}")
+        elif args.action == "export":
+            text = _dumps(registry.export_settings())
+            if args.file:
+                Path(args.file).write_text(text)
+            else:
+                print(text)
+        elif args.action == "find":
+            viewer = {"yes": True, "no": False}.get(args.viewer)
+            for keyName in registry.find(args.name, args.site, args.tag, args.model, viewer):
+                print(keyName)
+        elif args.action == "set":
+            changes = {"site": args.site, "model": args.model, "cameraName": args.name,
+                       "tags": [tag.strip() for tag in args.tags.split(",") if tag.strip()] if args.tags is not None else None,
+                       "ViewerSetupOptions": {"yes": "1", "no": "0"}.get(args.viewer)}
+            try:
+                registry.update(args.file, **{field: value for field, value in changes.items() if value is not None})
+            except KeyError:
+                print(f"No camera {args.file!r} in {args.db}", file=sys.stderr)
+                return 1
+    return 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="A camera registry in SQLite, imported from and exported to the settings file of the index.html.")
+    parser.add_argument("action", choices=("import", "export", "find", "set"))
+    parser.add_argument("file", nargs="?", help="import/export: the settings file (export: default stdout); set: the keyName of the camera")
+    parser.add_argument("--db", required=True, help="the registry database file (.db)")
+    parser.add_argument("--name", help="find/set: the cameraName")
+    parser.add_argument("--site", help="find/set: the site")
+    parser.add_argument("--tag", help="find: a tag")
+    parser.add_argument("--tags", help="set: the tags, separated by commas")
+    parser.add_argument("--model", help="find/set: the model")
+    parser.add_argument("--viewer", choices=("yes", "no"), help="find/set: in the Viewer or not")
+    args = parser.parse_intermixed_args()
+    if args.action in ("import", "set") and not args.file:
+        parser.error(f"{args.action} needs the {'settings file' if args.action == 'import' else 'keyName'}")
+    raise SystemExit(main(args))
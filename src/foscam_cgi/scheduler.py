@@ -0,0 +1,202 @@
+"""
+Polls the snapshots of many cameras adaptively: a camera whose picture changes is polled more often, and a
+camera with a static scene (e.g. an empty yard at night) less often, so that the cached snapshots stay fresh where
+something happens while the bandwidth to the quiet cameras drops.
+
+The change score of a camera is the fraction of pixels that differ between the two latest snapshots, compared
+as small grayscale thumbnails. This requires NumPy and Pillow (pip install numpy pillow); without them every
+camera is polled at its base interval. One heap of due times schedules all the cameras from one event loop.
+"""
+
+import asyncio
+import heapq
+import io
+import itertools
+import time
+
+try:
+    import numpy as np
+    from PIL import Image
+except ImportError:
+    np = Image = None
+
+from .client import CameraError
+
+thumbnail_size = (64, 36)   # the snapshots are compared at this size
+pixel_threshold = 16        # a thumbnail pixel has changed if its gray level differs more than this (0-255)
+
+
+def change_thumbnail(data: bytes):
+    """
+    Decodes a JPEG snapshot into a small grayscale array for change_score().
+    """
+    image = Image.open(io.BytesIO(data))
+    image.draft("L", (thumbnail_size[0] * 2, thumbnail_size[1] * 2))   # let the JPEG decoder skip the details
+    return np.asarray(image.convert("L").resize(thumbnail_size), dtype=np.int16)
+
+
+def change_score(previous, current):
+    """
+    The fraction (0-1) of the thumbnail pixels that have changed. Small changes (noise, compression) are ignored.
+    """
+    if previous.shape != current.shape:
+        return 1.0
+    return float(np.count_nonzero(np.abs(current - previous) > pixel_threshold)) / current.size
+
+
+class PollState:
+    """
+    The polling state of one camera.
+    """
+    def __init__(self, camera, interval: float, min_interval: float, max_interval: float):
+        self.camera = camera
+        self.interval = interval
+        self.min_interval = min_interval    # the per-camera budget: never poll more often than this
+        self.max_interval = max_interval
+        self.thumbnail = None
+        self.etag = None
+        self.score = None
+        self.polls = 0
+        self.errors = 0
+        self.removed = False
+
+    def as_dict(self):
+        return {"interval": round(self.interval, 3), "score": self.score, "polls": self.polls, "errors": self.errors}
+
+
+class AdaptivePoller:
+    """
+    Keeps the snapshots of the added cameras in the SnapshotCache. The interval of a camera is halved when its
+    score is above `active_score` and grows by `calm_factor` when it is below `calm_score`, within
+    [min_interval, max_interval]. At most `max_rate` snapshots per second and `max_concurrent` at once are
+    requested in total; when that global budget is exhausted, the polls are delayed in the order they are due.
+    """
+    def __init__(self, snapshots, min_interval: float = 1.0, max_interval: float = 30.0, base_interval: float = 5.0,
+                 max_rate: float = 20.0, max_concurrent: int = 16, active_score: float = 0.01, calm_score: float = 0.002,
+                 calm_factor: float = 1.5):
+        self.snapshots = snapshots
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.base_interval = base_interval
+        self.max_rate = max_rate
+        self.active_score = active_score
+        self.calm_score = calm_score
+        self.calm_factor = calm_factor
+        self.states = {}                # keyName -> PollState
+        self._heap = []                 # (due time, sequence number, PollState)
+        self._sequence = itertools.count()
+        self._slots = asyncio.Semaphore(max_concurrent)
+        self._next_slot = 0.0           # the earliest time the global rate allows the next request
+        self._wakeup = asyncio.Event()
+        self.stats = {"polls": 0, "unchanged": 0, "errors": 0}
+
+    @property
+    def adaptive(self):
+        return np is not None
+
+    def add(self, camera, interval: float = None, min_interval: float = None, max_interval: float = None):
+        """
+        Starts polling the camera. The optional intervals override the defaults for this camera.
+        """
+        self.remove(camera)
+        min_interval = self.min_interval if min_interval is None else min_interval
+        max_interval = self.max_interval if max_interval is None else max_interval
+        interval = min(max(self.base_interval if interval is None else interval, min_interval), max_interval)
+        state = self.states[camera.keyName] = PollState(camera, interval, min_interval, max_interval)
+        self._push(state, time.monotonic())
+        self._wakeup.set()
+        return state
+
+    def remove(self, camera):
+        state = self.states.pop(camera.keyName, None)
+        if state is not None:
+            state.removed = True    # lazily dropped when it comes up in the heap
+
+    def _push(self, state, due: float):
+        heapq.heappush(self._heap, (due, next(self._sequence), state))
+
+    def _adapt(self, state, score):
+        if score is None:
+            return
+        if score > self.active_score:
+            state.interval = max(state.min_interval, state.interval / 2)
+        elif score < self.calm_score:
+            state.interval = min(state.max_interval, state.interval * self.calm_factor)
+
+    def _score(self, state, frame):
+        if frame.etag == state.etag:
+            self.stats["unchanged"] += 1
+            return 0.0
+        state.etag = frame.etag
+        try:
+            thumbnail = change_thumbnail(frame.data)
+        except OSError:     # not a valid image
+            return None
+        score = None if state.thumbnail is None else change_score(state.thumbnail, thumbnail)  # None: the first frame
+        state.thumbnail = thumbnail
+        return score
+
+    async def _poll(self, state):
+        try:
+            # A frame that a viewer fetched meanwhile is fresh enough; the cache also coalesces with viewers.
+            frame = await self.snapshots.get(state.camera, state.min_interval / 2)
+        except CameraError:
+            state.errors += 1
+            self.stats["errors"] += 1
+            state.interval = min(state.max_interval, state.interval * 2)
+        else:
+            state.polls += 1
+            self.stats["polls"] += 1
+            if self.adaptive:
+                state.score = await asyncio.get_running_loop().run_in_executor(None, self._score, state, frame)
+                self._adapt(state, state.score)
+        finally:
+            self._slots.release()
+        if not state.removed:
+            self._push(state, time.monotonic() + state.interval)
+            self._wakeup.set()
+
+    async def run(self):
+        """
+        Polls until cancelled.
+        """
+        tasks = set()
+        try:
+            while True:
+                if not self._heap:
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                    continue
+                due, _, state = self._heap[0]
+                now = time.monotonic()
+                if due > now:
+                    self._wakeup.clear()
+                    try:    # a camera may be added, or a poll may finish, with an earlier due time
+                        await asyncio.wait_for(self._wakeup.wait(), due - now)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                heapq.heappop(self._heap)
+                if state.removed:
+                    continue
+                if self._next_slot > now:
+                    await asyncio.sleep(self._next_slot - now)
+                self._next_slot = max(now, self._next_slot) + 1 / self.max_rate
+                await self._slots.acquire()
+                task = asyncio.ensure_future(self._poll(state))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def status(self):
+        """
+        The stats and the current interval and score of each camera, as a JSON-serializable dict.
+        """
+        return {
+            "adaptive": self.adaptive,
+            "stats": self.stats,
+            "requestsPerSecond": round(sum(1 / s.interval for s in self.states.values()), 3),
+            "cameras": {keyName: state.as_dict() for keyName, state in self.states.items()},
+        }
@@ -0,0 +1,152 @@
+"""
+A minimal asyncio HTTP/1.1 server for the local services (proxy, snapshots, event streams). Requests on one
+connection are handled in order, so pipelined requests get their responses in the right order.
+"""
+
+import asyncio
+import json
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+reasons = {200: "OK", 204: "No Content", 304: "Not Modified", 400: "Bad Request", 403: "Forbidden", 404: "Not Found",
+           405: "Method Not Allowed", 500: "Internal Server Error", 502: "Bad Gateway", 503: "Service Unavailable",
+           504: "Gateway Timeout"}
+
+# Added to the responses to the origins given to serve(), so that a page loaded from there can read the responses.
+# Pages of other origins are refused: the services drive the cameras with the stored credentials.
+cors_headers = {
+    "Access-Control-Allow-Methods": "GET, OPTIONS",
+    "Access-Control-Allow-Headers": "*",
+}
+
+
+class Request:
+    def __init__(self, method: str, target: str, headers: dict, peer):
+        self.method = method
+        self.target = target
+        self.headers = headers  # lowercase header names
+        self.peer = peer        # (ip, port) of the client
+        url = urlsplit(target)
+        self.path = url.path
+        self.segments = [unquote(s) for s in url.path.split("/") if s]
+        self.query_list = parse_qsl(url.query, keep_blank_values=True)    # for repeated parameters
+        self.query = dict(self.query_list)
+        self.keep_alive = headers.get("connection", "").lower() != "close"
+
+    @property
+    def cross_origin(self):
+        """
+        The origin of the page that sent the request if it is not this server, or None. Browsers send no Origin
+        for images and links, but Sec-Fetch-Site tells that those come from another site (then the origin of
+        the Referer, or "null"). Requests that are not sent by a page (curl, the address bar) have neither.
+        """
+        origin = self.headers.get("origin")
+        if not origin and self.headers.get("sec-fetch-site") in ("cross-site", "same-site"):
+            referer = urlsplit(self.headers.get("referer", ""))
+            origin = f"{referer.scheme}://{referer.netloc}" if referer.netloc else "null"
+        if origin is None or origin == f"http://{self.headers.get('host', '')}":
+            return None
+        return origin
+
+
+class Response:
+    def __init__(self, status: int = 200, body: bytes = b"", content_type: str = "text/plain; charset=utf-8", headers=None):
+        self.status = status
+        self.body = body
+        self.headers = {"Content-Type": content_type, **(headers or {})}
+
+    @classmethod
+    def json(cls, data, status: int = 200, headers=None):
+        return cls(status, json.dumps(data).encode(), "application/json", headers)
+
+    @classmethod
+    def error(cls, status: int, message: str):
+        return cls.json({"error": message}, status)
+
+    def head_bytes(self, keep_alive: bool = True, content_length=True):
+        lines = [f"HTTP/1.1 {self.status} {reasons.get(self.status, 'Unknown')}"]
+        headers = dict(self.headers)
+        if content_length:
+            headers["Content-Length"] = str(len(self.body))
+        headers["Connection"] = "keep-alive" if keep_alive else "close"
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+
+class StreamingResponse(Response):
+    """
+    A response whose body is written by `stream(writer)` until the client disconnects (e.g. server-sent events or
+    an MJPEG stream). The connection is closed afterwards.
+    """
+    def __init__(self, stream, content_type: str, headers=None):
+        super().__init__(200, b"", content_type, {"Cache-Control": "no-cache", **(headers or {})})
+        self.stream = stream
+
+
+async def read_request(reader: asyncio.StreamReader, peer):
+    """
+    Reads the request line and the headers. Request bodies are not supported (only GET and friends are used).
+    Returns None if the client closed the connection.
+    """
+    request_line = await reader.readline()
+    if not request_line:
+        return None
+    parts = request_line.decode("latin-1").split()
+    if len(parts) != 3:
+        raise ValueError(f"Invalid request line: {request_line!r}")
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    if int(headers.get("content-length", 0) or 0) > 0:
+        await reader.readexactly(int(headers["content-length"]))
+    return Request(parts[0], parts[1], headers, peer)
+
+
+async def serve(handler, host: str = "127.0.0.1", port: int = 8000, idle_timeout: float = 60.0, allow_origins=()):
+    """
+    Starts the server. `handler(request)` is a coroutine returning a Response. Returns the asyncio.Server.
+    Requests from pages of other origins than `allow_origins` (e.g. "http://dashboard.local:3000") are refused.
+    """
+    async def connection(reader, writer):
+        peer = writer.get_extra_info("peername")
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(read_request(reader, peer), idle_timeout)
+                except (asyncio.TimeoutError, ValueError, ConnectionError):
+                    break
+                if request is None:
+                    break
+                origin = request.cross_origin
+                if origin is not None and origin not in allow_origins:
+                    response = Response.error(403, f"Requests from {origin} are not allowed, see --allow-origin")
+                else:
+                    if request.method == "OPTIONS":
+                        response = Response(204)
+                    else:
+                        try:
+                            response = await handler(request)
+                        except Exception as e:
+                            response = Response.error(500, f"{type(e).__name__}: {e}")
+                    if origin is not None:
+                        response.headers.update({"Access-Control-Allow-Origin": origin, "Vary": "Origin", **cors_headers})
+                if isinstance(response, StreamingResponse):
+                    writer.write(response.head_bytes(keep_alive=False, content_length=False))
+                    try:
+                        await response.stream(writer)
+                    except ConnectionError:
+                        pass
+                    break
+                writer.write(response.head_bytes(request.keep_alive) + (b"" if request.method == "HEAD" else response.body))
+                await writer.drain()
+                if not request.keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(connection, host, port)
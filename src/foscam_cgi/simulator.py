@@ -0,0 +1,365 @@
+"""
+Simulates any number of cameras for testing the tools without camera hardware. Every command of commandJson is
+answered with a <CGI_Result>: a set* command stores its parameters and the matching get* command returns them,
+snapPicture2 returns a JPEG, GetMJStream streams JPEGs (15 per second), getLog pages through a log of random logins (--log-rate entries per second, in
+a 1000 entry ring buffer like the cameras), getRecordList pages through random recordings on the SD card (their
+index is synchronized every 10 minutes, or by reloadRecordindex), and commands without a state (e.g. ptzMoveUp)
+just succeed.
+
+    python3 -m foscam_cgi.simulator --cameras 5000 --export simulated.json
+    python3 -m foscam_cgi.proxy --settings simulated.json --poll
+
+By default all the cameras share one port and are told apart by the user name (usr=cam0001 etc., the password is
+"simulated"). With --distinct-ports each camera listens on its own port instead (--port, --port + 1, ...).
+The latency, the errors and the connection limit of the small HTTP servers of real cameras can be simulated with
+--latency, --jitter, --error-rate and --max-connections.
+"""
+
+import argparse
+import asyncio
+import base64
+import io
+import itertools
+import json
+import random
+import time
+from collections import deque
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+try:
+    from PIL import Image, ImageDraw
+except ImportError:
+    Image = None
+
+from .cameras import Camera, settings_document
+from .commands import commandJson
+from .reconcile import get_command_for
+from .server import Response, StreamingResponse, read_request
+
+# A 16x9 gray JPEG, used (padded to the snapshot size) when Pillow is not installed.
+gray_jpeg = base64.b64decode(
+    "/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABALDA4MChAODQ4SERATGCgaGBYWGDEjJR0oOjM9PDkzODdASFxOQERXRTc4UG1RV19iZ2hnPk1x"
+    "eXBkeFxlZ2P/wAALCAAJABABAREA/8QAFQABAQAAAAAAAAAAAAAAAAAAAAX/xAAUEAEAAAAAAAAAAAAAAAAAAAAA/9oACAEBAAA/AJgD/9k=")
+
+# Values of get* commands that have no set* command, as a camera would return them:
+static_values = {
+    "getDevInfo": {"productName": "FI9821W V2", "serialNo": "0000000000000000", "devName": "", "mac": "",
+                   "year": 0, "mon": 0, "day": 0, "hour": 0, "min": 0, "sec": 0, "timeZone": 0,
+                   "firmwareVer": "2.11.1.120", "hardwareVer": "1.5.2.20"},
+    "getDevState": {"IOAlarm": 0, "motionDetectAlarm": 1, "soundAlarm": 1, "record": 0, "sdState": 0,
+                    "sdFreeSpace": "0k", "sdTotalSpace": "0k", "ntpState": 1, "ddnsState": 0, "url": "",
+                    "upnpState": 0, "isWifiConnected": 0, "wifiConnectedAP": "", "infraLedState": 0},
+}
+log_size = 1000         # the entries kept by getLog
+log_page_size = 10      # the entries returned by one getLog
+record_types = ("schedule", "alarm", "manual")
+record_index_interval = 600     # seconds between the automatic synchronizations of the recording index
+stream_fps = 15                 # the frame rate of GetMJStream
+
+
+def initial_values():
+    """
+    The default values of the get* commands: the example parameters of the matching set* commands.
+    """
+    values = {cmd: dict(fields) for cmd, fields in static_values.items()}
+    for cmd, command in commandJson.items():
+        get_cmd = get_command_for(cmd) if cmd.startswith("set") else None
+        if get_cmd and command["ExampleParams"]:
+            values.setdefault(get_cmd, {}).update(command["ExampleParams"])
+    return values
+
+
+def cgi_result(result: int, values=None):
+    lines = ["<CGI_Result>", f"    <result>{result}</result>"]
+    lines.extend(f"    <{name}>{escape(str(value))}</{name}>" for name, value in (values or {}).items())
+    lines.append("</CGI_Result>")
+    return "\n".join(lines).encode()
+
+
+def padded_jpeg(size: int):
+    """
+    The gray JPEG padded with comment segments to about `size` bytes, to simulate the transfer of a real snapshot.
+    """
+    padding, remaining = [], max(0, size - len(gray_jpeg))
+    while remaining > 4:
+        length = min(remaining - 2, 65535)
+        padding.append(b"\xff\xfe" + length.to_bytes(2, "big") + b"\0" * (length - 2))
+        remaining -= length + 2
+    return gray_jpeg[:2] + b"".join(padding) + gray_jpeg[2:]
+
+
+def render_frames(width: int, height: int, count: int = 16):
+    """
+    Snapshots of a box moving over a gradient, so that consecutive snapshots differ like a scene with motion.
+    """
+    if Image is None:
+        return [padded_jpeg(width * height // 10)]
+    frames = []
+    gradient = Image.linear_gradient("L").resize((width, height)).convert("RGB")
+    for i in range(count):
+        image = gradient.copy()
+        box = width // 8
+        x = (width - box) * i // max(1, count - 1)
+        ImageDraw.Draw(image).rectangle((x, height // 2 - box // 2, x + box, height // 2 + box // 2), fill=(200, 60, 40))
+        output = io.BytesIO()
+        image.save(output, "JPEG", quality=70)
+        frames.append(output.getvalue())
+    return frames
+
+
+class VirtualCamera:
+    """
+    The state of one simulated camera. Only the values changed by set* commands are stored per camera.
+    """
+    def __init__(self, index: int, user: str, password: str, port: int):
+        self.index = index
+        self.user = user
+        self.password = password
+        self.port = port
+        self.changed = {}           # get_cmd -> {param: value} set by set* commands
+        self.connections = 0
+        self.requests = 0
+        self.log = deque(maxlen=log_size)
+        self.log_next = None        # the time of the next log entry
+        self.records = []           # (start, end, type) of the recordings, oldest first
+        self.record_next = None     # the start of the next recording
+        self.indexed = 0            # the recordings in the index that getRecordList reads
+        self.indexed_time = 0
+
+    def values(self, defaults: dict, get_cmd: str):
+        return {**defaults.get(get_cmd, {}), **self.changed.get(get_cmd, {})}
+
+
+class Simulator:
+    def __init__(self, count: int = 10, host: str = "127.0.0.1", port: int = 8888, distinct_ports: bool = False,
+                 latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0, max_connections: int = 4,
+                 alarm_rate: float = 0.0, snapshot_size=(1280, 720), seed=None, log_rate: float = 0.01,
+                 record_rate: float = 1 / 600):
+        self.host = host
+        self.port = port
+        self.distinct_ports = distinct_ports
+        self.latency = latency              # seconds before each response
+        self.jitter = jitter                # +- seconds of random variation of the latency
+        self.error_rate = error_rate        # the fraction of requests whose connection is dropped without a response
+        self.max_connections = max_connections  # per camera, further connections are closed at once
+        self.alarm_rate = alarm_rate        # the probability that getDevState reports a motion alarm
+        self.log_rate = log_rate            # log entries per second and camera
+        self.record_rate = record_rate      # recordings per second and camera
+        self.random = random.Random(seed)
+        self.defaults = initial_values()
+        self.frames = render_frames(*snapshot_size)
+        self.cameras = [
+            VirtualCamera(i, f"cam{i + 1:04d}", "simulated", port + i if distinct_ports else port)
+            for i in range(count)
+        ]
+        self._by_user = {camera.user: camera for camera in self.cameras}
+        self.stats = {"requests": 0, "dropped": 0, "refused": 0}
+
+    def settings(self):
+        """
+        The cameras as a settings document that the index.html can import and cameras.load_cameras() can read.
+        """
+        return settings_document(Camera(self.host, camera.user, camera.password, f"Simulated {camera.index + 1}", camera.port)
+                                 for camera in self.cameras)
+
+    def respond(self, camera, request):
+        """
+        Returns the Response to a CGI request for the camera (None: the user of a shared port is unknown).
+        """
+        params = dict(request.query)
+        cmd = params.pop("cmd", "")
+        user, password = params.pop("usr", None), params.pop("pwd", None)
+        if camera is None or (user, password) != (camera.user, camera.password):
+            return Response(200, cgi_result(-2), "text/plain")
+        camera.requests += 1
+        if cmd == "snapPicture2":
+            frame = self.frames[(int(time.time()) + camera.index) % len(self.frames)]
+            return Response(200, frame, "image/jpeg")
+        if cmd == "GetMJStream":
+            return StreamingResponse(lambda writer: self._stream(camera, writer),
+                                     "multipart/x-mixed-replace;boundary=ipcamera")
+        if cmd == "getLog":
+            return Response(200, cgi_result(0, self._log_page(camera, params)), "text/plain")
+        if cmd in ("getRecordList", "getRecordList2"):
+            return Response(200, cgi_result(0, self._record_page(camera, params)), "text/plain")
+        if cmd == "reloadRecordindex":
+            self._update_records(camera, reload=True)
+            return Response(200, cgi_result(0), "text/plain")
+        if cmd not in commandJson:
+            return Response(200, cgi_result(-1), "text/plain")
+        if cmd.startswith("set") and get_command_for(cmd):
+            self._set(camera, get_command_for(cmd), params)
+            return Response(200, cgi_result(0), "text/plain")
+        values = camera.values(self.defaults, cmd) if cmd.startswith("get") else None
+        if cmd == "getDevState" and self.random.random() < self.alarm_rate:
+            values["motionDetectAlarm"] = 2
+        return Response(200, cgi_result(0, values), "text/plain")
+
+    async def _stream(self, camera, writer):
+        index = camera.index
+        while True:
+            frame = self.frames[index % len(self.frames)]
+            writer.write(b"--ipcamera\r\nContent-Type: image/jpeg\r\nContent-Length: %d\r\n\r\n" % len(frame))
+            writer.write(frame)
+            writer.write(b"\r\n")
+            await writer.drain()
+            index += 1
+            await asyncio.sleep(1 / stream_fps)
+
+    def _log_page(self, camera, params: dict):
+        """
+        The getLog values of the entries from `offset` (0 is the oldest), generating the entries due since the
+        last request. The first request of a camera generates a day of history.
+        """
+        now = time.time()
+        if camera.log_next is None:
+            camera.log_next = now - 86400
+        while self.log_rate > 0 and camera.log_next <= now:
+            user = self.random.choice(("admin", "admin", "guest", "operator"))
+            ip = f"192.168.1.{self.random.randint(2, 254)}"
+            camera.log.append(f"{int(camera.log_next)}+{user}+{ip}+{self.random.randint(0, 4)}")
+            camera.log_next += self.random.expovariate(self.log_rate)
+        offset = int(params.get("offset", 0) or 0)
+        count = min(int(params.get("count", log_page_size) or 0), log_page_size)
+        entries = list(itertools.islice(camera.log, offset, offset + count)) if offset >= 0 else []
+        values = {"totalCnt": len(camera.log), "curCnt": len(entries)}
+        values.update((f"log{i}", entry) for i, entry in enumerate(entries))
+        return values
+
+    def _update_records(self, camera, reload: bool = False):
+        """
+        Adds the recordings that have ended since the last request (a day of history on the first request), and
+        synchronizes the index if it is due or `reload`.
+        """
+        now = time.time()
+        if camera.record_next is None:
+            camera.record_next = now - 86400
+        while self.record_rate > 0:
+            length = self.random.randint(30, 300)
+            if camera.record_next + length > now:
+                break
+            camera.records.append((int(camera.record_next), int(camera.record_next) + length,
+                                   self.random.randrange(len(record_types))))
+            camera.record_next += length + self.random.expovariate(self.record_rate)
+        if reload or now - camera.indexed_time >= record_index_interval:
+            camera.indexed = len(camera.records)
+            camera.indexed_time = now
+
+    def _record_page(self, camera, params: dict):
+        """
+        The getRecordList values: the indexed recordings from `startTime` to `endTime`, 10 from `startNo`.
+        Each recording is "path,size,startTime,endTime,recordType".
+        """
+        self._update_records(camera)
+        start, end = int(params.get("startTime", 0) or 0), int(params.get("endTime", 2 ** 31 - 1) or 0)
+        records = [record for record in camera.records[:camera.indexed] if record[1] >= start and record[0] <= end]
+        first = int(params.get("startNo", 0) or 0)
+        page = records[first:first + log_page_size] if first >= 0 else []
+        values = {"totalCnt": len(records), "curCnt": len(page)}
+        for i, (record_start, record_end, record_type) in enumerate(page):
+            name = time.strftime("%Y%m%d_%H%M%S", time.localtime(record_start))
+            path = f"/mnt/sd/record/{record_types[record_type]}_{name}.avi"
+            values[f"record{i}"] = f"{path},{(record_end - record_start) * 250000},{record_start},{record_end},{record_type}"
+        return values
+
+    def _set(self, camera, get_cmd: str, params: dict):
+        changed = camera.changed.setdefault(get_cmd, {})
+        for name, value in params.items():
+            changed[name] = int(value) if value.lstrip("-").isdigit() and value == str(int(value)) else value
+
+    async def _connection(self, reader, writer, port_camera=None):
+        peer = writer.get_extra_info("peername")
+        counted = port_camera
+        if counted is not None:
+            if counted.connections >= self.max_connections:
+                self.stats["refused"] += 1
+                writer.close()
+                return
+            counted.connections += 1
+        try:
+            while True:
+                try:
+                    request = await read_request(reader, peer)
+                except (ValueError, ConnectionError, asyncio.IncompleteReadError):
+                    break
+                if request is None:
+                    break
+                camera = port_camera or self._by_user.get(request.query.get("usr"))
+                if counted is None and camera is not None:     # a shared port: count by the user
+                    if camera.connections >= self.max_connections:
+                        self.stats["refused"] += 1
+                        break
+                    counted = camera
+                    counted.connections += 1
+                self.stats["requests"] += 1
+                if self.latency or self.jitter:
+                    await asyncio.sleep(max(0.0, self.latency + self.random.uniform(-self.jitter, self.jitter)))
+                if self.random.random() < self.error_rate:
+                    self.stats["dropped"] += 1
+                    break
+                response = self.respond(camera, request)
+                if isinstance(response, StreamingResponse):
+                    writer.write(response.head_bytes(keep_alive=False, content_length=False))
+                    await response.stream(writer)
+                    break
+                writer.write(response.head_bytes(request.keep_alive) + response.body)
+                await writer.drain()
+                if not request.keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            if counted is not None:
+                counted.connections -= 1
+            writer.close()
+
+    async def start(self):
+        """
+        Starts listening. Returns the asyncio.Servers.
+        """
+        if not self.distinct_ports:
+            return [await asyncio.start_server(self._connection, self.host, self.port)]
+        servers = []
+        for camera in self.cameras:
+            servers.append(await asyncio.start_server(
+                lambda r, w, camera=camera: self._connection(r, w, camera), self.host, camera.port))
+        return servers
+
+    async def run(self):
+        servers = await self.start()
+        try:
+            await asyncio.gather(*(server.serve_forever() for server in servers))
+        finally:
+            for server in servers:
+                server.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Simulate Foscam cameras for testing.")
+    parser.add_argument("--cameras", type=int, default=10, help="the number of cameras (default: 10)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8888, help="the (first) port (default: 8888)")
+    parser.add_argument("--distinct-ports", action="store_true", help="a port per camera instead of one shared port")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds before each response (default: 0)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="+- seconds of random variation of the latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="the fraction of requests that get no response")
+    parser.add_argument("--max-connections", type=int, default=4, help="per camera (default: 4)")
+    parser.add_argument("--alarm-rate", type=float, default=0.0, help="the probability of a motion alarm in getDevState")
+    parser.add_argument("--snapshot-size", default="1280x720", help="the size of the snapPicture2 images (default: 1280x720)")
+    parser.add_argument("--log-rate", type=float, default=0.01, help="getLog entries per second and camera (default: 0.01)")
+    parser.add_argument("--record-rate", type=float, default=1 / 600, help="SD card recordings per second and camera (default: 1/600)")
+    parser.add_argument("--seed", type=int, help="the random seed, for reproducible errors and latencies")
+    parser.add_argument("--export", help="write the cameras to this file in the exported settings format")
+    args = parser.parse_args()
+    width, _, height = args.snapshot_size.partition("x")
+    simulator = Simulator(args.cameras, args.host, args.port, args.distinct_ports, args.latency, args.jitter,
+                          args.error_rate, args.max_connections, args.alarm_rate, (int(width), int(height)), args.seed,
+                          args.log_rate, args.record_rate)
+    if args.export:
+        Path(args.export).write_text(json.dumps(simulator.settings(), indent=4))
+    print(f"Simulating {args.cameras} cameras on {args.host}:{args.port}" + ("+" if args.distinct_ports else ""))
+    try:
+        asyncio.run(simulator.run())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,88 @@
+"""
+A shared cache of the latest snapshot (snapPicture2) of each camera, so that any number of viewers cause a
+constant load on the cameras: a cached frame younger than `max_age` is served as is, and concurrent requests
+for an older frame wait for one shared fetch. The least recently used frames are evicted to bound the memory.
+"""
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+
+from .client import CameraError
+
+
+class Frame:
+    def __init__(self, data: bytes, fetched_at: float = None):
+        self.data = data
+        self.fetched_at = time.monotonic() if fetched_at is None else fetched_at
+        self.timestamp = time.time()
+        self.etag = hashlib.blake2b(data, digest_size=8).hexdigest()
+
+    @property
+    def age(self):
+        return time.monotonic() - self.fetched_at
+
+
+class SnapshotCache:
+    def __init__(self, client, max_age: float = 1.0, max_bytes: int = 64 * 1024 * 1024, max_cameras: int = 10000):
+        self.client = client
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self.max_cameras = max_cameras
+        self.frames = OrderedDict()     # keyName -> Frame, least recently used first
+        self.bytes = 0
+        self._in_flight = {}            # keyName -> asyncio.Task of the fetch
+        self.listeners = []             # called with (camera, Frame) for every new frame, e.g. Archive.add
+        self.stats = {"hits": 0, "coalesced": 0, "fetches": 0, "errors": 0, "evictions": 0}
+
+    def latest(self, camera):
+        """
+        Returns the cached Frame of the camera (of any age) without fetching, or None.
+        """
+        return self.frames.get(camera.keyName)
+
+    def put(self, camera, data: bytes):
+        """
+        Stores a new frame of the camera, e.g. from a poller or an MJPEG stream. Returns the Frame.
+        """
+        frame = Frame(data)
+        old = self.frames.pop(camera.keyName, None)
+        if old is not None:
+            self.bytes -= len(old.data)
+        self.frames[camera.keyName] = frame
+        self.bytes += len(data)
+        while self.frames and (self.bytes > self.max_bytes or len(self.frames) > self.max_cameras):
+            _, evicted = self.frames.popitem(last=False)
+            self.bytes -= len(evicted.data)
+            self.stats["evictions"] += 1
+        for listener in self.listeners:
+            listener(camera, frame)
+        return frame
+
+    async def _fetch(self, camera):
+        self.stats["fetches"] += 1
+        try:
+            return self.put(camera, await self.client.camera(camera).snapshot())
+        except CameraError:
+            self.stats["errors"] += 1
+            raise
+        finally:
+            del self._in_flight[camera.keyName]
+
+    async def get(self, camera, max_age: float = None):
+        """
+        Returns a Frame of the camera that is at most `max_age` seconds old (default: the cache's max_age).
+        """
+        max_age = self.max_age if max_age is None else max_age
+        frame = self.frames.get(camera.keyName)
+        if frame is not None and frame.age <= max_age:
+            self.frames.move_to_end(camera.keyName)
+            self.stats["hits"] += 1
+            return frame
+        task = self._in_flight.get(camera.keyName)
+        if task is None:
+            task = self._in_flight[camera.keyName] = asyncio.ensure_future(self._fetch(camera))
+        else:
+            self.stats["coalesced"] += 1
+        return await asyncio.shield(task)   # a viewer that gives up must not cancel the fetch of the others
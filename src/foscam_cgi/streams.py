@@ -0,0 +1,357 @@
+"""
+Ingests the MJPEG streams of the cameras (/cgi-bin/CGIStream.cgi?cmd=GetMJStream) instead of polling snapshots:
+one connection per camera delivers about 15 frames per second without a request per frame. The frames go into
+the SnapshotCache (so /snapshot/<camera> serves the latest frame of the stream) and to the subscribers, e.g. the
+proxy's /stream/<camera>, which re-serves them to any number of browsers as multipart/x-mixed-replace.
+
+GetMJStream only works when the sub stream format is Motion JPEG (setSubStreamFormat&format=1):
+
+    python3 -m foscam_cgi.streams --settings FoscamApiExportedSettings.json --enable --seconds 10
+
+switches the sub stream of the cameras to MJPEG and measures the frame rate of each stream.
+
+The stream is read with an asyncio.BufferedProtocol straight into one buffer per camera, and the parts of the
+multipart response are found in place, so each frame is copied once, into the bytes shared by all the
+subscribers. The cameras are known to misbehave when a stream is held for a long time, so a stream is reopened
+after `max_session` seconds, when no frame has arrived for `stall_timeout` seconds, and (with a growing delay)
+after errors.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+from .cameras import load_cameras
+from .client import FoscamClient
+from .connection import build_request
+from .urls import render_target
+
+stream_path = "/cgi-bin/CGIStream.cgi"
+buffer_size = 512 * 1024        # the initial buffer of a stream, grown to fit the largest frame
+
+
+class StreamError(Exception):
+    """
+    The camera did not answer with a multipart stream.
+    """
+
+
+class MultipartProtocol(asyncio.BufferedProtocol):
+    """
+    Receives a multipart HTTP response into one buffer, and calls on_frame(bytes) for each part.
+    """
+    def __init__(self, on_frame):
+        self.on_frame = on_frame
+        self.buffer = bytearray(buffer_size)
+        self.view = memoryview(self.buffer)
+        self.start = 0              # the first byte not parsed yet
+        self.end = 0                # the end of the received bytes
+        self.boundary = None        # the boundary of the parts, once the response head has been read
+        self.part_length = None     # the Content-Length of the part being received, if it had one
+        self.error = None
+        self.closed = asyncio.get_running_loop().create_future()
+        self.transport = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def get_buffer(self, sizehint):
+        if self.end == len(self.buffer):
+            pending = self.end - self.start
+            if self.start == 0:     # a frame larger than the buffer: grow it
+                grown = bytearray(2 * len(self.buffer))
+                grown[:self.end] = self.view
+                self.buffer, self.view = grown, memoryview(grown)
+            else:                   # move the partial frame to the beginning
+                self.view[:pending] = self.view[self.start:self.end]
+                self.start, self.end = 0, pending
+        return self.view[self.end:]
+
+    def buffer_updated(self, nbytes):
+        self.end += nbytes
+        try:
+            while self._parse():
+                pass
+        except StreamError as e:
+            self.error = e
+            self.transport.close()
+
+    def _parse(self):
+        """
+        Parses what it can from start. Returns True if something was consumed.
+        """
+        if self.boundary is None:
+            head_end = self.buffer.find(b"\r\n\r\n", self.start, self.end)
+            if head_end < 0:
+                return False
+            lines = bytes(self.view[self.start:head_end]).decode("latin-1").split("\r\n")
+            status = lines[0].split(" ", 2)
+            headers = dict(line.partition(":")[::2] for line in lines[1:])
+            headers = {name.strip().lower(): value.strip() for name, value in headers.items()}
+            content_type = headers.get("content-type", "")
+            if len(status) < 2 or status[1] != "200" or "multipart" not in content_type:
+                raise StreamError(f"Not a multipart stream: {lines[0]} ({content_type or 'no Content-Type'})")
+            boundary = content_type.partition("boundary=")[2].split(";")[0].strip().strip('"')
+            if not boundary:
+                raise StreamError(f"No boundary in {content_type}")
+            self.boundary = boundary.encode("latin-1")     # the delimiter is "--" + boundary, but not on all cameras
+            self.start = head_end + 4
+            return True
+        if self.part_length is not None:
+            if self.end - self.start < self.part_length:
+                return False
+            self.on_frame(bytes(self.view[self.start:self.start + self.part_length]))
+            self.start += self.part_length
+            self.part_length = None
+            return True
+        # The start of a part: [CRLF] --boundary CRLF headers CRLF CRLF
+        found = self.buffer.find(self.boundary, self.start, self.end)
+        if found < 0:
+            return False
+        head_end = self.buffer.find(b"\r\n\r\n", found, self.end)
+        if head_end < 0:
+            return False
+        part_headers = bytes(self.view[found:head_end]).decode("latin-1").lower()
+        body_start = head_end + 4
+        if "content-length:" in part_headers:
+            self.part_length = int(part_headers.partition("content-length:")[2].split("\r\n")[0])
+            self.start = body_start
+            return True
+        # Without Content-Length, the part ends at the CRLF and dashes before the next boundary.
+        next_part = self.buffer.find(self.boundary, body_start, self.end)
+        if next_part < 0:
+            return False
+        body_end = next_part
+        while body_end > body_start and self.buffer[body_end - 1] == 0x2d:     # "-"
+            body_end -= 1
+        if self.buffer[body_end - 2:body_end] == b"\r\n":
+            body_end -= 2
+        self.on_frame(bytes(self.view[body_start:body_end]))
+        self.start = next_part
+        return True
+
+    def connection_lost(self, exc):
+        if not self.closed.done():
+            self.closed.set_result(exc)
+
+
+class MjpegStream:
+    """
+    Keeps the MJPEG stream of one camera open while run() is running.
+    """
+    def __init__(self, camera, cache=None, connect_timeout: float = 5.0, stall_timeout: float = 10.0,
+                 max_session: float = 1800.0, max_backoff: float = 30.0):
+        self.camera = camera
+        self.cache = cache                  # a SnapshotCache that gets the frames, or None
+        self.connect_timeout = connect_timeout
+        self.stall_timeout = stall_timeout
+        self.max_session = max_session
+        self.max_backoff = max_backoff
+        self.frame = None                   # the latest Frame (or bytes without a cache)
+        self.frame_time = None              # time.monotonic() of the latest frame
+        self.last_error = None
+        self._waiters = []
+        self.stats = {"frames": 0, "bytes": 0, "connections": 0, "errors": 0}
+
+    def _on_frame(self, data: bytes):
+        self.frame = self.cache.put(self.camera, data) if self.cache is not None else data
+        self.frame_time = time.monotonic()
+        self.stats["frames"] += 1
+        self.stats["bytes"] += len(data)
+        waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(self.frame)
+
+    async def next_frame(self, after=None):
+        """
+        Waits for a frame other than `after` (the previous frame the caller got), and returns it.
+        """
+        while self.frame is None or self.frame is after:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            await waiter
+        return self.frame
+
+    async def _session(self):
+        """
+        One connection, until it fails, stalls or has been open for max_session seconds.
+        """
+        loop = asyncio.get_running_loop()
+        transport, protocol = await asyncio.wait_for(
+            loop.create_connection(lambda: MultipartProtocol(self._on_frame), self.camera.ip, self.camera.port),
+            self.connect_timeout)
+        self.stats["connections"] += 1
+        try:
+            target = render_target(self.camera, "GetMJStream", path=stream_path)
+            transport.write(build_request(self.camera.ip, self.camera.port, target))
+            started = last_frames = loop.time()
+            frames = self.stats["frames"]
+            while loop.time() - started < self.max_session:
+                try:
+                    await asyncio.wait_for(asyncio.shield(protocol.closed), 1.0)
+                    raise protocol.error or ConnectionError("The camera closed the stream")
+                except asyncio.TimeoutError:
+                    pass
+                if self.stats["frames"] != frames:
+                    frames, last_frames = self.stats["frames"], loop.time()
+                elif loop.time() - last_frames > self.stall_timeout:
+                    raise StreamError(f"No frames for {self.stall_timeout:.0f} s")
+        finally:
+            transport.close()
+
+    async def run(self):
+        backoff = 0.5
+        while True:
+            frames = self.stats["frames"]
+            try:
+                await self._session()
+                continue            # open for max_session seconds: reopen at once
+            except (OSError, asyncio.TimeoutError, StreamError) as e:
+                self.last_error = f"{type(e).__name__}: {e}"
+                self.stats["errors"] += 1
+            if self.stats["frames"] > frames:
+                backoff = 0.5       # the stream worked for a while: start the delays over
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, self.max_backoff)
+
+    def status(self):
+        return {"frames": self.stats["frames"], "bytes": self.stats["bytes"],
+                "connections": self.stats["connections"], "errors": self.stats["errors"],
+                "frameAge": None if self.frame_time is None else time.monotonic() - self.frame_time,
+                "lastError": self.last_error}
+
+
+class StreamHub:
+    """
+    The MJPEG streams of the cameras: held permanently for the cameras given to hold(), and on demand for the
+    subscribers of other cameras, until `linger` seconds after the last subscriber has left.
+    """
+    def __init__(self, cache=None, linger: float = 30.0, **stream_options):
+        self.cache = cache
+        self.linger = linger
+        self.stream_options = stream_options
+        self.streams = {}           # keyName -> MjpegStream
+        self._tasks = {}            # keyName -> the asyncio.Task running the stream
+        self._held = set()          # keyNames streamed permanently
+        self._subscribers = {}      # keyName -> number of subscribers
+        self._stops = {}            # keyName -> the asyncio.TimerHandle stopping an unused stream
+        self._running = False
+
+    def _start(self, camera, run: bool = False):
+        stream = self.streams.get(camera.keyName)
+        if stream is None:
+            stream = self.streams[camera.keyName] = MjpegStream(camera, self.cache, **self.stream_options)
+        if (run or self._running) and camera.keyName not in self._tasks:
+            self._tasks[camera.keyName] = asyncio.ensure_future(stream.run())
+        return stream
+
+    def _stop(self, keyName: str):
+        self._stops.pop(keyName, None)
+        if keyName in self._held or self._subscribers.get(keyName):
+            return
+        task = self._tasks.pop(keyName, None)
+        if task is not None:
+            task.cancel()
+
+    def hold(self, camera):
+        """
+        Streams the camera permanently (from when run() is started).
+        """
+        self._held.add(camera.keyName)
+        return self._start(camera)
+
+    def latest(self, camera, max_age: float = 2.0):
+        """
+        The latest frame of the camera if it is being streamed and the frame is at most `max_age` seconds old.
+        """
+        stream = self.streams.get(camera.keyName)
+        if stream is None or camera.keyName not in self._tasks or stream.frame_time is None:
+            return None
+        return stream.frame if time.monotonic() - stream.frame_time <= max_age else None
+
+    def subscribe(self, camera):
+        """
+        Returns the MjpegStream of the camera, started if needed. Call unsubscribe() when done.
+        """
+        self._subscribers[camera.keyName] = self._subscribers.get(camera.keyName, 0) + 1
+        stop = self._stops.pop(camera.keyName, None)
+        if stop is not None:
+            stop.cancel()
+        return self._start(camera, run=True)
+
+    def unsubscribe(self, camera):
+        self._subscribers[camera.keyName] -= 1
+        if not self._subscribers[camera.keyName] and camera.keyName not in self._held:
+            self._stops[camera.keyName] = asyncio.get_running_loop().call_later(self.linger, self._stop, camera.keyName)
+
+    def status(self):
+        return {keyName: {**self.streams[keyName].status(), "subscribers": self._subscribers.get(keyName, 0),
+                          "held": keyName in self._held} for keyName in self._tasks}
+
+    async def run(self):
+        """
+        Starts the held streams and runs until cancelled; stops all the streams then.
+        """
+        self._running = True
+        for keyName in self._held:
+            self._start(self.streams[keyName].camera)
+        try:
+            await asyncio.Event().wait()
+        finally:
+            for task in self._tasks.values():
+                task.cancel()
+            self._tasks = {}
+            self._running = False
+
+
+async def multipart_stream(stream, writer, boundary: bytes = b"frame", keep_alive: float = 5.0):
+    """
+    Writes the frames of the MjpegStream as a multipart/x-mixed-replace body until the client disconnects. A client
+    that reads slower than the camera sends skips frames instead of falling behind.
+    """
+    frame = None
+    while True:
+        try:
+            frame = await asyncio.wait_for(stream.next_frame(frame), keep_alive)
+        except asyncio.TimeoutError:
+            # The camera is not sending: repeat the last frame, which also detects a client that has left.
+            if frame is None:
+                writer.write(b"\r\n")
+                await writer.drain()
+                if writer.is_closing():
+                    return
+                continue
+        data = getattr(frame, "data", frame)
+        writer.write(b"--%s\r\nContent-Type: image/jpeg\r\nContent-Length: %d\r\n\r\n" % (boundary, len(data)))
+        writer.write(data)
+        writer.write(b"\r\n")
+        await writer.drain()
+
+
+async def main(args):
+    cameras = list(load_cameras(args.settings).values())
+    if args.enable:
+        async with FoscamClient(timeout=10.0) as client:
+            results = await client.command_all(cameras, "setSubStreamFormat", format=1)
+        for keyName, result in results.items():
+            if isinstance(result, Exception) or not result.ok:
+                print(f"{keyName}: setSubStreamFormat failed: {result}", file=sys.stderr)
+    streams = [MjpegStream(camera) for camera in cameras]
+    tasks = [asyncio.ensure_future(stream.run()) for stream in streams]
+    await asyncio.sleep(args.seconds)
+    for task in tasks:
+        task.cancel()
+    for stream in streams:
+        error = f", {stream.last_error}" if stream.last_error else ""
+        print(f"{stream.camera.keyName}: {stream.stats['frames'] / args.seconds:.1f} frames/s, "
+              f"{stream.stats['bytes'] / args.seconds / 1024:.0f} KiB/s, {stream.stats['connections']} connections{error}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Measure the MJPEG streams of the cameras.")
+    parser.add_argument("--settings", required=True, help="a settings file exported from the index.html")
+    parser.add_argument("--enable", action="store_true", help="first switch the sub stream of the cameras to MJPEG (setSubStreamFormat&format=1)")
+    parser.add_argument("--seconds", type=float, default=10.0, help="how long to receive the streams (default: 10)")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,105 @@
+"""
+Builds and checks the CGI request targets with the command templates that parse_pdf_to_json.py compiles into
+commands.py: each command has a fixed parameter order (that of ExampleParams) with the "&<name>=" parts
+precomputed, and frozen sets of the allowed values of the parameters that have paramOptions. Checking the
+parameters before sending saves the round trip that the camera would answer with <result>-1.
+
+    problems = validate("setInfraLedConfig", {"mode": 3})     # ['mode=3 is not one of 0, 1']
+    target = render_target(camera, "setInfraLedConfig", {"mode": 1})
+
+For bulk jobs, render_batch() checks and renders many (camera, cmd, params) at once.
+"""
+
+from functools import lru_cache
+from urllib.parse import quote
+
+from .commands import commandTemplates, optionSets
+
+cgi_path = "/cgi-bin/CGIProxy.fcgi"
+
+
+@lru_cache(maxsize=65536)
+def _quote(value: str):
+    return quote(value)     # the same values (e.g. "0", "1") are quoted again and again
+
+
+@lru_cache(maxsize=4096)
+def _credentials(user: str, password: str):
+    return f"&usr={quote(user)}&pwd={quote(password)}"
+
+
+def validate(cmd: str, params: dict, complete: bool = False, strict: bool = False):
+    """
+    Returns the problems of the parameters (an empty list if none): values that are not among the paramOptions,
+    and with `complete`, the parameters of the command that are missing (the set* commands reset a missing
+    parameter to some default). Commands that are not in commandJson are not checked.
+
+    The parameters parsed from the spec are not all the parameters of every command (half of the commands have
+    no ExampleParams, and e.g. the `cnt` of getRecordList is not documented), so parameters that are not among
+    them are only reported with `strict`, when the caller knows that the command has no others.
+    """
+    template = commandTemplates.get(cmd)
+    if template is None:
+        return []
+    _, names, _, option_indexes = template
+    problems = [f"{cmd} has no parameter {name}" for name in params if name not in names] if strict else []
+    for name, index in zip(names, option_indexes):
+        if name not in params:
+            if complete:
+                problems.append(f"{cmd} needs the parameter {name}")
+        elif index is not None and str(params[name]) not in optionSets[index]:
+            problems.append(f"{name}={params[name]} is not one of {', '.join(sorted(optionSets[index]))}")
+    return problems
+
+
+def render_query(cmd: str, params: dict):
+    """
+    The query of the command without the credentials: the parameters in the order of the template (as getUrl()
+    of the index.html), then any others in the given order.
+    """
+    template = commandTemplates.get(cmd)
+    if template is None:
+        parts = [f"cmd={quote(cmd)}"]
+        names = ()
+    else:
+        parts = [template[0]]
+        names = template[1]
+        for name, key in zip(names, template[2]):
+            if name in params:
+                parts.append(key)
+                parts.append(_quote(str(params[name])))
+    if len(parts) // 2 < len(params):
+        parts.extend(f"&{quote(str(name))}={_quote(str(value))}" for name, value in params.items() if name not in names)
+    return "".join(parts)
+
+
+def render_target(camera, cmd: str, params=None, path: str = cgi_path):
+    """
+    The request target of the command, e.g. /cgi-bin/CGIProxy.fcgi?cmd=...&usr=...&pwd=...
+    """
+    return f"{path}?{render_query(cmd, params or {})}{_credentials(camera.user, camera.password)}"
+
+
+def render_batch(requests, complete: bool = False, path: str = cgi_path):
+    """
+    Checks and renders many (camera, cmd, params) at once. Returns (targets, problems): the targets in the order
+    of the requests (None for the invalid ones), and {index of the request: [problems]}.
+    """
+    targets, problems = [], {}
+    rendered = {}   # the same parameters are typically sent to many cameras: check and render them once
+    for index, (camera, cmd, params) in enumerate(requests):
+        try:
+            key = (cmd, tuple(params.items()))
+            found = rendered.get(key)
+        except TypeError:   # unhashable values
+            key = found = None
+        if found is None:
+            found = (validate(cmd, params, complete), render_query(cmd, params))
+            if key is not None:
+                rendered[key] = found
+        if found[0]:
+            problems[index] = found[0]
+            targets.append(None)
+        else:
+            targets.append(f"{path}?{found[1]}{_credentials(camera.user, camera.password)}")
+    return targets, problems
@@ -1,9 +1,21 @@
 #!python3
 
+import argparse
+import gzip
+import hashlib
 import json
 import os
+import pprint
+import sys
+import textwrap
+import time
 from pathlib import Path
 
+try:
+    import brotli   # optional, only for writing the .br sibling of the release build
+except ImportError:
+    brotli = None
+
 # The following txt file was created by copying all text from chapters 2 and 3 from the Foscam API PDF and pasted to a txt file.
 # Turns out that the tables are not converted to text in any consistent way.
 source_file = 'Foscam-IPCamera-CGI-User-Guide-AllPlatforms-2015.11.06.pdf.txt'
@@ -11,6 +23,22 @@ source_file = 'Foscam-IPCamera-CGI-User-Guide-AllPlatforms-2015.11.06.pdf.txt'
 # Print some possible problems to stdout?
 debug = False
 
+# Lines containing any of these are dropped before parsing: page headers, page footers and some random lines.
+# TODO: There are still some extra subheaders that should be dropped...
+noise_markers = ("All Platform", "Copyright@", "IPCamera CGI User Guide", "(20480~2097152)")
+
+# Every command in the guide is a header line (the command name) followed by these sections, each starting a new line.
+section_markers = ("Function", "privilege", "Usage", "Example")
+
+# Define generic options for boolean-type parameters:
+booleanParam = {
+    "optionsType" : "dict", # "list", or "dict" if the options have names: {"option1DisplayName" : "option1"}
+    "options" : {
+        "false/disabled (0)" : 0,
+        "true/enabled (1)" : 1,
+    }
+}
+
 def extract_all_between(after_text: str, before_text: str, lines, j: int, j_max: int):
     """
     Assumes the following text, starting on the j:th line in lines:
@@ -45,85 +73,90 @@ def extract_all_between(after_text: str, before_text: str, lines, j: int, j_max:
         extracted_text = extracted_text[:e]
     else:
         j += 1
+        parts = [extracted_text]
         while j < j_max and not lines[j].startswith(before_text):
-            extracted_text += lines[j].strip()
+            parts.append(lines[j].strip())
             j += 1
+        extracted_text = "".join(parts)
     return extracted_text, j
 
 
-if __name__ == '__main__':
-    full_path_of_this_script_dir = Path(os.path.realpath(__file__)).resolve().parent
-    
-    with open(Path(full_path_of_this_script_dir / source_file)) as f:
-        lines = f.readlines()
+def read_guide_lines(path):
+    """
+    Reads the guide text and drops the lines containing any of the `noise_markers`.
+    """
+    with open(path) as f:
+        return [l for l in f if not any(marker in l for marker in noise_markers)]
 
-    # Drop headers:
-    lines = [l for l in lines if "All Platform" not in l]
 
-    # Drop page footers:
-    lines = [l for l in lines if "Copyright@" not in l]
+def index_sections(lines):
+    """
+    Tokenizes the guide once. Returns a dict of line offsets for each of the `section_markers`
+    and for the method headers (the line just before each "Function"):
+    ```
+    {"method": [12, 25, ...], "Function": [13, 26, ...], "privilege": [...], "Usage": [...], "Example": [...]}
+    ```
+    """
+    index = {"method": []}
+    index.update({marker: [] for marker in section_markers})
+    for i, line in enumerate(lines):
+        for marker in section_markers:
+            if line.startswith(marker):
+                index[marker].append(i)
+                break
+    index["method"] = [i-1 for i in index["Function"]]
+    return index
 
-    # Drop page headers:
-    lines = [l for l in lines if "IPCamera CGI User Guide" not in l]
 
-    # Drop some random lines:
-    lines = [l for l in lines if "(20480~2097152)" not in l]
-    
-    # TODO: There are still some extra subheaders that should be dropped...
+def parse_example_params(example: str, method: str):
+    """
+    Parses the parameters of the Example URL of the method. Returns the dict of parameters
+    (or None if there are none) and the list of parameters that look like booleans.
+    """
+    all_params = example.replace("/cgi-bin/CGIProxy.fcgi?", "").replace(f"cmd={method}", "").replace("usr=admin", "").replace("pwd=", "").strip()
+    if len(all_params.strip("&")) <= 2:
+        return None, []
+
+    params_dict = {}
+    boolean_params = []
+    for param in all_params.split("&")[1:]:
+        key_value = param.split("=")
+        if len(key_value) == 2:
+            paramKey = key_value[0].strip().replace('\n','')
+            paramExamplevalue = key_value[1].strip().replace('\n','')
+            params_dict[paramKey] = paramExamplevalue
+
+            if paramKey[:2] == "is" or paramKey == "enable":
+                boolean_params.append(paramKey) # collect all params for which enabled/disabled options can be automatically added
+        elif debug and key_value[0].strip() != "":
+            print(f"Failed to parse parameters of {method}: {key_value}")
+    return params_dict, boolean_params
+
+
+def parse_command_json(lines):
+    """
+    Builds the automatically parsed `commandJson` from the guide lines in one pass over the
+    method headers, using the section index from `index_sections`.
+    """
+    index = index_sections(lines)
+    methods = [lines[i].rstrip() for i in index["method"]]
+    examples = index["Example"]
 
-    # Parse all commands/methods:
-    methods = []
-    i = 0
-    while i < len(lines):
-        if not lines[i].startswith("Function"):
-            i += 1
-            continue
-        cmd = lines[i-1]
-        methods.append(cmd.rstrip())
-        i += 1
-    
-    # Define generic options for boolean-type parameters:
-    booleanParam = {
-        "optionsType" : "dict", # "list", or "dict" if the options have names: {"option1DisplayName" : "option1"}
-        "options" : {
-            "false/disabled (0)" : 0,
-            "true/enabled (1)" : 1,
-        }
-    }
-    
-    # Parse the params, based on the Example:
     commandJson = {}
-    i = 0
-    i_m = 0
-    while i < len(lines) and i_m < len(methods):
-        if not lines[i].startswith("Example"):
-            i += 1     
-            continue
-        if i_m < len(methods)-1:
-            example, i = extract_all_between("Example", methods[i_m+1], lines, i, len(lines))
-        else:
-            example, i = extract_all_between("Example", "EOF", lines, i, len(lines))
-
-        all_params = example.replace("/cgi-bin/CGIProxy.fcgi?", "").replace(f"cmd={methods[i_m]}", "").replace("usr=admin", "").replace("pwd=", "").strip()
-        if len(all_params.strip("&")) > 2:
-            params = all_params.split("&")[1:]
-            params_dict = {}
-            boolean_params = []
-            for param in params:
-                key_value = param.split("=")
-                if len(key_value) == 2:
-                    paramKey = key_value[0].strip().replace('\n','')
-                    paramExamplevalue = key_value[1].strip().replace('\n','')
-                    params_dict[paramKey] = paramExamplevalue
-                    
-                    if paramKey[:2] == "is" or paramKey == "enable":
-                        boolean_params.append(paramKey) # collect all params for which enabled/disabled options can be automatically added
-                elif debug and key_value[0].strip() != "":
-                    print(f"Failed to parse parameters of {methods[i_m]}: {key_value}")
-        else:
-            params_dict = None
-            boolean_params = []
-        
+    i_e = 0                 # next candidate in `examples`
+    example_from = 0        # an Example is searched starting from this line
+    function_from = 0       # a Function is only parsed if it starts at or after this line
+    for i_m, method in enumerate(methods):
+        # Parse the params, based on the Example (the text until the next method header):
+        while i_e < len(examples) and examples[i_e] < example_from:
+            i_e += 1
+        if i_e >= len(examples):
+            break
+        next_method = methods[i_m+1] if i_m < len(methods)-1 else "EOF"
+        example, j = extract_all_between("Example", next_method, lines, examples[i_e], len(lines))
+        example_from = j + 1
+
+        params_dict, boolean_params = parse_example_params(example, method)
         if params_dict is not None and len(boolean_params) > 0:
             paramOptionsDict = {    # Add automatically dropdown options for all isEnable parameters
                 param : booleanParam
@@ -131,35 +164,32 @@ if __name__ == '__main__':
             }
         else:
             paramOptionsDict = None
-        
+
         p = {
             "ExampleParams" : params_dict,
             "paramOptions" : paramOptionsDict,
         }
-        
-        if not "not use" in methods[i_m]: # PDF contains some commands that are "not use"d ...  ignore them
-            commandJson[methods[i_m]] = p
-
-        i += 1
-        i_m += 1
-        
-    
-    # Parse the description and privilege:
-    i = 0
-    while i < len(lines):
-        if not lines[i].startswith("Function"):
-            i += 1     
+
+        if not "not use" in method: # PDF contains some commands that are "not use"d ...  ignore them
+            commandJson[method] = p
+
+        # Parse the description and privilege:
+        function_line = index["Function"][i_m]
+        if function_line < function_from:
             continue
-        cmd = lines[i-1].strip()
-        function, i = extract_all_between("Function", "privilege", lines, i, len(lines))
-        privilege, i = extract_all_between("privilege", "Usage", lines, i, len(lines))
+        function, j = extract_all_between("Function", "privilege", lines, function_line, len(lines))
+        privilege, j = extract_all_between("privilege", "Usage", lines, j, len(lines))
+        function_from = j + 1
+        p["Function"] = function.rstrip().replace('\n','')
+        p["Privilege"] = privilege.rstrip().replace('\n','')
 
-        if not "not use" in cmd: # PDF contains some commands that are "not use"d ...  ignore them
-            commandJson[cmd]["Function"] = function.rstrip().replace('\n','')
-            commandJson[cmd]["Privilege"] = privilege.rstrip().replace('\n','')
-        i += 1
+    return commandJson
 
 
+def add_manual_corrections(commandJson):
+    """
+    Applies the manual additions and corrections (in place) to the automatically parsed `commandJson`.
+    """
     #########################################################
     # MANUAL ADDITIONS AND CORRECTIONS TO THE commandJson:  #
     #########################################################
@@ -481,6 +511,16 @@ if __name__ == '__main__':
     }
     commandJson["setRecordPath"]["ExampleParams"]["path"] = 2
     commandJson["setRecordPath"]["Function"] += ". How to read the response: 'setResult': 0 success, -1 Sd card is not exist, -2 Share direction is not set, -3 Not enough space, -4 Param error, -5 Param recording."
+
+    for cmd in ("getRecordList", "getRecordList2"):
+        commandJson[cmd]["ExampleParams"] = {
+            "recordPath": 0,
+            "startTime": 0,
+            "endTime": 2147483647,
+            "recordType": 0,
+            "startNo": 0,
+        } # the parameters are listed in the pdf, but without an example
+        commandJson[cmd]["Function"] += ". Returns at most 10 recordings (record0-record9) starting from 'startNo', and 'totalCnt', the number of recordings from 'startTime' to 'endTime' (unix time). 'recordPath' as with setRecordPath. If recent recordings are missing, see reloadRecordindex."
     
     commandJson["setScheduleRecordConfig"]["Function"] += ". (This can be disabled if you only want to record a video clip when motion is detected.) The 'schedule' parameters work the same way as with setMotionDetectConfig, so you can possibly use the table under the 'Detector' category to figure out the correct values."
     commandJson["setScheduleRecordConfig"]["ExampleParams"]["isEnable"] = 0
@@ -655,20 +695,446 @@ if __name__ == '__main__':
     #########################################################
 
 
+# The commands of the views of the index.html (see setDefaultViewContents() of the template), in the order they are shown:
+view_commands = {
+    "Status": [
+        "getDevName", "getDevInfo", "getDevState", "getSessionList", "getFirewallConfig", "getLog"
+    ],
+    "Basic": [
+        "getDevName", "setDevName", "getSystemTime", "setSystemTime", "getUserList", "addAccount", "delAccount",
+        "changeUserName", "changePassword", "changeUserNameAndPwdTogether"
+    ],
+    "Network": [
+        "getIPInfo", "setIpInfo", "getWifiConfig", "setWifiSetting", "getSMTPConfig", "setSMTPConfig", "smtpTest",
+        "getFtpConfig", "setFtpConfig", "testFtpServer", "getPortInfo", "setPortInfo", "getP2PEnable", "setP2PEnable",
+        "getP2PPort", "setP2PPort", "getP2PInfo", "getDDNSConfig", "setDDNSConfig"
+    ],
+    "Video": [
+        "getMainVideoStreamType", "setMainVideoStreamType", "getVideoStreamParam", "setVideoStreamParam",
+        "getSubVideoStreamType", "setSubVideoStreamType", "getSubVideoStreamParam", "setSubVideoStreamParam",
+        "getOSDSetting", "setOSDSetting", "getSnapConfig", "setSnapConfig", "getScheduleSnapConfig",
+        "setScheduleSnapConfig", "getImageSetting", "setHue", "setBrightness", "setContrast", "setSaturation",
+        "setSharpness", "setPwrFreq", "getMirrorAndFlipSetting", "mirrorVideo", "flipVideo"
+    ],
+    "Detector": [
+        "setMotionDetectConfig", "getMotionDetectConfig", "getAudioAlarmConfig", "setAudioAlarmConfig"
+    ],
+    "Record": [
+        "getRecordPath", "setRecordPath", "getAlarmRecordConfig", "setAlarmRecordConfig", "getRecordList",
+        "getRecordList2", "getScheduleRecordConfig", "setScheduleRecordConfig", "getMultiDevList",
+        "getMultiDevDetailInfo", "addMultiDev", "delMultiDev", "getDeFrameLevel", "setDeFrameLevel", "getCloudConfig",
+        "setCloudConfig", "selectCloudServer", "getCloudToken", "getCloudQuota", "testCloudServer"
+    ],
+    "System": [
+        "exportConfig", "restoreToFactorySetting", "rebootSystem"
+    ],
+    "PTZ": [
+        "getPTZSpeed", "setPTZSpeed", "getPTZPresetPointList", "ptzAddPresetPoint", "ptzDeletePresetPoint",
+        "ptzGotoPresetPoint", "getPTZSelfTestMode", "setPTZSelfTestMode", "getPTZPrePointForSelfTest",
+        "setPTZPrePointForSelfTest", "getZoomSpeed", "setZoomSpeed", "ptzGetCruiseMapList", "ptzGetCruiseMapInfo",
+        "ptzSetCruiseMap", "ptzDelCruiseMap", "ptzStartCruise", "ptzStopCruise", "getCruiseTime", "setCruiseTime",
+        "getCruiseTimeCustomed", "setCruiseTimeCustomed", "getCruiseLoopCnt", "setCruiseLoopCnt", "getCruiseCtrlMode",
+        "setCruiseCtrlMode", "getCruisePrePointLingerTime", "setCruisePrePointLingerTime"
+    ],
+    "Operate": [
+        "snapPicture2", "snapPicture", "getInfraLedConfig", "setInfraLedConfig", "openInfraLed", "closeInfraLed",
+        "zoomIn", "zoomOut", "zoomStop", "ptzMoveUp", "ptzMoveDown", "ptzMoveLeft", "ptzMoveRight", "ptzStopRun",
+        "focusFar", "focusNear", "focusStop"
+    ],
+}
+
+
+def generate_html(commandJsonString: str, templateHtml: str, commandTemplatesString: str, commandIndexString: str):
+    """
+    Creates the index.html contents by replacing the placeholders in the template-html.
+    """
+    return (templateHtml.replace("{COMMANDJSON_PLACEHOLDER}", commandJsonString)
+            .replace("{COMMANDTEMPLATES_PLACEHOLDER}", commandTemplatesString)
+            .replace("{COMMANDINDEX_PLACEHOLDER}", commandIndexString))
+
+
+def compile_command_templates(commandJson):
+    """
+    Compiles each command into a URL template with a fixed parameter order, and a validator of the parameters:
+    [query start ("cmd=<cmd>"), the "&<name>=" of each parameter in the order of ExampleParams, and for each
+    parameter the index of its set of allowed values in optionSets (-1: any value)]. The option sets are the
+    values of the paramOptions entries as strings, each distinct set once. Returns (optionSets, templates).
+    """
+    optionSets = []
+    setIndexes = {}
+    templates = {}
+    for cmd, cmdObject in commandJson.items():
+        names = list(cmdObject.get("ExampleParams") or {})
+        paramOptions = cmdObject.get("paramOptions") or {}
+        indexes = []
+        for name in names:
+            options = paramOptions.get(name)
+            if options is None:
+                indexes.append(-1)
+                continue
+            values = options["options"].values() if options["optionsType"] == "dict" else options["options"]
+            key = tuple(sorted({str(value) for value in values}))
+            if key not in setIndexes:
+                setIndexes[key] = len(optionSets)
+                optionSets.append(list(key))
+            indexes.append(setIndexes[key])
+        templates[cmd] = [f"cmd={cmd}", [f"&{name}=" for name in names], indexes]
+    return optionSets, templates
+
+
+def serialize_command_templates(commandJson):
+    """
+    Returns the compiled command templates as compact JSON, for the template's compileCommandTemplates().
+    """
+    optionSets, templates = compile_command_templates(commandJson)
+    return json.dumps({"optionSets": optionSets, "commands": templates}, separators=(',', ':'))
+
+
+def build_command_index(commandJson):
+    """
+    The lookups of the index.html, precomputed so that the page does not walk commandJson when it loads: the
+    command names sorted case-insensitively ("commands", the other entries refer to a command by its position
+    in it), the commands of each view, the commands by privilege, the commands by lowercase parameter name, and
+    the commands by the trigrams of their lowercase name, for the command search of the Custom view.
+    """
+    unknown = [cmd for cmds in view_commands.values() for cmd in cmds if cmd not in commandJson]
+    if unknown:
+        raise ValueError(f"view_commands lists commands that are not in the spec: {unknown}")
+    commands = sorted(commandJson, key=lambda cmd: (cmd.lower(), cmd))
+    privileges, params, trigrams = {}, {}, {}
+    for position, cmd in enumerate(commands):
+        cmdObject = commandJson[cmd]
+        privileges.setdefault(str(cmdObject.get("Privilege")), []).append(position)
+        for name in dict.fromkeys(name.lower() for name in cmdObject.get("ExampleParams") or {}):
+            params.setdefault(name, []).append(position)
+        lower = cmd.lower()
+        for trigram in dict.fromkeys(lower[i:i + 3] for i in range(len(lower) - 2)):
+            trigrams.setdefault(trigram, []).append(position)
+    return {"commands": commands, "views": view_commands, "privileges": privileges, "params": params,
+            "trigrams": trigrams}
+
+
+def serialize_command_index(commandJson):
+    """
+    Returns the command index as compact JSON, for the template's commandIndex.
+    """
+    return json.dumps(build_command_index(commandJson), separators=(',', ':'))
+
+
+def generate_python_commands(commandJson):
+    """
+    Creates the contents of foscam_cgi/commands.py: the commandJson as a Python dict, and a `Commands` mixin with
+    one async method per command for the Python client, and the compiled command templates (see urls.py).
+    """
+    optionSets, templates = compile_command_templates(commandJson)
+    out = [
+        '"""',
+        "Generated by parse_pdf_to_json.py from the Foscam CGI User Guide. Do not edit: add or fix commands at",
+        "the end of parse_pdf_to_json.py instead.",
+        '"""',
+        "",
+        "commandJson = " + pprint.pformat(commandJson, indent=1, width=120, sort_dicts=False),
+        "",
+        "",
+        "# The allowed values (as strings) of the parameters that have paramOptions, each distinct set once:",
+        "optionSets = (",
+        *(f"    frozenset({values!r})," for values in optionSets),
+        ")",
+        "",
+        "# cmd -> (query start, parameter names in a fixed order, their '&<name>=', their optionSets index or None):",
+        "commandTemplates = {",
+        *(f"    {cmd!r}: ({prefix!r}, {tuple(key[1:-1] for key in keys)!r}, {tuple(keys)!r}, "
+          f"{tuple(None if i < 0 else i for i in indexes)!r}),"
+          for cmd, (prefix, keys, indexes) in templates.items()),
+        "}",
+        "",
+        "",
+        "class Commands:",
+        '    """',
+        "    One method per command. Each sends the command with the given parameters and returns the CGIResult.",
+        '    """',
+    ]
+    for cmd, cmdObject in commandJson.items():
+        description = (cmdObject.get("Function") or cmd).replace("\\", "\\\\").replace('"""', "'''")
+        out.append("")
+        out.append(f"    async def {cmd}(self, **params):")
+        out.append('        """')
+        out.extend(textwrap.wrap(description, 108, initial_indent="        ", subsequent_indent="        "))
+        out.append("")
+        out.append(f"        Privilege: {cmdObject.get('Privilege')}")
+        if cmdObject.get("ExampleParams"):
+            example = ", ".join(f"{k}={v}" for k, v in cmdObject["ExampleParams"].items())
+            out.extend(textwrap.wrap(f"Example params: {example}", 108, initial_indent="        ", subsequent_indent="            ", break_on_hyphens=False))
+        out.append('        """')
+        out.append(f"        return await self.command({cmd!r}, **params)")
+    return "\n".join(out) + "\n"
+
+
+def build_command_json(source_path):
+    """
+    Parses the guide text file and applies the manual corrections. Returns the final `commandJson`.
+    """
+    commandJson = parse_command_json(read_guide_lines(source_path))
+    add_manual_corrections(commandJson)
+    return commandJson
+
+
+def content_hash(*paths):
+    """
+    Returns a sha256 hex digest over the contents of all given files.
+    """
+    h = hashlib.sha256()
+    for path in paths:
+        h.update(Path(path).read_bytes())
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def build_spec(source_path, cache_dir=None):
+    """
+    Returns the serialized `commandJson`. If cache_dir is given, the result is cached there, keyed by a
+    content hash of the guide text and of this script (which contains the parser and the manual corrections).
+    """
+    if cache_dir is None:
+        return json.dumps(build_command_json(source_path), sort_keys=False, indent=4)
+
+    key = content_hash(source_path, Path(os.path.realpath(__file__)))
+    cached_path = Path(cache_dir) / f"commandJson-{key}.json"
+    if cached_path.exists():
+        return cached_path.read_text()
+
+    commandJsonString = json.dumps(build_command_json(source_path), sort_keys=False, indent=4)
+    Path(cache_dir).mkdir(parents=True, exist_ok=True)
+    for old in Path(cache_dir).glob("commandJson-*.json"):  # only the latest spec is worth keeping
+        old.unlink()
+    tmp_path = cached_path.with_suffix(".tmp")
+    tmp_path.write_text(commandJsonString)
+    os.replace(tmp_path, cached_path)
+    return commandJsonString
+
+
+def intern_param_options(commandJson):
+    """
+    Collects every distinct paramOptions entry (e.g. `booleanParam`, which is used by dozens of commands) into a
+    list of option tables, and replaces the entries in (a copy of) commandJson with indexes to that list.
+    Returns the option tables and the interned commandJson.
+    """
+    optionTables = []
+    tableIndexes = {}
+    internedCommandJson = {}
+    for cmd, cmdObject in commandJson.items():
+        cmdObject = dict(cmdObject)
+        paramOptions = cmdObject.get("paramOptions")
+        if paramOptions is not None:
+            references = {}
+            for paramName, options in paramOptions.items():
+                key = json.dumps(options)   # not sorted: the order of the options is the order of the dropdown
+                if key not in tableIndexes:
+                    tableIndexes[key] = len(optionTables)
+                    optionTables.append(options)
+                references[paramName] = tableIndexes[key]
+            cmdObject["paramOptions"] = references
+        internedCommandJson[cmd] = cmdObject
+    return optionTables, internedCommandJson
+
+
+def serialize_release_spec(commandJson):
+    """
+    Returns a compact JavaScript expression for the release build to replace the commandJson placeholder with.
+    The template's resolveParamOptionTables() restores the interned option tables when the page loads.
+    """
+    optionTables, internedCommandJson = intern_param_options(commandJson)
+    optionTablesString = json.dumps(optionTables, separators=(',', ':'))
+    internedString = json.dumps(internedCommandJson, separators=(',', ':'))
+    return f"resolveParamOptionTables({optionTablesString},{internedString})"
+
+
+def write_if_changed(path, content):
+    """
+    Writes the content (str or bytes) to the path, unless the file already has exactly that content. Returns True if written.
+    """
+    path = Path(path)
+    data = content.encode() if isinstance(content, str) else content
+    if path.exists() and path.read_bytes() == data:
+        return False
+    path.write_bytes(data)
+    return True
+
+
+def write_compressed_siblings(path, data: bytes):
+    """
+    Writes the precompressed `.gz` and (if the brotli module is installed) `.br` versions of a file for HTTP hosting.
+    Returns the written paths and their sizes.
+    """
+    written = {}
+    gz_path = Path(str(path) + ".gz")
+    write_if_changed(gz_path, gzip.compress(data, compresslevel=9, mtime=0))
+    written[gz_path] = gz_path.stat().st_size
+    if brotli is not None:
+        br_path = Path(str(path) + ".br")
+        write_if_changed(br_path, brotli.compress(data, quality=11))
+        written[br_path] = br_path.stat().st_size
+    else:
+        print("The brotli module is not installed, skipping the .br file (pip install brotli)")
+    return written
+
+
+def min_time_ms(function, repeat=20):
+    """
+    Returns the fastest of `repeat` runs of the function, in milliseconds.
+    """
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1000
+
+
+def print_release_report(defaultHtml: str, releaseHtml: str, commandJsonString: str, commandJson):
+    """
+    Prints the sizes of the default and release index.html (raw and compressed), and the time to parse the
+    embedded spec (json.loads, as a proxy for the browser's JSON parsing).
+    """
+    def sizes(html):
+        data = html.encode()
+        result = [len(data), len(gzip.compress(data, compresslevel=9, mtime=0))]
+        result.append(len(brotli.compress(data, quality=11)) if brotli is not None else None)
+        return result
+
+    optionTables, internedCommandJson = intern_param_options(commandJson)
+    optionTablesString = json.dumps(optionTables, separators=(',', ':'))
+    internedString = json.dumps(internedCommandJson, separators=(',', ':'))
+    def parse_release():
+        tables = json.loads(optionTablesString)
+        for cmdObject in json.loads(internedString).values():
+            if cmdObject.get("paramOptions") is not None:
+                cmdObject["paramOptions"] = {k: tables[v] for k, v in cmdObject["paramOptions"].items()}
+
+    # The parses take well under a millisecond, so the best of 20 runs still varies by more than the difference.
+    rows = [
+        ("default", sizes(defaultHtml), min_time_ms(lambda: json.loads(commandJsonString), repeat=200)),
+        ("release", sizes(releaseHtml), min_time_ms(parse_release, repeat=200)),
+    ]
+    print(f"{'':8} {'raw (B)':>10} {'gzip (B)':>10} {'brotli (B)':>10} {'spec parse (ms)':>16}")
+    for name, (raw, gz, br), parse_ms in rows:
+        print(f"{name:8} {raw:>10} {gz:>10} {br if br is not None else '-':>10} {parse_ms:>16.2f}")
+    print(f"Option tables: {len(optionTables)} distinct, "
+          f"{sum(len(c['paramOptions'] or {}) for c in commandJson.values())} references")
+
+
+class Build:
+    """
+    The build of index.html in two stages: the spec (guide text -> `commandJson`), and the render
+    (spec + template -> index.html). A stage is only re-run when its inputs have changed.
+    """
+    def __init__(self, source_path, template_path, output_path, commands_path=None, cache_dir=None):
+        self.source_path = Path(source_path)
+        self.template_path = Path(template_path)
+        self.output_path = Path(output_path)
+        self.commands_path = commands_path  # foscam_cgi/commands.py for the Python client, written at the spec stage
+        self.cache_dir = cache_dir
+        self.commandJsonString = None
+        self.commandTemplatesString = None
+        self.commandIndexString = None
+        self.templateHtml = None
+
+    def run(self, spec_changed=True, template_changed=True):
+        if spec_changed or self.commandJsonString is None:
+            self.commandJsonString = build_spec(self.source_path, self.cache_dir)
+            self.commandTemplatesString = serialize_command_templates(json.loads(self.commandJsonString))
+            self.commandIndexString = serialize_command_index(json.loads(self.commandJsonString))
+            if self.commands_path is not None and write_if_changed(self.commands_path, generate_python_commands(json.loads(self.commandJsonString))):
+                print(f"Writing Python commands to {self.commands_path}")
+        if template_changed or self.templateHtml is None:
+            self.templateHtml = self.template_path.read_text()
+        finalHtml = generate_html(self.commandJsonString, self.templateHtml, self.commandTemplatesString,
+                                  self.commandIndexString)
+        if write_if_changed(self.output_path, finalHtml):
+            print(f"Writing final HTML to {self.output_path}")
+        else:
+            print(f"{self.output_path} is up to date")
+
+    def run_release(self, release_path):
+        """
+        Writes the release build: the spec embedded as compact JSON with interned option tables,
+        plus the precompressed siblings. Prints a size and parse time comparison to the default build.
+        """
+        if self.commandJsonString is None:
+            self.commandJsonString = build_spec(self.source_path, self.cache_dir)
+        if self.templateHtml is None:
+            self.templateHtml = self.template_path.read_text()
+        commandJson = json.loads(self.commandJsonString)
+        commandTemplatesString = serialize_command_templates(commandJson)
+        commandIndexString = serialize_command_index(commandJson)
+        releaseHtml = generate_html(serialize_release_spec(commandJson), self.templateHtml, commandTemplatesString,
+                                    commandIndexString)
+
+        release_path = Path(release_path)
+        release_path.parent.mkdir(parents=True, exist_ok=True)
+        write_if_changed(release_path, releaseHtml)
+        print(f"Wrote release HTML to {release_path}")
+        for path, size in write_compressed_siblings(release_path, releaseHtml.encode()).items():
+            print(f"Wrote {path} ({size} B)")
+        print_release_report(generate_html(self.commandJsonString, self.templateHtml, commandTemplatesString, commandIndexString), releaseHtml, self.commandJsonString, commandJson)
+
+    def watch(self, poll_interval_s=0.05):
+        """
+        Rebuilds whenever the guide text or the template changes. If this script itself changes (e.g. the
+        manual corrections were edited), the whole process is restarted to load the new code.
+        """
+        this_script = Path(os.path.realpath(__file__))
+        def mtimes():
+            return {p: p.stat().st_mtime_ns for p in (self.source_path, self.template_path, this_script)}
+
+        self.run()
+        last = mtimes()
+        print("Watching for changes (Ctrl+C to stop)...")
+        while True:
+            time.sleep(poll_interval_s)
+            try:
+                current = mtimes()
+            except FileNotFoundError:
+                continue    # an editor may be replacing the file just now
+            if current == last:
+                continue
+            if current[this_script] != last[this_script]:
+                print(f"{this_script.name} changed, restarting")
+                os.execv(sys.executable, [sys.executable] + sys.argv)
+            started = time.perf_counter()
+            self.run(spec_changed=current[self.source_path] != last[self.source_path],
+                     template_changed=current[self.template_path] != last[self.template_path])
+            print(f"Rebuilt in {(time.perf_counter() - started) * 1000:.1f} ms")
+            last = current
+
+
+if __name__ == '__main__':
+    full_path_of_this_script_dir = Path(os.path.realpath(__file__)).resolve().parent
+
+    parser = argparse.ArgumentParser(description="Parse the Foscam CGI guide text and generate the index.html.")
+    parser.add_argument("--watch", action="store_true", help="keep running and rebuild when the template or the guide text changes")
+    parser.add_argument("--no-cache", action="store_true", help="always re-parse the guide text instead of using the cached spec")
+    parser.add_argument("--release", action="store_true", help="write a compact, precompressed build to dist/ instead of index.html")
+    args = parser.parse_args()
+
     ## Save the commandJson as json:
     #with open(Path(full_path_of_this_script_dir / "FoscamApiAutoscraped.json"), 'w') as fp:
-    #    json.dump(commandJson, fp, indent=4)
-    
-    # Create the index.html by replacing a placeholder in the template-html:
-    commandJsonString = json.dumps(commandJson, sort_keys=False, indent=4)
-    
-    with open(Path(full_path_of_this_script_dir / "index_template.html")) as f:
-        templateHtml = f.read()
-        
-    finalHtml = templateHtml.replace("{COMMANDJSON_PLACEHOLDER}", commandJsonString)
-    
-    finalPathInParentDir = Path(full_path_of_this_script_dir.parent / 'index.html')
-    print(f"Writing final HTML to {finalPathInParentDir}")
-    with open(finalPathInParentDir, 'w') as fp:
-        fp.write(finalHtml)
+    #    json.dump(build_command_json(Path(full_path_of_this_script_dir / source_file)), fp, indent=4)
 
+    build = Build(
+        Path(full_path_of_this_script_dir / source_file),
+        Path(full_path_of_this_script_dir / "index_template.html"),
+        Path(full_path_of_this_script_dir.parent / 'index.html'),
+        commands_path=Path(full_path_of_this_script_dir / 'foscam_cgi' / 'commands.py'),
+        cache_dir=None if args.no_cache else Path(full_path_of_this_script_dir / ".build_cache"),
+    )
+    if args.release:
+        build.run_release(Path(full_path_of_this_script_dir.parent / 'dist' / 'index.html'))
+    elif args.watch:
+        try:
+            build.watch()
+        except KeyboardInterrupt:
+            pass
+    else:
+        build.run()